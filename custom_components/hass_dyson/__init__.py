@@ -55,6 +55,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
 
+from .cloud_client import async_shutdown_cloud_client_pool
+
 # Import config flow explicitly to ensure it's available for registration
 from .config_flow import DysonConfigFlow  # noqa: F401
 from .const import (
@@ -64,6 +66,8 @@ from .const import (
     CONF_CULTURE,
     CONF_POLL_FOR_DEVICES,
     CONF_SERIAL_NUMBER,
+    CONF_STARTUP_CONCURRENCY,
+    DATA_STARTUP_CONCURRENCY,
     DEFAULT_AUTO_ADD_DEVICES,
     DEFAULT_POLL_FOR_DEVICES,
     DISCOVERY_CLOUD,
@@ -77,6 +81,7 @@ from .coordinator import (
     DysonDataUpdateCoordinator,
 )
 from .device_utils import mask_serial
+from .mdns import async_shutdown_mdns_cache
 from .services import (
     async_remove_cloud_services,
     async_remove_device_services_for_coordinator,
@@ -84,6 +89,7 @@ from .services import (
     async_setup_device_services_for_coordinator,
     async_setup_services,
 )
+from .startup import get_startup_orchestrator, shutdown_startup_orchestrator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -109,6 +115,9 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Optional("devices", default=[]): vol.All(
                     cv.ensure_list, [DEVICE_SCHEMA]
                 ),
+                vol.Optional(CONF_STARTUP_CONCURRENCY): vol.All(
+                    vol.Coerce(int), vol.Range(min=1)
+                ),
             }
         )
     },
@@ -136,6 +145,10 @@ async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
     domain_config = config.get(DOMAIN, {})
     devices = domain_config.get("devices", [])
 
+    # Optionally bound how many device entries connect at once
+    if CONF_STARTUP_CONCURRENCY in domain_config:
+        hass.data[DATA_STARTUP_CONCURRENCY] = domain_config[CONF_STARTUP_CONCURRENCY]
+
     if not devices:
         _LOGGER.debug("No devices configured in YAML, skipping YAML setup")
         return True
@@ -512,10 +525,13 @@ async def _setup_individual_device_entry(
 
     _LOGGER.debug("Setting up individual device config entry")
     coordinator = DysonDataUpdateCoordinator(hass, entry)
+    startup = get_startup_orchestrator(hass)
 
     try:
-        # Perform initial data fetch
-        await coordinator.async_config_entry_first_refresh()
+        # Perform initial data fetch once a startup slot is free
+        timing = await startup.async_connect(
+            coordinator.serial_number, coordinator.async_config_entry_first_refresh
+        )
     except UnsupportedDeviceError as err:
         # Device doesn't support MQTT - schedule removal AFTER setup_lock is released.
         # Awaiting async_remove here would deadlock because async_setup_entry already
@@ -544,8 +560,12 @@ async def _setup_individual_device_entry(
     # Set up device services for this coordinator
     await async_setup_device_services_for_coordinator(hass, coordinator)
 
-    # Set up platforms and services
-    await _setup_platforms_and_services(hass, entry, coordinator)
+    # Set up platforms and services; the startup slot is already released
+    await startup.async_setup_platforms(
+        coordinator.serial_number,
+        timing,
+        _setup_platforms_and_services(hass, entry, coordinator),
+    )
 
     _LOGGER.info(
         "Successfully set up Dyson device '%s'", mask_serial(coordinator.serial_number)
@@ -861,6 +881,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             key == "services_setup" for key in hass.data[DOMAIN]
         ):
             await async_remove_services(hass)
+            await async_shutdown_cloud_client_pool(hass)
+            await async_shutdown_mdns_cache(hass)
+            shutdown_startup_orchestrator(hass)
+
+            from .image import shutdown_render_worker
+
+            shutdown_render_worker()
 
         _LOGGER.info("Successfully unloaded Dyson device '%s'", entry.title)
 
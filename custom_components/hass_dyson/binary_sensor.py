@@ -25,6 +25,7 @@ from .const import (
     ROBOT_STATES_CHARGING,
 )
 from .coordinator import DysonBLEDataUpdateCoordinator, DysonDataUpdateCoordinator
+from .device import FAULT_OK_VALUES, fault_severity
 from .device_utils import mask_serial
 from .entity import DysonBLEEntity, DysonEntity
 
@@ -329,6 +330,10 @@ class DysonFaultSensor(DysonEntity, BinarySensorEntity):  # type: ignore[misc]
         self._attr_name = f"Fault {self._get_fault_friendly_name()}"
         self._attr_device_class = BinarySensorDeviceClass.PROBLEM
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        # (category/capabilities key, relevant) from the last relevance check
+        self._relevance: tuple[tuple[str, str], bool] | None = None
+        # Fault-index state of the last write, None to always write
+        self._written_fault_state: tuple[Any, ...] | None = None
 
     def _get_fault_friendly_name(self) -> str:
         """Get a friendly name for the fault code."""
@@ -378,22 +383,57 @@ class DysonFaultSensor(DysonEntity, BinarySensorEntity):  # type: ignore[misc]
         is_fault = self.is_on if self.is_on is not None else False
         return self._get_fault_icon(is_fault=is_fault)
 
+    def _is_relevant(self) -> bool:
+        """Return whether this fault code applies to the device (cached).
+
+        Re-evaluated only when the coordinator's category or capabilities
+        change.
+        """
+        device_category = self.coordinator.device_category
+        device_capabilities = self.coordinator.device_capabilities
+        key = (repr(device_category), repr(device_capabilities))
+        if self._relevance is None or self._relevance[0] != key:
+            self._relevance = (
+                key,
+                _is_fault_code_relevant(
+                    self._fault_code, device_category, device_capabilities
+                ),
+            )
+        return self._relevance[1]
+
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if not self.coordinator.device:
+        device = self.coordinator.device
+        if not device:
+            self._written_fault_state = None
             self._attr_is_on = False
             self._attr_extra_state_attributes = {}
             super()._handle_coordinator_update()
             return
 
         # Check if this fault code is relevant to the current device category and capabilities
-        device_category_str = self.coordinator.device_category
-        device_capabilities = self.coordinator.device_capabilities
+        relevant = self._is_relevant()
+
+        # Devices keep a flat, versioned fault index; skip the state write
+        # when this code's entry has not changed since the last one.
+        fault_index = getattr(device, "fault_index", None)
+        if isinstance(fault_index, dict):
+            entry = fault_index.get(self._fault_code)
+            fault_state = (
+                relevant,
+                bool(fault_index),
+                entry.version if entry else None,
+                self.available,
+            )
+            if fault_state == self._written_fault_state:
+                return
+            self._written_fault_state = fault_state
+        else:
+            self._written_fault_state = None
 
-        if not _is_fault_code_relevant(
-            self._fault_code, device_category_str, device_capabilities
-        ):
+        if not relevant:
             # This fault sensor is not relevant to the current device type
+            device_category_str = self.coordinator.device_category
             self._attr_available = False
             self._attr_is_on = False
             self._attr_extra_state_attributes = {
@@ -408,47 +448,19 @@ class DysonFaultSensor(DysonEntity, BinarySensorEntity):  # type: ignore[misc]
 
         # Get current faults from device
         try:
-            # We'll use the same method the coordinator uses
-            if (
-                hasattr(self.coordinator.device, "_faults_data")
-                and self.coordinator.device._faults_data
-            ):
-                raw_faults = self.coordinator.device._faults_data
-                # Check if this fault code has any non-OK values in any section
-                fault_found, fault_value = self._search_fault_in_data(raw_faults)
-
-                if fault_found:
-                    # Only consider it a fault if it's not OK/NONE/PASS/GOOD
-                    if fault_value and fault_value.upper() not in [
-                        "OK",
-                        "NONE",
-                        "PASS",
-                        "GOOD",
-                    ]:
-                        self._attr_is_on = True
-                        # Get human-readable description
-                        description = self._fault_info.get(
-                            fault_value, f"Unknown fault: {fault_value}"
-                        )
-                        self._attr_extra_state_attributes = {
-                            "fault_code": self._fault_code,
-                            "fault_value": fault_value,
-                            "description": description,
-                            "severity": self._get_fault_severity(fault_value),
-                        }
-                    else:
-                        self._attr_is_on = False
-                        self._attr_extra_state_attributes = {
-                            "fault_code": self._fault_code,
-                            "fault_value": fault_value,
-                            "status": "OK",
-                        }
+            if isinstance(fault_index, dict):
+                if fault_index:
+                    entry = fault_index.get(self._fault_code)
+                    self._set_fault_value(entry.value if entry else None)
                 else:
                     self._attr_is_on = False
-                    self._attr_extra_state_attributes = {
-                        "fault_code": self._fault_code,
-                        "status": "No data",
-                    }
+                    self._attr_extra_state_attributes = {}
+            elif hasattr(device, "_faults_data") and device._faults_data:
+                # Check if this fault code has any non-OK values in any section
+                fault_found, fault_value = self._search_fault_in_data(
+                    device._faults_data
+                )
+                self._set_fault_value(fault_value if fault_found else None)
             else:
                 self._attr_is_on = False
                 self._attr_extra_state_attributes = {}
@@ -460,6 +472,35 @@ class DysonFaultSensor(DysonEntity, BinarySensorEntity):  # type: ignore[misc]
 
         super()._handle_coordinator_update()
 
+    def _set_fault_value(self, fault_value: str | None) -> None:
+        """Set state and attributes from the code's value (None if not reported)."""
+        if fault_value is None:
+            self._attr_is_on = False
+            self._attr_extra_state_attributes = {
+                "fault_code": self._fault_code,
+                "status": "No data",
+            }
+        elif fault_value and fault_value.upper() not in FAULT_OK_VALUES:
+            # Only consider it a fault if it's not OK/NONE/PASS/GOOD
+            self._attr_is_on = True
+            # Get human-readable description
+            description = self._fault_info.get(
+                fault_value, f"Unknown fault: {fault_value}"
+            )
+            self._attr_extra_state_attributes = {
+                "fault_code": self._fault_code,
+                "fault_value": fault_value,
+                "description": description,
+                "severity": self._get_fault_severity(fault_value),
+            }
+        else:
+            self._attr_is_on = False
+            self._attr_extra_state_attributes = {
+                "fault_code": self._fault_code,
+                "fault_value": fault_value,
+                "status": "OK",
+            }
+
     def _search_fault_in_data(self, fault_data: dict[str, Any]) -> tuple[bool, str]:
         """Search for fault code in nested fault data structure."""
         # Search in all fault sections
@@ -483,14 +524,7 @@ class DysonFaultSensor(DysonEntity, BinarySensorEntity):  # type: ignore[misc]
 
     def _get_fault_severity(self, fault_value: str) -> str:
         """Determine fault severity based on fault value."""
-        if fault_value.upper() in ["FAIL", "STLL"]:
-            return "Critical"
-        elif fault_value.upper() in ["WARN", "HIGH", "LOW", "WEAK"]:
-            return "Warning"
-        elif fault_value.upper() in ["CHNG", "FULL", "WORN"]:
-            return "Maintenance"
-        else:
-            return "Unknown"
+        return fault_severity(fault_value)
 
 
 class DysonRobotFaultSensor(DysonEntity, BinarySensorEntity):  # type: ignore[misc]
@@ -8,7 +8,8 @@ exclusively over Bluetooth Low Energy.  It handles:
   the MyDyson Android app by S-Termi, discussion #334)
 - LTK silent re-auth (HKDF-SHA256 + AES-128-CBC + HMAC-SHA256)
 - GATT characteristic subscriptions (power, brightness, color temperature, motion)
-- State change propagation via the Home Assistant event bus
+- State change propagation to the lamp's own coordinator through state
+  callbacks, optionally mirrored on the Home Assistant event bus
   (``EVENT_BLE_STATE_CHANGE``) — *no MQTT*
 
 The crypto implementation faithfully mirrors the Android app's ``g20/a.java``
@@ -25,11 +26,13 @@ the actual algorithm, not the summary description.
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import hashlib
 import hmac
 import logging
 import math
 import os
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
@@ -80,6 +83,10 @@ _RECONNECT_DELAYS = [5, 15, 30, 60]
 # Keepalive poll interval in seconds
 _KEEPALIVE_INTERVAL = 20.0
 
+# Deadline for a batch of concurrent GATT reads or subscriptions; one proxy
+# round trip can take this long with low-duty-cycle scan windows.
+_GATT_OP_TIMEOUT = 10.0
+
 # Treat consecutive manual light adjustments as one interaction. The lamp does
 # not expose a decoded daylight-mode notification, so a later interaction must
 # reassert manual mode in case the physical daylight button was pressed.
@@ -474,7 +481,8 @@ class DysonBLEDevice:
     2. Authenticate using stored LTK via the silent re-auth flow
     3. Read initial state from GATT characteristics
     4. Subscribe to runtime notifications (motion, flags)
-    5. Fire :const:`.const.EVENT_BLE_STATE_CHANGE` on every state update
+    5. Notify state callbacks of the changed fields on every state update,
+       and fire :const:`.const.EVENT_BLE_STATE_CHANGE` when enabled
     6. Reconnect with exponential backoff on disconnect
 
     Commands (:meth:`set_power`, :meth:`set_brightness`,
@@ -519,6 +527,9 @@ class DysonBLEDevice:
         self._ble_proxy = ble_proxy
         self._daylight_capable = daylight_capable
         self._manual_mode_valid_until = 0.0
+        self._state_callbacks: list[Callable[[dict[str, Any]], None]] = []
+        # State as last published, to work out which fields changed
+        self._published_state: dict[str, Any] = {}
 
         self.state = BLELightState()
         self._client: Any | None = None  # BleakClient at runtime
@@ -528,16 +539,42 @@ class DysonBLEDevice:
 
     # ── Internal helpers ──────────────────────────────────────────────────────
 
+    def add_state_callback(self, callback: Callable[[dict[str, Any]], None]) -> None:
+        """Add a callback to be notified of the state fields that changed."""
+        if callback not in self._state_callbacks:
+            self._state_callbacks.append(callback)
+
+    def remove_state_callback(self, callback: Callable[[dict[str, Any]], None]) -> None:
+        """Remove a state change callback."""
+        if callback in self._state_callbacks:
+            self._state_callbacks.remove(callback)
+
     def _fire_state_change(self) -> None:
-        """Publish current state on the HA event bus."""
-        import dataclasses
+        """Publish the state fields changed since the last publish.
+
+        Only this lamp's state callbacks are called, with the changed fields
+        of :class:`BLELightState`.  The full state is also fired on the event
+        bus as :const:`.const.EVENT_BLE_STATE_CHANGE` for automations.
+        """
+        state = dataclasses.asdict(self.state)
+        changes = {
+            key: value
+            for key, value in state.items()
+            if key not in self._published_state or self._published_state[key] != value
+        }
+        if not changes:
+            return
+        self._published_state = state
+
+        for state_callback in list(self._state_callbacks):
+            try:
+                state_callback(changes)
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.error("Error in BLE state callback: %s", err)
 
         self.hass.bus.async_fire(
             EVENT_BLE_STATE_CHANGE,
-            {
-                "serial_number": self.serial_number,
-                **dataclasses.asdict(self.state),
-            },
+            {"serial_number": self.serial_number, **state},
         )
 
     def _on_auth_notification(self, _characteristic: Any, data: bytearray) -> None:
@@ -1017,132 +1054,215 @@ class DysonBLEDevice:
 
     # ── GATT state read / subscribe ───────────────────────────────────────────
 
-    async def _read_initial_state(self) -> None:
+    async def _run_gatt_operations(
+        self, operations: dict[str, Awaitable[Any]]
+    ) -> dict[str, Any]:
+        """Run independent GATT operations concurrently under one deadline.
+
+        Every operation is started at once and given until the same deadline,
+        :data:`_GATT_OP_TIMEOUT` seconds away, so a batch costs at most one
+        proxy timeout however many characteristics stop answering.
+
+        Returns:
+            Each operation's result keyed by name, or the exception it raised
+            (:class:`TimeoutError` if it did not answer before the deadline).
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _GATT_OP_TIMEOUT
+
+        async def run(operation: Awaitable[Any]) -> Any:
+            return await asyncio.wait_for(operation, max(0.0, deadline - loop.time()))
+
+        results = await asyncio.gather(
+            *(run(operation) for operation in operations.values()),
+            return_exceptions=True,
+        )
+        return dict(zip(operations, results, strict=True))
+
+    def _log_gatt_batch(self, batch: str, results: dict[str, Any]) -> set[str]:
+        """Log which characteristics answered a GATT batch and return them."""
+        answered = {
+            name
+            for name, result in results.items()
+            if not isinstance(result, BaseException)
+        }
+        _LOGGER.debug(
+            "GATT %s for %s answered: %s; no answer: %s",
+            batch,
+            self.serial_number,
+            sorted(answered) or "none",
+            sorted(results.keys() - answered) or "none",
+        )
+        return answered
+
+    async def _read_initial_state(self) -> set[str]:
         """Read current values from all light control characteristics.
 
-        Each characteristic is read independently so that a proxy timeout on
-        one does not prevent the others from being read.  Best-effort: logs
-        debug messages on failure and does not raise.
+        The power, brightness and colour temperature reads are issued
+        concurrently, so a proxy timeout on one does not delay or prevent the
+        others.  Best-effort: logs debug messages on failure and does not
+        raise.
 
         With the default esp32_ble_tracker scan parameters (window=30ms /
         interval=320ms), any individual GATT read may time out through a BLE
-        proxy.  Isolating each read limits the worst-case delay to one timeout
-        (≤10 s) per characteristic rather than aborting all reads on the first
-        failure.
+        proxy.  Sharing one deadline limits the worst case to a single
+        timeout (≤10 s) rather than one per characteristic.
+
+        Returns:
+            Names of the characteristics that answered.
         """
         if self._client is None:
-            return
-
-        # Power
-        try:
-            power_raw = bytes(await self._client.read_gatt_char(BLE_POWER_UUID))
-            self.state.power = bool(power_raw and power_raw[0] != 0)
-            _LOGGER.debug(
-                "Initial power read from %s: raw=%s → %s",
-                self.serial_number,
-                power_raw.hex(),
-                "ON" if self.state.power else "OFF",
-            )
-        except Exception as exc:  # noqa: BLE001
-            _LOGGER.debug(
-                "Could not read power state from %s: %s", self.serial_number, exc
-            )
+            return set()
 
-        # Brightness — 11009 lumens for daylight devices, 11000 percent otherwise
-        try:
-            brightness_raw = bytes(
-                await self._client.read_gatt_char(self._brightness_uuid)
-            )
-            _LOGGER.debug(
-                "Initial brightness read from %s (%s): raw=%s (%d bytes)",
-                self.serial_number,
-                self._brightness_uuid,
-                brightness_raw.hex(),
-                len(brightness_raw),
-            )
-            if self._daylight_capable and len(brightness_raw) >= 2:  # noqa: PLR2004
-                lumens = int.from_bytes(brightness_raw[:2], byteorder="little")
-                self.state.brightness_raw = lumens
-                self.state.brightness = raw_lumens_to_ha_brightness(lumens)
+        results = await self._run_gatt_operations(
+            {
+                "power": self._client.read_gatt_char(BLE_POWER_UUID),
+                # 11009 lumens for daylight devices, 11000 percent otherwise
+                "brightness": self._client.read_gatt_char(self._brightness_uuid),
+                "color_temp": self._client.read_gatt_char(BLE_COLOR_TEMP_UUID),
+            }
+        )
+        parsers = {
+            "power": self._apply_initial_power,
+            "brightness": self._apply_initial_brightness,
+            "color_temp": self._apply_initial_color_temp,
+        }
+        for name, result in results.items():
+            if isinstance(result, BaseException):
                 _LOGGER.debug(
-                    "Initial brightness for %s: %d lm → HA %d",
+                    "Could not read %s from %s: %s",
+                    name,
                     self.serial_number,
-                    lumens,
-                    self.state.brightness,
+                    result or type(result).__name__,
                 )
-            elif not self._daylight_capable and brightness_raw:
-                percent = max(0, min(100, brightness_raw[0]))
-                self.state.brightness_raw = percent
-                self.state.brightness = raw_to_ha_brightness(percent)
-            else:
-                _LOGGER.warning(
-                    "Brightness char 11009 on %s returned %d bytes (raw=%s); "
-                    "expected uint16 LE — value format may differ from assumption",
-                    self.serial_number,
-                    len(brightness_raw),
-                    brightness_raw.hex(),
+                continue
+            try:
+                parsers[name](bytes(result))
+            except Exception as exc:  # noqa: BLE001
+                _LOGGER.debug(
+                    "Could not parse %s from %s: %s", name, self.serial_number, exc
                 )
-        except Exception as exc:  # noqa: BLE001
-            _LOGGER.debug(
-                "Could not read brightness from %s: %s", self.serial_number, exc
-            )
+        return self._log_gatt_batch("reads", results)
 
-        # Color temperature
-        try:
-            color_temp_raw = bytes(
-                await self._client.read_gatt_char(BLE_COLOR_TEMP_UUID)
-            )
+    def _apply_initial_power(self, power_raw: bytes) -> None:
+        """Apply an initial power read."""
+        self.state.power = bool(power_raw and power_raw[0] != 0)
+        _LOGGER.debug(
+            "Initial power read from %s: raw=%s → %s",
+            self.serial_number,
+            power_raw.hex(),
+            "ON" if self.state.power else "OFF",
+        )
+
+    def _apply_initial_brightness(self, brightness_raw: bytes) -> None:
+        """Apply an initial brightness read (lumens or percent)."""
+        _LOGGER.debug(
+            "Initial brightness read from %s (%s): raw=%s (%d bytes)",
+            self.serial_number,
+            self._brightness_uuid,
+            brightness_raw.hex(),
+            len(brightness_raw),
+        )
+        if self._daylight_capable and len(brightness_raw) >= 2:  # noqa: PLR2004
+            lumens = int.from_bytes(brightness_raw[:2], byteorder="little")
+            self.state.brightness_raw = lumens
+            self.state.brightness = raw_lumens_to_ha_brightness(lumens)
             _LOGGER.debug(
-                "Initial color temp read from %s (char 11001): raw=%s (%d bytes)",
+                "Initial brightness for %s: %d lm → HA %d",
                 self.serial_number,
-                color_temp_raw.hex(),
-                len(color_temp_raw),
+                lumens,
+                self.state.brightness,
+            )
+        elif not self._daylight_capable and brightness_raw:
+            percent = max(0, min(100, brightness_raw[0]))
+            self.state.brightness_raw = percent
+            self.state.brightness = raw_to_ha_brightness(percent)
+        else:
+            _LOGGER.warning(
+                "Brightness char 11009 on %s returned %d bytes (raw=%s); "
+                "expected uint16 LE — value format may differ from assumption",
+                self.serial_number,
+                len(brightness_raw),
+                brightness_raw.hex(),
+            )
+
+    def _apply_initial_color_temp(self, color_temp_raw: bytes) -> None:
+        """Apply an initial colour temperature read."""
+        _LOGGER.debug(
+            "Initial color temp read from %s (char 11001): raw=%s (%d bytes)",
+            self.serial_number,
+            color_temp_raw.hex(),
+            len(color_temp_raw),
+        )
+        if len(color_temp_raw) >= 2:  # noqa: PLR2004
+            kelvin = int.from_bytes(color_temp_raw[:2], byteorder="little")
+            self.state.color_temp_kelvin = kelvin
+            self.state.color_temp_mired = (
+                kelvin_to_mired(kelvin) if kelvin > 0 else None
             )
-            if len(color_temp_raw) >= 2:  # noqa: PLR2004
-                kelvin = int.from_bytes(color_temp_raw[:2], byteorder="little")
-                self.state.color_temp_kelvin = kelvin
-                self.state.color_temp_mired = (
-                    kelvin_to_mired(kelvin) if kelvin > 0 else None
-                )
-                _LOGGER.debug(
-                    "Initial color temp for %s: %d K",
-                    self.serial_number,
-                    kelvin,
-                )
-        except Exception as exc:  # noqa: BLE001
             _LOGGER.debug(
-                "Could not read color temperature from %s: %s",
+                "Initial color temp for %s: %d K",
                 self.serial_number,
-                exc,
+                kelvin,
             )
 
-    async def _subscribe_notifications(self) -> None:
-        """Subscribe to notify characteristics for real-time updates."""
+    async def _subscribe_notifications(self) -> set[str]:
+        """Subscribe to notify characteristics for real-time updates.
+
+        All subscriptions are issued concurrently under one deadline (see
+        :meth:`_run_gatt_operations`).
+
+        Returns:
+            Names of the characteristics that accepted the subscription.
+        """
         if self._client is None:
-            return
+            return set()
 
         # Light-control characteristics: power, brightness, color temperature.
         # The Lightcycle Morph (CF06) uses characteristic 11009 for brightness
         # (uint16 LE lumens) rather than 11000.  Power and color temperature
         # use their respective characteristics on all supported devices.
-        for uuid, handler, name in (
-            (BLE_POWER_UUID, self._on_power_notification, "power"),
-            (
-                self._brightness_uuid,
-                self._on_brightness_notification,
-                "brightness",
-            ),
-            (BLE_COLOR_TEMP_UUID, self._on_color_temp_notification, "color_temp"),
-        ):
-            try:
-                await self._client.start_notify(uuid, handler)
+        # Motion drives the binary sensor.  Note: 11009 is now the primary
+        # brightness channel; only 11006 and 11007 remain as diagnostic
+        # characteristics (best-effort).
+        subscriptions: dict[str, tuple[str, Callable[..., None]]] = {
+            "power": (BLE_POWER_UUID, self._on_power_notification),
+            "brightness": (self._brightness_uuid, self._on_brightness_notification),
+            "color_temp": (BLE_COLOR_TEMP_UUID, self._on_color_temp_notification),
+            "motion": (BLE_MOTION_UUID, self._on_motion_notification),
+            "11006": (BLE_CHAR_11006_UUID, self._on_runtime_notification("11006")),
+            "11007": (BLE_CHAR_11007_UUID, self._on_runtime_notification("11007")),
+        }
+        results = await self._run_gatt_operations(
+            {
+                name: self._client.start_notify(uuid, handler)
+                for name, (uuid, handler) in subscriptions.items()
+            }
+        )
+
+        for name, result in results.items():
+            uuid = subscriptions[name][0]
+            if not isinstance(result, BaseException):
                 _LOGGER.debug(
                     "Subscribed to %s notifications for %s (UUID %s)",
                     name,
                     self.serial_number,
                     uuid,
                 )
-            except Exception as exc:  # noqa: BLE001
+            elif name in ("11006", "11007"):
+                _LOGGER.debug(
+                    "Could not subscribe to diagnostic characteristic %s for %s: %s",
+                    name,
+                    self.serial_number,
+                    result,
+                )
+            elif name == "motion":
+                _LOGGER.warning(
+                    "Failed to subscribe to motion characteristic for %s: %s",
+                    self.serial_number,
+                    result,
+                )
+            else:
                 _LOGGER.warning(
                     "Could not subscribe to %s notifications for %s (UUID %s): %s "
                     "— commands to this characteristic will not be confirmed via "
@@ -1150,47 +1270,9 @@ class DysonBLEDevice:
                     name,
                     self.serial_number,
                     uuid,
-                    exc,
-                )
-
-        # Motion notifications (most important — drives binary sensor)
-        try:
-            await self._client.start_notify(
-                BLE_MOTION_UUID, self._on_motion_notification
-            )
-            _LOGGER.debug(
-                "Subscribed to motion notifications for %s", self.serial_number
-            )
-        except Exception as exc:  # noqa: BLE001
-            _LOGGER.warning(
-                "Failed to subscribe to motion characteristic for %s: %s",
-                self.serial_number,
-                exc,
-            )
-
-        # Runtime / diagnostic notifications (best-effort)
-        # Note: 11009 is now the primary brightness channel and is subscribed
-        # above; only 11006 and 11007 remain as diagnostic characteristics.
-        for short_id, uuid in (
-            ("11006", BLE_CHAR_11006_UUID),
-            ("11007", BLE_CHAR_11007_UUID),
-        ):
-            try:
-                await self._client.start_notify(
-                    uuid, self._on_runtime_notification(short_id)
-                )
-                _LOGGER.debug(
-                    "Subscribed to diagnostic characteristic %s for %s",
-                    short_id,
-                    self.serial_number,
-                )
-            except Exception as exc:  # noqa: BLE001
-                _LOGGER.debug(
-                    "Could not subscribe to diagnostic characteristic %s for %s: %s",
-                    short_id,
-                    self.serial_number,
-                    exc,
+                    result,
                 )
+        return self._log_gatt_batch("subscriptions", results)
 
     # ── Public connection API ─────────────────────────────────────────────────
 
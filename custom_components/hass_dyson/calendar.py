@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, time, timedelta
-from typing import Any
+from typing import Any, NamedTuple
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.config_entries import ConfigEntry
@@ -22,12 +22,16 @@ from homeassistant.util import dt as dt_util
 from .const import DOMAIN
 from .coordinator import DysonDataUpdateCoordinator
 from .entity import DysonEntity
-from .sensor import _device_product_type, _schedule_cache
+from .sensor import _fetch_scheduled_events, _schedule_cache
 
 _LOGGER = logging.getLogger(__name__)
 
 _UPDATE_INTERVAL = timedelta(minutes=5)
 
+# Expanded windows remembered per calendar entity; the calendar card re-asks
+# for the same few windows while the user flips between views.
+_MAX_CACHED_WINDOWS = 8
+
 # Day names indexed by Python weekday (0 = Monday … 6 = Sunday)
 _DAY_NAMES = [
     "Monday",
@@ -143,51 +147,32 @@ def _group_events(events: list[Any]) -> list[list[Any]]:
     return groups
 
 
-def expand_schedule_to_calendar_events(
-    data: Any,
-    range_start: datetime,
-    range_end: datetime,
-    device_name: str = "Dyson",
-    local_tz: dt_util.dt.tzinfo | None = None,
-) -> list[CalendarEvent]:
-    """Expand :class:`~libdyson_rest.models.ScheduledEventsData` into a list of
-    :class:`~homeassistant.components.calendar.CalendarEvent` instances for
-    the given date range.
+class CompiledScheduleGroup(NamedTuple):
+    """One enabled schedule group, pre-parsed for repeated range expansion."""
 
-    Each enabled schedule group is turned into weekly recurring events.
-    The **start** of each calendar event is the group's earliest ``startTime``;
-    the **end** is the group's latest ``startTime`` (or start + 1 hour when the
-    group has only a single event).  Overnight schedules (end < start) are
-    handled by advancing the end date by one day.
+    weekday_mask: int  # bit n set when the group runs on Python weekday n
+    start: time
+    end: time | None  # None when the group has a single event
+    summary: str
+    description: str
 
-    Args:
-        data: A ``ScheduledEventsData`` instance (or ``None``).
-        range_start: Inclusive start of the requested date range (timezone-aware).
-        range_end: Inclusive end of the requested date range (timezone-aware).
-        device_name: Human-readable device name used in event summaries.
-        local_tz: The local timezone to interpret schedule times in.  Dyson
-            schedule times are in local time, so passing ``hass``'s timezone
-            ensures events appear at the correct hour in the HA calendar.
 
-    Returns:
-        A list of ``CalendarEvent`` objects that overlap with the range.
+def compile_schedule(
+    data: Any, device_name: str = "Dyson"
+) -> tuple[CompiledScheduleGroup, ...]:
+    """Compile ``ScheduledEventsData`` into :class:`CompiledScheduleGroup` records.
+
+    Grouping, ``HH:MM`` parsing and summary/description rendering only depend
+    on the schedule itself, so they are done once per fetched schedule rather
+    than on every calendar query.  A disabled schedule compiles to ``()``.
     """
     if not data or not data.schedule_enabled:
-        return []
+        return ()
 
-    # Schedule times from Dyson are in the device's local time.  Use the
-    # caller-supplied local timezone (from hass.config) so events land on
-    # the correct hour in the HA calendar.  Fall back to the HA default
-    # timezone when not supplied, and only use range_start.tzinfo (UTC) as
-    # a last resort.
-    tz: dt_util.dt.tzinfo = (
-        local_tz or dt_util.get_default_time_zone() or range_start.tzinfo or dt_util.UTC
-    )
     active = [e for e in data.events if e.enabled]
-    groups = _group_events(active)
-    cal_events: list[CalendarEvent] = []
+    compiled: list[CompiledScheduleGroup] = []
 
-    for group_idx, group in enumerate(groups, start=1):
+    for group_idx, group in enumerate(_group_events(active), start=1):
         first = group[0]
         last = group[-1]
 
@@ -200,15 +185,15 @@ def expand_schedule_to_calendar_events(
         # Collect weekdays (Python 0=Mon … 6=Sun).
         # Dyson API uses 0=Sunday (JS convention), so convert:
         #   python_weekday = (dyson_day - 1) % 7
-        weekdays: set[int] = set()
+        weekday_mask = 0
         for ev in group:
             for d in ev.days:
                 try:
-                    weekdays.add((int(d) - 1) % 7)
+                    weekday_mask |= 1 << ((int(d) - 1) % 7)
                 except (ValueError, TypeError):
                     pass
-        if not weekdays:
-            weekdays = set(range(7))
+        if not weekday_mask:
+            weekday_mask = 0b1111111
 
         # Build human-readable summary / description
         first_settings = first.raw.get("settings") or {}
@@ -223,21 +208,62 @@ def expand_schedule_to_calendar_events(
             s = _describe_settings(ev.raw.get("settings") or {}) or "—"
             desc_lines.append(f"  {t}: {s}")
         days_label = ", ".join(
-            _DAY_NAMES[d] for d in sorted(weekdays) if d < len(_DAY_NAMES)
+            _DAY_NAMES[d] for d in range(7) if weekday_mask & (1 << d)
         )
         desc_lines.append(f"Days: {days_label}")
-        description = "\n".join(desc_lines)
-
-        # Expand recurring occurrences within the requested range.
-        # Walk dates in the local timezone to avoid boundary edge cases.
-        local_start = range_start.astimezone(tz)
-        local_end = range_end.astimezone(tz)
-        current_date = local_start.date()
-        while current_date <= local_end.date():
-            if current_date.weekday() in weekdays:
-                ev_start = datetime.combine(current_date, start_t, tzinfo=tz)
-                if end_t and end_t != start_t:
-                    ev_end = datetime.combine(current_date, end_t, tzinfo=tz)
+
+        compiled.append(
+            CompiledScheduleGroup(
+                weekday_mask=weekday_mask,
+                start=start_t,
+                end=end_t if end_t != start_t else None,
+                summary=summary,
+                description="\n".join(desc_lines),
+            )
+        )
+
+    return tuple(compiled)
+
+
+def expand_compiled_schedule(
+    compiled: tuple[CompiledScheduleGroup, ...],
+    range_start: datetime,
+    range_end: datetime,
+    local_tz: dt_util.dt.tzinfo | None = None,
+) -> list[CalendarEvent]:
+    """Expand a compiled schedule into calendar events overlapping a range.
+
+    Only the scheduled weekdays are visited: the first matching date of each
+    weekday is found directly and then advanced a week at a time.
+    """
+    if not compiled:
+        return []
+
+    # Schedule times from Dyson are in the device's local time.  Use the
+    # caller-supplied local timezone (from hass.config) so events land on
+    # the correct hour in the HA calendar.  Fall back to the HA default
+    # timezone when not supplied, and only use range_start.tzinfo (UTC) as
+    # a last resort.
+    tz: dt_util.dt.tzinfo = (
+        local_tz or dt_util.get_default_time_zone() or range_start.tzinfo or dt_util.UTC
+    )
+    # Walk dates in the local timezone to avoid boundary edge cases.
+    first_date = range_start.astimezone(tz).date()
+    last_date = range_end.astimezone(tz).date()
+    first_weekday = first_date.weekday()
+    one_week = timedelta(days=7)
+    cal_events: list[CalendarEvent] = []
+
+    for group in compiled:
+        occurrences: list[CalendarEvent] = []
+        for weekday in range(7):
+            if not group.weekday_mask & (1 << weekday):
+                continue
+            current_date = first_date + timedelta(days=(weekday - first_weekday) % 7)
+            while current_date <= last_date:
+                ev_start = datetime.combine(current_date, group.start, tzinfo=tz)
+                if group.end is not None:
+                    ev_end = datetime.combine(current_date, group.end, tzinfo=tz)
                     if ev_end <= ev_start:
                         # Overnight: schedule ends the following day
                         ev_end += timedelta(days=1)
@@ -246,19 +272,59 @@ def expand_schedule_to_calendar_events(
 
                 # Include only events that overlap with the requested range
                 if ev_end > range_start and ev_start < range_end:
-                    cal_events.append(
+                    occurrences.append(
                         CalendarEvent(
-                            summary=summary,
+                            summary=group.summary,
                             start=ev_start,
                             end=ev_end,
-                            description=description,
+                            description=group.description,
                         )
                     )
-            current_date += timedelta(days=1)
+                current_date += one_week
+        occurrences.sort(key=lambda e: e.start)
+        cal_events.extend(occurrences)
 
     return cal_events
 
 
+def expand_schedule_to_calendar_events(
+    data: Any,
+    range_start: datetime,
+    range_end: datetime,
+    device_name: str = "Dyson",
+    local_tz: dt_util.dt.tzinfo | None = None,
+) -> list[CalendarEvent]:
+    """Expand :class:`~libdyson_rest.models.ScheduledEventsData` into a list of
+    :class:`~homeassistant.components.calendar.CalendarEvent` instances for
+    the given date range.
+
+    Each enabled schedule group is turned into weekly recurring events.
+    The **start** of each calendar event is the group's earliest ``startTime``;
+    the **end** is the group's latest ``startTime`` (or start + 1 hour when the
+    group has only a single event).  Overnight schedules (end < start) are
+    handled by advancing the end date by one day.
+
+    This compiles the schedule on every call; callers that query the same
+    schedule repeatedly should keep the result of :func:`compile_schedule`
+    and use :func:`expand_compiled_schedule` instead.
+
+    Args:
+        data: A ``ScheduledEventsData`` instance (or ``None``).
+        range_start: Inclusive start of the requested date range (timezone-aware).
+        range_end: Inclusive end of the requested date range (timezone-aware).
+        device_name: Human-readable device name used in event summaries.
+        local_tz: The local timezone to interpret schedule times in.  Dyson
+            schedule times are in local time, so passing ``hass``'s timezone
+            ensures events appear at the correct hour in the HA calendar.
+
+    Returns:
+        A list of ``CalendarEvent`` objects that overlap with the range.
+    """
+    return expand_compiled_schedule(
+        compile_schedule(data, device_name), range_start, range_end, local_tz
+    )
+
+
 # ---------------------------------------------------------------------------
 # Entity
 # ---------------------------------------------------------------------------
@@ -282,6 +348,23 @@ class DysonScheduleCalendar(DysonEntity, CalendarEntity):
         self._attr_unique_id = f"{coordinator.serial_number}_schedule_calendar"
         self._attr_translation_key = "schedule"
         self._schedule_data: Any = None
+        # Compiled form of the last schedule seen.  Each fetch yields a new
+        # data object, so object identity doubles as the schedule version;
+        # the device name is baked into the summaries.
+        self._compiled_source: Any = None
+        self._compiled_name: str | None = None
+        self._compiled: tuple[CompiledScheduleGroup, ...] = ()
+        self._window_cache: dict[tuple[Any, ...], list[CalendarEvent]] = {}
+
+    def _compiled_schedule(self, data: Any) -> tuple[CompiledScheduleGroup, ...]:
+        """Return *data* compiled, recompiling only when the schedule changed."""
+        device_name = self.coordinator.device_name
+        if data is not self._compiled_source or device_name != self._compiled_name:
+            self._compiled = compile_schedule(data, device_name)
+            self._compiled_source = data
+            self._compiled_name = device_name
+            self._window_cache.clear()
+        return self._compiled
 
     async def async_added_to_hass(self) -> None:
         """Perform an initial data fetch and register the refresh timer."""
@@ -298,29 +381,15 @@ class DysonScheduleCalendar(DysonEntity, CalendarEntity):
 
     async def _async_refresh(self, now: object = None) -> None:
         """Fetch fresh schedule data from the Dyson cloud and update state."""
-        from libdyson_rest.exceptions import DysonAPIError, DysonAuthError
-
-        serial = self.coordinator.serial_number
         # Expire the cache entry so get() misses but get_stale() still works as
         # a fallback when the live fetch fails.
-        _schedule_cache.expire(serial)
+        _schedule_cache.expire(self.coordinator.serial_number)
 
-        product_type = _device_product_type(self.coordinator) or None
-        async with self.coordinator.async_cloud_client() as client:
-            if client is not None:
-                try:
-                    data = await client.get_scheduled_events(
-                        serial, product_type=product_type
-                    )
-                    _schedule_cache.set(serial, data)
-                    self._schedule_data = data
-                except (DysonAPIError, DysonAuthError) as err:
-                    _LOGGER.debug(
-                        "Failed to refresh schedule calendar for %s: %s", serial, err
-                    )
-                    stale = _schedule_cache.get_stale(serial)
-                    if stale is not None:
-                        self._schedule_data = stale
+        # Shared with the scheduled-events sensor, which refreshes on the same
+        # interval; concurrent refreshes make a single API call.
+        data = await _fetch_scheduled_events(self.coordinator)
+        if data is not None:
+            self._schedule_data = data
 
         self.async_write_ha_state()
 
@@ -334,11 +403,10 @@ class DysonScheduleCalendar(DysonEntity, CalendarEntity):
         if not self._schedule_data:
             return None
         now = dt_util.now()
-        events = expand_schedule_to_calendar_events(
-            self._schedule_data,
+        events = expand_compiled_schedule(
+            self._compiled_schedule(self._schedule_data),
             now,
             now + timedelta(days=7),
-            device_name=self.coordinator.device_name,
             local_tz=dt_util.get_default_time_zone(),
         )
         if not events:
@@ -360,17 +428,21 @@ class DysonScheduleCalendar(DysonEntity, CalendarEntity):
         """Return all calendar events within the requested date range.
 
         Reads from the shared TTL cache so the cloud is not queried on
-        every calendar view render.
+        every calendar view render.  Expanded windows are memoised until the
+        schedule changes, since the calendar card re-requests the same range.
         """
         data = (
             _schedule_cache.get(self.coordinator.serial_number) or self._schedule_data
         )
         if not data:
             return []
-        return expand_schedule_to_calendar_events(
-            data,
-            start_date,
-            end_date,
-            device_name=self.coordinator.device_name,
-            local_tz=dt_util.get_default_time_zone(),
-        )
+        compiled = self._compiled_schedule(data)
+        local_tz = dt_util.get_default_time_zone()
+        window = (start_date, end_date, local_tz)
+        events = self._window_cache.get(window)
+        if events is None:
+            events = expand_compiled_schedule(compiled, start_date, end_date, local_tz)
+            if len(self._window_cache) >= _MAX_CACHED_WINDOWS:
+                self._window_cache.pop(next(iter(self._window_cache)))
+            self._window_cache[window] = events
+        return list(events)
@@ -429,9 +429,15 @@ class DysonClimateEntity(DysonEntity, ClimateEntity):  # type: ignore[misc]
                 )
                 return
 
-            # Update local state immediately for responsive UI
-            self._attr_hvac_mode = hvac_mode
-            self.async_write_ha_state()
+            # Confirm on the last key the mode change sends: intermediate
+            # states (fan on, heating not yet on) would otherwise reject it.
+            if hvac_mode == HVACMode.OFF:
+                keys: tuple[str, ...] = ("fpwr", "fmod")
+            elif "Heating" in device_capabilities:
+                keys = ("hmod",)
+            else:
+                keys = ("fpwr", "fmod")
+            self._async_set_optimistic(keys, hvac_mode=hvac_mode)
 
             _LOGGER.debug(
                 "Set HVAC mode to %s for %s", hvac_mode, self.coordinator.serial_number
@@ -471,9 +477,7 @@ class DysonClimateEntity(DysonEntity, ClimateEntity):  # type: ignore[misc]
             # Call the device method directly
             await self.coordinator.device.set_target_temperature(temperature)
 
-            # Update local state immediately for responsive UI
-            self._attr_target_temperature = temperature
-            self.async_write_ha_state()
+            self._async_set_optimistic(("hmax",), target_temperature=temperature)
 
             _LOGGER.debug(
                 "Set target temperature to %s°C for %s",
@@ -534,9 +538,7 @@ class DysonClimateEntity(DysonEntity, ClimateEntity):  # type: ignore[misc]
                 # Fallback to direct device control if humidifier entity not available
                 await self.coordinator.device.set_target_humidity(humidity)
 
-            # Update local state immediately for responsive UI
-            self._attr_target_humidity = int(humidity)
-            self.async_write_ha_state()
+            self._async_set_optimistic(("humt",), target_humidity=int(humidity))
 
             _LOGGER.debug(
                 "Set target humidity to %s%% for %s",
@@ -577,8 +579,7 @@ class DysonClimateEntity(DysonEntity, ClimateEntity):  # type: ignore[misc]
             enabled = fan_mode == FAN_FOCUS
             await self.coordinator.device.set_focus_mode(enabled)
 
-            self._attr_fan_mode = fan_mode
-            self.async_write_ha_state()
+            self._async_set_optimistic(("ffoc",), fan_mode=fan_mode)
 
             _LOGGER.debug(
                 "Set fan mode to %s for %s",
@@ -0,0 +1,235 @@
+"""Shared Dyson cloud API clients for the Dyson integration.
+
+Every cloud call (device discovery, firmware checks, robot maps, schedules,
+air-quality history...) used to build its own ``AsyncDysonClient`` and close
+it again, paying for a fresh HTTP session and TLS handshake each time. This
+module keeps one reference-counted client per Dyson account instead.
+
+Pooling Model:
+    - Clients are keyed by account: email, country, culture and auth token
+    - Long-lived holders (device and account coordinators) acquire a lease at
+      setup and release it on shutdown, keeping the client warm between calls
+    - Short-lived callers borrow through :meth:`DysonCloudClientPool.async_client`
+    - A client is closed as soon as its last lease is released
+
+Token Refresh:
+    The auth token is part of the key, so a re-authenticated config entry
+    resolves to a new client while callers still holding the old one finish
+    undisturbed. A client whose token the API rejects is retired from the
+    pool immediately so the next caller never reuses it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any, NamedTuple
+
+from homeassistant.core import HomeAssistant
+from libdyson_rest import AsyncDysonClient
+from libdyson_rest.exceptions import DysonAuthError
+
+from .const import DATA_CLOUD_CLIENT_POOL
+from .device_utils import mask_email
+
+_LOGGER = logging.getLogger(__name__)
+
+CloudClientFactory = Callable[[], Awaitable[AsyncDysonClient]]
+
+
+class CloudAccountKey(NamedTuple):
+    """Identity of a Dyson cloud account session."""
+
+    email: str | None
+    country: str
+    culture: str
+    auth_token: str | None
+
+    def __repr__(self) -> str:
+        """Return a representation safe for logs (no token, masked email)."""
+        return (
+            f"CloudAccountKey({mask_email(self.email) if self.email else None}, "
+            f"{self.country}, {self.culture}, "
+            f"token={'***' if self.auth_token else None})"
+        )
+
+
+class _PooledClient:
+    """A pooled client and the number of outstanding leases on it."""
+
+    __slots__ = ("client", "key", "leases")
+
+    def __init__(self, key: CloudAccountKey, client: AsyncDysonClient) -> None:
+        self.key = key
+        self.client = client
+        self.leases = 0
+
+
+class DysonCloudClientPool:
+    """Reference-counted ``AsyncDysonClient`` instances, one per account.
+
+    Example:
+        Borrowing a client for a single request:
+
+        >>> pool = get_cloud_client_pool(hass)
+        >>> async with pool.async_client(key, factory) as client:
+        >>>     devices = await client.get_devices()
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty pool."""
+        self._clients: dict[CloudAccountKey, _PooledClient] = {}
+        # Leases are tracked per client so retired clients can still be
+        # released (and closed) after a newer client replaced them.
+        self._leases: dict[int, _PooledClient] = {}
+        # One lock per account, so a slow login only holds up callers of
+        # the same account.
+        self._locks: dict[CloudAccountKey, asyncio.Lock] = {}
+
+    @property
+    def size(self) -> int:
+        """Return the number of open clients, including retired ones."""
+        return len(self._leases)
+
+    async def async_acquire(
+        self, key: CloudAccountKey, factory: CloudClientFactory
+    ) -> AsyncDysonClient:
+        """Return the client for *key*, creating it with *factory* if needed.
+
+        Every call must be paired with :meth:`async_release`.
+        """
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        async with lock:
+            pooled = self._clients.get(key)
+            if pooled is None:
+                pooled = _PooledClient(key, await factory())
+                self._clients[key] = pooled
+                self._leases[id(pooled.client)] = pooled
+                _LOGGER.debug("Opened pooled cloud client for %r", key)
+            pooled.leases += 1
+            return pooled.client
+
+    async def async_release(self, client: AsyncDysonClient) -> None:
+        """Release a lease taken by :meth:`async_acquire`.
+
+        The client is closed once its last lease is released.
+        """
+        pooled = self._leases.get(id(client))
+        if pooled is None or pooled.client is not client:
+            return
+        pooled.leases -= 1
+        if pooled.leases > 0:
+            return
+        del self._leases[id(client)]
+        if self._clients.get(pooled.key) is pooled:
+            del self._clients[pooled.key]
+        lock = self._locks.get(pooled.key)
+        if lock is not None and not lock.locked():
+            del self._locks[pooled.key]
+        await self._async_close(pooled)
+
+    def retire(self, client: AsyncDysonClient) -> None:
+        """Stop handing out *client*; it closes when its leases are released."""
+        pooled = self._leases.get(id(client))
+        if pooled is not None and self._clients.get(pooled.key) is pooled:
+            del self._clients[pooled.key]
+            _LOGGER.debug("Retired pooled cloud client for %r", pooled.key)
+
+    @asynccontextmanager
+    async def async_client(
+        self, key: CloudAccountKey, factory: CloudClientFactory
+    ) -> AsyncIterator[AsyncDysonClient]:
+        """Borrow the client for *key* for the duration of the block."""
+        client = await self.async_acquire(key, factory)
+        try:
+            yield client
+        except DysonAuthError:
+            # The token was rejected; make sure no later caller reuses it.
+            self.retire(client)
+            raise
+        finally:
+            await self.async_release(client)
+
+    async def async_shutdown(self) -> None:
+        """Close every client regardless of outstanding leases."""
+        pooled_clients = list(self._leases.values())
+        self._clients.clear()
+        self._leases.clear()
+        self._locks.clear()
+        for pooled in pooled_clients:
+            await self._async_close(pooled)
+
+    @staticmethod
+    async def _async_close(pooled: _PooledClient) -> None:
+        """Close a pooled client, logging rather than raising on failure."""
+        try:
+            await pooled.client.close()
+        except Exception as err:
+            _LOGGER.debug("Error closing cloud client for %r: %s", pooled.key, err)
+        else:
+            _LOGGER.debug("Closed pooled cloud client for %r", pooled.key)
+
+
+class CloudClientLease:
+    """A long-lived lease on a pooled client, held by a coordinator.
+
+    The lease follows the account key: when the key changes (for example
+    after re-authentication) the old client is released and a new one leased.
+    """
+
+    def __init__(self, pool: DysonCloudClientPool) -> None:
+        """Initialise an empty lease on *pool*."""
+        self._pool = pool
+        self._key: CloudAccountKey | None = None
+        self._client: AsyncDysonClient | None = None
+
+    @property
+    def pool(self) -> DysonCloudClientPool:
+        """Return the pool this lease draws from."""
+        return self._pool
+
+    async def async_get(
+        self, key: CloudAccountKey, factory: CloudClientFactory
+    ) -> AsyncDysonClient:
+        """Return the leased client for *key*, acquiring it if necessary."""
+        if self._client is not None and self._key == key:
+            return self._client
+        await self.async_release()
+        self._client = await self._pool.async_acquire(key, factory)
+        self._key = key
+        return self._client
+
+    async def async_release(self) -> None:
+        """Release the held client, if any."""
+        client, self._client, self._key = self._client, None, None
+        if client is not None:
+            await self._pool.async_release(client)
+
+
+def get_cloud_client_pool(hass: HomeAssistant | Any) -> DysonCloudClientPool:
+    """Return the integration-wide client pool, creating it on first use.
+
+    Hass stand-ins without a real ``data`` dict (tests, partially set-up
+    objects) get a private pool, which degrades to one client per call.
+    """
+    data = getattr(hass, "data", None)
+    if not isinstance(data, dict):
+        return DysonCloudClientPool()
+    pool = data.get(DATA_CLOUD_CLIENT_POOL)
+    if pool is None:
+        pool = data[DATA_CLOUD_CLIENT_POOL] = DysonCloudClientPool()
+    return pool
+
+
+async def async_shutdown_cloud_client_pool(hass: HomeAssistant) -> None:
+    """Close and drop the integration-wide client pool, if one exists."""
+    data = getattr(hass, "data", None)
+    if not isinstance(data, dict):
+        return
+    pool = data.pop(DATA_CLOUD_CLIENT_POOL, None)
+    if pool is not None:
+        await pool.async_shutdown()
@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
-import socket
 from typing import Any
 from urllib.parse import urlparse
 
@@ -36,8 +34,8 @@ from .const import (
     DEFAULT_POLL_FOR_DEVICES,
     DISCOVERY_CLOUD,
     DOMAIN,
-    MDNS_SERVICE_DYSON,
 )
+from .mdns import async_get_mdns_cache
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -172,8 +170,12 @@ def _get_device_connection_options(account_connection_type: str) -> dict[str, st
 
 async def _discover_device_via_mdns(
     hass, serial_number: str, timeout: int = 10
-) -> str | None:  # noqa: C901
-    """Discover Dyson device via mDNS using Home Assistant's shared zeroconf instance.
+) -> str | None:
+    """Discover Dyson device via the integration's shared mDNS cache.
+
+    Devices that have already announced themselves are answered from the
+    cache immediately; otherwise a single asynchronous query is made for
+    the device's service instance.
 
     Args:
         hass: Home Assistant instance
@@ -183,55 +185,16 @@ async def _discover_device_via_mdns(
     Returns:
         IP address if found, None otherwise
     """
-    from homeassistant.components import zeroconf
-
     from .device_utils import mask_serial
 
     try:
-        # Get Home Assistant's shared zeroconf instance
-        zeroconf_instance = await zeroconf.async_get_instance(hass)
-        if zeroconf_instance is None:
-            _LOGGER.warning("Unable to get shared zeroconf instance")
-            return None
-
-        def _find_device():
-            """Synchronous mDNS discovery function."""
-            try:
-                # Look for Dyson services
-                services = zeroconf_instance.get_service_info(
-                    MDNS_SERVICE_DYSON, f"{serial_number}.{MDNS_SERVICE_DYSON}"
-                )
-                if services and services.addresses:
-                    # Return the first available IP address
-                    return socket.inet_ntoa(services.addresses[0])
-
-                # Also try the common pattern {serial}.local
-                try:
-                    hostname = f"{serial_number}.local"
-                    ip = socket.gethostbyname(hostname)
-                    return ip
-                except socket.gaierror:
-                    pass
-
-            except Exception as e:
-                _LOGGER.debug(
-                    "mDNS discovery error for %s: %s", mask_serial(serial_number), e
-                )
-                return None
-
-        # Run discovery in executor to avoid blocking
-        try:
-            return await asyncio.wait_for(
-                asyncio.get_event_loop().run_in_executor(None, _find_device),
-                timeout=timeout,
-            )
-        except TimeoutError:
-            _LOGGER.debug(
-                "mDNS discovery timeout for device %s", mask_serial(serial_number)
-            )
+        mdns_cache = await async_get_mdns_cache(hass)
+        if mdns_cache is None:
+            _LOGGER.warning("Unable to start mDNS discovery via shared zeroconf")
             return None
+        return await mdns_cache.async_resolve(serial_number, timeout)
     except Exception as e:
-        _LOGGER.debug("Error getting zeroconf instance: %s", e)
+        _LOGGER.debug("mDNS discovery error for %s: %s", mask_serial(serial_number), e)
         return None
 
 
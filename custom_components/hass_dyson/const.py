@@ -11,6 +11,16 @@ AQIRange = tuple[float | int, float | int, int, int, str]
 # Integration domain
 DOMAIN: Final = "hass_dyson"
 
+# hass.data key for the shared, per-account cloud API client pool
+DATA_CLOUD_CLIENT_POOL: Final = f"{DOMAIN}_cloud_client_pool"
+# hass.data key for the persistent robot map / rendered image cache
+DATA_MAP_DISK_CACHE: Final = f"{DOMAIN}_map_disk_cache"
+# hass.data key for the shared mDNS device address cache
+DATA_MDNS_CACHE: Final = f"{DOMAIN}_mdns_cache"
+# hass.data key for the fleet-wide device startup orchestrator
+DATA_STARTUP: Final = f"{DOMAIN}_startup"
+DATA_STARTUP_CONCURRENCY: Final = f"{DOMAIN}_startup_concurrency"
+
 # Default values
 DEFAULT_CLOUD_POLLING_INTERVAL: Final = 60  # 1 minute in seconds
 # 1 minute for connectivity checks only (devices send natural STATE-CHANGE messages)
@@ -29,6 +39,7 @@ CONF_CAPABILITIES: Final = "capabilities"
 CONF_DISCOVERY_METHOD: Final = "discovery_method"
 CONF_CONNECTION_TYPE: Final = "connection_type"
 CONF_MQTT_PREFIX: Final = "mqtt_prefix"
+CONF_STARTUP_CONCURRENCY: Final = "startup_concurrency"
 
 # Cloud account configuration keys
 CONF_POLL_FOR_DEVICES: Final = "poll_for_devices"
@@ -211,6 +222,17 @@ MQTT_CMD_STATE_SET: Final = "STATE-SET"
 MQTT_MSG_CURRENT_STATE: Final = "CURRENT-STATE"
 MQTT_MSG_STATE_CHANGE: Final = "STATE-CHANGE"
 MQTT_MSG_ENVIRONMENTAL_DATA: Final = "ENVIRONMENTAL-CURRENT-SENSOR-DATA"
+MQTT_MSG_CURRENT_FAULTS: Final = "CURRENT-FAULTS"
+
+# Upper bounds for awaiting a device reply to a REQUEST-* command. Replies
+# normally land within ~250 ms; the timeouts only cap unresponsive devices.
+MQTT_RESPONSE_TIMEOUT: Final = 3.0  # seconds
+# ENVIRONMENTAL-CURRENT-SENSOR-DATA follows CURRENT-STATE unprompted on newer
+# firmware (~110 ms later); older firmware (e.g. TP04) never sends it.
+MQTT_ENVIRONMENTAL_FOLLOWUP_TIMEOUT: Final = 0.5  # seconds
+# STATE-SET payloads issued within this window of each other are merged into
+# one message; scenes and slider drags send several within a few ms.
+STATE_SET_COALESCE_WINDOW: Final = 0.05  # seconds
 
 # MQTT constants
 MQTT_MODE_REASON: Final = "RAPP"  # Remote App
@@ -20,24 +20,30 @@ Key Features:
 from __future__ import annotations
 
 import asyncio
+import functools
 import hashlib
 import logging
 import re
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 if TYPE_CHECKING:
     from .ble_device import DysonBLEDevice
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed  # noqa: F401
 from homeassistant.helpers import instance_id as ha_instance_id
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from libdyson_rest import AsyncDysonClient
 from libdyson_rest.exceptions import DysonAPIError, DysonAuthError, DysonConnectionError
 
+from .cloud_client import CloudAccountKey, CloudClientLease, get_cloud_client_pool
 from .const import (
     CONF_AUTO_ADD_DEVICES,
     CONF_COUNTRY,
@@ -60,13 +66,26 @@ from .const import (
     EVENT_DEVICE_FAULT,
     MQTT_CMD_REQUEST_CURRENT_STATE,
     MQTT_CMD_REQUEST_ENVIRONMENT,
+    MQTT_ENVIRONMENTAL_FOLLOWUP_TIMEOUT,
+    MQTT_MSG_ENVIRONMENTAL_DATA,
+    MQTT_RESPONSE_TIMEOUT,
     UnsupportedDeviceError,
 )
-from .device import DysonDevice
+from .device import DysonChangeSet, DysonDevice
 from .device_utils import mask_email, mask_serial
+from .instrumentation import (
+    COUNTER_LISTENER_UPDATES,
+    COUNTER_LISTENERS_SKIPPED,
+    METRIC_LISTENER_PREFIX,
+    METRIC_MESSAGE_UPDATE,
+    DysonHotPathMetrics,
+)
+from .mdns import async_get_mdns_cache, get_mdns_cache
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 # Compiled regex patterns for culture/language normalisation (module-level for efficiency).
 _CULTURE_PATTERN = re.compile(r"^[a-z]{2}-[A-Z]{2}$")
 _EXTENDED_CULTURE_PATTERN = re.compile(r"^([a-z]{2})-[A-Za-z]+-([A-Z]{2})$")
@@ -164,28 +183,62 @@ def _get_default_country_culture_for_coordinator(hass) -> tuple[str, str]:
 
 
 class TTLCache:
-    """Tiny in-process TTL cache keyed by string.
+    """Small in-process TTL cache keyed by string, bounded and LRU-evicting.
+
+    All entries share the same TTL; entries expire lazily on ``get()`` but stay
+    available to :meth:`get_stale` as a fallback until they are evicted.
 
-    All entries share the same TTL; entries expire lazily on ``get()``.
+    The cache holds at most *max_entries* entries and, when *max_bytes* is
+    given, at most that many bytes of ``bytes``-like values (rendered PNGs).
+    When a ``set()`` exceeds either bound, expired entries are dropped first
+    and then the least recently used fresh ones. Hit, miss, eviction and
+    expiry counts are kept for diagnostics (see :meth:`stats`).
     """
 
-    def __init__(self, ttl_seconds: int) -> None:
+    def __init__(
+        self,
+        ttl_seconds: int,
+        *,
+        max_entries: int = 128,
+        max_bytes: int | None = None,
+    ) -> None:
         """Initialise the cache with *ttl_seconds* time-to-live."""
         self._ttl = ttl_seconds
-        self._store: dict[str, tuple[float, Any]] = {}
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        # key -> (fresh-from timestamp, value), least recently used first
+        self._store: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        # key -> size in bytes for entries added by set()
+        self._sizes: dict[str, int] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        """Return the number of entries, fresh or stale."""
+        return len(self._store)
 
     def get(self, key: str) -> Any | None:
         """Return the cached value for *key*, or ``None`` if absent/expired."""
         cached = self._store.get(key)
-        if cached is None:
-            return None
-        if (time.monotonic() - cached[0]) >= self._ttl:
+        if cached is None or (time.monotonic() - cached[0]) >= self._ttl:
+            self.misses += 1
             return None
+        self.hits += 1
+        self._store.move_to_end(key)
         return cached[1]
 
     def set(self, key: str, value: Any) -> None:
         """Store *value* under *key*, resetting the TTL."""
-        self._store[key] = (time.monotonic(), value)
+        now = time.monotonic()
+        self._discard(key)
+        size = _cached_size(value)
+        self._store[key] = (now, value)
+        self._sizes[key] = size
+        self._bytes += size
+        self._evict(now)
 
     def expire(self, key: str) -> None:
         """Force *key* to miss on the next :meth:`get` without removing it.
@@ -204,16 +257,19 @@ class TTLCache:
     def get_stale(self, key: str) -> Any | None:
         """Return the cached value regardless of TTL (use only as a fallback)."""
         cached = self._store.get(key)
-        return cached[1] if cached else None
+        if cached is None:
+            return None
+        self._store.move_to_end(key)
+        return cached[1]
 
     def invalidate(self, key: str) -> None:
         """Remove *key* from the cache."""
-        self._store.pop(key, None)
+        self._discard(key)
 
     def invalidate_prefix(self, prefix: str) -> None:
         """Remove every key that starts with *prefix* from the cache."""
         for key in [k for k in self._store if k.startswith(prefix)]:
-            self._store.pop(key, None)
+            self._discard(key)
 
     def expire_prefix(self, prefix: str) -> None:
         """Expire every key that starts with *prefix* (see :meth:`expire`).
@@ -225,6 +281,123 @@ class TTLCache:
         for key in [k for k in self._store if k.startswith(prefix)]:
             self.expire(key)
 
+    def stats(self) -> dict[str, int]:
+        """Return size and hit/miss/eviction counters."""
+        return {
+            "entries": len(self._store),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _discard(self, key: str) -> None:
+        """Remove *key* and its bookkeeping, if present."""
+        self._store.pop(key, None)
+        self._bytes -= self._sizes.pop(key, 0)
+
+    def _over_entries(self) -> bool:
+        """Return True if the cache holds more than *max_entries* entries."""
+        return len(self._store) > self._max_entries
+
+    def _over_bytes(self) -> bool:
+        """Return True if the cache holds more than *max_bytes* bytes."""
+        return self._max_bytes is not None and self._bytes > self._max_bytes
+
+    def _evict(self, now: float) -> None:
+        """Drop entries until within both bounds, expired entries first."""
+        if not (self._over_entries() or self._over_bytes()):
+            return
+        expired = [
+            key
+            for key, (fresh_from, _) in self._store.items()
+            if now - fresh_from >= self._ttl
+        ]
+        for key in expired:
+            over_entries = self._over_entries()
+            if not (over_entries or self._over_bytes()):
+                return
+            # Under byte pressure alone, only entries with a size help.
+            if over_entries or self._sizes.get(key):
+                self._discard(key)
+                self.expirations += 1
+        while self._store and (self._over_entries() or self._over_bytes()):
+            self._discard(next(iter(self._store)))
+            self.evictions += 1
+
+
+def _cached_size(value: Any) -> int:
+    """Return the byte size counted against a cache's *max_bytes* budget."""
+    if isinstance(value, bytes | bytearray | memoryview):
+        return len(value)
+    return 0
+
+
+def coordinator_call_key(coordinator: Any, *args: Hashable) -> tuple:
+    """Return a :func:`single_flight` key of the device serial and arguments."""
+    return (coordinator.serial_number, *args)
+
+
+def single_flight(
+    key: Callable[..., Hashable],
+) -> Callable[[Callable[..., Awaitable[_T]]], Callable[..., Awaitable[_T]]]:
+    """Coalesce concurrent calls of an async function that share a key.
+
+    The first caller for a key starts the call as a task; callers arriving
+    while it is in flight await the same task instead of repeating the work,
+    and all of them receive its result or exception. *key* is called with
+    the function's arguments, e.g. ``lambda coordinator, clean_id:
+    (coordinator.serial_number, clean_id)``.
+
+    Cancelling one caller does not cancel the shared call for the others.
+    """
+
+    def decorator(
+        func: Callable[..., Awaitable[_T]],
+    ) -> Callable[..., Awaitable[_T]]:
+        in_flight: dict[Hashable, asyncio.Task[_T]] = {}
+
+        def _done(flight_key: Hashable, task: asyncio.Task[_T]) -> None:
+            if in_flight.get(flight_key) is task:
+                del in_flight[flight_key]
+            if not task.cancelled():
+                # Mark the exception retrieved even if every caller went away.
+                task.exception()
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> _T:
+            flight_key = key(*args, **kwargs)
+            task = in_flight.get(flight_key)
+            if task is None or task.get_loop() is not asyncio.get_running_loop():
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                in_flight[flight_key] = task
+                task.add_done_callback(functools.partial(_done, flight_key))
+            return await asyncio.shield(task)
+
+        wrapper.in_flight = in_flight  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+@dataclass(frozen=True)
+class DysonKeySubscription:
+    """State keys a coordinator listener reads.
+
+    Entities pass this as their coordinator context; delta updates whose
+    change set touches none of these keys skip the listener.
+    """
+
+    product_state: frozenset[str] = frozenset()
+    environmental: frozenset[str] = frozenset()
+
+    def matches(self, changes: DysonChangeSet) -> bool:
+        """Return True if *changes* touches any subscribed key."""
+        return changes.touches(
+            product_state=self.product_state, environmental=self.environmental
+        )
+
 
 class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator for managing individual Dyson device state and communication.
@@ -243,6 +416,10 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         firmware_auto_update_enabled: Whether auto-updates are enabled
         firmware_latest_version: Latest available firmware version
         firmware_update_in_progress: Whether update is currently running
+        change_set: Keys changed by the MQTT message being dispatched to
+            listeners; None outside a delta dispatch (i.e. a full refresh)
+        environmental_version: Counter bumped on every in-place update of
+            the environmental data, for caching values derived from it
 
     Example:
         Creating and using a device coordinator:
@@ -271,8 +448,24 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         Environmental data is streamed in real-time via MQTT callbacks,
         providing immediate updates to sensor entities.
+
+        Per-message updates hand listeners the device's retained state along
+        with the message's change set instead of re-reading the full state;
+        messages that change nothing do not notify listeners at all, and
+        listeners registered with a DysonKeySubscription context are only
+        called when the change set touches one of their keys. Change sets
+        that arrive faster than the event loop applies them are merged into
+        one update.
     """
 
+    # Bumped whenever environmental data is updated in place.
+    environmental_version = 0
+    # (environmental_version, environmental data, result) of the last AQI
+    # calculation, shared by the AQI sensors; see sensor._coordinator_aqi.
+    _aqi_cache: (
+        tuple[int, dict[str, Any], tuple[int | None, str | None, list[str]]] | None
+    ) = None
+
     def __init__(self, hass: HomeAssistant, config_entry) -> None:  # type: ignore
         """Initialize the coordinator."""
         self.config_entry = config_entry
@@ -293,6 +486,15 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._services_registered: bool = False
         self._firmware_latest_version: str | None = None
         self._firmware_update_in_progress: bool = False
+        # Keys changed by the update being dispatched; None for a full refresh
+        self.change_set: DysonChangeSet | None = None
+        # Change sets received on the MQTT thread but not yet applied on the loop
+        self._pending_change_set: DysonChangeSet | None = None
+        self._pending_change_set_lock = threading.Lock()
+        self._cloud_client_lease: CloudClientLease | None = None
+        # Removes the mDNS address listener registered for this device
+        self._unsub_mdns: Callable[[], None] | None = None
+        self._metrics = DysonHotPathMetrics()
 
         super().__init__(
             hass,
@@ -621,42 +823,25 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     err,
                 )
 
-    def _on_environmental_update(self) -> None:
-        """Handle environmental data update from device."""
-        _LOGGER.debug(
-            "Received environmental update notification for %s - updating sensors",
-            self.serial_number,
-        )
-
-        # Log current environmental data state for debugging
-        if self.device and hasattr(self.device, "_environmental_data"):
-            env_data = self.device.get_environmental_data()
-            _LOGGER.debug(
-                "Environmental data at callback time for %s: pm25=%s, pm10=%s",
-                self.serial_number,
-                env_data.get("pm25"),
-                env_data.get("pm10"),
-            )
-
-        # Schedule the async update using proper coordinator method to notify entities
-        self.hass.add_job(self._notify_ha_of_state_change)
+    @property
+    def metrics(self) -> DysonHotPathMetrics:
+        """Return this coordinator's hot-path counters and latency histograms.
 
-    async def _notify_ha_of_state_change(self) -> None:
-        """Notify Home Assistant framework of state changes via MQTT."""
-        try:
-            if self.device:
-                fresh_state = await self.device.get_state()
-                _LOGGER.debug(
-                    "Updated coordinator data via MQTT callback, notifying HA framework"
-                )
-                self.async_set_updated_data(fresh_state)
-            else:
-                _LOGGER.debug("No device available for coordinator data update")
-        except Exception as e:
-            _LOGGER.warning("Error updating coordinator data: %s", e)
+        Message updates are timed on paho's network thread; listener
+        fan-out, clean-map fetches and map renders on the event loop.
+        """
+        return self._metrics
 
     def _on_message_update(self, topic: str, data: dict[str, Any]) -> None:
         """Handle message updates from device for real-time state changes."""
+        started = time.perf_counter()
+        try:
+            self._dispatch_message_update(topic, data)
+        finally:
+            self.metrics.record(METRIC_MESSAGE_UPDATE, time.perf_counter() - started)
+
+    def _dispatch_message_update(self, topic: str, data: dict[str, Any]) -> None:
+        """Route a device message to the matching coordinator update."""
         _LOGGER.debug(
             "Received message update for %s on topic %s", self.serial_number, topic
         )
@@ -673,14 +858,14 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.debug(
                 "Processing STATE-CHANGE message for real-time entity updates"
             )
-            self._handle_state_change_message()
+            self._handle_state_change_message(self._message_change_set(message_type))
         elif message_type == "CURRENT-STATE":
             _LOGGER.debug(
                 "Processing CURRENT-STATE message for real-time entity updates"
             )
             # CURRENT-STATE messages should also trigger coordinator updates
             # This handles responses from REQUEST-CURRENT-STATE (like timer polling)
-            self._handle_state_change_message()
+            self._handle_state_change_message(self._message_change_set(message_type))
         elif message_type == "ENVIRONMENTAL-CURRENT-SENSOR-DATA":
             _LOGGER.debug(
                 "Processing ENVIRONMENTAL-CURRENT-SENSOR-DATA message for real-time entity updates"
@@ -694,7 +879,20 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             # CURRENT-FAULTS messages should trigger coordinator updates
             # This ensures binary sensors and other fault-dependent entities are notified
-            self._handle_state_change_message()
+            self._handle_state_change_message(self._message_change_set(message_type))
+
+    def _message_change_set(self, message_type: str) -> DysonChangeSet | None:
+        """Return the device's change set for the message being dispatched.
+
+        Message callbacks run synchronously inside the device's message
+        processing, so ``last_change_set`` still describes this message.
+        Returns None when the change set is unavailable or belongs to a
+        different message, which makes the update fall back to a full refresh.
+        """
+        changes = getattr(getattr(self, "device", None), "last_change_set", None)
+        if isinstance(changes, DysonChangeSet) and changes.message_type == message_type:
+            return changes
+        return None
 
     def _handle_environmental_message(self, data: dict[str, Any]) -> None:
         """Handle ENVIRONMENTAL-CURRENT-SENSOR-DATA message directly."""
@@ -717,11 +915,21 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
             # Update the environmental data in coordinator
             self.data["environmental-data"].update(env_data)
+            # Invalidates values derived from it, such as the shared AQI.
+            self.environmental_version += 1
+
+            changes = self._message_change_set(MQTT_MSG_ENVIRONMENTAL_DATA)
+            if changes is not None and not changes:
+                _LOGGER.debug(
+                    "Environmental data unchanged for %s, skipping listener update",
+                    self.serial_number,
+                )
+                return
 
             # Notify Home Assistant of the update with the fresh environmental data
             # This ensures entities see the latest environmental data immediately
             self.hass.loop.call_soon_threadsafe(
-                lambda: self.async_set_updated_data(self.data)
+                self._async_set_changed_data, self.data, changes
             )
 
         except Exception as e:
@@ -775,20 +983,121 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 e,
             )
 
-    def _handle_state_change_message(self) -> None:
-        """Handle STATE-CHANGE message updates."""
+    def _handle_state_change_message(
+        self, changes: DysonChangeSet | None = None
+    ) -> None:
+        """Handle STATE-CHANGE message updates.
+
+        Args:
+            changes: Keys changed by the message, or None if unknown (forces
+                a full state refresh).
+        """
         try:
             if self.device:
-                self._schedule_coordinator_data_update()
+                if changes is not None and not changes:
+                    _LOGGER.debug(
+                        "%s message for %s changed no state, skipping update",
+                        changes.message_type,
+                        self.serial_number,
+                    )
+                    return
+                self._schedule_coordinator_data_update(changes)
             else:
                 self._schedule_listener_update()
         except Exception as e:
             _LOGGER.warning("Error setting up STATE-CHANGE data update: %s", e)
             self._schedule_fallback_update()
 
-    def _schedule_coordinator_data_update(self) -> None:
-        """Schedule coordinator data update with fresh device state."""
-        self.hass.loop.call_soon_threadsafe(self._create_coordinator_update_task)
+    def _schedule_coordinator_data_update(
+        self, changes: DysonChangeSet | None = None
+    ) -> None:
+        """Schedule coordinator data update with the device's retained state.
+
+        With a change set the retained state is published directly from the
+        loop; without one a task re-reads the full device state. Change sets
+        arriving before the loop has applied the previous one are merged into
+        it, so a burst of messages costs a single listener fan-out.
+        """
+        if changes is None:
+            self.hass.loop.call_soon_threadsafe(self._create_coordinator_update_task)
+            return
+        with self._pending_change_set_lock:
+            pending = self._pending_change_set
+            self._pending_change_set = (
+                changes if pending is None else pending.merge(changes)
+            )
+        if pending is None:
+            self.hass.loop.call_soon_threadsafe(self._apply_pending_change_set)
+
+    def _apply_pending_change_set(self) -> None:
+        """Apply the change sets coalesced since the last dispatch (loop thread)."""
+        with self._pending_change_set_lock:
+            changes = self._pending_change_set
+            self._pending_change_set = None
+        if changes is not None:
+            self._apply_change_set(changes)
+
+    def _apply_change_set(self, changes: DysonChangeSet) -> None:
+        """Publish the device's retained state for a delta update (loop thread)."""
+        try:
+            if not self.device:
+                _LOGGER.warning("No device available for coordinator data update")
+                return
+            self._async_set_changed_data(self.device.state_data, changes)
+        except Exception as e:
+            _LOGGER.warning("Error applying %s change set: %s", changes.message_type, e)
+            self.async_update_listeners()
+
+    def _async_set_changed_data(
+        self, data: dict[str, Any], changes: DysonChangeSet | None
+    ) -> None:
+        """Set coordinator data and notify listeners of what changed (loop thread).
+
+        The change set is only published for the duration of the listener
+        dispatch, so later async_update_listeners() calls (connection state,
+        firmware status...) still reach every entity.
+        """
+        if not getattr(self, "last_update_success", True):
+            # Recovering from a failed refresh flips availability for every
+            # entity, not just those whose keys changed.
+            changes = None
+        self.change_set = changes
+        _LOGGER.debug(
+            "Delta update for %s: %s", self.serial_number, changes or "full refresh"
+        )
+        try:
+            self.async_set_updated_data(data)
+        finally:
+            self.change_set = None
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update registered listeners, skipping those the change set misses.
+
+        Listeners without a DysonKeySubscription context, and every listener
+        on a full refresh, are always called. Each call is timed per entity
+        class so slow state writes show up in the coordinator's metrics.
+        """
+        changes = self.change_set
+        metrics = self.metrics
+        for update_callback, context in list(self._listeners.values()):
+            if (
+                changes is not None
+                and isinstance(context, DysonKeySubscription)
+                and not context.matches(changes)
+            ):
+                metrics.increment(COUNTER_LISTENERS_SKIPPED)
+                continue
+            metrics.increment(COUNTER_LISTENER_UPDATES)
+            started = time.perf_counter()
+            try:
+                update_callback()
+            finally:
+                owner = getattr(update_callback, "__self__", update_callback)
+                metrics.record(
+                    METRIC_LISTENER_PREFIX + type(owner).__name__,
+                    time.perf_counter() - started,
+                )
 
     def _create_coordinator_update_task(self) -> None:
         """Create the async update task."""
@@ -825,8 +1134,8 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.warning("Failed to schedule fallback update: %s", fallback_e)
 
     def _notify_ha_via_loop(self) -> None:
-        """Notify HA from loop thread."""
-        self.hass.add_job(self._notify_ha_of_state_change)
+        """Notify listeners of the current data from the loop thread."""
+        self.async_update_listeners()
 
     @property
     def serial_number(self) -> str:
@@ -934,7 +1243,11 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         _LOGGER.debug("Setting up cloud device for %s", mask_serial(self.serial_number))
 
         try:
-            cloud_client = await self._authenticate_cloud_client()
+            # Keep the account's pooled client leased for the coordinator's
+            # lifetime so later firmware, map and schedule calls reuse it.
+            cloud_client = await self._get_cloud_client_lease().async_get(
+                self._cloud_account_key(), self._authenticate_cloud_client
+            )
             device_info = await self._find_cloud_device(cloud_client)
 
             # Check if device has MQTT support BEFORE extracting device info
@@ -975,13 +1288,50 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         except UnsupportedDeviceError:
             # Let UnsupportedDeviceError propagate unchanged for automatic removal
+            await self._release_cloud_client_lease()
             raise
         except Exception as err:
+            await self._release_cloud_client_lease()
             _LOGGER.error(
                 "Failed to set up cloud device %s: %s", self.serial_number, err
             )
             raise UpdateFailed(f"Cloud device setup failed: {err}") from err
 
+    def _cloud_account_key(self) -> CloudAccountKey:
+        """Return the pool key for this entry's cloud account."""
+        data = self.config_entry.data
+        auth_token = data.get("auth_token")
+        if auth_token:
+            country = data.get(CONF_COUNTRY, "US")
+            culture = data.get(CONF_CULTURE, "en-US")
+        else:
+            country, culture = _get_default_country_culture_for_coordinator(
+                getattr(self, "hass", None)
+            )
+        return CloudAccountKey(data.get("email"), country, culture, auth_token)
+
+    def _get_cloud_client_lease(self) -> CloudClientLease:
+        """Return this coordinator's lease on the shared cloud client pool."""
+        if self._cloud_client_lease is None:
+            self._cloud_client_lease = CloudClientLease(
+                get_cloud_client_pool(getattr(self, "hass", None))
+            )
+        return self._cloud_client_lease
+
+    async def _release_cloud_client_lease(self) -> None:
+        """Release the long-lived cloud client lease, if one is held."""
+        if self._cloud_client_lease is not None:
+            await self._cloud_client_lease.async_release()
+
+    @asynccontextmanager
+    async def _pooled_cloud_client(self):
+        """Borrow the account's pooled ``AsyncDysonClient`` for one block."""
+        pool = self._get_cloud_client_lease().pool
+        async with pool.async_client(
+            self._cloud_account_key(), self._authenticate_cloud_client
+        ) as client:
+            yield client
+
     async def _authenticate_cloud_client(self):
         """Authenticate and return a cloud client."""
         auth_token = self.config_entry.data.get("auth_token")
@@ -1070,9 +1420,10 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def async_cloud_client(self):
         """Async context manager yielding an authenticated ``AsyncDysonClient``.
 
-        Wraps :meth:`_authenticate_cloud_client` with proper close handling so
-        callers don't need to manage client lifecycle.  Yields ``None`` when no
-        ``auth_token`` is available so callers can fall back gracefully.
+        Borrows the account's client from the shared pool so callers don't
+        need to manage client lifecycle and consecutive calls reuse one HTTP
+        session.  Yields ``None`` when no ``auth_token`` is available so
+        callers can fall back gracefully.
 
         Example::
 
@@ -1089,11 +1440,8 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             yield None
             return
 
-        client = await self._authenticate_cloud_client()
-        try:
+        async with self._pooled_cloud_client() as client:
             yield client
-        finally:
-            await client.close()
 
     async def _find_cloud_device(self, cloud_client):
         """Find our device in the cloud device list."""
@@ -1592,6 +1940,9 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self, device_info, mqtt_credentials, cloud_credentials
     ) -> None:
         """Create and connect to cloud device."""
+        # Make sure the shared mDNS browser is running so announced addresses
+        # are available to _get_device_host and later reconnects.
+        await async_get_mdns_cache(self.hass)
         device_host = self._get_device_host(device_info)
         mqtt_prefix = self._get_mqtt_prefix(device_info)
         connection_type = self._get_effective_connection_type()
@@ -1674,10 +2025,38 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Now that device is connected, refine capabilities based on actual device state
         await self._refine_capabilities_from_device_state()
 
-        # Register for environmental update notifications
-        self.device.add_environmental_callback(self._on_environmental_update)
         # Register for message updates to get real-time state changes
         self.device.add_message_callback(self._on_message_update)
+        self._track_mdns_address()
+
+    def _track_mdns_address(self) -> None:
+        """Follow the device's mDNS announcements unless its host is pinned."""
+        if self.config_entry.data.get(CONF_HOSTNAME, "").strip():
+            return
+        mdns_cache = get_mdns_cache(self.hass)
+        if mdns_cache is None:
+            return
+        self._unsub_mdns = mdns_cache.async_add_listener(
+            self.serial_number, self._on_mdns_address
+        )
+
+    @callback
+    def _on_mdns_address(self, address: str) -> None:
+        """Point the device at a newly announced address, reconnecting if down."""
+        device = self.device
+        if device is None or device.host == address:
+            return
+        _LOGGER.info(
+            "Device %s announced a new local address %s (was %s)",
+            self.serial_number,
+            address,
+            device.host,
+        )
+        device.host = address
+        if not device.is_connected:
+            # The old address is gone; reconnect now instead of waiting for
+            # the next attempt against it to time out.
+            self.hass.async_create_task(device.connect(force=True))
 
     async def _async_setup_manual_device(self) -> None:
         """Set up device configured manually."""
@@ -1759,9 +2138,6 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self._device_capabilities,
             )
 
-            # Register for environmental update notifications
-            self.device.add_environmental_callback(self._on_environmental_update)
-
             # Register for message updates to get real-time state changes
             self.device.add_message_callback(self._on_message_update)
 
@@ -1832,11 +2208,14 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     # and a separate ENVIRONMENTAL-CURRENT-SENSOR-DATA message automatically.
                     # Older devices (e.g. TP04) embed environmental data in the CURRENT-STATE
                     # message itself but do NOT send the separate environmental message.
+                    # Register for the environmental message before publishing so an
+                    # immediate reply is not missed; send_command returns once
+                    # CURRENT-STATE has arrived (or MQTT_RESPONSE_TIMEOUT elapses).
+                    env_reply = self.device.expect_message(MQTT_MSG_ENVIRONMENTAL_DATA)
                     await self.device.send_command(MQTT_CMD_REQUEST_CURRENT_STATE)
-
-                    # Wait for CURRENT-STATE (and ENVIRONMENTAL-CURRENT-SENSOR-DATA if sent automatically)
-                    # Typical timing: CURRENT-STATE at ~140ms, ENVIRONMENTAL-CURRENT-SENSOR-DATA at ~250ms
-                    await asyncio.sleep(0.5)
+                    await self.device.async_wait_for_message(
+                        env_reply, MQTT_ENVIRONMENTAL_FOLLOWUP_TIMEOUT
+                    )
 
                     # Check whether _environmental_data was populated by an automatic
                     # ENVIRONMENTAL-CURRENT-SENSOR-DATA response.  If not, the device
@@ -1848,8 +2227,13 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                             "requesting explicitly (older device firmware)",
                             self.serial_number,
                         )
+                        env_reply = self.device.expect_message(
+                            MQTT_MSG_ENVIRONMENTAL_DATA
+                        )
                         await self.device.send_command(MQTT_CMD_REQUEST_ENVIRONMENT)
-                        await asyncio.sleep(0.5)
+                        await self.device.async_wait_for_message(
+                            env_reply, MQTT_RESPONSE_TIMEOUT
+                        )
 
                     _LOGGER.debug(
                         "Completed wait for initial state messages from %s",
@@ -1943,12 +2327,9 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return False
 
         try:
+            # The device answers with a STATE-CHANGE message, which reaches
+            # listeners through the MQTT delta path; no refresh is needed.
             await self.device.send_command(command, data)
-
-            # Request updated state after command
-            await asyncio.sleep(1)  # Give device time to process
-            await self.async_request_refresh()
-
             return True
 
         except Exception as err:
@@ -2001,10 +2382,7 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return False
 
         try:
-            # Create a temporary cloud client for the update check
-            cloud_client = await self._authenticate_cloud_client()
-
-            try:
+            async with self._pooled_cloud_client() as cloud_client:
                 # Use new libdyson-rest 0.7.0b1 async method
                 pending_release = await cloud_client.get_pending_release(
                     self.serial_number
@@ -2027,9 +2405,6 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         "No firmware update available for %s", self.serial_number
                     )
                     return False
-            finally:
-                # Ensure client is properly closed
-                await cloud_client.close()
 
         except (DysonAPIError, DysonAuthError, DysonConnectionError) as e:
             # Handle specific Dyson API errors
@@ -2084,10 +2459,7 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self._firmware_update_in_progress = True
             self.async_update_listeners()
 
-            # Authenticate cloud client
-            cloud_client = await self._authenticate_cloud_client()
-
-            try:
+            async with self._pooled_cloud_client() as cloud_client:
                 # Trigger firmware update using the new cloud API method
                 success = await cloud_client.trigger_firmware_update(self.serial_number)
 
@@ -2106,10 +2478,6 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     self.async_update_listeners()
                     return False
 
-            finally:
-                # Always close the cloud client
-                await cloud_client.close()
-
         except Exception as e:
             _LOGGER.error(
                 "Error installing firmware update for %s: %s", self.serial_number, e
@@ -2122,14 +2490,18 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Shutdown the coordinator and cleanup connections."""
         _LOGGER.debug("Shutting down coordinator for device %s", self.serial_number)
 
+        if self._unsub_mdns is not None:
+            self._unsub_mdns()
+            self._unsub_mdns = None
+
         if self.device:
-            # Remove environmental callback before disconnecting
-            self.device.remove_environmental_callback(self._on_environmental_update)
             # Remove message callback before disconnecting
             self.device.remove_message_callback(self._on_message_update)
             await self.device.disconnect()
             self.device = None
 
+        await self._release_cloud_client_lease()
+
     def _extract_capabilities(self, device_info: Any) -> list[str]:
         """Extract device capabilities from cloud device info."""
         capabilities: list[str] = []
@@ -2198,15 +2570,12 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return
 
         try:
-            # Request current state to ensure we have fresh data for capability detection
+            # Request current state to ensure we have fresh data for capability detection.
+            # send_command returns once the CURRENT-STATE reply has been merged into
+            # the device state (or MQTT_RESPONSE_TIMEOUT elapses), so no extra wait.
             try:
                 await self.device.send_command(MQTT_CMD_REQUEST_CURRENT_STATE)
                 _LOGGER.debug("Requested current state for capability refinement")
-
-                # Give device a moment to respond with current state
-                import asyncio
-
-                await asyncio.sleep(2)
             except Exception as cmd_err:
                 _LOGGER.warning(
                     "Failed to request current state for capability refinement: %s",
@@ -2341,7 +2710,8 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Priority order:
         1. User-provided static IP/hostname from config entry (bypasses mDNS)
         2. Hostname from device_info (cloud API)
-        3. Fall back to {serial}.local for mDNS resolution
+        3. Address last announced over mDNS (shared browser cache)
+        4. Fall back to {serial}.local for mDNS resolution
         """
         # Check if user provided a static IP/hostname in config entry
         configured_hostname = self.config_entry.data.get(CONF_HOSTNAME, "").strip()
@@ -2363,6 +2733,19 @@ class DysonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             return api_hostname
 
+        # Use the address the device last announced over mDNS, if known
+        mdns_cache = get_mdns_cache(self.hass)
+        mdns_address = (
+            mdns_cache.get_address(self.serial_number) if mdns_cache else None
+        )
+        if mdns_address:
+            _LOGGER.debug(
+                "Using mDNS-announced address for device %s: %s",
+                mask_serial(self.serial_number),
+                mdns_address,
+            )
+            return mdns_address
+
         # Fall back to mDNS resolution using {serial}.local
         fallback_hostname = f"{self.serial_number}.local"
         _LOGGER.debug(
@@ -2468,6 +2851,7 @@ class DysonCloudAccountCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def __init__(self, hass: HomeAssistant, config_entry) -> None:  # type: ignore
         """Initialize the cloud account coordinator."""
         self.config_entry = config_entry
+        self._cloud_client_lease: CloudClientLease | None = None
         self._email = config_entry.data.get("email")
         self._auth_token = config_entry.data.get("auth_token")
         self._country = config_entry.data.get(CONF_COUNTRY, "US")
@@ -2563,23 +2947,68 @@ class DysonCloudAccountCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self._culture,
         )
 
-        # Create client with auth token and country/culture for CN API support
-        async with AsyncDysonClient(
+        # The account's pooled client stays leased between polls
+        client = await self._get_cloud_client_lease().async_get(
+            self._cloud_account_key(), self._create_cloud_client
+        )
+        try:
+            # Get devices from cloud API
+            devices = await client.get_devices()
+        except DysonAuthError:
+            # Rejected token: drop the client so the next poll starts fresh
+            self._get_cloud_client_lease().pool.retire(client)
+            await self._release_cloud_client_lease()
+            raise
+
+        if not devices:
+            _LOGGER.debug(
+                "No devices found in cloud account %s", mask_email(self._email)
+            )
+            return []
+
+        return devices
+
+    def _cloud_account_key(self) -> CloudAccountKey:
+        """Return the pool key for this cloud account."""
+        return CloudAccountKey(
+            self._email, self._country, self._culture, self._auth_token
+        )
+
+    async def _create_cloud_client(self) -> AsyncDysonClient:
+        """Create a client with the account token and CN-aware country/culture."""
+        return AsyncDysonClient(
             email=self._email,
             auth_token=self._auth_token,
             country=self._country,
             culture=self._culture,
-        ) as client:
-            # Get devices from cloud API
-            devices = await client.get_devices()
+        )
 
-            if not devices:
-                _LOGGER.debug(
-                    "No devices found in cloud account %s", mask_email(self._email)
-                )
-                return []
+    def _get_cloud_client_lease(self) -> CloudClientLease:
+        """Return this coordinator's lease on the shared cloud client pool."""
+        if self._cloud_client_lease is None:
+            self._cloud_client_lease = CloudClientLease(
+                get_cloud_client_pool(getattr(self, "hass", None))
+            )
+        return self._cloud_client_lease
 
-            return devices
+    async def _release_cloud_client_lease(self) -> None:
+        """Release the long-lived cloud client lease, if one is held."""
+        if self._cloud_client_lease is not None:
+            await self._cloud_client_lease.async_release()
+
+    @asynccontextmanager
+    async def async_cloud_client(self):
+        """Borrow the account's pooled ``AsyncDysonClient`` for one block."""
+        pool = self._get_cloud_client_lease().pool
+        async with pool.async_client(
+            self._cloud_account_key(), self._create_cloud_client
+        ) as client:
+            yield client
+
+    async def async_shutdown(self) -> None:
+        """Release the pooled cloud client and shut down the coordinator."""
+        await self._release_cloud_client_lease()
+        await super().async_shutdown()
 
     def _build_device_list(self, devices):
         """Build device info list from cloud devices."""
@@ -2869,11 +3298,13 @@ class DysonBLEDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator for Dyson BLE-only lights (e.g. Lightcycle Morph CD06).
 
     Manages the BLE connection lifecycle via a dedicated named asyncio Task and
-    propagates state changes received on the Home Assistant event bus to all
-    subscribed entities using :meth:`async_set_updated_data`.
+    propagates state changes reported by its own lamp to all subscribed
+    entities using :meth:`async_set_updated_data`.
 
-    No MQTT is used.  State arrives via ``EVENT_BLE_STATE_CHANGE`` events fired
-    by :class:`.ble_device.DysonBLEDevice`.
+    No MQTT is used.  State arrives through a state callback registered on
+    :class:`.ble_device.DysonBLEDevice`, carrying only the changed fields, so
+    a coordinator never sees other lamps' updates.  ``EVENT_BLE_STATE_CHANGE``
+    bus events are still fired for automations.
 
     Attributes:
         serial_number: Dyson device serial number.
@@ -2892,7 +3323,6 @@ class DysonBLEDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.serial_number: str = config_entry.data[CONF_SERIAL_NUMBER]
         self.ble_device: DysonBLEDevice | None = None
         self._config_entry = config_entry
-        self._unsub_event: Any | None = None
         self._ble_task: asyncio.Task[None] | None = None
         self._stop_event = asyncio.Event()
 
@@ -2917,7 +3347,6 @@ class DysonBLEDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             BLE_CAPABILITY_PERSONAL_DAYLIGHT,
             CONF_BLE_MAC,
             CONF_LTK,
-            EVENT_BLE_STATE_CHANGE,
         )
 
         # Use the Dyson account UUID stored in the BLE config entry (set during LTK auto-fetch).
@@ -2963,12 +3392,8 @@ class DysonBLEDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             ),
         )
 
-        # Subscribe to BLE state change events
-        if self._unsub_event is not None:
-            self._unsub_event()
-        self._unsub_event = self.hass.bus.async_listen(
-            EVENT_BLE_STATE_CHANGE, self._handle_ble_event
-        )
+        # Subscribe to this lamp's state changes
+        self.ble_device.add_state_callback(self._handle_ble_state)
 
         _LOGGER.info(
             "BLE coordinator setup complete for %s "
@@ -2998,10 +3423,8 @@ class DysonBLEDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             except (asyncio.CancelledError, Exception):  # noqa: BLE001
                 pass
             self._ble_task = None
-        if self._unsub_event is not None:
-            self._unsub_event()
-            self._unsub_event = None
         if self.ble_device is not None:
+            self.ble_device.remove_state_callback(self._handle_ble_state)
             await self.ble_device.disconnect()
 
     async def _ble_lifecycle_task(self) -> None:
@@ -3081,17 +3504,14 @@ class DysonBLEDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             except asyncio.TimeoutError:
                 pass
 
-    async def _handle_ble_event(self, event: Any) -> None:
-        """Handle ``EVENT_BLE_STATE_CHANGE`` and push data to entities.
+    @callback
+    def _handle_ble_state(self, changes: dict[str, Any]) -> None:
+        """Merge this lamp's changed state fields and push them to entities.
 
         Args:
-            event: Home Assistant event with ``serial_number`` and state data.
+            changes: The :class:`.ble_device.BLELightState` fields that changed.
         """
-        data: dict[str, Any] = event.data
-        if data.get("serial_number") != self.serial_number:
-            return
-        state_dict = {k: v for k, v in data.items() if k != "serial_number"}
-        self.async_set_updated_data(state_dict)
+        self.async_set_updated_data({**(self.data or {}), **changes})
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Return current data (no-op; data arrives via events)."""
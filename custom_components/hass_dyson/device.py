@@ -36,12 +36,14 @@ import logging
 import socket
 import time
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
 from typing import Any
 
 import paho.mqtt.client as mqtt
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant
+from homeassistant.util.ssl import get_default_context
 
 from .const import (
     CONNECTION_STATUS_CLOUD,
@@ -52,14 +54,152 @@ from .const import (
     FAULT_TRANSLATIONS,
     LEGACY_FILTER_LIFE_MAX_HOURS,
     MQTT_CMD_REQUEST_ENVIRONMENT,
+    MQTT_MSG_CURRENT_FAULTS,
+    MQTT_MSG_CURRENT_STATE,
+    MQTT_RESPONSE_TIMEOUT,
     ROBOT_FAULT_SUBSYSTEMS,
     STATE_KEY_LEGACY_FILTER_LIFE,
+    STATE_SET_COALESCE_WINDOW,
     celsius_to_decikelvin,
 )
 from .device_utils import mask_serial, mask_token
+from .instrumentation import (
+    COUNTER_CALLBACK_ERRORS,
+    COUNTER_CALLBACKS,
+    COUNTER_EXECUTOR_JOBS,
+    COUNTER_MESSAGE_ERRORS,
+    METRIC_CALLBACKS,
+    METRIC_ON_MESSAGE,
+    DysonHotPathMetrics,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# publish() return codes meaning the message was not queued for sending.
+_PUBLISH_FAILURES = frozenset({mqtt.MQTT_ERR_NO_CONN, mqtt.MQTT_ERR_QUEUE_SIZE})
+
+# Envelope keys carried by every message; never part of a change set.
+_ENVELOPE_KEYS = frozenset(
+    {"msg", "time", "mode-reason", "state-reason", "product-state"}
+)
+
+
+@dataclass(frozen=True)
+class DysonChangeSet:
+    """Keys whose values changed as a result of one inbound MQTT message.
+
+    Attributes:
+        message_type: The ``msg`` field of the message that produced the change.
+        product_state: Changed ``product-state`` keys (e.g. ``fnsp``, ``hflr``).
+        environmental: Changed environmental sensor keys (e.g. ``pm25``, ``tact``).
+        faults: Changed fault codes across all CURRENT-FAULTS sections.
+        other: Changed top-level state keys (robot ``state``, ``zoneStatus``...).
+    """
+
+    message_type: str
+    product_state: frozenset[str] = frozenset()
+    environmental: frozenset[str] = frozenset()
+    faults: frozenset[str] = frozenset()
+    other: frozenset[str] = frozenset()
+
+    def __bool__(self) -> bool:
+        """Return True when the message changed at least one key."""
+        return bool(
+            self.product_state or self.environmental or self.faults or self.other
+        )
+
+    def touches(
+        self,
+        product_state: Iterable[str] = (),
+        environmental: Iterable[str] = (),
+        faults: Iterable[str] = (),
+        other: Iterable[str] = (),
+    ) -> bool:
+        """Return True if any of the given keys changed."""
+        return (
+            not self.product_state.isdisjoint(product_state)
+            or not self.environmental.isdisjoint(environmental)
+            or not self.faults.isdisjoint(faults)
+            or not self.other.isdisjoint(other)
+        )
+
+    def merge(self, other: DysonChangeSet) -> DysonChangeSet:
+        """Return the union of two change sets, typed by the later message."""
+        return DysonChangeSet(
+            other.message_type,
+            product_state=self.product_state | other.product_state,
+            environmental=self.environmental | other.environmental,
+            faults=self.faults | other.faults,
+            other=self.other | other.other,
+        )
+
+
+# CURRENT-FAULTS sections, in the order a code is looked up across them.
+_FAULT_SECTIONS = (
+    "product-errors",
+    "product-warnings",
+    "module-errors",
+    "module-warnings",
+)
+
+# Fault values that mean "no fault".
+FAULT_OK_VALUES = frozenset({"OK", "NONE", "PASS", "GOOD"})
+
+
+def fault_severity(fault_value: str) -> str:
+    """Return the severity of a fault value (Critical, Warning, Maintenance...)."""
+    value = fault_value.upper()
+    if value in ("FAIL", "STLL"):
+        return "Critical"
+    if value in ("WARN", "HIGH", "LOW", "WEAK"):
+        return "Warning"
+    if value in ("CHNG", "FULL", "WORN"):
+        return "Maintenance"
+    return "Unknown"
+
+
+@dataclass(frozen=True)
+class DysonFaultEntry:
+    """Current value of one fault code in the device's fault index.
+
+    Attributes:
+        value: Raw fault value reported by the device (``OK``, ``FAIL``...).
+        section: CURRENT-FAULTS section holding the code, or None for a
+            top-level code.
+        severity: Severity derived from the value (see :func:`fault_severity`).
+        version: Index version at which the entry last changed; equal
+            versions mean an unchanged entry.
+    """
+
+    value: str
+    section: str | None
+    severity: str
+    version: int
+
+
+def _changed_keys(old: dict[str, Any], new: dict[str, Any]) -> frozenset[str]:
+    """Return the keys of *new* whose values differ from those in *old*."""
+    return frozenset(key for key, value in new.items() if old.get(key) != value)
+
+
+@dataclass
+class _StateSetBatch:
+    """STATE-SET values waiting to be published as one message."""
+
+    data: dict[str, Any] = field(default_factory=dict)
+    waiters: list[asyncio.Future[None]] = field(default_factory=list)
+    timer: asyncio.TimerHandle | None = None
+
+    def resolve(self, err: BaseException | None = None) -> None:
+        """Complete every caller's future with the publish outcome."""
+        for future in self.waiters:
+            if future.done():
+                continue
+            if err is None:
+                future.set_result(None)
+            else:
+                future.set_exception(err)
+
 
 class DysonDevice:
     """Primary interface for Dyson device communication and control.
@@ -192,6 +332,12 @@ class DysonDevice:
         )
         self._intentional_disconnect = False  # Track intentional disconnections
         self._rst_during_handshake = False  # RST arrived before CONNACK (async path)
+        # Resolved by _on_connect/_on_disconnect while a connection is awaited
+        self._connection_waiter: asyncio.Future[bool] | None = None
+        self._handshake_started: float | None = None
+        self._last_connack_latency: float | None = None
+        # Last (credential, parsed) AWS IoT credential pair
+        self._cloud_credential_cache: tuple[str, dict[str, Any]] | None = None
         self._connect_lock = asyncio.Lock()
         self._reconnect_task: asyncio.Task | None = None
         self._local_connect_block_until = 0.0
@@ -205,7 +351,22 @@ class DysonDevice:
         self._state_data: dict[str, Any] = {}
         self._environmental_data: dict[str, Any] = {}
         self._faults_data: dict[str, Any] = {}  # Raw fault data from device
+        # Flat view of _faults_data (code -> entry), rebuilt per CURRENT-FAULTS
+        self._fault_index: dict[str, DysonFaultEntry] = {}
+        self._fault_index_version = 0
         self._message_callbacks: list[Callable[[str, dict[str, Any]], None]] = []
+        # Callers awaiting the next message of a given type (see expect_message)
+        self._pending_responses: dict[str, list[asyncio.Future[dict[str, Any]]]] = {}
+        # Keys changed by the most recently processed message
+        self._last_change_set: DysonChangeSet | None = None
+        self._metrics = DysonHotPathMetrics()
+
+        # STATE-SET values waiting for the coalescing window to close
+        self._state_set_batch: _StateSetBatch | None = None
+        # Last value queued per STATE-SET key
+        self._commanded_state: dict[str, Any] = {}
+        # Seconds the most recent publish() call took on the event loop
+        self._last_publish_latency: float | None = None
 
         # Power control capability detection
         self._fpwr_message_count = 0  # Track messages containing fpwr
@@ -214,9 +375,6 @@ class DysonDevice:
         self._power_control_type: str | None = (
             None  # "fpwr" or "fmod" or None (detecting)
         )
-        self._environmental_callbacks: list[
-            Callable[[], None]
-        ] = []  # Environmental update callbacks
 
         _LOGGER.debug(
             "Initialized environmental data as empty dict for %s",
@@ -559,7 +717,7 @@ class DysonDevice:
             sock.settimeout(5)  # 5 second timeout
 
             try:
-                await self.hass.async_add_executor_job(sock.connect, (host, port))
+                await self._async_add_executor_job(sock.connect, (host, port))
                 _LOGGER.debug(
                     "Network connectivity test successful for %s:%s", host, port
                 )
@@ -620,12 +778,10 @@ class DysonDevice:
                     # disconnect() first so the background thread stops its
                     # auto-reconnect loop promptly; loop_stop() then unblocks fast.
                     try:
-                        await self.hass.async_add_executor_job(
-                            self._mqtt_client.disconnect
-                        )
+                        await self._async_add_executor_job(self._mqtt_client.disconnect)
                     except Exception:
                         pass  # Socket may already be closed
-                    await self.hass.async_add_executor_job(self._mqtt_client.loop_stop)
+                    await self._async_add_executor_job(self._mqtt_client.loop_stop)
                 except Exception as stop_err:
                     _LOGGER.debug(
                         "Failed to stop previous MQTT loop for %s: %s",
@@ -679,15 +835,11 @@ class DysonDevice:
                 # but disconnect should still be attempted to flush the socket).
                 if self._mqtt_client is not None:
                     try:
-                        await self.hass.async_add_executor_job(
-                            self._mqtt_client.disconnect
-                        )
+                        await self._async_add_executor_job(self._mqtt_client.disconnect)
                     except Exception:
                         pass
                     try:
-                        await self.hass.async_add_executor_job(
-                            self._mqtt_client.loop_stop
-                        )
+                        await self._async_add_executor_job(self._mqtt_client.loop_stop)
                     except Exception:
                         pass
                     self._mqtt_client = None
@@ -738,8 +890,9 @@ class DysonDevice:
                 _LOGGER.debug("Attempting local MQTT connection to %s:%s", host, port)
 
                 rst_detected = False
+                self._handshake_started = time.monotonic()
                 try:
-                    result = await self.hass.async_add_executor_job(
+                    result = await self._async_add_executor_job(
                         mqtt_client.connect, host, port, 60
                     )
                 except ConnectionResetError as rst_err:
@@ -800,7 +953,7 @@ class DysonDevice:
 
                 if result == mqtt.CONNACK_ACCEPTED:
                     # Start the network loop in a thread.
-                    await self.hass.async_add_executor_job(mqtt_client.loop_start)
+                    await self._async_add_executor_job(mqtt_client.loop_start)
 
                     # Wait for connection to be established.
                     connection_success = await self._wait_for_connection("local")
@@ -815,14 +968,12 @@ class DysonDevice:
                         # seconds (capped to 3 s by reconnect_delay_set above).
                         try:
                             try:
-                                await self.hass.async_add_executor_job(
+                                await self._async_add_executor_job(
                                     mqtt_client.disconnect
                                 )
                             except Exception:
                                 pass  # Socket may already be closed by device
-                            await self.hass.async_add_executor_job(
-                                mqtt_client.loop_stop
-                            )
+                            await self._async_add_executor_job(mqtt_client.loop_stop)
                             self._mqtt_client = None
                             _LOGGER.debug(
                                 "Cleaned up failed local connection attempt for %s",
@@ -904,6 +1055,15 @@ class DysonDevice:
             self._record_local_connection_failure(type(err).__name__)
             return False
 
+    def _parse_cloud_credential(self, credential: str) -> dict[str, Any]:
+        """Return the parsed AWS IoT credential, reusing the last parse."""
+        cached = self._cloud_credential_cache
+        if cached is not None and cached[0] == credential:
+            return cached[1]
+        parsed = json.loads(credential)
+        self._cloud_credential_cache = (credential, parsed)
+        return parsed
+
     async def _attempt_cloud_connection(self, host: str, credential: str) -> bool:
         """Attempt AWS IoT WebSocket MQTT connection."""
         # Reset before each attempt so a stale True from a previous call cannot
@@ -918,12 +1078,10 @@ class DysonDevice:
                     # disconnect() first so the background thread stops its
                     # auto-reconnect loop promptly; loop_stop() then unblocks fast.
                     try:
-                        await self.hass.async_add_executor_job(
-                            self._mqtt_client.disconnect
-                        )
+                        await self._async_add_executor_job(self._mqtt_client.disconnect)
                     except Exception:
                         pass  # Socket may already be closed
-                    await self.hass.async_add_executor_job(self._mqtt_client.loop_stop)
+                    await self._async_add_executor_job(self._mqtt_client.loop_stop)
                 except Exception as stop_err:
                     _LOGGER.debug(
                         "Failed to stop previous MQTT loop for %s: %s",
@@ -934,7 +1092,7 @@ class DysonDevice:
 
             # Parse AWS IoT credentials from JSON string
             try:
-                cloud_credentials = json.loads(credential)
+                cloud_credentials = self._parse_cloud_credential(credential)
                 client_id = cloud_credentials.get("client_id", "")
                 custom_authorizer_name = cloud_credentials.get(
                     "custom_authorizer_name", ""
@@ -991,9 +1149,9 @@ class DysonDevice:
                 logger=None
             )  # Disable MQTT client logging to reduce noise
 
-            # Set up TLS for secure WebSocket connection
-            # Use executor to avoid blocking SSL operations in the event loop
-            await self.hass.async_add_executor_job(mqtt_client.tls_set)
+            # Set up TLS with Home Assistant's shared client context, which is
+            # built once at startup, so nothing blocks the loop here
+            mqtt_client.tls_set_context(get_default_context())
 
             # Set up WebSocket headers for AWS IoT Custom Authorizer
             # Following OpenDyson Go implementation: use HTTP headers instead of query parameters
@@ -1027,13 +1185,14 @@ class DysonDevice:
                 "Attempting AWS IoT WebSocket connection to %s:%s", host, port
             )
 
-            result = await self.hass.async_add_executor_job(
+            self._handshake_started = time.monotonic()
+            result = await self._async_add_executor_job(
                 mqtt_client.connect, host, port, 60
             )
 
             if result == mqtt.CONNACK_ACCEPTED:
                 # Start the network loop in a thread
-                await self.hass.async_add_executor_job(mqtt_client.loop_start)
+                await self._async_add_executor_job(mqtt_client.loop_start)
 
                 # Wait for connection to be established
                 connection_success = await self._wait_for_connection("cloud")
@@ -1043,12 +1202,10 @@ class DysonDevice:
                     # Call disconnect() first (see local cleanup comments).
                     try:
                         try:
-                            await self.hass.async_add_executor_job(
-                                mqtt_client.disconnect
-                            )
+                            await self._async_add_executor_job(mqtt_client.disconnect)
                         except Exception:
                             pass  # Socket may already be closed
-                        await self.hass.async_add_executor_job(mqtt_client.loop_stop)
+                        await self._async_add_executor_job(mqtt_client.loop_stop)
                         self._mqtt_client = None
                         _LOGGER.debug(
                             "Cleaned up failed cloud connection attempt for %s",
@@ -1072,47 +1229,86 @@ class DysonDevice:
             _LOGGER.error("AWS IoT connection failed: %s", err)
             return False
 
+    @property
+    def last_connack_latency(self) -> float | None:
+        """Return how long the most recent handshake took to CONNACK, in seconds."""
+        return self._last_connack_latency
+
     async def _wait_for_connection(self, conn_type: str) -> bool:
-        """Wait for MQTT connection to be established."""
+        """Wait for MQTT connection to be established.
+
+        ``_on_connect`` and ``_on_disconnect`` resolve the waiter from paho's
+        network thread, so this wakes as soon as the broker answers (CONNACK)
+        or resets the handshake instead of polling for either.
+        """
         connection_timeout = 5  # Reduced to 5 seconds timeout for faster failover
-        check_interval = 0.1  # Check every 100ms
-        elapsed_time = 0.0
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        waiter: asyncio.Future[bool] = loop.create_future()
+        self._connection_waiter = waiter
 
-        while elapsed_time < connection_timeout:
-            if self._connected:
-                _LOGGER.info(
-                    "Successfully connected to device %s via %s after %.1f seconds",
-                    self._log_serial,
-                    conn_type,
-                    elapsed_time,
-                )
-                return True
+        # The network loop is already running, so the callbacks may have fired
+        # before the waiter existed; their flags are set before they hand off.
+        if self._connected:
+            waiter.set_result(True)
+        elif self._rst_during_handshake:
+            waiter.set_result(False)
 
-            # Broker RST'd the handshake asynchronously — no point waiting out the
-            # full timeout; the retry loop will handle it.  Returning early (within
-            # one polling interval, ~100 ms) ensures we reach loop_stop() before
-            # paho's 1-second min reconnect delay fires, so we see only one RST
-            # per attempt instead of multiple paho auto-reconnect attempts.
-            if self._rst_during_handshake:
-                _LOGGER.debug(
-                    "RST detected during handshake for %s via %s after %.1f seconds — aborting connection wait",
-                    self._log_serial,
-                    conn_type,
-                    elapsed_time,
-                )
-                return False
+        try:
+            connected = await asyncio.wait_for(waiter, connection_timeout)
+        except TimeoutError:
+            _LOGGER.debug(
+                "Connection timeout for device %s via %s after %.1f seconds",
+                self._log_serial,
+                conn_type,
+                loop.time() - started,
+            )
+            return False
+        finally:
+            self._handshake_started = None
+            if self._connection_waiter is waiter:
+                self._connection_waiter = None
 
-            await asyncio.sleep(check_interval)
-            elapsed_time += check_interval
+        elapsed_time = loop.time() - started
+        if connected:
+            _LOGGER.info(
+                "Successfully connected to device %s via %s after %.1f seconds",
+                self._log_serial,
+                conn_type,
+                elapsed_time,
+            )
+            return True
 
+        # Broker RST'd or refused the handshake — no point waiting out the full
+        # timeout; the retry loop will handle it.  Returning at once ensures we
+        # reach loop_stop() before paho's 1-second min reconnect delay fires, so
+        # we see only one RST per attempt instead of multiple paho
+        # auto-reconnect attempts.
         _LOGGER.debug(
-            "Connection timeout for device %s via %s after %.1f seconds",
+            "Handshake for %s via %s ended without a connection after %.1f seconds — aborting connection wait",
             self._log_serial,
             conn_type,
             elapsed_time,
         )
         return False
 
+    def _wake_connection_waiter(self, connected: bool) -> None:
+        """Hand a handshake outcome to a pending wait (paho network thread).
+
+        Skips the loop hop when nothing waits, e.g. for paho's own
+        reconnects; a wait that starts later reads the flags set before this.
+        """
+        if self._connection_waiter is not None:
+            self.hass.loop.call_soon_threadsafe(
+                self._resolve_connection_waiter, connected
+            )
+
+    def _resolve_connection_waiter(self, connected: bool) -> None:
+        """Wake a pending ``_wait_for_connection``; runs on the event loop."""
+        waiter = self._connection_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(connected)
+
     def _cancel_reconnect_task(self) -> None:
         """Cancel any queued automatic reconnect attempt."""
         if self._reconnect_task and not self._reconnect_task.done():
@@ -1204,10 +1400,10 @@ class DysonDevice:
                 # disconnect() first so paho does not keep its loop thread alive
                 # in an auto-reconnect sleep before loop_stop() can terminate it.
                 try:
-                    await self.hass.async_add_executor_job(self._mqtt_client.disconnect)
+                    await self._async_add_executor_job(self._mqtt_client.disconnect)
                 except Exception:
                     pass  # Socket may already be closed
-                await self.hass.async_add_executor_job(self._mqtt_client.loop_stop)
+                await self._async_add_executor_job(self._mqtt_client.loop_stop)
                 self._mqtt_client = None
                 self._connected = False
                 self._current_connection_type = CONNECTION_STATUS_DISCONNECTED
@@ -1344,6 +1540,15 @@ class DysonDevice:
         if rc == mqtt.CONNACK_ACCEPTED:
             _LOGGER.info("MQTT connected to device %s", mask_serial(self.serial_number))
             self._connected = True
+            if self._handshake_started is not None:
+                self._last_connack_latency = time.monotonic() - self._handshake_started
+                self._handshake_started = None
+                _LOGGER.debug(
+                    "CONNACK from %s after %.1f ms",
+                    self._log_serial,
+                    self._last_connack_latency * 1000,
+                )
+            self._wake_connection_waiter(True)
             self._had_stable_connection = (
                 True  # Mark that we've had a successful connection
             )
@@ -1381,6 +1586,7 @@ class DysonDevice:
                 self._log_serial,
                 rc,
             )
+            self._wake_connection_waiter(False)
 
     def _on_disconnect(
         self,
@@ -1433,6 +1639,7 @@ class DysonDevice:
             )
             if is_rst:
                 self._rst_during_handshake = True
+                self._wake_connection_waiter(False)
 
         self._connected = False
         self._current_connection_type = CONNECTION_STATUS_DISCONNECTED
@@ -1471,6 +1678,7 @@ class DysonDevice:
         self, client: mqtt.Client, userdata: Any, message: mqtt.MQTTMessage
     ) -> None:
         """Handle MQTT message callback."""
+        started = time.perf_counter()
         try:
             topic = message.topic
             payload: str | bytes = message.payload
@@ -1494,32 +1702,38 @@ class DysonDevice:
             self._process_message_data(data, topic)
 
         except Exception as err:
+            self.metrics.increment(COUNTER_MESSAGE_ERRORS)
             _LOGGER.error(
                 "Error handling MQTT message for %s: %s", self._log_serial, err
             )
+        finally:
+            self.metrics.record(METRIC_ON_MESSAGE, time.perf_counter() - started)
 
     def _process_message_data(self, data: dict[str, Any], topic: str) -> None:
         """Process parsed message data by type."""
         message_type = data.get("msg", "")
+        self.metrics.count_message(message_type)
         _LOGGER.debug(
             "Processing message type '%s' for device %s",
             message_type,
             self._log_serial,
         )
 
+        changes = DysonChangeSet(message_type)
+
         # Handle different message types based on our successful test
         if message_type == "CURRENT-STATE":
             _LOGGER.debug("Processing CURRENT-STATE message for %s", self._log_serial)
-            self._handle_current_state(data, topic)
+            changes = self._handle_current_state(data, topic)
         elif message_type == "ENVIRONMENTAL-CURRENT-SENSOR-DATA":
             _LOGGER.debug(
                 "Processing ENVIRONMENTAL-CURRENT-SENSOR-DATA message for %s",
                 self._log_serial,
             )
-            self._handle_environmental_data(data)
+            changes = self._handle_environmental_data(data)
         elif message_type == "CURRENT-FAULTS":
             _LOGGER.debug("Processing CURRENT-FAULTS message for %s", self._log_serial)
-            self._handle_faults_data(data)
+            changes = self._handle_faults_data(data)
         elif message_type == "STATE-CHANGE":
             _LOGGER.debug("Processing STATE-CHANGE message for %s", self._log_serial)
 
@@ -1551,7 +1765,7 @@ class DysonDevice:
                         self._total_state_messages,
                     )
 
-            self._handle_state_change(data)
+            changes = self._handle_state_change(data)
         elif message_type == "PERSISTENT-MAP-MANIFEST-UPDATED":
             # Robot announcement that its persistent-map manifest changed
             # (zone edits in the MyDyson app, or its own post-clean map
@@ -1566,11 +1780,21 @@ class DysonDevice:
                 data,
             )
 
-        # Notify callbacks
+        # Published before callbacks run so they can read it synchronously.
+        self._last_change_set = changes
+
+        if message_type in self._pending_responses:
+            # Paho delivers messages on its network thread; futures belong to
+            # the event loop and must be resolved there.
+            self.hass.loop.call_soon_threadsafe(
+                self._resolve_pending_responses, message_type, data
+            )
+
+        # Every message, whatever its type, is dispatched exactly once.
         self._notify_callbacks(topic, data)
 
-    def _handle_current_state(self, data: dict[str, Any], topic: str) -> None:
-        """Handle current state message."""
+    def _handle_current_state(self, data: dict[str, Any], topic: str) -> DysonChangeSet:
+        """Handle current state message and return the keys it changed."""
         _LOGGER.debug("Received current state data for %s: %s", self._log_serial, data)
 
         # Check specifically for filter data
@@ -1585,18 +1809,36 @@ class DysonDevice:
                 if value is not None:
                     _LOGGER.debug("Filter field %s: %s", field, value)
 
+        # CURRENT-STATE is a full snapshot: diff it against the retained state
+        # before merging so listeners only hear about keys that moved.
+        previous_product_state = self._state_data.get("product-state") or {}
+        changed_product_state = _changed_keys(previous_product_state, product_state)
+        if product_state:
+            changed_product_state |= previous_product_state.keys() - product_state
+        changed_other = {
+            key
+            for key, value in data.items()
+            if key not in _ENVELOPE_KEYS and self._state_data.get(key) != value
+        }
+
         # For CURRENT-STATE messages, values are already strings - store directly
         self._state_data.update(data)
         _LOGGER.debug("Updated device state for %s", self._log_serial)
 
-        self._reconcile_robot_faults(data.get("activeFaults"))
+        if self._reconcile_robot_faults(data.get("activeFaults")):
+            changed_other.add("faults")
         self._update_robot_session(data.get("state") or data.get("newstate"))
 
-        # Notify callbacks (including coordinator)
-        self._notify_callbacks(topic, data)
+        changes = DysonChangeSet(
+            "CURRENT-STATE",
+            product_state=frozenset(changed_product_state),
+            other=frozenset(changed_other),
+        )
+        # Callbacks are notified once by _process_message_data.
+        return changes
 
-    def _handle_environmental_data(self, data: dict[str, Any]) -> None:
-        """Handle environmental sensor data message."""
+    def _handle_environmental_data(self, data: dict[str, Any]) -> DysonChangeSet:
+        """Handle environmental sensor data message and return the keys it changed."""
         env_data = data.get("data", {})
         _LOGGER.debug(
             "Processing environmental data for %s: received_keys=%s",
@@ -1638,60 +1880,20 @@ class DysonDevice:
                 env_data["hcho"],
             )
 
-        # Store previous environmental data for comparison
-        previous_pm25 = self._environmental_data.get("pm25")
-        previous_pm10 = self._environmental_data.get("pm10")
+        # Environmental sensors are updated through the message's change set,
+        # dispatched once with every other message type.
+        changed_environmental = _changed_keys(self._environmental_data, env_data)
 
         self._environmental_data.update(env_data)
         _LOGGER.debug(
-            "Updated environmental data for %s: keys=%s",
+            "Updated environmental data for %s: changed keys=%s",
             self._log_serial,
-            list(env_data.keys()),
+            sorted(changed_environmental),
         )
-        _LOGGER.debug(
-            "Environmental data state before callback for %s: pm25=%s->%s, pm10=%s->%s",
-            self._log_serial,
-            previous_pm25,
-            env_data.get("pm25"),
-            previous_pm10,
-            env_data.get("pm10"),
-        )
-
-        # Only trigger update if PM data actually changed to avoid unnecessary updates
-        pm25_changed = previous_pm25 != env_data.get("pm25")
-        pm10_changed = previous_pm10 != env_data.get("pm10")
 
-        if pm25_changed or pm10_changed:
-            _LOGGER.debug(
-                "PM data changed for %s, triggering environmental update",
-                self._log_serial,
-            )
-            # Trigger immediate environmental sensor batch update
-            self._trigger_environmental_update()
-        else:
-            _LOGGER.debug(
-                "PM data unchanged for %s, skipping environmental update",
-                self._log_serial,
-            )
-
-    def _trigger_environmental_update(self) -> None:
-        """Trigger immediate update of all environmental sensors."""
-        # Notify environmental update callbacks
-        for callback in self._environmental_callbacks:
-            try:
-                callback()
-            except Exception as err:
-                _LOGGER.error("Error in environmental update callback: %s", err)
-
-    def add_environmental_callback(self, callback: Callable[[], None]) -> None:
-        """Add a callback to be notified of environmental data updates."""
-        if callback not in self._environmental_callbacks:
-            self._environmental_callbacks.append(callback)
-
-    def remove_environmental_callback(self, callback: Callable[[], None]) -> None:
-        """Remove an environmental update callback."""
-        if callback in self._environmental_callbacks:
-            self._environmental_callbacks.remove(callback)
+        return DysonChangeSet(
+            "ENVIRONMENTAL-CURRENT-SENSOR-DATA", environmental=changed_environmental
+        )
 
     def add_message_callback(
         self, callback: Callable[[str, dict[str, Any]], None]
@@ -1707,8 +1909,12 @@ class DysonDevice:
         if callback in self._message_callbacks:
             self._message_callbacks.remove(callback)
 
-    def _handle_faults_data(self, data: dict[str, Any]) -> None:
-        """Handle faults data message and create Home Assistant events for device faults."""
+    def _handle_faults_data(self, data: dict[str, Any]) -> DysonChangeSet:
+        """Handle faults data message and create Home Assistant events for device faults.
+
+        Returns the fault codes whose values changed, across every section
+        (``product-errors``, ``module-warnings``...) and top-level codes.
+        """
         fault_data = data.get("data", {})
 
         # Check if there are any faults reported
@@ -1740,11 +1946,68 @@ class DysonDevice:
         else:
             _LOGGER.debug("No faults reported for %s", self._log_serial)
 
+        changed_faults: set[str] = set()
+        for key, value in data.items():
+            if key in _ENVELOPE_KEYS:
+                continue
+            previous = self._faults_data.get(key)
+            if isinstance(value, dict):
+                previous_section = previous if isinstance(previous, dict) else {}
+                changed_faults |= _changed_keys(previous_section, value)
+                changed_faults |= previous_section.keys() - value.keys()
+            elif previous != value:
+                changed_faults.add(key)
+
         self._faults_data.update(data)
+        self._rebuild_fault_index()
         _LOGGER.debug("Updated faults data for %s", self._log_serial)
 
-    def _handle_state_change(self, data: dict[str, Any]) -> None:
-        """Handle state change message."""
+        return DysonChangeSet("CURRENT-FAULTS", faults=frozenset(changed_faults))
+
+    def _rebuild_fault_index(self) -> None:
+        """Flatten the retained fault data into the code -> entry index.
+
+        Entries whose value and section are unchanged are carried over, so
+        their version only moves when the code's reading does.
+        """
+        self._fault_index_version += 1
+        version = self._fault_index_version
+        previous = self._fault_index
+        index: dict[str, DysonFaultEntry] = {}
+
+        def add(code: str, value: Any, section: str | None) -> None:
+            if code in index:
+                return
+            value = str(value)
+            entry = previous.get(code)
+            if entry is None or entry.value != value or entry.section != section:
+                entry = DysonFaultEntry(value, section, fault_severity(value), version)
+            index[code] = entry
+
+        faults = self._faults_data if isinstance(self._faults_data, dict) else {}
+        for section_name in _FAULT_SECTIONS:
+            section = faults.get(section_name)
+            if isinstance(section, dict):
+                for code, value in section.items():
+                    add(code, value, section_name)
+        for code, value in faults.items():
+            if code not in _ENVELOPE_KEYS and not isinstance(value, dict | list):
+                add(code, value, None)
+
+        self._fault_index = index
+
+    @property
+    def fault_index(self) -> dict[str, DysonFaultEntry]:
+        """Return the current fault entry of every reported fault code.
+
+        A code reported in several sections resolves to the first of
+        ``product-errors``, ``product-warnings``, ``module-errors`` and
+        ``module-warnings``; top-level codes come last.
+        """
+        return self._fault_index
+
+    def _handle_state_change(self, data: dict[str, Any]) -> DysonChangeSet:
+        """Handle state change message and return the keys it changed."""
         _LOGGER.debug("Received state change data for %s: %s", self._log_serial, data)
 
         product_state = data.get("product-state", {})
@@ -1783,7 +2046,18 @@ class DysonDevice:
 
         if "product-state" not in self._state_data:
             self._state_data["product-state"] = {}
+        changed_product_state = _changed_keys(
+            self._state_data["product-state"], normalized_product_state
+        )
         self._state_data["product-state"].update(normalized_product_state)
+        # Top-level robot keys are diffed against a snapshot taken before the
+        # merge below (which may also drop traverseTargetId or adopt the
+        # programme's persistentMapId).
+        previous_other = {
+            key: self._state_data.get(key)
+            for key in (data.keys() - _ENVELOPE_KEYS)
+            | {"traverseTargetId", "persistentMapId"}
+        }
 
         # Robot vacuums report the active persistent map and per-zone
         # progress at the top level of state messages during cleans; retain
@@ -1814,11 +2088,26 @@ class DysonDevice:
             self._state_data["cleaningProgramme"] = programme
             if programme.get("persistentMapId"):
                 self._state_data["persistentMapId"] = programme["persistentMapId"]
-        self._clear_robot_faults(data.get("oldActiveFaults"))
+        # Transition keys that are not retained (newstate, oldstate...) are
+        # events in their own right and always count as changed.
+        changed_other = {
+            key
+            for key, value in previous_other.items()
+            if self._state_data.get(key) != value
+            or (key in data and key not in self._state_data)
+        }
+        if self._clear_robot_faults(data.get("oldActiveFaults")):
+            changed_other.add("faults")
         self._update_robot_session(data.get("newstate") or data.get("state"))
         _LOGGER.debug("State change for %s", self._log_serial)
 
-    def _reconcile_robot_faults(self, active_faults: Any) -> None:
+        return DysonChangeSet(
+            "STATE-CHANGE",
+            product_state=changed_product_state,
+            other=frozenset(changed_other),
+        )
+
+    def _reconcile_robot_faults(self, active_faults: Any) -> bool:
         """Apply an ``activeFaults`` snapshot to the retained ``faults`` dict.
 
         The per-subsystem ``faults`` dict only rides fault-transition
@@ -1830,13 +2119,16 @@ class DysonDevice:
         active and no ``faults`` dict has been seen yet (e.g. after a
         restart), seed one so the fault sensors can report "off" instead
         of sitting unknown until the next fault transition.
+
+        Returns True if the retained ``faults`` dict was modified.
         """
         if not isinstance(active_faults, list):
-            return
+            return False
         active_codes = {
             entry.get("faultCode") for entry in active_faults if isinstance(entry, dict)
         }
         faults = self._state_data.get("faults")
+        modified = False
         if isinstance(faults, dict):
             for subsystem, entry in faults.items():
                 if (
@@ -1845,23 +2137,30 @@ class DysonDevice:
                     and entry.get("description") not in active_codes
                 ):
                     faults[subsystem] = {"active": False}
+                    modified = True
         elif not active_codes:
             self._state_data["faults"] = {
                 subsystem: {"active": False} for subsystem in ROBOT_FAULT_SUBSYSTEMS
             }
+            modified = True
+        return modified
+
+    def _clear_robot_faults(self, old_active_faults: Any) -> bool:
+        """Deactivate retained subsystem faults named in ``oldActiveFaults``.
 
-    def _clear_robot_faults(self, old_active_faults: Any) -> None:
-        """Deactivate retained subsystem faults named in ``oldActiveFaults``."""
+        Returns True if any retained subsystem fault was cleared.
+        """
         if not isinstance(old_active_faults, list) or not old_active_faults:
-            return
+            return False
         faults = self._state_data.get("faults")
         if not isinstance(faults, dict):
-            return
+            return False
         cleared_codes = {
             entry.get("faultCode")
             for entry in old_active_faults
             if isinstance(entry, dict)
         }
+        modified = False
         for subsystem, entry in faults.items():
             if (
                 isinstance(entry, dict)
@@ -1869,6 +2168,8 @@ class DysonDevice:
                 and entry.get("description") in cleared_codes
             ):
                 faults[subsystem] = {"active": False}
+                modified = True
+        return modified
 
     # Robot states that end a clean/mapping session even though they carry
     # an active-looking prefix. FINISHED means the robot is back on (or at)
@@ -1912,17 +2213,218 @@ class DysonDevice:
 
     def _notify_callbacks(self, topic: str, data: dict[str, Any]) -> None:
         """Notify registered callbacks of new message."""
+        metrics = self.metrics
+        started = time.perf_counter()
         for msg_callback in self._message_callbacks:
+            metrics.increment(COUNTER_CALLBACKS)
             try:
                 msg_callback(topic, data)
             except Exception as err:
+                metrics.increment(COUNTER_CALLBACK_ERRORS)
                 _LOGGER.error("Error in message callback: %s", err)
+        metrics.record(METRIC_CALLBACKS, time.perf_counter() - started)
 
-    async def _request_current_state(self) -> None:
-        """Request current state from device."""
-        if not self._connected or not self._mqtt_client:
+    @property
+    def metrics(self) -> DysonHotPathMetrics:
+        """Return this device's hot-path counters and latency histograms.
+
+        Message counters and handler timings are recorded on paho's network
+        thread, executor hops on the event loop.
+        """
+        return self._metrics
+
+    def _async_add_executor_job(self, target: Callable[..., Any], *args: Any) -> Any:
+        """Run *target* in the executor, counting the hop off the event loop."""
+        self.metrics.increment(COUNTER_EXECUTOR_JOBS)
+        return self.hass.async_add_executor_job(target, *args)
+
+    @property
+    def last_change_set(self) -> DysonChangeSet | None:
+        """Return the keys changed by the most recently processed message.
+
+        Set before message callbacks run, so a callback can read it
+        synchronously to learn what its message changed.
+        """
+        return self._last_change_set
+
+    def expect_message(self, message_type: str) -> asyncio.Future[dict[str, Any]]:
+        """Register interest in the next ``message_type`` message from the device.
+
+        Register before publishing the request that triggers the reply so a
+        fast response cannot arrive unobserved, then pass the returned future
+        to :meth:`async_wait_for_message`. Must be called from the event loop.
+        """
+        future: asyncio.Future[dict[str, Any]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._pending_responses.setdefault(message_type, []).append(future)
+        return future
+
+    async def async_wait_for_message(
+        self, future: asyncio.Future[dict[str, Any]], timeout: float
+    ) -> dict[str, Any] | None:
+        """Wait for a future from :meth:`expect_message` to resolve.
+
+        Returns the message payload, or ``None`` if the device did not answer
+        within ``timeout`` seconds. The waiter is always deregistered.
+        """
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except TimeoutError:
+            _LOGGER.debug(
+                "No reply from %s within %.1f seconds", self._log_serial, timeout
+            )
+            return None
+        finally:
+            self._discard_pending_response(future)
+
+    def _discard_pending_response(self, future: asyncio.Future[dict[str, Any]]) -> None:
+        """Deregister a waiter, cancelling it if it is still outstanding."""
+        if not future.done():
+            future.cancel()
+        for message_type, waiters in list(self._pending_responses.items()):
+            if future in waiters:
+                waiters.remove(future)
+                if not waiters:
+                    del self._pending_responses[message_type]
+                return
+
+    def _resolve_pending_responses(
+        self, message_type: str, data: dict[str, Any]
+    ) -> None:
+        """Resolve every waiter registered for ``message_type`` (event loop only)."""
+        for future in self._pending_responses.pop(message_type, []):
+            if not future.done():
+                future.set_result(data)
+
+    @property
+    def commanded_state(self) -> dict[str, Any]:
+        """Return the value last queued for each STATE-SET key.
+
+        Entities compare reported values against these to tell the echo of
+        their own command from a change made elsewhere.
+        """
+        return self._commanded_state
+
+    @property
+    def last_publish_latency(self) -> float | None:
+        """Return how long the most recent publish took, in seconds."""
+        return self._last_publish_latency
+
+    def _publish(self, topic: str, payload: str) -> mqtt.MQTTMessageInfo:
+        """Publish a message from the event loop.
+
+        With the network loop started by ``loop_start``, paho's publish only
+        queues the packet and wakes the network thread, so it is called
+        directly rather than through the executor. Because it is synchronous,
+        messages leave in the order they are published.
+
+        Raises:
+            RuntimeError: If the client could not queue the message
+        """
+        started = time.perf_counter()
+        info = self._mqtt_client.publish(topic, payload)
+        self._last_publish_latency = time.perf_counter() - started
+        _LOGGER.debug(
+            "Published to %s in %.3f ms",
+            self._log_serial,
+            self._last_publish_latency * 1000,
+        )
+        if info.rc in _PUBLISH_FAILURES:
+            raise RuntimeError(
+                f"Publish to {self.serial_number} failed: {mqtt.error_string(info.rc)}"
+            )
+        return info
+
+    def queue_state_set(self, data: dict[str, Any]) -> asyncio.Future[None]:
+        """Queue STATE-SET values for the device's next coalesced publish.
+
+        Values queued within ``STATE_SET_COALESCE_WINDOW`` of the first one
+        are sent as a single message; a key set more than once takes its
+        last value. Batches and other commands are published in the order
+        they were issued.
+
+        Returns a future for this call that resolves once the merged
+        message is published, or raises the publish error. Must be called
+        from the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._state_set_batch
+        if batch is None:
+            batch = self._state_set_batch = _StateSetBatch()
+            batch.timer = loop.call_later(
+                STATE_SET_COALESCE_WINDOW, self._flush_state_set_batch
+            )
+        batch.data.update(data)
+        self._commanded_state.update(data)
+        future: asyncio.Future[None] = loop.create_future()
+        batch.waiters.append(future)
+        return future
+
+    def _flush_state_set_batch(self) -> None:
+        """Publish the open batch now, so a following command stays behind it."""
+        batch, self._state_set_batch = self._state_set_batch, None
+        if batch is None:
             return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        self._publish_state_set(batch)
 
+    def _publish_state_set(self, batch: _StateSetBatch) -> None:
+        """Publish one merged STATE-SET and settle its callers' futures."""
+        if len(batch.waiters) > 1:
+            _LOGGER.debug(
+                "Coalesced %d STATE-SET commands for %s into one message",
+                len(batch.waiters),
+                self._log_serial,
+            )
+        try:
+            if not self._connected or not self._mqtt_client:
+                raise RuntimeError(f"Device {self.serial_number} is not connected")
+            self._publish_command("STATE-SET", batch.data)
+        except Exception as err:
+            batch.resolve(err)
+        else:
+            batch.resolve()
+
+    def _publish_command(self, command: str, data: dict[str, Any] | None) -> None:
+        """Format a command and publish it."""
+        command_topic = f"{self.mqtt_prefix}/{self.serial_number}/command"
+
+        if data:
+            # If data is provided, construct command with data
+            command_msg: dict[str, Any] = {
+                "msg": command,
+                "time": self._get_timestamp(),
+                "mode-reason": "RAPP",
+            }
+
+            # STATE-SET commands need data wrapped in a "data" field
+            if command == "STATE-SET":
+                command_msg["data"] = data
+            else:
+                command_msg.update(data)
+
+            command_json = json.dumps(command_msg)
+        else:
+            # Simple command without additional data
+            command_json = json.dumps({"msg": command})
+
+        self._publish(command_topic, command_json)
+        _LOGGER.debug("Sent command %s to %s", command, self._log_serial)
+
+    async def _request_current_state(
+        self, timeout: float = MQTT_RESPONSE_TIMEOUT
+    ) -> dict[str, Any] | None:
+        """Request current state from device and wait for its CURRENT-STATE reply.
+
+        Returns the reply payload, or ``None`` if the device did not answer
+        within ``timeout`` seconds or the request could not be sent.
+        """
+        if not self._connected or not self._mqtt_client:
+            return None
+
+        reply = self.expect_message(MQTT_MSG_CURRENT_STATE)
         try:
             command_topic = f"{self.mqtt_prefix}/{self.serial_number}/command"
             timestamp = self._get_timestamp()
@@ -1940,23 +2442,30 @@ class DysonDevice:
             )
             _LOGGER.debug("Publishing command: %s", command)
 
-            result = await self.hass.async_add_executor_job(
-                self._mqtt_client.publish, command_topic, command
-            )
+            result = self._publish(command_topic, command)
             _LOGGER.debug("Publish result: %s", result)
             _LOGGER.debug("Requested current state from %s", self._log_serial)
 
-            # Give device time to respond
-            await asyncio.sleep(3.0)
+            # Return as soon as the reply lands instead of sleeping a fixed delay
+            return await self.async_wait_for_message(reply, timeout)
 
         except Exception as err:
+            self._discard_pending_response(reply)
             _LOGGER.error("Failed to request state from %s: %s", self._log_serial, err)
+            return None
+
+    async def _request_current_faults(
+        self, timeout: float = MQTT_RESPONSE_TIMEOUT
+    ) -> dict[str, Any] | None:
+        """Request current faults from device and wait for its CURRENT-FAULTS reply.
 
-    async def _request_current_faults(self) -> None:
-        """Request current faults from device."""
+        Returns the reply payload, or ``None`` if the device did not answer
+        within ``timeout`` seconds or the request could not be sent.
+        """
         if not self._connected or not self._mqtt_client:
-            return
+            return None
 
+        reply = self.expect_message(MQTT_MSG_CURRENT_FAULTS)
         try:
             command_topic = f"{self.mqtt_prefix}/{self.serial_number}/command"
             timestamp = self._get_timestamp()
@@ -1968,13 +2477,15 @@ class DysonDevice:
                 }
             )
 
-            await self.hass.async_add_executor_job(
-                self._mqtt_client.publish, command_topic, command
-            )
+            self._publish(command_topic, command)
             _LOGGER.debug("Requested current faults from %s", self._log_serial)
 
+            return await self.async_wait_for_message(reply, timeout)
+
         except Exception as err:
+            self._discard_pending_response(reply)
             _LOGGER.error("Failed to request faults from %s: %s", self._log_serial, err)
+            return None
 
     async def _request_environmental_data(self) -> None:
         """Request current environmental data from device."""
@@ -1992,9 +2503,7 @@ class DysonDevice:
                 }
             )
 
-            await self.hass.async_add_executor_job(
-                self._mqtt_client.publish, command_topic, command
-            )
+            self._publish(command_topic, command)
             _LOGGER.debug("Requested environmental data from %s", self._log_serial)
 
         except Exception as err:
@@ -2092,6 +2601,11 @@ class DysonDevice:
             Commands are executed asynchronously and may take 1-3 seconds
             for the device to process and reflect in state updates.
 
+            STATE-SET commands are coalesced per device: see
+            :meth:`queue_state_set`. The call returns once the merged message
+            has been published; any other command first publishes STATE-SET
+            values queued before it.
+
             Temperature values are sent in Kelvin * 10 format. For example,
             22°C = 295.15K = 2951.5 ≈ 2953.
 
@@ -2104,6 +2618,13 @@ class DysonDevice:
         try:
             _LOGGER.debug("Sending command %s to device %s", command, self._log_serial)
 
+            if command == "STATE-SET" and data:
+                await self.queue_state_set(data)
+                return
+
+            # Keep commands behind STATE-SET values queued before them
+            self._flush_state_set_batch()
+
             # Handle heartbeat commands (REQUEST-CURRENT-STATE and REQUEST-CURRENT-FAULTS)
             if command == "REQUEST-CURRENT-STATE":
                 await self._request_current_state()
@@ -2116,31 +2637,7 @@ class DysonDevice:
                 return
 
             # For other commands, use the generic command format
-            command_topic = f"{self.mqtt_prefix}/{self.serial_number}/command"
-
-            if data:
-                # If data is provided, construct command with data
-                command_msg: dict[str, Any] = {
-                    "msg": command,
-                    "time": self._get_timestamp(),
-                    "mode-reason": "RAPP",
-                }
-
-                # STATE-SET commands need data wrapped in a "data" field
-                if command == "STATE-SET":
-                    command_msg["data"] = data
-                else:
-                    command_msg.update(data)
-
-                command_json = json.dumps(command_msg)
-            else:
-                # Simple command without additional data
-                command_json = json.dumps({"msg": command})
-
-            await self.hass.async_add_executor_job(
-                self._mqtt_client.publish, command_topic, command_json
-            )
-            _LOGGER.debug("Sent command %s to %s", command, self._log_serial)
+            self._publish_command(command, data)
 
         except Exception as err:
             _LOGGER.error(
@@ -2163,9 +2660,7 @@ class DysonDevice:
             # Get state from paho-mqtt client
             if hasattr(self._mqtt_client, "get_state"):
                 # type: ignore[attr-defined]
-                state = await self.hass.async_add_executor_job(
-                    self._mqtt_client.get_state
-                )
+                state = await self._async_add_executor_job(self._mqtt_client.get_state)
                 if state:
                     _LOGGER.debug(
                         "Received state data for %s: %s", self._log_serial, state
@@ -2197,6 +2692,15 @@ class DysonDevice:
         _LOGGER.debug("Final state data for %s: %s", self._log_serial, self._state_data)
         return self._state_data
 
+    @property
+    def state_data(self) -> dict[str, Any]:
+        """Return the state retained from MQTT messages without polling the client.
+
+        Unlike :meth:`get_state` this never leaves the event loop, so it is
+        what per-message coordinator updates hand to listeners.
+        """
+        return self._state_data
+
     def _normalize_faults_to_list(self, faults: Any) -> list[dict[str, Any]]:
         """Normalize faults data to list format, filtering out OK statuses."""
         if not faults:
@@ -2217,7 +2721,7 @@ class DysonDevice:
             # Process each fault key in the data
             for fault_key, fault_value in fault_data.items():
                 # Skip if the value indicates no fault (OK, NONE, etc.)
-                if not fault_value or fault_value in ["OK", "NONE", "PASS", "GOOD"]:
+                if not fault_value or fault_value in FAULT_OK_VALUES:
                     continue
 
                 # Get human-readable description
@@ -2235,6 +2739,7 @@ class DysonDevice:
         # Store the raw fault data for other methods
         if not isinstance(faults, list):
             self._faults_data = faults
+            self._rebuild_fault_index()
 
         return actual_faults
 
@@ -2257,9 +2762,7 @@ class DysonDevice:
 
         # Try get_faults method
         if hasattr(self._mqtt_client, "get_faults"):
-            faults = await self.hass.async_add_executor_job(
-                self._mqtt_client.get_faults
-            )  # type: ignore[attr-defined]
+            faults = await self._async_add_executor_job(self._mqtt_client.get_faults)  # type: ignore[attr-defined]
             if faults:
                 return self._normalize_faults_to_list(faults)
 
@@ -3780,17 +4283,7 @@ class DysonDevice:
         )
 
         try:
-            # Use asyncio to make MQTT publish non-blocking
-            import asyncio
-
-            loop = asyncio.get_event_loop()
-
-            # Publish command using existing MQTT infrastructure
-            def _publish_command():
-                result = self._mqtt_client.publish(topic, message)
-                result.wait_for_publish(timeout=5.0)  # 5 second timeout
-
-            await loop.run_in_executor(None, _publish_command)
+            self._publish(topic, message)
 
             _LOGGER.debug("Robot command sent successfully to %s", self._log_serial)
 
@@ -0,0 +1,93 @@
+"""Diagnostics support for Dyson devices.
+
+Besides the (redacted) config entry, a device entry's diagnostics include the
+hot-path metrics its device and coordinator collect (see
+:mod:`.instrumentation`): message rates per type, MQTT handler and callback
+latency, executor hops, listener time per entity class, clean-map fetches and
+map renders. Together with the connection latencies and startup timing they
+show which device, or which entity class, is spending event loop time.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_CREDENTIAL,
+    CONF_LTK,
+    CONF_SERIAL_NUMBER,
+    DATA_STARTUP,
+    DOMAIN,
+)
+from .coordinator import DysonDataUpdateCoordinator
+from .device_utils import mask_serial
+from .startup import DysonStartupOrchestrator
+
+TO_REDACT = {
+    CONF_CREDENTIAL,
+    CONF_LTK,
+    CONF_SERIAL_NUMBER,
+    "account_uuid",
+    "auth_token",
+    "device_serial_number",
+    "email",
+    "password",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    diagnostics: dict[str, Any] = {
+        "entry": {
+            "title": entry.title,
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        }
+    }
+
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if isinstance(entry_data, DysonDataUpdateCoordinator):
+        diagnostics["device"] = _device_diagnostics(hass, entry_data)
+    elif isinstance(entry_data, dict) and entry_data.get("is_ble"):
+        diagnostics["device"] = {"type": "ble"}
+    return diagnostics
+
+
+def _device_diagnostics(
+    hass: HomeAssistant, coordinator: DysonDataUpdateCoordinator
+) -> dict[str, Any]:
+    """Return connection details and hot-path metrics for one device."""
+    device = coordinator.device
+    # Read-only: diagnostics must not recreate an orchestrator after unload
+    orchestrator: DysonStartupOrchestrator | None = hass.data.get(DATA_STARTUP)
+    timing = (
+        None
+        if orchestrator is None
+        else orchestrator.get_timing(coordinator.serial_number)
+    )
+    result: dict[str, Any] = {
+        "serial_number": mask_serial(coordinator.serial_number),
+        "device_category": coordinator.device_category,
+        "last_update_success": coordinator.last_update_success,
+        "startup": None
+        if timing is None
+        else {**asdict(timing), "total": timing.total},
+        "coordinator_metrics": coordinator.metrics.as_dict(),
+    }
+    if device is not None:
+        result.update(
+            {
+                "connection_status": device.connection_status,
+                "last_connack_latency_s": device.last_connack_latency,
+                "last_publish_latency_s": device.last_publish_latency,
+                "device_metrics": device.metrics.as_dict(),
+            }
+        )
+    return result
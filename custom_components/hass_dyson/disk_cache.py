@@ -0,0 +1,365 @@
+"""Persistent on-disk cache for robot map data and rendered map images.
+
+Clean-map records, persistent maps and rendered PNGs are held in in-memory
+``TTLCache`` instances, which are empty after every Home Assistant restart.
+This module keeps a copy of those values under HA's storage directory so the
+image and cleaning-history entities can serve the last known data at startup
+while the cloud is queried again in the background.
+
+Storage Model:
+    - One file per entry under ``.storage/hass_dyson/map_cache``
+    - Entries are addressed by namespace + key (serial plus clean ID, map ID
+      or render fingerprint), hashed into the file name
+    - Reads refresh an entry's modification time; once the directory exceeds
+      its byte budget the least recently used entries are deleted
+    - Rendered PNGs are stored as-is in ``.png`` files
+    - Clean-map records and persistent maps are stored in ``.json`` files in
+      their dict form and rebuilt into libdyson-rest models on read; the
+      caller names the model class, so nothing but plain data is decoded
+    - Unreadable entries, older entry formats and records whose fields no
+      longer match the model are treated as misses and removed
+
+Stale-While-Revalidate:
+    :func:`async_restore` seeds a memory cache from disk only the first time
+    a key is needed after start-up; from then on the memory cache's own TTL
+    (and any explicit invalidation, e.g. at the end of a clean) decides when
+    the cloud is asked again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, fields, is_dataclass
+from functools import cache
+from types import UnionType
+from typing import Any, Union, get_args, get_origin, get_type_hints
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import DATA_MAP_DISK_CACHE, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Rendered PNGs dominate the footprint (a few hundred KiB per Vis Nav map).
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_ENTRY_VERSION = 3
+_PNG_SUFFIX = ".png"
+_JSON_SUFFIX = ".json"
+_ENTRY_SUFFIXES = (_PNG_SUFFIX, _JSON_SUFFIX)
+# Pickled entries written by earlier versions; deleted on the first scan.
+_LEGACY_SUFFIX = ".cache"
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+class DysonDiskCache:
+    """Size-bounded, least-recently-used file cache.
+
+    All file I/O runs in the executor; the in-memory index of entry sizes
+    and access times is only touched on the event loop.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, directory: str, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        """Initialise a cache rooted at *directory*; nothing is read yet."""
+        self._hass = hass
+        self._directory = directory
+        self._max_bytes = max_bytes
+        # file name -> (size in bytes, last access time)
+        self._index: dict[str, tuple[int, float]] | None = None
+        self._index_lock = asyncio.Lock()
+        # Keys already offered to async_restore since start-up.
+        self._restore_claims: set[tuple[str, str]] = set()
+
+    @property
+    def size(self) -> int:
+        """Return the bytes currently stored (0 before the first access)."""
+        return sum(size for size, _ in (self._index or {}).values())
+
+    def claim_restore(self, namespace: str, key: str) -> bool:
+        """Return True the first time *key* is restored since start-up."""
+        claim = (namespace, key)
+        if claim in self._restore_claims:
+            return False
+        self._restore_claims.add(claim)
+        return True
+
+    @staticmethod
+    def _file_name(namespace: str, key: str, suffix: str) -> str:
+        """Return the file name for *namespace* / *key*."""
+        digest = hashlib.sha1(
+            f"{namespace}\0{key}".encode(), usedforsecurity=False
+        ).hexdigest()
+        return f"{namespace}-{digest}{suffix}"
+
+    def _find(
+        self, index: dict[str, tuple[int, float]], namespace: str, key: str
+    ) -> str | None:
+        """Return the file name holding *key*, whichever format it was stored in."""
+        for suffix in _ENTRY_SUFFIXES:
+            name = self._file_name(namespace, key, suffix)
+            if name in index:
+                return name
+        return None
+
+    async def async_get(
+        self, namespace: str, key: str, model: type | None = None
+    ) -> Any | None:
+        """Return the stored value for *key*, or ``None`` on a miss.
+
+        *model* is the dataclass a JSON entry (or each item of a JSON list)
+        is rebuilt into; without it the decoded JSON is returned as-is.
+        """
+        index = await self._async_index()
+        name = self._find(index, namespace, key)
+        if name is None:
+            return None
+        value = await self._hass.async_add_executor_job(self._read, name, model)
+        if value is None:
+            index.pop(name, None)
+            return None
+        index[name] = (index[name][0], time.time())
+        return value
+
+    async def async_set(self, namespace: str, key: str, value: Any) -> None:
+        """Store *value* under *key*, evicting old entries past the budget.
+
+        ``bytes`` values are PNGs and are written as-is; anything else must be
+        JSON-serialisable once dataclasses are converted to dicts.
+        """
+        index = await self._async_index()
+        suffix = _PNG_SUFFIX if isinstance(value, bytes) else _JSON_SUFFIX
+        name = self._file_name(namespace, key, suffix)
+        try:
+            size = await self._hass.async_add_executor_job(self._write, name, value)
+        except (OSError, TypeError, ValueError) as err:
+            _LOGGER.debug("Not caching %s/%s on disk: %s", namespace, key, err)
+            return
+        if size is None:
+            return
+        index[name] = (size, time.time())
+        await self._async_evict(index)
+
+    async def async_invalidate(self, namespace: str, key: str) -> None:
+        """Remove the entry for *key*, if present."""
+        index = await self._async_index()
+        name = self._find(index, namespace, key)
+        if name is not None:
+            index.pop(name)
+            await self._hass.async_add_executor_job(self._remove, name)
+
+    async def _async_index(self) -> dict[str, tuple[int, float]]:
+        """Return the entry index, scanning the directory on first use."""
+        if self._index is None:
+            async with self._index_lock:
+                if self._index is None:
+                    self._index = await self._hass.async_add_executor_job(self._scan)
+        return self._index
+
+    async def _async_evict(self, index: dict[str, tuple[int, float]]) -> None:
+        """Delete least recently used entries until within the byte budget."""
+        total = sum(size for size, _ in index.values())
+        if total <= self._max_bytes:
+            return
+        victims: list[str] = []
+        for name, (size, _) in sorted(index.items(), key=lambda item: item[1][1]):
+            if total <= self._max_bytes:
+                break
+            victims.append(name)
+            total -= size
+        for name in victims:
+            index.pop(name, None)
+        _LOGGER.debug("Evicting %d map cache entries", len(victims))
+        await self._hass.async_add_executor_job(self._remove, *victims)
+
+    # -- executor helpers -------------------------------------------------
+
+    def _scan(self) -> dict[str, tuple[int, float]]:
+        """Index existing entries by size and modification time."""
+        os.makedirs(self._directory, exist_ok=True)
+        index: dict[str, tuple[int, float]] = {}
+        stale: list[str] = []
+        with os.scandir(self._directory) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if entry.name.endswith(_ENTRY_SUFFIXES):
+                    stat = entry.stat()
+                    index[entry.name] = (stat.st_size, stat.st_mtime)
+                elif entry.name.endswith(_LEGACY_SUFFIX):
+                    stale.append(entry.name)
+        self._remove(*stale)
+        return index
+
+    def _read(self, name: str, model: type | None) -> Any | None:
+        """Read and decode one entry, removing it if it cannot be used."""
+        path = os.path.join(self._directory, name)
+        try:
+            with open(path, "rb") as file:
+                payload = file.read()
+            os.utime(path)
+            if name.endswith(_PNG_SUFFIX):
+                value = payload if payload.startswith(_PNG_SIGNATURE) else None
+            else:
+                entry = json.loads(payload)
+                # Older entry formats are dropped rather than migrated.
+                value = (
+                    _decode(model, entry["value"])
+                    if entry.get("version") == _ENTRY_VERSION
+                    else None
+                )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as err:
+            # Truncated file, or a record the running model no longer accepts.
+            _LOGGER.debug("Discarding unreadable map cache entry %s: %s", name, err)
+            value = None
+        if value is None:
+            self._remove(name)
+        return value
+
+    def _write(self, name: str, value: Any) -> int | None:
+        """Atomically write one entry; return its size, or None if too large."""
+        if isinstance(value, bytes):
+            payload = value
+        else:
+            entry = {"version": _ENTRY_VERSION, "value": _encode(value)}
+            payload = json.dumps(entry, separators=(",", ":")).encode()
+        if len(payload) > self._max_bytes:
+            return None
+        os.makedirs(self._directory, exist_ok=True)
+        path = os.path.join(self._directory, name)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(payload)
+        os.replace(temp_path, path)
+        return len(payload)
+
+    def _remove(self, *names: str) -> None:
+        """Delete entries, ignoring ones already gone."""
+        for name in names:
+            try:
+                os.remove(os.path.join(self._directory, name))
+            except FileNotFoundError:
+                pass
+            except OSError as err:
+                _LOGGER.debug("Failed to remove map cache entry %s: %s", name, err)
+
+
+def _encode(value: Any) -> Any:
+    """Return *value* with dataclasses (and lists of them) in dict form."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _decode(model: type | None, data: Any) -> Any:
+    """Rebuild *model* instances from the dict form written by :func:`_encode`."""
+    if model is None:
+        return data
+    if isinstance(data, list):
+        return [_build(model, item) for item in data]
+    return _build(model, data)
+
+
+@cache
+def _field_types(model: type) -> dict[str, Any]:
+    """Return the resolved field annotations of dataclass *model*."""
+    return get_type_hints(model)
+
+
+def _build(annotation: Any, data: Any) -> Any:
+    """Convert JSON *data* into *annotation*, recursing into nested dataclasses.
+
+    Raises ``TypeError`` when a required field is missing, so a record written
+    against an older model is discarded instead of half-restored.
+    """
+    if data is None:
+        return None
+    origin = get_origin(annotation)
+    if origin is list and isinstance(data, list):
+        item_type = next(iter(get_args(annotation)), Any)
+        return [_build(item_type, item) for item in data]
+    if origin in (Union, UnionType):
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _build(members[0], data) if len(members) == 1 else data
+    if is_dataclass(annotation) and isinstance(data, dict):
+        hints = _field_types(annotation)
+        return annotation(
+            **{
+                field.name: _build(hints[field.name], data[field.name])
+                for field in fields(annotation)
+                if field.name in data
+            }
+        )
+    return data
+
+
+def get_disk_cache(hass: HomeAssistant | Any) -> DysonDiskCache | None:
+    """Return the integration-wide disk cache, creating it on first use.
+
+    Returns ``None`` for hass stand-ins without a real ``data`` dict or
+    config directory (tests, partially set-up objects), which disables the
+    disk layer.
+    """
+    data = getattr(hass, "data", None)
+    if not isinstance(data, dict):
+        return None
+    cache = data.get(DATA_MAP_DISK_CACHE)
+    if cache is None:
+        try:
+            directory = hass.config.path(STORAGE_DIR, DOMAIN, "map_cache")
+        except AttributeError:
+            return None
+        if not isinstance(directory, str):
+            return None
+        cache = data[DATA_MAP_DISK_CACHE] = DysonDiskCache(hass, directory)
+    return cache
+
+
+async def async_restore(
+    hass: HomeAssistant | Any,
+    memory_cache: Any,
+    namespace: str,
+    key: str,
+    model: type | None = None,
+) -> Any | None:
+    """Seed *memory_cache* from disk the first time *key* is needed.
+
+    Only the first call per key since start-up reads the disk, and only
+    while the memory cache holds nothing for it, so invalidating the memory
+    cache later never resurrects an older disk copy. A restored value is
+    stored fresh, so it is served for one TTL before the cloud is asked
+    again. *model* is passed to :meth:`DysonDiskCache.async_get`. Returns
+    the restored value, or ``None``.
+    """
+    cache = get_disk_cache(hass)
+    if cache is None or not cache.claim_restore(namespace, key):
+        return None
+    if memory_cache.get_stale(key) is not None:
+        return None
+    value = await cache.async_get(namespace, key, model)
+    if value is not None:
+        _LOGGER.debug("Restored %s/%s from the map cache", namespace, key)
+        memory_cache.set(key, value)
+    return value
+
+
+def persist(hass: HomeAssistant | Any, namespace: str, key: str, value: Any) -> None:
+    """Write *value* to the disk cache in the background."""
+    cache = get_disk_cache(hass)
+    if cache is None:
+        return
+    hass.async_create_background_task(
+        cache.async_set(namespace, key, value),
+        name=f"{DOMAIN}_map_cache_write",
+    )
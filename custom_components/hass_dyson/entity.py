@@ -10,6 +10,9 @@ Key Features:
     - Thread-safe coordinator update handling
     - Consistent entity naming with _attr_has_entity_name = True
     - Type-safe coordinator access with proper type annotations
+    - Optional per-entity key subscriptions so MQTT deltas only wake the
+      entities whose data changed
+    - Optimistic command state that is held until the device confirms it
 
 Inheritance Chain:
     DysonEntity → CoordinatorEntity → Entity (Home Assistant base)
@@ -30,9 +33,46 @@ Example:
 
 from __future__ import annotations
 
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .coordinator import DysonBLEDataUpdateCoordinator, DysonDataUpdateCoordinator
+from .coordinator import (
+    DysonBLEDataUpdateCoordinator,
+    DysonDataUpdateCoordinator,
+    DysonKeySubscription,
+)
+from .device import DysonChangeSet
+
+_LOGGER = logging.getLogger(__name__)
+
+# How long an optimistic state is held while waiting for the device to report
+# the commanded keys. Devices normally echo a STATE-CHANGE within a second.
+OPTIMISTIC_TIMEOUT = 10.0
+
+
+@dataclass
+class _PendingCommand:
+    """Optimistic attribute values shown until the device reports them."""
+
+    keys: frozenset[str]
+    attributes: dict[str, Any]
+    # Raw values per key that echo this command, or an older command it
+    # replaced whose echo may still arrive. Keys without one are unknown.
+    expected: dict[str, frozenset[str]] = field(default_factory=dict)
+    cancel_timeout: CALLBACK_TYPE | None = field(default=None, repr=False)
+
+    def cancel(self) -> None:
+        """Cancel the rollback timer."""
+        if self.cancel_timeout is not None:
+            self.cancel_timeout()
+            self.cancel_timeout = None
 
 
 class DysonEntity(CoordinatorEntity):
@@ -45,6 +85,8 @@ class DysonEntity(CoordinatorEntity):
     Attributes:
         coordinator: DysonDataUpdateCoordinator instance providing device access
         _attr_has_entity_name: Always True for modern Home Assistant naming
+        _product_state_keys: product-state keys the entity reads
+        _environmental_keys: environmental-data keys the entity reads
 
     Properties:
         device_info: Device information dict for Home Assistant device registry
@@ -62,6 +104,22 @@ class DysonEntity(CoordinatorEntity):
         2. Coordinator has a device instance (not None)
         3. Device reports is_connected as True
 
+    Key Subscriptions:
+        Subclasses that declare ``_product_state_keys`` and/or
+        ``_environmental_keys`` register them with the coordinator, which then
+        skips the entity for MQTT delta updates that change none of those
+        keys. Full refreshes always reach every entity, as do entities that
+        declare no keys.
+
+    Optimistic Commands:
+        Command handlers call ``_async_set_optimistic`` after sending a
+        command so the new state shows at once. Coordinator updates keep
+        showing it until the state the entity derives from device data
+        matches it (confirmed), a STATE-CHANGE reports one of the command's
+        keys at a value neither it nor a command it replaced sent (rolled
+        back), or ``OPTIMISTIC_TIMEOUT`` passes (rolled back). Late echoes of
+        replaced commands therefore do not make the state flicker.
+
     Thread Safety:
         Update handling is thread-safe using hass.loop.call_soon_threadsafe
         to ensure all updates occur in the main Home Assistant event loop.
@@ -89,10 +147,165 @@ class DysonEntity(CoordinatorEntity):
 
     coordinator: DysonDataUpdateCoordinator
     _attr_has_entity_name = True
+    _product_state_keys: frozenset[str] = frozenset()
+    _environmental_keys: frozenset[str] = frozenset()
+    # Optimistic states awaiting confirmation, oldest first.
+    _pending_commands: tuple[_PendingCommand, ...] = ()
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the Dyson entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, self._key_subscription())
+
+    @classmethod
+    def _key_subscription(cls) -> DysonKeySubscription | None:
+        """Return the coordinator context for the keys this entity reads.
+
+        None (no declared keys) subscribes the entity to every update.
+        """
+        if not (cls._product_state_keys or cls._environmental_keys):
+            return None
+        return DysonKeySubscription(
+            product_state=cls._product_state_keys,
+            environmental=cls._environmental_keys,
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop pending optimistic states when the entity is removed."""
+        for pending in self._pending_commands:
+            pending.cancel()
+        self._pending_commands = ()
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _async_set_optimistic(
+        self,
+        keys: Iterable[str],
+        timeout: float = OPTIMISTIC_TIMEOUT,
+        **attributes: Any,
+    ) -> None:
+        """Show a commanded state now and hold it until the device confirms it.
+
+        Args:
+            keys: product-state keys the command sets on the device
+            timeout: Seconds to wait for confirmation before rolling back
+            **attributes: Optimistic values by attribute name, e.g.
+                ``is_on=True`` sets ``_attr_is_on``
+
+        A newer command for any of the same attributes replaces the older one.
+        The values the device was last sent for *keys* (see
+        :attr:`.device.DysonDevice.commanded_state`) are what the command
+        expects the device to echo.
+        """
+        keys = frozenset(keys)
+        commanded = getattr(
+            getattr(self.coordinator, "device", None), "commanded_state", None
+        )
+        pending = _PendingCommand(
+            keys,
+            {f"_attr_{name}": value for name, value in attributes.items()},
+            {
+                key: frozenset({str(commanded[key])})
+                for key in keys
+                if isinstance(commanded, dict) and key in commanded
+            },
+        )
+        kept = []
+        for older in self._pending_commands:
+            if older.attributes.keys() & pending.attributes.keys():
+                older.cancel()
+                for key, values in older.expected.items():
+                    if key in pending.expected:
+                        pending.expected[key] |= values
+            else:
+                kept.append(older)
+        self._pending_commands = (*kept, pending)
+
+        if self.hass is not None:
+
+            @callback
+            def _async_expire(_now: datetime) -> None:
+                self._async_expire_optimistic(pending)
+
+            pending.cancel_timeout = async_call_later(self.hass, timeout, _async_expire)
+
+        for attribute, value in pending.attributes.items():
+            setattr(self, attribute, value)
+        self.async_write_ha_state()
+
+    @callback
+    def _async_expire_optimistic(self, pending: _PendingCommand) -> None:
+        """Fall back to the reported state of an unconfirmed command."""
+        pending.cancel_timeout = None
+        if pending not in self._pending_commands:
+            return
+        self._pending_commands = tuple(
+            other for other in self._pending_commands if other is not pending
+        )
+        _LOGGER.debug(
+            "%s not confirmed by %s; reverting to reported state",
+            pending.attributes,
+            self.coordinator.serial_number,
+        )
+        self._handle_coordinator_update()
+
+    def _reconcile_optimistic(self) -> None:
+        """Confirm, roll back or re-apply pending states after an update.
+
+        Runs after the subclass has derived its attributes from the new
+        device data, so those attributes are what the device reports.
+        """
+        changes = self.coordinator.change_set
+        changed_keys = (
+            changes.product_state
+            if isinstance(changes, DysonChangeSet)
+            else frozenset()
+        )
+        data = self.coordinator.data
+        reported = data.get("product-state", {}) if isinstance(data, dict) else {}
+        kept = []
+        for pending in self._pending_commands:
+            if all(
+                getattr(self, attribute, None) == value
+                for attribute, value in pending.attributes.items()
+            ):
+                pending.cancel()
+            elif self._optimistic_rejected(pending, changed_keys, reported):
+                _LOGGER.debug(
+                    "%s rejected by %s; reverting to reported state",
+                    pending.attributes,
+                    self.coordinator.serial_number,
+                )
+                pending.cancel()
+            else:
+                kept.append(pending)
+        self._pending_commands = tuple(kept)
+        for pending in kept:
+            for attribute, value in pending.attributes.items():
+                setattr(self, attribute, value)
+
+    @staticmethod
+    def _optimistic_rejected(
+        pending: _PendingCommand,
+        changed_keys: frozenset[str],
+        reported: dict[str, Any],
+    ) -> bool:
+        """Return True if the device reported a commanded key at another value.
+
+        A changed key with no expected value counts as a rejection, as the
+        command's own echo cannot be told apart from other changes.
+        """
+        for key in pending.keys & changed_keys:
+            expected = pending.expected.get(key)
+            if expected is None or str(reported.get(key)) not in expected:
+                return True
+        return False
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the new state, keeping unconfirmed optimistic values."""
+        if self._pending_commands:
+            self._reconcile_optimistic()
+        super()._handle_coordinator_update()
 
     @property
     def device_info(self):
@@ -13,7 +13,7 @@ Key Features:
     - Night mode integration for quiet operation
     - Climate integration for heating-enabled devices
     - Real-time state updates via MQTT coordinator
-    - Command pending system to prevent UI flickering
+    - Optimistic command state held until the device confirms it
 
 Supported Device Features (capability-dependent):
     - SET_SPEED: All devices (1-10 speed levels)
@@ -38,9 +38,7 @@ Climate Integration:
 
 from __future__ import annotations
 
-import asyncio
 import logging
-import time
 from collections.abc import Mapping
 from typing import Any
 
@@ -266,10 +264,6 @@ class DysonFan(DysonEntity, FanEntity):
         # mid-transition from briefly reporting oscillating=False in the HA UI.
         self._breeze_transition_pending: bool = False
 
-        # Initialize command pending attributes to prevent linting errors
-        self._command_pending = False
-        self._command_end_time: float | None = None
-
         # Note: Oscillation control removed - will be handled by custom advanced oscillation entities
         # Standard Home Assistant oscillation (on/off) doesn't support Dyson's advanced oscillation features
 
@@ -408,23 +402,7 @@ class DysonFan(DysonEntity, FanEntity):
             self._attr_percentage,
         )
 
-        # Force Home Assistant to update with the new state
-        _LOGGER.debug(
-            "Fan %s writing state to Home Assistant - is_on: %s",
-            self.coordinator.serial_number,
-            self._attr_is_on,
-        )
-        self.async_write_ha_state()
-
-        # Additional debugging - check what HA thinks our state is after writing
-        _LOGGER.debug(
-            "Fan %s after state write - entity_id: %s, state: %s, is_on property: %s",
-            self.coordinator.serial_number,
-            self.entity_id,
-            self.state,
-            self.is_on,
-        )
-
+        # Writes the new state, keeping any unconfirmed command values
         super()._handle_coordinator_update()
 
     @property
@@ -432,24 +410,6 @@ class DysonFan(DysonEntity, FanEntity):
         """Return True if the fan is on."""
         return self._attr_is_on if self._attr_is_on is not None else False
 
-    def _start_command_pending(self, duration_seconds: float = 7.0) -> None:
-        """Start ignoring coordinator updates for a specified duration."""
-        self._command_pending = True
-        self._command_end_time = time.time() + duration_seconds
-        _LOGGER.debug(
-            "Fan %s started command pending period for %.1f seconds",
-            self.coordinator.serial_number,
-            duration_seconds,
-        )
-
-    def _stop_command_pending(self) -> None:
-        """Stop ignoring coordinator updates immediately."""
-        self._command_pending = False
-        self._command_end_time = None
-        _LOGGER.debug(
-            "Fan %s stopped command pending period", self.coordinator.serial_number
-        )
-
     def turn_on(
         self,
         percentage: int | None = None,
@@ -481,9 +441,8 @@ class DysonFan(DysonEntity, FanEntity):
         # Turn on fan power
         await self.coordinator.device.set_fan_power(True)
 
-        # Update state immediately for responsive UI
-        self._attr_is_on = True
-        self.async_write_ha_state()
+        # Show the fan on until the device reports its power state
+        self._async_set_optimistic(("fpwr", "fmod"), is_on=True)
 
         # Set fan speed if specified
         if percentage is not None:
@@ -497,8 +456,7 @@ class DysonFan(DysonEntity, FanEntity):
         if preset_mode is not None:
             await self.async_set_preset_mode(preset_mode)
 
-        # Let the coordinator update naturally from MQTT messages
-        # No forced refresh or immediate state writing to prevent race conditions
+        # Speed follows from the device's STATE-CHANGE for fnsp
 
     def turn_off(self, **kwargs: Any) -> None:
         """Turn off the fan (sync wrapper).
@@ -519,11 +477,8 @@ class DysonFan(DysonEntity, FanEntity):
         # Turn off fan power
         await self.coordinator.device.set_fan_power(False)
 
-        # Update state immediately for responsive UI
-        self._attr_is_on = False
-        self.async_write_ha_state()
-
-        # Let the coordinator update naturally from MQTT messages for final state
+        # Show the fan off until the device reports its power state
+        self._async_set_optimistic(("fpwr", "fmod"), is_on=False)
 
     def set_percentage(self, percentage: int) -> None:
         """Set the fan speed percentage (sync wrapper).
@@ -549,7 +504,8 @@ class DysonFan(DysonEntity, FanEntity):
             speed = max(1, min(10, round(percentage / 10)))
             await self.coordinator.device.set_fan_speed(speed)
 
-            # Let the coordinator update naturally from MQTT messages for final state
+            # Show the new speed until the device reports fnsp
+            self._async_set_optimistic(("fnsp",), percentage=speed * 10)
 
     def set_direction(self, direction: str) -> None:
         """Set the fan direction (sync wrapper).
@@ -588,12 +544,7 @@ class DysonFan(DysonEntity, FanEntity):
                 self.coordinator.serial_number,
             )
 
-            # Force coordinator refresh to update state immediately
-            await asyncio.sleep(0.5)  # Give device time to process
-            await self.coordinator.async_request_refresh()
-
-            # Force Home Assistant to update with confirmed device state
-            self.async_write_ha_state()
+            self._async_set_optimistic(("fdir",), current_direction=direction)
         except (ConnectionError, TimeoutError) as err:
             _LOGGER.error(
                 "Communication error setting fan direction for %s: %s",
@@ -647,16 +598,9 @@ class DysonFan(DysonEntity, FanEntity):
                 self.coordinator.serial_number,
             )
 
-            # Update state immediately to provide responsive UI
-            self._attr_preset_mode = preset_mode
-            self.async_write_ha_state()
-
-            # Force coordinator refresh to update state immediately
-            await asyncio.sleep(0.5)  # Give device time to process
-            await self.coordinator.async_request_refresh()
-
-            # Force Home Assistant to update with confirmed device state
-            self.async_write_ha_state()
+            self._async_set_optimistic(
+                ("auto", "fmod", "hmod"), preset_mode=preset_mode
+            )
         except (ConnectionError, TimeoutError) as err:
             _LOGGER.error(
                 "Communication error setting preset mode '%s' for %s: %s",
@@ -873,9 +817,7 @@ class DysonFan(DysonEntity, FanEntity):
                         pass
                     await self.coordinator.device.set_oscillation(oscillating)
 
-            # Update state immediately for responsive UI
-            self._attr_oscillating = oscillating
-            self.async_write_ha_state()
+            self._async_set_optimistic(("oson",), oscillating=oscillating)
 
             _LOGGER.debug(
                 "Set oscillation to %s for %s via native fan service",
@@ -161,10 +161,7 @@ class DysonHumidifierEntity(DysonEntity, HumidifierEntity):  # type: ignore[misc
                 enabled=True, auto_mode=False
             )
 
-            # Update local state immediately for responsive UI
-            self._attr_is_on = True
-            self._attr_mode = MODE_NORMAL
-            self.async_write_ha_state()
+            self._async_set_optimistic(("hume", "haut"), is_on=True, mode=MODE_NORMAL)
 
             _LOGGER.debug(
                 "Turned on humidifier for %s",
@@ -193,10 +190,7 @@ class DysonHumidifierEntity(DysonEntity, HumidifierEntity):  # type: ignore[misc
                 enabled=False, auto_mode=False
             )
 
-            # Update local state immediately for responsive UI
-            self._attr_is_on = False
-            self._attr_mode = None
-            self.async_write_ha_state()
+            self._async_set_optimistic(("hume", "haut"), is_on=False, mode=None)
 
             _LOGGER.debug(
                 "Turned off humidifier for %s", self.coordinator.serial_number
@@ -234,9 +228,7 @@ class DysonHumidifierEntity(DysonEntity, HumidifierEntity):  # type: ignore[misc
         try:
             await self.coordinator.device.set_target_humidity(rounded_humidity)
 
-            # Update local state immediately for responsive UI
-            self._attr_target_humidity = rounded_humidity
-            self.async_write_ha_state()
+            self._async_set_optimistic(("humt",), target_humidity=rounded_humidity)
 
             _LOGGER.debug(
                 "Set target humidity to %s%% for %s",
@@ -285,17 +277,14 @@ class DysonHumidifierEntity(DysonEntity, HumidifierEntity):  # type: ignore[misc
                 await self.coordinator.device.set_humidifier_mode(
                     enabled=True, auto_mode=True
                 )
-                self._attr_mode = MODE_AUTO
             elif mode == MODE_NORMAL:
                 # Enable normal/manual mode
                 await self.coordinator.device.set_humidifier_mode(
                     enabled=True, auto_mode=False
                 )
-                self._attr_mode = MODE_NORMAL
 
-            # Ensure humidifier is marked as on
-            self._attr_is_on = True
-            self.async_write_ha_state()
+            # Either mode turns the humidifier on
+            self._async_set_optimistic(("hume", "haut"), is_on=True, mode=mode)
 
             _LOGGER.debug(
                 "Set humidifier mode to %s for %s",
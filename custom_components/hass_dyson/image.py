@@ -31,19 +31,30 @@ v2 devices (e.g. RB05 Spot+Scrub):
        Rendered client-side by _render_v2_floor_plan_png (white background +
        dark zone boundary line segments + green dock icon).
 
+All renders run off the event loop through the shared MapRenderWorker, which
+bounds how many run at once and de-duplicates identical in-flight renders.
+Persistent maps, fetched map images and finished renders are also kept in the
+on-disk map cache (disk_cache.py), so both images are served immediately after
+a restart while the cloud is queried again.
+
 Bitmap rendering ported from thoukydides/matterbridge-dyson-robot
 (src/dyson-bitmap-octet.ts + src/dyson-device-360-map.ts).
 """
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
 import io
 import logging
+import time
 import zlib
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from functools import partial
+from typing import Any
 
 from homeassistant.components.image import ImageEntity
 from homeassistant.config_entries import ConfigEntry
@@ -51,8 +62,15 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DEVICE_CATEGORY_ROBOT, DOMAIN
-from .coordinator import DysonDataUpdateCoordinator, TTLCache
+from .coordinator import (
+    DysonDataUpdateCoordinator,
+    TTLCache,
+    coordinator_call_key,
+    single_flight,
+)
+from .disk_cache import async_restore, get_disk_cache, persist
 from .entity import DysonEntity
+from .instrumentation import METRIC_RENDER_PREFIX, DysonHotPathMetrics
 from .vacuum import fetch_clean_maps
 
 _LOGGER = logging.getLogger(__name__)
@@ -76,6 +94,18 @@ _DUST_GRADIENT_RGB: list[tuple[int, int, int]] = [
     (0xFF, 0xFF, 0xFF),  # 231 white
 ]
 
+# Alpha of every non-zero dust cell in the heatmap overlay.
+_DUST_ALPHA = 220
+
+# Floor-plan repaint colours, indexed by pixel class (see _floor_plan_classes).
+_FLOOR_PLAN_PALETTE: bytes = bytes(
+    (
+        *(60, 60, 90, 255),  # 0: boundary / wall
+        *(250, 248, 240, 255),  # 1: zone interior
+        *(235, 235, 235, 255),  # 2: outside any zone
+    )
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -118,11 +148,197 @@ async def async_setup_entry(
 # the cache stays local. Persistent maps change rarely → generous TTL.
 # ----------------------------------------------------------------------------
 
-_persist_map_cache = TTLCache(6 * 3600)
-_map_image_cache = TTLCache(10 * 60)
-_floor_plan_cache = TTLCache(6 * 3600)
+# Map images are keyed per clean run, so over weeks of uptime they accumulate
+# one PNG per run; the byte budget keeps the rendered images in check.
+_persist_map_cache = TTLCache(6 * 3600, max_entries=32)
+_map_image_cache = TTLCache(10 * 60, max_entries=64, max_bytes=16 * 1024 * 1024)
+_floor_plan_cache = TTLCache(6 * 3600, max_entries=32, max_bytes=16 * 1024 * 1024)
+
+# Disk-cache namespaces (see disk_cache.py). Renders are keyed by their full
+# input fingerprint, so a persisted render is valid for as long as it exists.
+_PERSIST_MAP_DISK_NAMESPACE = "persist_map"
+_MAP_IMAGE_DISK_NAMESPACE = "map_image"
+_FLOOR_PLAN_DISK_NAMESPACE = "floor_plan"
+_RENDER_DISK_NAMESPACE = "render"
+
+
+# ----------------------------------------------------------------------------
+# Render worker.
+#
+# Every map render (dust maps, v2 clean-maps-data, floor plans) goes through
+# one shared worker: renders run on its own small thread pool, so a burst of
+# end-of-clean refreshes across several robots can neither block the event
+# loop nor pin Home Assistant's shared executor.
+# ----------------------------------------------------------------------------
+
+# Renders allowed to run at once across all robots. PNG encoding is
+# CPU-bound; Raspberry Pi class hosts have few cores to spare.
+_RENDER_MAX_CONCURRENCY = 2
+
+
+class MapRenderWorker:
+    """Bounded, de-duplicating off-loop runner for map renders.
+
+    Renders are keyed by their inputs: a request whose key matches a render
+    that is already queued or running awaits that render instead of starting
+    another one. At most ``max_concurrency`` renders run at once; the rest
+    wait for a slot, and their number is reported as ``queue_depth``.
+    """
+
+    def __init__(self, max_concurrency: int = _RENDER_MAX_CONCURRENCY) -> None:
+        """Initialise the worker; threads are started on first use."""
+        self._max_concurrency = max_concurrency
+        self._executor: ThreadPoolExecutor | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self._waiting = 0
+        self._active = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of renders waiting for a free render slot."""
+        return self._waiting
+
+    @property
+    def active(self) -> int:
+        """Return the number of renders currently running."""
+        return self._active
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of distinct renders queued or running."""
+        return len(self._in_flight)
+
+    async def async_render(
+        self, key: Hashable, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run ``func(*args, **kwargs)`` off the loop, sharing identical renders.
+
+        A caller being cancelled does not cancel the render others may be
+        waiting on.
+        """
+        self._bind_loop()
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                self._async_run(partial(func, *args, **kwargs))
+            )
+            self._in_flight[key] = task
+            task.add_done_callback(partial(self._render_done, key))
+            _LOGGER.debug(
+                "Queued map render %s (queue depth %d, active %d)",
+                key,
+                self._waiting,
+                self._active,
+            )
+        else:
+            _LOGGER.debug("Joining in-flight map render %s", key)
+        return await asyncio.shield(task)
+
+    def _bind_loop(self) -> None:
+        """(Re)create loop-bound state when first used on a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._in_flight.clear()
+            self._waiting = 0
+            self._active = 0
+
+    async def _async_run(self, job: Callable[[], Any]) -> Any:
+        """Wait for a render slot, then run *job* on the worker threads."""
+        semaphore = self._semaphore
+        if semaphore is None:
+            raise RuntimeError("Map render worker is not bound to an event loop")
+        self._waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        self._active += 1
+        try:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_concurrency,
+                    thread_name_prefix="hass_dyson_map_render",
+                )
+            return await asyncio.get_running_loop().run_in_executor(self._executor, job)
+        finally:
+            self._active -= 1
+            semaphore.release()
+
+    def shutdown(self) -> None:
+        """Stop the render threads; they are recreated if rendering resumes."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _render_done(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a finished render and mark its outcome as retrieved."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled() and task.exception() is not None:
+            _LOGGER.debug("Map render %s failed: %s", key, task.exception())
+
+
+_render_worker = MapRenderWorker()
+
+
+def shutdown_render_worker() -> None:
+    """Stop the shared map render threads once the last entry is unloaded."""
+    _render_worker.shutdown()
+
+
+async def _async_timed_render(
+    key: tuple,
+    func: Callable[..., Any],
+    *args: Any,
+    metrics: DysonHotPathMetrics | None = None,
+    **kwargs: Any,
+) -> bytes | None:
+    """Render a PNG on the worker, timing it into *metrics*.
+
+    The sample is recorded under the renderer's name and covers the whole
+    wait: time queued for a render slot, or for an identical render already
+    in flight, as well as the render itself.
+    """
+    started = time.perf_counter()
+    png = await _render_worker.async_render(key, func, *args, **kwargs)
+    if metrics is not None:
+        metrics.record(
+            METRIC_RENDER_PREFIX + getattr(func, "__name__", "png").strip("_"),
+            time.perf_counter() - started,
+        )
+    return png
 
 
+async def _async_render_png(
+    hass: HomeAssistant,
+    key: tuple,
+    func: Callable[..., Any],
+    *args: Any,
+    metrics: DysonHotPathMetrics | None = None,
+    **kwargs: Any,
+) -> bytes | None:
+    """Render a PNG on the worker, reusing one persisted for the same *key*.
+
+    PNGs restored from disk are returned untimed; every other call is timed
+    into *metrics* by :func:`_async_timed_render`.
+    """
+    disk_key = repr(key)
+    disk_cache = get_disk_cache(hass)
+    if disk_cache is not None:
+        png = await disk_cache.async_get(_RENDER_DISK_NAMESPACE, disk_key)
+        if png:
+            return png
+    png = await _async_timed_render(key, func, *args, metrics=metrics, **kwargs)
+    if png:
+        persist(hass, _RENDER_DISK_NAMESPACE, disk_key, png)
+    return png
+
+
+@single_flight(coordinator_call_key)
 async def _fetch_map_image(
     coordinator: DysonDataUpdateCoordinator, map_id: str
 ) -> bytes | None:
@@ -144,6 +360,11 @@ async def _fetch_map_image(
     if cached is not None:
         # b"" sentinel means a previous call confirmed no image is available.
         return cached if cached else None
+    restored = await async_restore(
+        coordinator.hass, _map_image_cache, _MAP_IMAGE_DISK_NAMESPACE, key
+    )
+    if restored:
+        return restored
 
     async with coordinator.async_cloud_client() as client:
         if client is None:
@@ -163,11 +384,23 @@ async def _fetch_map_image(
 
     if image_bytes:
         _map_image_cache.set(key, image_bytes)
+        persist(coordinator.hass, _MAP_IMAGE_DISK_NAMESPACE, key, image_bytes)
     else:
         _map_image_cache.set(key, b"")
     return image_bytes or None
 
 
+@single_flight(lambda client, serial, clean_id: (serial, clean_id))
+async def _get_clean_map_data(client: Any, serial: str, clean_id: str) -> Any:
+    """Fetch raw clean-maps-data once for every concurrent consumer.
+
+    The dust-map and floor-plan entities both need the same payload for the
+    latest clean, usually at the same moment.
+    """
+    return await client.get_clean_map_data(serial, clean_id)
+
+
+@single_flight(coordinator_call_key)
 async def _fetch_clean_map_data_image(
     coordinator: DysonDataUpdateCoordinator, clean_id: str
 ) -> bytes | None:
@@ -190,12 +423,19 @@ async def _fetch_clean_map_data_image(
     cached = _map_image_cache.get(key)
     if cached is not None:
         return cached if cached else None
+    restored = await async_restore(
+        coordinator.hass, _map_image_cache, _MAP_IMAGE_DISK_NAMESPACE, key
+    )
+    if restored:
+        return restored
 
     async with coordinator.async_cloud_client() as client:
         if client is None:
             return None
         try:
-            data = await client.get_clean_map_data(coordinator.serial_number, clean_id)
+            data = await _get_clean_map_data(
+                client, coordinator.serial_number, clean_id
+            )
         except (DysonAPIError, DysonAuthError) as err:
             _LOGGER.debug(
                 "clean_map_data fetch failed for %s clean_id=%s: %s",
@@ -227,16 +467,31 @@ async def _fetch_clean_map_data_image(
     # (returned by GET /v2/{serial}/clean-maps-data/{cleanId} for RB05/804A)
     if "dimensions" in data and "dustMap" in data:
         rotation = int(data.get("orientation") or 0)
-        png = _render_v2_map_png(data, rotation)
+        png = await _async_timed_render(
+            ("v2map", key),
+            _render_v2_map_png,
+            data,
+            rotation,
+            metrics=coordinator.metrics,
+        )
         if png:
             _map_image_cache.set(key, png)
+            persist(coordinator.hass, _MAP_IMAGE_DISK_NAMESPACE, key, png)
             return png
 
     # Strategy 2: v1 format — {width, height, dustData}
     if "width" in data and "height" in data and "dustData" in data:
-        png = _render_dust_map_png(data, None, None)
+        png = await _async_timed_render(
+            ("v1map", key),
+            _render_dust_map_png,
+            data,
+            None,
+            None,
+            metrics=coordinator.metrics,
+        )
         if png:
             _map_image_cache.set(key, png)
+            persist(coordinator.hass, _MAP_IMAGE_DISK_NAMESPACE, key, png)
             return png
 
     # Nothing renderable — cache the miss.
@@ -244,6 +499,7 @@ async def _fetch_clean_map_data_image(
     return None
 
 
+@single_flight(coordinator_call_key)
 async def _fetch_v2_floor_plan_image(
     coordinator: DysonDataUpdateCoordinator, clean_id: str
 ) -> bytes | None:
@@ -260,12 +516,19 @@ async def _fetch_v2_floor_plan_image(
     cached = _floor_plan_cache.get(key)
     if cached is not None:
         return cached if cached else None
+    restored = await async_restore(
+        coordinator.hass, _floor_plan_cache, _FLOOR_PLAN_DISK_NAMESPACE, key
+    )
+    if restored:
+        return restored
 
     async with coordinator.async_cloud_client() as client:
         if client is None:
             return None
         try:
-            data = await client.get_clean_map_data(coordinator.serial_number, clean_id)
+            data = await _get_clean_map_data(
+                client, coordinator.serial_number, clean_id
+            )
         except (DysonAPIError, DysonAuthError) as err:
             _LOGGER.debug(
                 "v2 floor plan fetch failed for %s clean_id=%s: %s",
@@ -281,23 +544,58 @@ async def _fetch_v2_floor_plan_image(
         return None
 
     rotation = int(data.get("orientation") or 0)
-    png = _render_v2_floor_plan_png(data, rotation)
+    png = await _async_timed_render(
+        ("v2fp", key),
+        _render_v2_floor_plan_png,
+        data,
+        rotation,
+        metrics=coordinator.metrics,
+    )
     _floor_plan_cache.set(key, png if png else b"")
+    if png:
+        persist(coordinator.hass, _FLOOR_PLAN_DISK_NAMESPACE, key, png)
     return png
 
 
+@single_flight(coordinator_call_key)
 async def _fetch_persist_map(coordinator: DysonDataUpdateCoordinator, map_id: str):
     """Fetch a persistent map via libdyson-rest (cached 6 h).
 
     Returns a ``PersistentMap`` object or the stale cached value on failure.
+    The first call after a restart returns the map persisted by the previous
+    run, if any, and refreshes it in the background.
     """
-    from libdyson_rest.exceptions import DysonAPIError, DysonAuthError
-
     key = f"{coordinator.serial_number}:{map_id}"
     fresh = _persist_map_cache.get(key)
     if fresh is not None:
         return fresh
 
+    from libdyson_rest.models import PersistentMap
+
+    restored = await async_restore(
+        coordinator.hass,
+        _persist_map_cache,
+        _PERSIST_MAP_DISK_NAMESPACE,
+        key,
+        PersistentMap,
+    )
+    if restored is not None:
+        coordinator.hass.async_create_background_task(
+            _async_download_persist_map(coordinator, map_id),
+            name=f"{DOMAIN}_revalidate_persist_map_{coordinator.serial_number}",
+        )
+        return restored
+
+    return await _async_download_persist_map(coordinator, map_id)
+
+
+async def _async_download_persist_map(
+    coordinator: DysonDataUpdateCoordinator, map_id: str
+):
+    """Fetch a persistent map from the cloud and cache it in memory and on disk."""
+    from libdyson_rest.exceptions import DysonAPIError, DysonAuthError
+
+    key = f"{coordinator.serial_number}:{map_id}"
     async with coordinator.async_cloud_client() as client:
         if client is None:
             return _persist_map_cache.get_stale(key)
@@ -317,6 +615,7 @@ async def _fetch_persist_map(coordinator: DysonDataUpdateCoordinator, map_id: st
             return _persist_map_cache.get_stale(key)
 
     _persist_map_cache.set(key, pmap)
+    persist(coordinator.hass, _PERSIST_MAP_DISK_NAMESPACE, key, pmap)
     return pmap
 
 
@@ -359,6 +658,91 @@ def _apply_orientation(img, rotation_deg: int):
     return img
 
 
+def _dust_level_colour(level: int, scale: int) -> tuple[int, int, int, int]:
+    """Return the heatmap RGBA for one dust *level* out of *scale*.
+
+    Level 0 is fully transparent; anything else picks a gradient step by its
+    share of *scale* and is drawn at the overlay alpha.
+    """
+    if level == 0:
+        return (0, 0, 0, 0)
+    n_levels = len(_DUST_GRADIENT_RGB)
+    normalized = min(1.0, level / scale)
+    idx = min(n_levels - 1, int(normalized * n_levels))
+    return (*_DUST_GRADIENT_RGB[idx], _DUST_ALPHA)
+
+
+def _palette_image(size: tuple[int, int], indices: bytes, palette: bytes):
+    """Build an RGBA image from one palette index per pixel.
+
+    Pillow maps every pixel through the RGBA *palette* in a single C pass,
+    which replaces per-pixel Python loops over the canvas.
+    """
+    from PIL import Image
+
+    img = Image.frombytes("P", size, indices)
+    img.putpalette(palette, rawmode="RGBA")
+    return img.convert("RGBA")
+
+
+def _dust_heatmap(raw: bytes, width: int, height: int, scale: int):
+    """Render 8-bit v1 dust levels as an RGBA heatmap.
+
+    Each byte is a dust level, so the levels index a 256-entry RGBA palette
+    directly.
+    """
+    palette = b"".join(bytes(_dust_level_colour(level, scale)) for level in range(256))
+    return _palette_image((width, height), raw[: width * height], palette)
+
+
+def _v2_dust_heatmap(dust_data: list[int], width: int, height: int):
+    """Render v2 dust values, normalised to their maximum, as an RGBA heatmap.
+
+    The values are unbounded integers, so each distinct value is coloured
+    once and cells are mapped to a compact palette of gradient steps (index
+    0 is transparent). Cells beyond the data stay transparent, surplus
+    values are ignored.
+    """
+    max_val = max(dust_data) or 1
+    count = width * height
+    colours: list[tuple[int, int, int, int]] = [(0, 0, 0, 0)]
+    colour_index: dict[tuple[int, int, int, int], int] = {colours[0]: 0}
+    value_index: dict[int, int] = {}
+    for value in set(dust_data[:count]):
+        colour = _dust_level_colour(value, max_val)
+        if colour not in colour_index:
+            colour_index[colour] = len(colours)
+            colours.append(colour)
+        value_index[value] = colour_index[colour]
+    indices = bytes(map(value_index.__getitem__, dust_data[:count]))
+    indices += bytes(count - len(indices))
+    palette = b"".join(bytes(colour) for colour in colours)
+    return _palette_image((width, height), indices, palette)
+
+
+def _floor_plan_classes(img):
+    """Classify floor-plan pixels as boundary (0), interior (1) or outside (2).
+
+    Works on whole channels: per-channel threshold LUTs via ``Image.point``
+    combined with ``ImageChops.darker`` (a per-pixel minimum, i.e. AND for
+    0/255 masks) yield the white and black masks in C.
+    """
+    from PIL import Image, ImageChops
+
+    red, green, blue = img.split()[:3]
+
+    def _all_channels(threshold) -> Image.Image:
+        lut = [255 if threshold(v) else 0 for v in range(256)]
+        return ImageChops.darker(
+            ImageChops.darker(red.point(lut), green.point(lut)), blue.point(lut)
+        )
+
+    classes = Image.new("L", img.size, 2)
+    classes.paste(1, mask=_all_channels(lambda v: v < 50))
+    classes.paste(0, mask=_all_channels(lambda v: v > 200))
+    return classes
+
+
 def _palette_from_floor_plan(presentation_png: bytes):
     """Open the floor-plan PNG and recolour for clear display.
 
@@ -372,23 +756,9 @@ def _palette_from_floor_plan(presentation_png: bytes):
     from PIL import Image
 
     img = Image.open(io.BytesIO(presentation_png)).convert("RGBA")
-    pixels = img.load()
-    w, h = img.size
     # Repaint: zones → light cream, boundaries → dark blue-grey, outside → near-white
-    for y in range(h):
-        for x in range(w):
-            rgba_pixel: tuple[int, int, int, int] = pixels[x, y]  # type: ignore[assignment]
-            r, g, b, _ = rgba_pixel
-            if r > 200 and g > 200 and b > 200:
-                # white = boundary
-                pixels[x, y] = (60, 60, 90, 255)
-            elif r < 50 and g < 50 and b < 50:
-                # black = zone interior
-                pixels[x, y] = (250, 248, 240, 255)
-            else:
-                # gray = outside
-                pixels[x, y] = (235, 235, 235, 255)
-    return img
+    classes = _floor_plan_classes(img)
+    return _palette_image(img.size, classes.tobytes(), _FLOOR_PLAN_PALETTE)
 
 
 def _render_dust_map_png(
@@ -437,21 +807,7 @@ def _render_dust_map_png(
         return None
 
     # Build the dust heatmap as RGBA in its native (clean-coordinate) space.
-    rgba = bytearray(width * height * 4)
-    n_levels = len(_DUST_GRADIENT_RGB)
-    for i in range(width * height):
-        level = raw[i]
-        if level == 0:
-            rgba[i * 4 + 3] = 0
-            continue
-        normalized = min(1.0, level / scale)
-        idx = min(n_levels - 1, int(normalized * n_levels))
-        r, g, b = _DUST_GRADIENT_RGB[idx]
-        rgba[i * 4] = r
-        rgba[i * 4 + 1] = g
-        rgba[i * 4 + 2] = b
-        rgba[i * 4 + 3] = 220
-    dust_img = Image.frombytes("RGBA", (width, height), bytes(rgba))
+    dust_img = _dust_heatmap(raw, width, height, scale)
 
     # No floor plan → render dust map alone with orientation
     if not presentation_png:
@@ -575,22 +931,7 @@ def _render_v2_map_png(data: dict, rotation_deg: int = 0) -> bytes | None:
             return None
 
         # --- Render the dust heatmap onto a width×height RGBA canvas ---
-        max_val = max(dust_data) or 1
-        n_levels = len(_DUST_GRADIENT_RGB)
-        rgba = bytearray(width * height * 4)
-        for i in range(min(len(dust_data), width * height)):
-            level = dust_data[i]
-            if level == 0:
-                continue
-            normalized = min(1.0, level / max_val)
-            idx = min(n_levels - 1, int(normalized * n_levels))
-            r, g, b = _DUST_GRADIENT_RGB[idx]
-            rgba[i * 4] = r
-            rgba[i * 4 + 1] = g
-            rgba[i * 4 + 2] = b
-            rgba[i * 4 + 3] = 220
-
-        img = Image.frombytes("RGBA", (width, height), bytes(rgba))
+        img = _v2_dust_heatmap(dust_data, width, height)
         draw = ImageDraw.Draw(img)
 
         def _world_to_px(wx: float, wy: float) -> tuple[int, int]:
@@ -918,19 +1259,20 @@ class DysonDustMapImage(DysonEntity, ImageEntity):
             except (ValueError, TypeError):
                 cleaned_fp_png = None
 
-        # The renderer is pure-Python pixel loops over the full bitmap —
-        # run it in the executor so the event loop is not blocked.
-        png = await self.hass.async_add_executor_job(
-            partial(
-                _render_dust_map_png,
-                dust_map_dict,
-                cleaned_fp_png,
-                presentation_png,
-                rotation_deg,
-                map_offset_mm=map_offset_mm,
-                clean_position_mm=clean_position_mm,
-                map_resolution_mm_per_px=resolution_mm_per_px,
-            )
+        # Rendering and PNG encoding are CPU-bound — run them on the render
+        # worker so the event loop is not blocked.
+        png = await _async_render_png(
+            self.hass,
+            (self.coordinator.serial_number, *render_key),
+            _render_dust_map_png,
+            dust_map_dict,
+            cleaned_fp_png,
+            presentation_png,
+            rotation_deg,
+            map_offset_mm=map_offset_mm,
+            clean_position_mm=clean_position_mm,
+            map_resolution_mm_per_px=resolution_mm_per_px,
+            metrics=self.coordinator.metrics,
         )
         if png:
             self._render_cache_key = render_key
@@ -1052,8 +1394,13 @@ class DysonFloorPlanImage(DysonEntity, ImageEntity):
             )
             return None
 
-        png = await self.hass.async_add_executor_job(
-            _render_presentation_png, png_in, pmap.display_orientation
+        png = await _async_render_png(
+            self.hass,
+            (self.coordinator.serial_number, *render_key),
+            _render_presentation_png,
+            png_in,
+            pmap.display_orientation,
+            metrics=self.coordinator.metrics,
         )
         if png:
             self._render_cache_key = render_key
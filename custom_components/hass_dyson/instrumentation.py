@@ -0,0 +1,164 @@
+"""Lightweight counters and latency histograms for the integration's hot paths.
+
+Without numbers it is hard to tell which device floods the event loop with
+messages, or which entity class takes the longest to write its state. Each
+device and coordinator therefore keeps a :class:`DysonHotPathMetrics` that
+the MQTT handlers, listener fan-out, clean-map fetches and map renders
+record into.
+
+Recording Model:
+    - Counters are plain integers keyed by name; message types get their own
+      counter so rates per type can be reported
+    - Latencies go into fixed-bucket histograms, so recording is one
+      ``bisect`` and a few additions with no per-sample allocation
+    - Nothing is reset while the integration runs; rates are derived from
+      the time since the metrics were created
+
+Threading:
+    Each metric has a single writer: message counters and handler timings
+    are only written on paho's network thread, everything else only on the
+    event loop. Readers (diagnostics, sensors) may see a snapshot that is one
+    sample behind, which is fine for monitoring.
+
+The collected metrics are exposed through the integration's diagnostics and
+through optional, disabled-by-default diagnostic sensors.
+"""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections import Counter
+from typing import Any
+
+# Upper bounds of the histogram buckets, in milliseconds. Samples above the
+# last bound land in an overflow bucket.
+HISTOGRAM_BUCKETS_MS: tuple[float, ...] = (
+    0.1,
+    0.5,
+    1,
+    5,
+    10,
+    50,
+    100,
+    500,
+    1000,
+)
+
+# Histogram names shared by the recording sites and their readers.
+METRIC_ON_MESSAGE = "on_message"
+METRIC_CALLBACKS = "message_callbacks"
+METRIC_MESSAGE_UPDATE = "message_update"
+METRIC_LISTENER_PREFIX = "listener."
+METRIC_FETCH_CLEAN_MAPS = "fetch_clean_maps"
+METRIC_RENDER_PREFIX = "render."
+
+# Counter names.
+COUNTER_MESSAGES = "messages"
+COUNTER_MESSAGE_ERRORS = "message_errors"
+COUNTER_CALLBACKS = "callbacks"
+COUNTER_CALLBACK_ERRORS = "callback_errors"
+COUNTER_EXECUTOR_JOBS = "executor_jobs"
+COUNTER_LISTENER_UPDATES = "listener_updates"
+COUNTER_LISTENERS_SKIPPED = "listeners_skipped"
+
+
+class DysonLatencyHistogram:
+    """Count, total, maximum and bucketed distribution of latency samples."""
+
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self) -> None:
+        """Initialise an empty histogram."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+
+    def record(self, seconds: float) -> None:
+        """Add one sample measured in seconds."""
+        milliseconds = seconds * 1000
+        self.count += 1
+        self.total += milliseconds
+        if milliseconds > self.max:
+            self.max = milliseconds
+        self.buckets[bisect_left(HISTOGRAM_BUCKETS_MS, milliseconds)] += 1
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean sample in milliseconds, or None without samples."""
+        if not self.count:
+            return None
+        return self.total / self.count
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as JSON-serialisable data."""
+        mean = self.mean
+        buckets = {
+            f"le_{bound:g}ms": count
+            for bound, count in zip(HISTOGRAM_BUCKETS_MS, self.buckets, strict=False)
+        }
+        buckets[f"gt_{HISTOGRAM_BUCKETS_MS[-1]:g}ms"] = self.buckets[-1]
+        return {
+            "count": self.count,
+            "total_ms": round(self.total, 3),
+            "mean_ms": None if mean is None else round(mean, 3),
+            "max_ms": round(self.max, 3),
+            "buckets": buckets,
+        }
+
+
+class DysonHotPathMetrics:
+    """Counters and latency histograms for one device or coordinator."""
+
+    def __init__(self) -> None:
+        """Initialise empty metrics starting now."""
+        self.started = time.monotonic()
+        self.counters: Counter[str] = Counter()
+        self.message_types: Counter[str] = Counter()
+        self.histograms: dict[str, DysonLatencyHistogram] = {}
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Add *amount* to the counter called *name*."""
+        self.counters[name] += amount
+
+    def count_message(self, message_type: str) -> None:
+        """Count one received message of *message_type*."""
+        self.counters[COUNTER_MESSAGES] += 1
+        self.message_types[message_type or "unknown"] += 1
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record a latency sample for the histogram called *name*."""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = DysonLatencyHistogram()
+        histogram.record(seconds)
+
+    def get_histogram(self, name: str) -> DysonLatencyHistogram | None:
+        """Return the histogram called *name*, if anything was recorded."""
+        return self.histograms.get(name)
+
+    @property
+    def uptime(self) -> float:
+        """Return the seconds since the metrics were created."""
+        return time.monotonic() - self.started
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all metrics, with per-minute rates, as JSON-serialisable data."""
+        minutes = max(self.uptime / 60, 1 / 60)
+        return {
+            "uptime_s": round(self.uptime, 1),
+            "counters": dict(self.counters),
+            "messages_per_minute": round(self.counters[COUNTER_MESSAGES] / minutes, 3),
+            "message_types": {
+                message_type: {
+                    "count": count,
+                    "per_minute": round(count / minutes, 3),
+                }
+                for message_type, count in dict(self.message_types).items()
+            },
+            "histograms": {
+                name: histogram.as_dict()
+                for name, histogram in sorted(dict(self.histograms).items())
+            },
+        }
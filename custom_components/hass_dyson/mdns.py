@@ -0,0 +1,249 @@
+"""Shared mDNS browser that tracks Dyson device addresses on the local network.
+
+Locating a device used to mean a blocking ``get_service_info`` query and a
+``gethostbyname`` lookup in the executor, under a 10 second wait, every time
+a device was set up manually. This module keeps one ``AsyncServiceBrowser``
+on Home Assistant's shared zeroconf instance instead, so addresses are known
+before anyone asks for them.
+
+Cache Model:
+    - The browser listens for ``_dyson._mqtt._tcp`` announcements for as long
+      as the integration is loaded
+    - Each announcement is resolved asynchronously and indexed by the serial
+      number taken from the service instance name
+    - Lookups of announced devices are answered from the index without any
+      network traffic; unknown serials fall back to one targeted query
+
+Address Changes:
+    Listeners registered per serial are called when a device announces a
+    different address than before (typically after a new DHCP lease), so a
+    coordinator can point its device at the new address and reconnect at
+    once rather than waiting for connection attempts to the old one to fail.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from zeroconf import IPVersion, ServiceStateChange
+from zeroconf.asyncio import AsyncServiceBrowser, AsyncServiceInfo
+
+from .const import DATA_MDNS_CACHE, MDNS_SERVICE_DYSON
+from .device_utils import mask_serial
+
+_LOGGER = logging.getLogger(__name__)
+
+# How long a single announcement may take to resolve to an address.
+_RESOLVE_TIMEOUT_MS = 3000
+
+AddressListener = Callable[[str], None]
+
+
+def _serial_from_service_name(name: str, service_type: str) -> str | None:
+    """Return the serial number encoded in an mDNS service instance name.
+
+    Dyson devices announce ``{serial}.{service_type}``; some firmware prefixes
+    the product type as ``{product_type}_{serial}``.
+    """
+    suffix = f".{service_type}"
+    if not name.endswith(suffix):
+        return None
+    instance = name[: -len(suffix)]
+    serial = instance.rsplit("_", 1)[-1]
+    return serial.upper() or None
+
+
+class DysonMdnsCache:
+    """Index of Dyson device addresses fed by a long-running mDNS browser.
+
+    All state is only touched on the event loop: zeroconf's asyncio browser
+    calls :meth:`_on_service_state_change` from the loop as well.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise an empty cache; the browser starts on first use."""
+        self._hass = hass
+        self._zeroconf: Any = None
+        self._browser: AsyncServiceBrowser | None = None
+        self._start_lock = asyncio.Lock()
+        self._addresses: dict[str, str] = {}
+        self._listeners: dict[str, list[AddressListener]] = {}
+        self._resolving: dict[str, asyncio.Task] = {}
+
+    @property
+    def started(self) -> bool:
+        """Return True once the browser is running."""
+        return self._browser is not None
+
+    async def async_start(self) -> None:
+        """Start browsing for Dyson devices on HA's shared zeroconf instance."""
+        async with self._start_lock:
+            if self._browser is not None:
+                return
+            from homeassistant.components import zeroconf
+
+            aiozc = await zeroconf.async_get_async_instance(self._hass)
+            self._zeroconf = aiozc.zeroconf
+            self._browser = AsyncServiceBrowser(
+                self._zeroconf,
+                [MDNS_SERVICE_DYSON],
+                handlers=[self._on_service_state_change],
+            )
+            _LOGGER.debug("Started mDNS browser for %s", MDNS_SERVICE_DYSON)
+
+    async def async_stop(self) -> None:
+        """Stop the browser and drop pending resolutions."""
+        for task in self._resolving.values():
+            task.cancel()
+        self._resolving.clear()
+        browser, self._browser = self._browser, None
+        if browser is not None:
+            await browser.async_cancel()
+
+    def get_address(self, serial_number: str) -> str | None:
+        """Return the last announced IPv4 address for a device, if any."""
+        return self._addresses.get(serial_number.upper())
+
+    async def async_resolve(
+        self, serial_number: str, timeout: float = 10
+    ) -> str | None:
+        """Return a device's address, querying the network only if unannounced."""
+        address = self.get_address(serial_number)
+        if address is not None or self._zeroconf is None:
+            return address
+        return await self._async_resolve_service(
+            serial_number.upper(),
+            MDNS_SERVICE_DYSON,
+            f"{serial_number}.{MDNS_SERVICE_DYSON}",
+            int(timeout * 1000),
+        )
+
+    @callback
+    def async_add_listener(
+        self, serial_number: str, listener: AddressListener
+    ) -> Callable[[], None]:
+        """Call *listener* with the new address whenever a device moves.
+
+        Returns a function that removes the listener again.
+        """
+        listeners = self._listeners.setdefault(serial_number.upper(), [])
+        listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            if listener in listeners:
+                listeners.remove(listener)
+
+        return _remove
+
+    def _on_service_state_change(
+        self,
+        zeroconf: Any,
+        service_type: str,
+        name: str,
+        state_change: ServiceStateChange,
+    ) -> None:
+        """Resolve added or updated Dyson services in the background."""
+        if state_change is ServiceStateChange.Removed:
+            # Keep the last known address; devices usually return on it.
+            return
+        serial = _serial_from_service_name(name, service_type)
+        if serial is None or name in self._resolving:
+            return
+        task = self._hass.async_create_background_task(
+            self._async_resolve_service(
+                serial, service_type, name, _RESOLVE_TIMEOUT_MS
+            ),
+            name=f"dyson-mdns-{mask_serial(serial)}",
+        )
+        self._resolving[name] = task
+        task.add_done_callback(lambda _: self._resolving.pop(name, None))
+
+    async def _async_resolve_service(
+        self, serial: str, service_type: str, name: str, timeout_ms: int
+    ) -> str | None:
+        """Resolve one service instance and record its IPv4 address."""
+        info = AsyncServiceInfo(service_type, name)
+        try:
+            if not await info.async_request(self._zeroconf, timeout_ms):
+                return None
+        except Exception as err:
+            _LOGGER.debug("mDNS resolution failed for %s: %s", mask_serial(serial), err)
+            return None
+        addresses = info.parsed_addresses(IPVersion.V4Only)
+        if not addresses:
+            return None
+        self._async_set_address(serial, addresses[0])
+        return addresses[0]
+
+    @callback
+    def _async_set_address(self, serial: str, address: str) -> None:
+        """Record *address* for *serial* and notify listeners if it changed."""
+        previous = self._addresses.get(serial)
+        self._addresses[serial] = address
+        if previous == address:
+            return
+        _LOGGER.debug(
+            "Device %s announced at %s (was %s)",
+            mask_serial(serial),
+            address,
+            previous or "unknown",
+        )
+        for listener in list(self._listeners.get(serial, ())):
+            try:
+                listener(address)
+            except Exception:
+                _LOGGER.exception(
+                    "Error in mDNS address listener for %s", mask_serial(serial)
+                )
+
+
+def get_mdns_cache(hass: HomeAssistant | Any) -> DysonMdnsCache | None:
+    """Return the integration-wide mDNS cache, creating it on first use.
+
+    Returns ``None`` for hass stand-ins without a real ``data`` dict (tests,
+    partially set-up objects). The returned cache may not be browsing yet;
+    use :func:`async_get_mdns_cache` to make sure it is.
+    """
+    data = getattr(hass, "data", None)
+    if not isinstance(data, dict):
+        return None
+    cache = data.get(DATA_MDNS_CACHE)
+    if cache is None:
+        cache = data[DATA_MDNS_CACHE] = DysonMdnsCache(hass)
+    return cache
+
+
+async def async_get_mdns_cache(hass: HomeAssistant | Any) -> DysonMdnsCache | None:
+    """Return the mDNS cache with its browser running, or ``None`` if unavailable.
+
+    The browser needs Home Assistant's zeroconf integration; without it (or
+    when it fails to start) callers fall back to ``{serial}.local`` names.
+    """
+    components = getattr(getattr(hass, "config", None), "components", None)
+    if not isinstance(components, set) or "zeroconf" not in components:
+        return None
+    cache = get_mdns_cache(hass)
+    if cache is None:
+        return None
+    if not cache.started:
+        try:
+            await cache.async_start()
+        except Exception as err:
+            _LOGGER.debug("Unable to start mDNS browser: %s", err)
+            return None
+    return cache
+
+
+async def async_shutdown_mdns_cache(hass: HomeAssistant) -> None:
+    """Stop and drop the integration-wide mDNS cache, if one exists."""
+    data = getattr(hass, "data", None)
+    if not isinstance(data, dict):
+        return
+    cache = data.pop(DATA_MDNS_CACHE, None)
+    if cache is not None:
+        await cache.async_stop()
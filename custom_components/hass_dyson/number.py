@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
+import time
+from collections.abc import Callable
 from typing import Any
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
 from .const import DOMAIN
 from .coordinator import DysonDataUpdateCoordinator
@@ -17,6 +19,9 @@ from .entity import DysonEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# The device reports the sleep timer in whole minutes.
+_SLEEP_TIMER_TICK = 60.0
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -59,9 +64,18 @@ async def async_setup_entry(
 
 
 class DysonSleepTimerNumber(DysonEntity, NumberEntity):
-    """Number entity for sleep timer control."""
+    """Number entity for sleep timer control.
+
+    The device only reports ``sltm`` when the timer is set or changed, in
+    whole minutes rounded down.  Rather than polling while a timer runs, the
+    remaining time is counted down locally from the last reported value and
+    re-anchored whenever the device reports a new one.  The device is only
+    asked for its state when the local countdown ends but the device still
+    reports a running timer.
+    """
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"sltm"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the sleep timer number."""
@@ -75,194 +89,142 @@ class DysonSleepTimerNumber(DysonEntity, NumberEntity):
         self._attr_native_max_value = 540  # 9 hours in minutes
         self._attr_native_step = 15  # 15-minute increments
         self._attr_native_unit_of_measurement = "min"
-        self._timer_polling_task: asyncio.Task | None = None
+        # (minutes, time.monotonic()) of the value the countdown started from
+        self._timer_anchor: tuple[int, float] | None = None
+        self._last_reported_sltm: Any = None
+        self._unsub_timer_tick: Callable[[], None] | None = None
         if coordinator.data and coordinator.device:
-            product_state = coordinator.data.get("product-state", {})
-            sltm = coordinator.device.get_state_value(product_state, "sltm", "OFF")
-            try:
-                self._attr_native_value = 0 if sltm == "OFF" else int(sltm)
-            except (ValueError, TypeError):
-                self._attr_native_value = 0
+            self._last_reported_sltm, minutes = self._reported_timer()
+            self._anchor_timer(minutes)
         else:
             self._attr_native_value = 0
 
     async def async_added_to_hass(self) -> None:
         """Entity added to hass."""
         await super().async_added_to_hass()
-        # Start minimal polling when timer is active (vendor app behavior)
-        self._start_timer_polling_if_needed()
+        # Start the local countdown if a timer was already running
+        self._start_timer_tracking()
 
     async def async_will_remove_from_hass(self) -> None:
         """Entity will be removed from hass."""
-        if hasattr(self, "_timer_polling_task") and self._timer_polling_task:
-            self._timer_polling_task.cancel()
+        self._stop_timer_tracking()
         await super().async_will_remove_from_hass()
 
-    def _start_timer_polling_if_needed(self) -> None:
-        """Start polling only when timer is active, like vendor app."""
-        if self._timer_polling_task and not self._timer_polling_task.done():
-            return  # Already running
-
-        # Check if timer is currently active
-        if self.coordinator.device:
-            product_state = self.coordinator.data.get("product-state", {})
-            timer_data = self.coordinator.device.get_state_value(
-                product_state, "sltm", "OFF"
-            )
-            if timer_data != "OFF":
-                try:
-                    timer_value = int(timer_data)
-                    if timer_value > 0:
-                        _LOGGER.debug(
-                            "Starting timer polling for active timer (%s min) on %s",
-                            timer_value,
-                            self.coordinator.serial_number,
-                        )
-                        self._timer_polling_task = asyncio.create_task(
-                            self._poll_timer_updates()
-                        )
-                except (ValueError, TypeError):
-                    pass
-
-    async def _poll_timer_updates(self) -> None:
-        """Poll for timer updates when timer is active (vendor app behavior)."""
-        try:
-            # Device reports whole minutes rounded down, so timing is unpredictable
-            # Use more frequent polling initially to catch minute transitions reliably
-            await self._do_frequent_initial_polling()
-
-            # Then continue with regular 60-second intervals
-            await self._do_regular_polling()
-        except asyncio.CancelledError:
-            _LOGGER.debug(
-                "Timer polling cancelled for %s", self.coordinator.serial_number
-            )
-        except asyncio.CancelledError:
-            _LOGGER.debug(
-                "Timer polling task cancelled for %s", self.coordinator.serial_number
-            )
-        except (ConnectionError, TimeoutError) as err:
-            _LOGGER.warning(
-                "Communication error during timer polling for %s: %s",
-                self.coordinator.serial_number,
-                err,
-            )
-        except Exception as err:
-            _LOGGER.error(
-                "Unexpected error in timer polling for %s: %s",
-                self.coordinator.serial_number,
-                err,
-            )
-
-    async def _do_frequent_initial_polling(self) -> None:
-        """Do frequent polling for first few minutes to catch transitions."""
-        # Poll every 30 seconds for the first 3 minutes to catch transitions
-        for i in range(6):  # 6 polls over 3 minutes
-            await asyncio.sleep(30)
-
-            if not await self._poll_timer_once(f"initial poll {i + 1}/6"):
-                return
-
-    async def _do_regular_polling(self) -> None:
-        """Continue with regular 60-second polling intervals."""
-        while True:
-            await asyncio.sleep(60)  # Wait 1 minute
-
-            if not await self._poll_timer_once("regular poll"):
-                return
-
-    async def _poll_timer_once(self, poll_type: str) -> bool:
-        """Poll timer once and return False if timer is off or device unavailable."""
-        if not (self.coordinator.device and self.coordinator.device.is_connected):
-            return False
-
+    def _reported_timer(self) -> tuple[Any, int]:
+        """Return the raw ``sltm`` value and the minutes it represents."""
         product_state = self.coordinator.data.get("product-state", {})
-        timer_data = self.coordinator.device.get_state_value(
-            product_state, "sltm", "OFF"
+        sltm = self.coordinator.device.get_state_value(product_state, "sltm", "OFF")
+        try:
+            minutes = 0 if sltm == "OFF" else int(sltm)
+        except (ValueError, TypeError):
+            minutes = 0
+        return sltm, minutes
+
+    def _remaining_minutes(self) -> int:
+        """Return the locally counted-down minutes left on the timer."""
+        if self._timer_anchor is None:
+            return 0
+        minutes, anchored_at = self._timer_anchor
+        elapsed = int((time.monotonic() - anchored_at) // _SLEEP_TIMER_TICK)
+        return max(0, minutes - elapsed)
+
+    def _anchor_timer(self, minutes: int) -> None:
+        """Restart the local countdown from *minutes* (0 stops it)."""
+        self._stop_timer_tracking()
+        self._attr_native_value = minutes
+        if minutes > 0:
+            self._timer_anchor = (minutes, time.monotonic())
+            self._start_timer_tracking()
+        else:
+            self._timer_anchor = None
+
+    def _start_timer_tracking(self) -> None:
+        """Schedule the next countdown tick while a timer is running."""
+        if (
+            self._timer_anchor is None
+            or self._unsub_timer_tick is not None
+            or self.hass is None
+        ):
+            return
+        # Tick on the anchor's minute boundaries, when the value changes
+        elapsed = time.monotonic() - self._timer_anchor[1]
+        delay = _SLEEP_TIMER_TICK - (elapsed % _SLEEP_TIMER_TICK)
+        self._unsub_timer_tick = async_call_later(
+            self.hass, delay, self._async_timer_tick
         )
 
-        if timer_data == "OFF" or timer_data == "0":
-            _LOGGER.debug(
-                "Timer finished or turned off for %s", self.coordinator.serial_number
-            )
-            return False
+    def _stop_timer_tracking(self) -> None:
+        """Cancel the pending countdown tick, if any."""
+        if self._unsub_timer_tick is not None:
+            self._unsub_timer_tick()
+            self._unsub_timer_tick = None
+
+    @callback
+    def _async_timer_tick(self, _now: Any) -> None:
+        """Advance the local countdown by one minute."""
+        self._unsub_timer_tick = None
+        remaining = self._remaining_minutes()
+        self._attr_native_value = remaining
+        self.async_write_ha_state()
+        if remaining > 0:
+            self._start_timer_tracking()
+            return
 
-        _LOGGER.debug(
-            "Timer %s for %s: %s min",
-            poll_type,
-            self.coordinator.serial_number,
-            timer_data,
-        )
-        await self.coordinator.device._request_current_state()
-        return True
-
-    def _stop_timer_polling(self) -> None:
-        """Stop timer polling task."""
-        if self._timer_polling_task and not self._timer_polling_task.done():
-            self._timer_polling_task.cancel()
-            self._timer_polling_task = None
+        self._timer_anchor = None
+        device = self.coordinator.device
+        if (
+            device
+            and device.is_connected
+            and self.coordinator.data
+            and self._reported_timer()[1] > 0
+        ):
+            # The device should have reported the timer ending by now; our
+            # clock has drifted from its, so ask for the authoritative value.
             _LOGGER.debug(
-                "Stopped sleep timer polling for %s", self.coordinator.serial_number
+                "Sleep timer countdown ended but device still reports %s for %s; "
+                "requesting current state",
+                self._last_reported_sltm,
+                self.coordinator.serial_number,
             )
+            self.hass.async_create_task(device.send_command("REQUEST-CURRENT-STATE"))
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.debug(
-            "Sleep timer entity _handle_coordinator_update called for %s",
-            self.coordinator.serial_number,
-        )
         if self.coordinator.device:
-            # Get sleep timer from device state (sltm)
-            product_state = self.coordinator.data.get("product-state", {})
             try:
-                timer_data = self.coordinator.device.get_state_value(
-                    product_state, "sltm", "OFF"
-                )
-                if timer_data == "OFF":
-                    device_value = 0
-                else:
-                    try:
-                        # Convert timer data to minutes
-                        device_value = int(timer_data)
-                    except (ValueError, TypeError):
-                        device_value = 0
-
-                _LOGGER.debug(
-                    "TIMER DEBUG: Updating sleep timer entity from %s to %s for %s (coordinator update)",
-                    self._attr_native_value,
-                    device_value,
-                    self.coordinator.serial_number,
-                )
-                self._attr_native_value = device_value
-
-                # Start polling if timer is now active (handles vendor app timer changes)
-                if device_value > 0:
-                    self._start_timer_polling_if_needed()
+                sltm, device_value = self._reported_timer()
+                # Unrelated updates carry the last reported (now stale) value;
+                # only a newly reported value corrects the countdown.
+                if sltm != self._last_reported_sltm:
+                    expected = self._remaining_minutes()
+                    if abs(device_value - expected) > 1:
+                        _LOGGER.debug(
+                            "Sleep timer for %s corrected from %s to %s min",
+                            self.coordinator.serial_number,
+                            expected,
+                            device_value,
+                        )
+                    self._last_reported_sltm = sltm
+                    self._anchor_timer(device_value)
                 else:
-                    self._stop_timer_polling()
-
+                    self._attr_native_value = self._remaining_minutes()
             except (KeyError, AttributeError) as err:
                 _LOGGER.debug(
                     "Sleep timer data not available for %s: %s",
                     self.coordinator.serial_number,
                     err,
                 )
-                self._attr_native_value = 0
-            except (ValueError, TypeError) as err:
-                _LOGGER.warning(
-                    "Invalid sleep timer data format for %s: %s",
-                    self.coordinator.serial_number,
-                    err,
-                )
-                self._attr_native_value = 0
+                self._anchor_timer(0)
             except Exception as err:
                 _LOGGER.error(
                     "Unexpected error processing sleep timer update for %s: %s",
                     self.coordinator.serial_number,
                     err,
                 )
-                self._attr_native_value = 0
+                self._anchor_timer(0)
         else:
+            self._stop_timer_tracking()
+            self._timer_anchor = None
             self._attr_native_value = None
         super()._handle_coordinator_update()
 
@@ -282,24 +244,13 @@ class DysonSleepTimerNumber(DysonEntity, NumberEntity):
             # Send the command to the device
             await self.coordinator.device.set_sleep_timer(minutes)
 
-            if minutes > 0:
-                # Wait for device to process the command, then poll to get actual value
-                _LOGGER.debug(
-                    "Sleep timer set, waiting 15s then polling for actual device value"
-                )
-                await asyncio.sleep(15)
-
-                # Force a poll to get the device's actual timer value
-                await self.coordinator.device._request_current_state()
-
-                # Wait a bit more for the coordinator update, then start polling
-                await asyncio.sleep(5)
-                self._start_timer_polling_if_needed()
-            else:
-                # Timer turned off, stop polling and set to 0
-                self._stop_timer_polling()
-                self._attr_native_value = 0
-                self.async_write_ha_state()
+            # Count down from the requested value straight away; the device's
+            # STATE-CHANGE echo re-anchors it to the value it actually applied.
+            _LOGGER.debug(
+                "Sleep timer set, counting down locally from %s minutes", minutes
+            )
+            self._anchor_timer(minutes)
+            self.async_write_ha_state()
 
         except (ConnectionError, TimeoutError) as err:
             _LOGGER.error(
@@ -348,6 +299,7 @@ class DysonOscillationLowerAngleNumber(DysonEntity, NumberEntity):
     """Number entity for oscillation lower angle control."""
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"osal", "osau", "ancp"})
 
     # Canonical spans for named presets — device does not update osal/osau for
     # these, so we derive lower/upper from ancp + the last-known midpoint.
@@ -465,6 +417,7 @@ class DysonOscillationUpperAngleNumber(DysonEntity, NumberEntity):
     """Number entity for oscillation upper angle control."""
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"osal", "osau", "ancp"})
 
     # Canonical spans for named presets — device does not update osal/osau for
     # these, so we derive lower/upper from ancp + the last-known midpoint.
@@ -582,6 +535,7 @@ class DysonOscillationCenterAngleNumber(DysonEntity, NumberEntity):
     """Number entity for oscillation center angle control."""
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"osal", "osau"})
 
     # Map ancp preset codes to canonical spans (same as DysonOscillationAngleSpanNumber).
     # Used in async_set_native_value so that moving the center while in a named
@@ -711,6 +665,7 @@ class DysonOscillationAngleSpanNumber(DysonEntity, NumberEntity):
     """Number entity for oscillation angle span control."""
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"osal", "osau", "ancp"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the oscillation angle span number."""
@@ -838,6 +793,7 @@ class DysonOscillationDay0LowerAngleNumber(DysonEntity, NumberEntity):
     """Number entity for AdvanceOscillationDay0 lower angle control."""
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"osal"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the Day0 oscillation lower angle number."""
@@ -893,6 +849,7 @@ class DysonOscillationDay0LowerAngleNumber(DysonEntity, NumberEntity):
             await self.coordinator.device.set_oscillation_angles_day0(
                 lower_angle, upper_angle
             )
+            self._async_set_optimistic(("osal",), native_value=lower_angle)
             _LOGGER.debug(
                 "Set Day0 oscillation lower angle to %s for %s",
                 lower_angle,
@@ -931,6 +888,7 @@ class DysonOscillationDay0UpperAngleNumber(DysonEntity, NumberEntity):
     """Number entity for AdvanceOscillationDay0 upper angle control."""
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"osau"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the Day0 oscillation upper angle number."""
@@ -986,6 +944,7 @@ class DysonOscillationDay0UpperAngleNumber(DysonEntity, NumberEntity):
             await self.coordinator.device.set_oscillation_angles_day0(
                 lower_angle, upper_angle
             )
+            self._async_set_optimistic(("osau",), native_value=upper_angle)
             _LOGGER.debug(
                 "Set Day0 oscillation upper angle to %s for %s",
                 upper_angle,
@@ -1024,6 +983,7 @@ class DysonOscillationDay0AngleSpanNumber(DysonEntity, NumberEntity):
     """Number entity for AdvanceOscillationDay0 angle span control."""
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"osal", "osau"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the Day0 oscillation angle span number."""
@@ -1133,6 +1093,7 @@ class DysonOscillationDay0CenterAngleNumber(DysonEntity, NumberEntity):
     """
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"osal", "osau"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the Day0 oscillation center angle number."""
@@ -96,6 +96,7 @@ class DysonOscillationModeSelect(DysonEntity, SelectEntity):
     """Select entity for oscillation mode."""
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"oson", "osal", "osau", "ancp"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the oscillation mode select."""
@@ -496,6 +497,7 @@ class DysonOscillationModeDay0Select(DysonEntity, SelectEntity):
     """Select entity for oscillation mode (AdvanceOscillationDay0 capability)."""
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"oson", "osal", "osau", "ancp"})
     _PRESET_ANCP_MAP: dict[str, str] = {"0015": "15°", "0040": "40°", "0070": "70°"}
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
@@ -675,6 +677,7 @@ class DysonHeatingModeSelect(DysonEntity, SelectEntity):
     """Select entity for heating mode."""
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"hmod", "hmax"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the heating mode select."""
@@ -725,6 +728,7 @@ class DysonHeatingModeSelect(DysonEntity, SelectEntity):
                 mode_value = "AUTO"
 
             await self.coordinator.device.set_heating_mode(mode_value)
+            self._async_set_optimistic(("hmod",), current_option=option)
             _LOGGER.debug(
                 "Set heating mode to %s for %s", option, self.coordinator.serial_number
             )
@@ -787,6 +791,7 @@ class DysonWaterHardnessSelect(DysonEntity, SelectEntity):
     """Select entity for water hardness setting on humidifier devices."""
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"wath"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the water hardness select."""
@@ -850,10 +855,7 @@ class DysonWaterHardnessSelect(DysonEntity, SelectEntity):
 
         try:
             await self.coordinator.device.set_water_hardness(option.lower())
-
-            # Update local state immediately for responsive UI
-            self._attr_current_option = option
-            self.async_write_ha_state()
+            self._async_set_optimistic(("wath",), current_option=option)
 
             _LOGGER.debug(
                 "Set water hardness to '%s' for %s",
@@ -1289,6 +1291,7 @@ class DysonTiltOscillationModeSelect(DysonEntity, SelectEntity):
     """
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"oton", "otal", "otau", "anct"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the tilt oscillation mode select."""
@@ -1341,10 +1344,7 @@ class DysonTiltOscillationModeSelect(DysonEntity, SelectEntity):
 
         try:
             await self.coordinator.device.set_tilt_oscillation(option)
-
-            # Optimistic update for responsive UI
-            self._attr_current_option = option
-            self.async_write_ha_state()
+            self._async_set_optimistic(("oton", "otal"), current_option=option)
 
             _LOGGER.debug(
                 "Set tilt oscillation to '%s' for %s",
@@ -50,8 +50,9 @@ Sensor States:
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
-from typing import Any
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import Any, NamedTuple
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -66,7 +67,7 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_call_later, async_track_time_interval
@@ -74,18 +75,43 @@ from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import (
     _PM_SENSOR_UNAVAILABLE_STATES,
+    AQI_CO2_RANGES,
+    AQI_HCHO_RANGES,
+    AQI_NO2_RANGES,
+    AQI_PM10_RANGES,
+    AQI_PM25_RANGES,
+    AQI_VOC_RANGES,
     CAPABILITY_EXTENDED_AQ,
     CAPABILITY_FORMALDEHYDE,
     CAPABILITY_VOC,
     DOMAIN,
+    POLLUTANT_KEYS,
+    STATE_KEY_LEGACY_FILTER_LIFE,
+    AQIRange,
+)
+from .coordinator import (
+    DysonDataUpdateCoordinator,
+    TTLCache,
+    coordinator_call_key,
+    single_flight,
 )
-from .coordinator import DysonDataUpdateCoordinator, TTLCache
 from .device_utils import mask_serial
 from .entity import DysonEntity
+from .instrumentation import (
+    COUNTER_EXECUTOR_JOBS,
+    COUNTER_MESSAGES,
+    METRIC_LISTENER_PREFIX,
+    METRIC_ON_MESSAGE,
+)
 from .vacuum import _clean_maps_cache, fetch_clean_maps
 
 _LOGGER = logging.getLogger(__name__)
 
+# Every environmental key the AQI calculation can read.
+_POLLUTANT_SUBSCRIPTION = frozenset(
+    key for keys in POLLUTANT_KEYS.values() for key in keys
+)
+
 
 class DysonP25RSensor(DysonEntity, SensorEntity):
     """PM2.5 air quality sensor for Dyson devices with EnvironmentalData or ExtendedAQ capability.
@@ -129,6 +155,7 @@ class DysonP25RSensor(DysonEntity, SensorEntity):
     """
 
     coordinator: DysonDataUpdateCoordinator
+    _environmental_keys = frozenset({"p25r"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the PM2.5 sensor with proper Home Assistant integration.
@@ -255,6 +282,7 @@ class DysonP10RSensor(DysonEntity, SensorEntity):
     """
 
     coordinator: DysonDataUpdateCoordinator
+    _environmental_keys = frozenset({"p10r"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the P10R sensor."""
@@ -349,6 +377,7 @@ class DysonCO2Sensor(DysonEntity, SensorEntity):
     """CO2 sensor for Dyson devices with ExtendedAQ capability."""
 
     coordinator: DysonDataUpdateCoordinator
+    _environmental_keys = frozenset({"co2r"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the CO2 sensor."""
@@ -444,6 +473,7 @@ class DysonVOCSensor(DysonEntity, SensorEntity):
     """VOC (Volatile Organic Compounds) sensor for Dyson devices with ExtendedAQ capability."""
 
     coordinator: DysonDataUpdateCoordinator
+    _environmental_keys = frozenset({"va10"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the VOC sensor."""
@@ -545,6 +575,39 @@ class DysonVOCSensor(DysonEntity, SensorEntity):
         super()._handle_coordinator_update()
 
 
+def _lookup_pollutant_aqi(
+    value: float | int | None,
+    highs: tuple[float | int, ...],
+    ranges: tuple[AQIRange, ...] | list[AQIRange],
+) -> tuple[int | None, str | None]:
+    """Calculate AQI value and category by bisecting precomputed breakpoints.
+
+    *highs* holds the upper bound of each range in *ranges*, which must be
+    sorted and non-overlapping.
+    """
+    if value is None or value < 0:
+        return None, None
+
+    index = bisect_left(highs, value)
+    if index < len(ranges) and ranges[index][0] <= value:
+        low, high, aqi_low, aqi_high, category = ranges[index]
+        # Linear interpolation between breakpoints
+        if high == low:
+            # Avoid division by zero for single-value ranges
+            return aqi_low, category
+        calculated_aqi = int(
+            round(((aqi_high - aqi_low) / (high - low)) * (value - low) + aqi_low)
+        )
+        return calculated_aqi, category
+
+    # Value exceeds all ranges (or falls between two) - return highest category
+    if ranges:
+        _, _, _, aqi_high, category = ranges[-1]
+        return aqi_high, category
+
+    return None, None
+
+
 def _calculate_pollutant_aqi(
     value: float | int, ranges: list[tuple[float | int, float | int, int, int, str]]
 ) -> tuple[int | None, str | None]:
@@ -560,29 +623,7 @@ def _calculate_pollutant_aqi(
     Returns:
         Tuple of (aqi_value, category) or (None, None) if value is invalid
     """
-    if value is None or value < 0:
-        return None, None
-
-    for low, high, aqi_low, aqi_high, category in ranges:
-        if low <= value <= high:
-            # Linear interpolation between breakpoints
-            if high == low:
-                # Avoid division by zero for single-value ranges
-                calculated_aqi: int = aqi_low
-            else:
-                calculated_aqi = int(
-                    round(
-                        ((aqi_high - aqi_low) / (high - low)) * (value - low) + aqi_low
-                    )
-                )
-            return calculated_aqi, category
-
-    # Value exceeds all ranges - return highest category
-    if ranges:
-        _, _, _, aqi_high, category = ranges[-1]
-        return aqi_high, category
-
-    return None, None
+    return _lookup_pollutant_aqi(value, tuple(high for _, high, *_ in ranges), ranges)
 
 
 def _get_environmental_value(
@@ -603,6 +644,43 @@ def _get_environmental_value(
     return None
 
 
+class _AQIPollutant(NamedTuple):
+    """Precomputed AQI breakpoints for one pollutant."""
+
+    name: str
+    display_name: str
+    keys: list[str]
+    scale_factor: float | int  # converts device units to range units
+    highs: tuple[float | int, ...]
+    ranges: tuple[AQIRange, ...]
+
+
+def _aqi_pollutant(
+    name: str, display_name: str, ranges: list[AQIRange], scale_factor: float | int
+) -> _AQIPollutant:
+    """Build the breakpoint arrays for one pollutant's range table."""
+    return _AQIPollutant(
+        name,
+        display_name,
+        POLLUTANT_KEYS.get(name, []),
+        scale_factor,
+        tuple(high for _, high, *_ in ranges),
+        tuple(ranges),
+    )
+
+
+# Built once at import; Dyson ranges for PM2.5, PM10, VOC, NO2, HCHO and EPA
+# ranges for CO2.
+_AQI_POLLUTANTS: tuple[_AQIPollutant, ...] = (
+    _aqi_pollutant("pm25", "PM2.5", AQI_PM25_RANGES, 1),  # μg/m³
+    _aqi_pollutant("pm10", "PM10", AQI_PM10_RANGES, 1),  # μg/m³
+    _aqi_pollutant("voc", "VOC", AQI_VOC_RANGES, 1),  # Use raw device value directly
+    _aqi_pollutant("no2", "NO2", AQI_NO2_RANGES, 1),  # ppb (EPA guidelines)
+    _aqi_pollutant("co2", "CO2", AQI_CO2_RANGES, 1),  # ppm
+    _aqi_pollutant("hcho", "Formaldehyde", AQI_HCHO_RANGES, 0.001),  # mg/m³ to ppm
+)
+
+
 def _calculate_overall_aqi(
     env_data: dict[str, Any],
 ) -> tuple[int | None, str | None, list[str]]:
@@ -618,69 +696,45 @@ def _calculate_overall_aqi(
         Tuple of (overall_aqi, worst_category, dominant_pollutants) or (None, None, []) if no data
         dominant_pollutants is a list of pollutant names at the maximum AQI level
     """
-    from .const import (
-        AQI_CO2_RANGES,
-        AQI_HCHO_RANGES,
-        AQI_NO2_RANGES,
-        AQI_PM10_RANGES,
-        AQI_PM25_RANGES,
-        AQI_VOC_RANGES,
-        POLLUTANT_KEYS,
-    )
-
     max_aqi = None
     max_category = None
     dominant_pollutants = []
 
-    # Define pollutant configurations: (pollutant_name, display_name, ranges, scale_factor)
-    # scale_factor converts device units to range units
-    pollutant_configs: list[
-        tuple[
-            str, str, list[tuple[float | int, float | int, int, int, str]], float | int
-        ]
-    ] = [
-        ("pm25", "PM2.5", AQI_PM25_RANGES, 1),  # μg/m³
-        ("pm10", "PM10", AQI_PM10_RANGES, 1),  # μg/m³
-        ("voc", "VOC", AQI_VOC_RANGES, 1),  # Use raw device value directly
-        ("no2", "NO2", AQI_NO2_RANGES, 1),  # ppb (EPA guidelines)
-        ("co2", "CO2", AQI_CO2_RANGES, 1),  # ppm
-        ("hcho", "Formaldehyde", AQI_HCHO_RANGES, 0.001),  # Convert mg/m³ to ppm
-    ]
-
     # First pass: calculate all AQI values
     pollutant_aqis = []
-    for pollutant_name, display_name, ranges, scale_factor in pollutant_configs:
+    for pollutant in _AQI_POLLUTANTS:
         # Get value using priority key list
-        keys = POLLUTANT_KEYS.get(pollutant_name, [])
-        raw_value = _get_environmental_value(env_data, keys)
+        raw_value = _get_environmental_value(env_data, pollutant.keys)
 
         if raw_value is not None:
             # Skip "OFF" and "INIT" values - sensors are inactive or initializing
             if raw_value in ("OFF", "INIT"):
                 _LOGGER.debug(
                     "%s sensor %s, skipping AQI calculation",
-                    display_name,
+                    pollutant.display_name,
                     "inactive" if raw_value == "OFF" else "initializing",
                 )
                 continue
 
             try:
                 # Convert to numeric and apply scale factor
-                value = float(raw_value) * scale_factor
-                aqi, category = _calculate_pollutant_aqi(value, ranges)
+                value = float(raw_value) * pollutant.scale_factor
+                aqi, category = _lookup_pollutant_aqi(
+                    value, pollutant.highs, pollutant.ranges
+                )
 
                 if aqi is not None:
-                    pollutant_aqis.append((display_name, aqi, category))
+                    pollutant_aqis.append((pollutant.display_name, aqi, category))
                     _LOGGER.debug(
                         "Pollutant %s: value=%.3f, AQI=%s, category=%s",
-                        pollutant_name,
+                        pollutant.name,
                         value,
                         aqi,
                         category,
                     )
             except (ValueError, TypeError) as err:
                 _LOGGER.debug(
-                    "Could not convert %s value %s: %s", pollutant_name, raw_value, err
+                    "Could not convert %s value %s: %s", pollutant.name, raw_value, err
                 )
 
     # Second pass: find maximum AQI and all pollutants at that level
@@ -696,6 +750,30 @@ def _calculate_overall_aqi(
     return max_aqi, max_category, dominant_pollutants
 
 
+def _coordinator_aqi(
+    coordinator: DysonDataUpdateCoordinator,
+) -> tuple[int | None, str | None, list[str]]:
+    """Return the overall AQI of the coordinator's environmental data.
+
+    Computed once per environmental update and cached on the coordinator, so
+    the AQI, AQI category and dominant pollutant sensors share one result.
+    The cache is keyed by the coordinator's ``environmental_version`` and the
+    identity of its environmental data dict, which full refreshes replace.
+    """
+    env_data = (
+        coordinator.data.get("environmental-data", {}) if coordinator.data else {}
+    )
+    version = getattr(coordinator, "environmental_version", None)
+    cached = getattr(coordinator, "_aqi_cache", None)
+    if isinstance(cached, tuple) and cached[0] == version and cached[1] is env_data:
+        return cached[2]
+
+    result = _calculate_overall_aqi(env_data)
+    if env_data:
+        coordinator._aqi_cache = (version, env_data, result)
+    return result
+
+
 class DysonAQISensor(DysonEntity, SensorEntity):
     """Numeric AQI sensor for Dyson devices with EnvironmentalData capability.
 
@@ -737,6 +815,7 @@ class DysonAQISensor(DysonEntity, SensorEntity):
     """
 
     coordinator: DysonDataUpdateCoordinator
+    _environmental_keys = _POLLUTANT_SUBSCRIPTION
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the AQI sensor.
@@ -757,16 +836,9 @@ class DysonAQISensor(DysonEntity, SensorEntity):
         device_serial = self.coordinator.serial_number
 
         try:
-            # Get environmental data from coordinator
-            env_data = (
-                self.coordinator.data.get("environmental-data", {})
-                if self.coordinator.data
-                else {}
-            )
-
-            # Calculate overall AQI
-            aqi_value, aqi_category, dominant_pollutants = _calculate_overall_aqi(
-                env_data
+            # Shared with the other AQI sensors; computed once per update
+            aqi_value, aqi_category, dominant_pollutants = _coordinator_aqi(
+                self.coordinator
             )
 
             old_value = self._attr_native_value
@@ -836,6 +908,7 @@ class DysonAQICategorySensor(DysonEntity, SensorEntity):
     """
 
     coordinator: DysonDataUpdateCoordinator
+    _environmental_keys = _POLLUTANT_SUBSCRIPTION
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the AQI category sensor.
@@ -854,16 +927,9 @@ class DysonAQICategorySensor(DysonEntity, SensorEntity):
         device_serial = self.coordinator.serial_number
 
         try:
-            # Get environmental data from coordinator
-            env_data = (
-                self.coordinator.data.get("environmental-data", {})
-                if self.coordinator.data
-                else {}
-            )
-
-            # Calculate overall AQI
-            aqi_value, aqi_category, dominant_pollutants = _calculate_overall_aqi(
-                env_data
+            # Shared with the other AQI sensors; computed once per update
+            aqi_value, aqi_category, dominant_pollutants = _coordinator_aqi(
+                self.coordinator
             )
 
             old_value = self._attr_native_value
@@ -938,6 +1004,7 @@ class DysonDominantPollutantSensor(DysonEntity, SensorEntity):
     """
 
     coordinator: DysonDataUpdateCoordinator
+    _environmental_keys = _POLLUTANT_SUBSCRIPTION
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the dominant pollutant sensor.
@@ -956,16 +1023,9 @@ class DysonDominantPollutantSensor(DysonEntity, SensorEntity):
         device_serial = self.coordinator.serial_number
 
         try:
-            # Get environmental data from coordinator
-            env_data = (
-                self.coordinator.data.get("environmental-data", {})
-                if self.coordinator.data
-                else {}
-            )
-
-            # Calculate overall AQI to get dominant pollutants
-            aqi_value, aqi_category, dominant_pollutants = _calculate_overall_aqi(
-                env_data
+            # Shared with the other AQI sensors; computed once per update
+            aqi_value, aqi_category, dominant_pollutants = _coordinator_aqi(
+                self.coordinator
             )
 
             old_value = self._attr_native_value
@@ -1247,6 +1307,8 @@ async def async_setup_entry(  # noqa: C901
                     DysonWiFiSensor(coordinator),
                     DysonConnectionStatusSensor(coordinator),
                     DysonIpAddressSensor(coordinator),
+                    DysonMqttMessagesSensor(coordinator),
+                    DysonMqttHandlingTimeSensor(coordinator),
                 ]
             )
         else:
@@ -1653,6 +1715,7 @@ class DysonTemperatureSensor(DysonEntity, SensorEntity):
     """Temperature sensor for Dyson devices."""
 
     coordinator: DysonDataUpdateCoordinator
+    _environmental_keys = frozenset({"tact"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the temperature sensor."""
@@ -1704,6 +1767,7 @@ class DysonHumiditySensor(DysonEntity, SensorEntity):
     """Humidity sensor for Dyson devices."""
 
     coordinator: DysonDataUpdateCoordinator
+    _environmental_keys = frozenset({"hact"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the humidity sensor."""
@@ -1810,6 +1874,7 @@ class DysonPM25Sensor(DysonEntity, SensorEntity):
     """PM2.5 sensor for Dyson devices."""
 
     coordinator: DysonDataUpdateCoordinator
+    _environmental_keys = frozenset({"p25r", "pm25"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the PM2.5 sensor."""
@@ -1934,6 +1999,7 @@ class DysonPM10Sensor(DysonEntity, SensorEntity):
     """PM10 sensor for Dyson devices."""
 
     coordinator: DysonDataUpdateCoordinator
+    _environmental_keys = frozenset({"p10r", "pm10"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the PM10 sensor."""
@@ -2079,6 +2145,7 @@ class DysonParticulatesSensor(DysonEntity, SensorEntity):
     """
 
     coordinator: DysonDataUpdateCoordinator
+    _environmental_keys = frozenset({"pact"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the Particulates sensor."""
@@ -2200,6 +2267,7 @@ class DysonVOCLinkSensor(DysonEntity, SensorEntity):
     """
 
     coordinator: DysonDataUpdateCoordinator
+    _environmental_keys = frozenset({"vact"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the VOC Link sensor."""
@@ -2312,6 +2380,7 @@ class DysonNO2Sensor(DysonEntity, SensorEntity):
     """NO2 (Nitrogen Dioxide) sensor for Dyson devices."""
 
     coordinator: DysonDataUpdateCoordinator
+    _environmental_keys = frozenset({"noxl"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the NO2 sensor."""
@@ -2407,6 +2476,7 @@ class DysonFormaldehydeSensor(DysonEntity, SensorEntity):
     """HCHO (Formaldehyde) sensor for legacy Dyson devices with Formaldehyde capability."""
 
     coordinator: DysonDataUpdateCoordinator
+    _environmental_keys = frozenset({"hchr", "hcho"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the formaldehyde sensor."""
@@ -2544,6 +2614,9 @@ class DysonHEPAFilterLifeSensor(DysonEntity, SensorEntity):
     """HEPA filter life sensor for Dyson devices."""
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset(
+        {"hflr", "hflt", "cflt", "fflr", STATE_KEY_LEGACY_FILTER_LIFE}
+    )
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the HEPA filter life sensor."""
@@ -2629,6 +2702,7 @@ class DysonCarbonFilterLifeSensor(DysonEntity, SensorEntity):
     """Carbon filter life sensor for Dyson devices."""
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"cflr"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the carbon filter life sensor."""
@@ -2738,6 +2812,7 @@ class DysonHEPAFilterTypeSensor(DysonEntity, SensorEntity):
     """HEPA filter type sensor for Dyson devices."""
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"hflt"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the HEPA filter type sensor."""
@@ -2778,6 +2853,7 @@ class DysonCarbonFilterTypeSensor(DysonEntity, SensorEntity):
     """Carbon filter type sensor for Dyson devices."""
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"cflt"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the carbon filter type sensor."""
@@ -2951,10 +3027,127 @@ class DysonIpAddressSensor(DysonEntity, SensorEntity):
         super()._handle_coordinator_update()
 
 
+class _DysonMqttMetricsSensor(DysonEntity, SensorEntity):
+    """Base for sensors reporting the device's hot-path metrics.
+
+    The metrics change with every MQTT message, so the state is written once
+    per ``_UPDATE_INTERVAL`` rather than on each coordinator update.
+    """
+
+    coordinator: DysonDataUpdateCoordinator
+    _UPDATE_INTERVAL = timedelta(minutes=1)
+
+    async def async_added_to_hass(self) -> None:
+        """Start writing the state periodically."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self._async_write_metrics,
+                self._UPDATE_INTERVAL,
+            )
+        )
+
+    @callback
+    def _async_write_metrics(self, now: datetime | None = None) -> None:
+        """Write the current metrics to the state machine."""
+        self.async_write_ha_state()
+
+    def _handle_coordinator_update(self) -> None:
+        """Skip per-message updates; the state is written on a timer."""
+
+
+class DysonMqttMessagesSensor(_DysonMqttMetricsSensor):
+    """Number of MQTT messages received from the device since startup.
+
+    Disabled by default; enable it to compare message rates across devices.
+    Per-type counts and the executor hops made on the device's behalf are
+    exposed as attributes; the per-type counts are not recorded.
+    """
+
+    _unrecorded_attributes = frozenset({"message_types"})
+
+    def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
+        """Initialize the MQTT message count sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.serial_number}_mqtt_messages"
+        self._attr_translation_key = "mqtt_messages"
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_entity_registry_enabled_default = False
+        self._attr_icon = "mdi:message-processing"
+        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the number of messages received."""
+        if not self.coordinator.device:
+            return None
+        return self.coordinator.device.metrics.counters[COUNTER_MESSAGES]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return message counts by type and executor hops."""
+        if not self.coordinator.device:
+            return None
+        metrics = self.coordinator.device.metrics
+        return {
+            "message_types": dict(metrics.message_types),
+            "executor_jobs": metrics.counters[COUNTER_EXECUTOR_JOBS],
+        }
+
+
+class DysonMqttHandlingTimeSensor(_DysonMqttMetricsSensor):
+    """Mean time spent handling one MQTT message from the device.
+
+    Disabled by default. Covers decoding, state merging and the coordinator
+    and entity updates a message triggers; the mean time each entity class
+    spends updating is exposed as an (unrecorded) attribute.
+    """
+
+    _unrecorded_attributes = frozenset({"entity_update_ms"})
+
+    def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
+        """Initialize the MQTT handling time sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.serial_number}_mqtt_handling_time"
+        self._attr_translation_key = "mqtt_handling_time"
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_entity_registry_enabled_default = False
+        self._attr_icon = "mdi:timer-outline"
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+        self._attr_suggested_display_precision = 2
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the mean message handling time in milliseconds."""
+        if not self.coordinator.device:
+            return None
+        histogram = self.coordinator.device.metrics.get_histogram(METRIC_ON_MESSAGE)
+        return None if histogram is None else histogram.mean
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the slowest message and mean update time per entity class."""
+        attributes: dict[str, Any] = {}
+        if self.coordinator.device:
+            histogram = self.coordinator.device.metrics.get_histogram(METRIC_ON_MESSAGE)
+            if histogram is not None:
+                attributes["max_ms"] = round(histogram.max, 3)
+        attributes["entity_update_ms"] = {
+            name.removeprefix(METRIC_LISTENER_PREFIX): round(histogram.mean or 0, 3)
+            for name, histogram in dict(self.coordinator.metrics.histograms).items()
+            if name.startswith(METRIC_LISTENER_PREFIX)
+        }
+        return attributes
+
+
 class DysonNextCleaningCycleSensor(DysonEntity, SensorEntity):
     """Representation of a Dyson next cleaning cycle sensor for humidifier devices."""
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"cltr"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the next cleaning cycle sensor."""
@@ -3027,6 +3220,7 @@ class DysonCleaningTimeRemainingSensor(DysonEntity, SensorEntity):
     """Representation of a Dyson cleaning time remaining sensor for humidifier devices."""
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"cdrr"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the cleaning time remaining sensor."""
@@ -3488,6 +3682,7 @@ class DysonLastCleanSensor(DysonEntity, SensorEntity):
 _recommended_cleans_cache = TTLCache(30 * 60)
 
 
+@single_flight(coordinator_call_key)
 async def _fetch_recommended_cleans(coordinator: DysonDataUpdateCoordinator) -> list:
     """Fetch recommended zone cleans via libdyson-rest (cached 30 min).
 
@@ -3767,6 +3962,81 @@ _daily_env_cache = TTLCache(60 * 60)
 _schedule_cache = TTLCache(5 * 60)  # 5-min TTL so schedule changes surface quickly
 
 
+@single_flight(coordinator_call_key)
+async def _fetch_outdoor_aqi(coordinator: DysonDataUpdateCoordinator) -> Any:
+    """Fetch outdoor AQI via libdyson-rest (cached 15 min, stale on failure)."""
+    from libdyson_rest.exceptions import DysonAPIError, DysonAuthError
+
+    serial = coordinator.serial_number
+    data = _outdoor_aqi_cache.get(serial)
+    if data is not None:
+        return data
+    async with coordinator.async_cloud_client() as client:
+        if client is None:
+            return None
+        try:
+            data = await client.get_outdoor_environment_data(serial)
+        except (DysonAPIError, DysonAuthError) as err:
+            _LOGGER.debug("Failed to fetch outdoor AQI for %s: %s", serial, err)
+            return _outdoor_aqi_cache.get_stale(serial)
+    _outdoor_aqi_cache.set(serial, data)
+    return data
+
+
+@single_flight(coordinator_call_key)
+async def _fetch_daily_env(coordinator: DysonDataUpdateCoordinator) -> Any:
+    """Fetch the daily AQI series via libdyson-rest (cached 1 h, stale on failure)."""
+    from libdyson_rest.exceptions import DysonAPIError, DysonAuthError
+
+    serial = coordinator.serial_number
+    data = _daily_env_cache.get(serial)
+    if data is not None:
+        return data
+    async with coordinator.async_cloud_client() as client:
+        if client is None:
+            return None
+        try:
+            data = await client.get_daily_environment_data(serial)
+        except (DysonAPIError, DysonAuthError) as err:
+            _LOGGER.debug("Failed to fetch daily AQI for %s: %s", serial, err)
+            return _daily_env_cache.get_stale(serial)
+    _daily_env_cache.set(serial, data)
+    return data
+
+
+@single_flight(coordinator_call_key)
+async def _fetch_scheduled_events(coordinator: DysonDataUpdateCoordinator) -> Any:
+    """Fetch scheduled events via libdyson-rest (cached 5 min, stale on failure).
+
+    Shared by the scheduled-events sensor and the schedule calendar, which
+    refresh on the same interval.
+    """
+    from libdyson_rest.exceptions import DysonAPIError, DysonAuthError
+
+    serial = coordinator.serial_number
+    data = _schedule_cache.get(serial)
+    if data is not None:
+        return data
+    product_type = _device_product_type(coordinator) or None
+    async with coordinator.async_cloud_client() as client:
+        if client is None:
+            return None
+        try:
+            data = await client.get_scheduled_events(serial, product_type=product_type)
+        except (DysonAPIError, DysonAuthError) as err:
+            _LOGGER.debug("Failed to fetch scheduled events for %s: %s", serial, err)
+            return _schedule_cache.get_stale(serial)
+    _schedule_cache.set(serial, data)
+    _LOGGER.debug(
+        "Scheduled events for %s: schedule_enabled=%s, total=%d, raw_events=%s",
+        serial,
+        data.schedule_enabled,
+        len(data.events),
+        [e.raw for e in data.events],
+    )
+    return data
+
+
 def _device_product_type(coordinator: DysonDataUpdateCoordinator) -> str | None:
     """Return the device's productType code (e.g. '438K') for query params.
 
@@ -3832,21 +4102,7 @@ class DysonOutdoorAQISensor(DysonEntity, SensorEntity):
         self.async_write_ha_state()
 
     async def async_update(self) -> None:
-        from libdyson_rest.exceptions import DysonAPIError, DysonAuthError
-
-        serial = self.coordinator.serial_number
-        data = _outdoor_aqi_cache.get(serial)
-        if data is None:
-            async with self.coordinator.async_cloud_client() as client:
-                if client is not None:
-                    try:
-                        data = await client.get_outdoor_environment_data(serial)
-                        _outdoor_aqi_cache.set(serial, data)
-                    except (DysonAPIError, DysonAuthError) as err:
-                        _LOGGER.debug(
-                            "Failed to fetch outdoor AQI for %s: %s", serial, err
-                        )
-                        data = _outdoor_aqi_cache.get_stale(serial)
+        data = await _fetch_outdoor_aqi(self.coordinator)
 
         if not data:
             self._attr_native_value = None
@@ -3905,21 +4161,7 @@ class DysonDailyAirQualitySensor(DysonEntity, SensorEntity):
         self.async_write_ha_state()
 
     async def async_update(self) -> None:
-        from libdyson_rest.exceptions import DysonAPIError, DysonAuthError
-
-        serial = self.coordinator.serial_number
-        data = _daily_env_cache.get(serial)
-        if data is None:
-            async with self.coordinator.async_cloud_client() as client:
-                if client is not None:
-                    try:
-                        data = await client.get_daily_environment_data(serial)
-                        _daily_env_cache.set(serial, data)
-                    except (DysonAPIError, DysonAuthError) as err:
-                        _LOGGER.debug(
-                            "Failed to fetch daily AQI for %s: %s", serial, err
-                        )
-                        data = _daily_env_cache.get_stale(serial)
+        data = await _fetch_daily_env(self.coordinator)
 
         if not data:
             self._attr_native_value = None
@@ -3979,32 +4221,7 @@ class DysonScheduledEventsSensor(DysonEntity, SensorEntity):
         self.async_write_ha_state()
 
     async def async_update(self) -> None:
-        from libdyson_rest.exceptions import DysonAPIError, DysonAuthError
-
-        serial = self.coordinator.serial_number
-        data = _schedule_cache.get(serial)
-        if data is None:
-            product_type = _device_product_type(self.coordinator) or None
-            async with self.coordinator.async_cloud_client() as client:
-                if client is not None:
-                    try:
-                        data = await client.get_scheduled_events(
-                            serial, product_type=product_type
-                        )
-                        _schedule_cache.set(serial, data)
-                        _LOGGER.debug(
-                            "Scheduled events for %s: schedule_enabled=%s, "
-                            "total=%d, raw_events=%s",
-                            serial,
-                            data.schedule_enabled,
-                            len(data.events),
-                            [e.raw for e in data.events],
-                        )
-                    except (DysonAPIError, DysonAuthError) as err:
-                        _LOGGER.debug(
-                            "Failed to fetch scheduled events for %s: %s", serial, err
-                        )
-                        data = _schedule_cache.get_stale(serial)
+        data = await _fetch_scheduled_events(self.coordinator)
 
         if not data:
             self._attr_native_value = "unknown"
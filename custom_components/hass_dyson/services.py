@@ -71,6 +71,7 @@ from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import config_validation as cv, device_registry as dr
 from libdyson_rest import DysonAPIError, DysonAuthError, DysonConnectionError
 
+from .cloud_client import CloudAccountKey, get_cloud_client_pool
 from .const import (
     CONF_COUNTRY,
     CONF_CULTURE,
@@ -88,7 +89,12 @@ from .const import (
     SLEEP_TIMER_MAX,
     SLEEP_TIMER_MIN,
 )
-from .coordinator import DysonDataUpdateCoordinator, TTLCache
+from .coordinator import (
+    DysonDataUpdateCoordinator,
+    TTLCache,
+    coordinator_call_key,
+    single_flight,
+)
 from .device_utils import mask_email, mask_serial
 
 _LOGGER = logging.getLogger(__name__)
@@ -628,6 +634,7 @@ async def _handle_reset_filter(hass: HomeAssistant, call: ServiceCall) -> None:
 _persistent_map_cache = TTLCache(3600)
 
 
+@single_flight(coordinator_call_key)
 async def _fetch_persistent_map_metadata(
     coordinator: DysonDataUpdateCoordinator,
 ) -> list:
@@ -1070,7 +1077,7 @@ async def _handle_get_cloud_devices(
 
     try:
         device_data = await _get_cloud_device_data_from_coordinator(
-            selected_coordinator, sanitize
+            selected_coordinator, sanitize, hass
         )
 
         response_data = {
@@ -1178,7 +1185,9 @@ def _find_cloud_coordinators(hass: HomeAssistant) -> list[dict[str, Any]]:
 
 
 async def _get_cloud_device_data_from_coordinator(
-    coordinator_info: dict[str, Any], sanitize: bool
+    coordinator_info: dict[str, Any],
+    sanitize: bool,
+    hass: HomeAssistant | None = None,
 ) -> dict[str, Any]:
     """Retrieve device data using existing coordinator's cloud connection or config entry."""
     coordinator_type = coordinator_info.get("type")
@@ -1186,7 +1195,7 @@ async def _get_cloud_device_data_from_coordinator(
     if coordinator_type == "config_entry":
         # Handle config entry case (no active coordinator)
         return await _get_device_data_from_config_entry(
-            coordinator_info["config_entry"], sanitize
+            coordinator_info["config_entry"], sanitize, hass
         )
     elif coordinator_type == "cloud_account":
         # Handle cloud account coordinator case - these have access to multiple devices
@@ -1211,14 +1220,9 @@ async def _get_cloud_device_data_from_coordinator(
                     },
                 }
 
-            # Enhance devices with decrypted MQTT credentials using the coordinator's auth token
-            from libdyson_rest import AsyncDysonClient
-
-            async with AsyncDysonClient(
-                auth_token=coordinator._auth_token,
-                country=coordinator._country,
-                culture=coordinator._culture,
-            ) as client:
+            # Enhance devices with decrypted MQTT credentials using the
+            # coordinator's pooled client
+            async with coordinator.async_cloud_client() as client:
                 enhanced_devices = await _enhance_devices_with_mqtt_credentials(
                     client, devices
                 )
@@ -1305,7 +1309,7 @@ async def _enhance_devices_with_mqtt_credentials(
     return enhanced_devices
 
 
-async def _fetch_live_cloud_devices(config_entry):
+async def _fetch_live_cloud_devices(config_entry, hass: HomeAssistant | None = None):
     """Fetch live device data from Dyson cloud API using config entry credentials."""
     from libdyson_rest import AsyncDysonClient
 
@@ -1322,9 +1326,12 @@ async def _fetch_live_cloud_devices(config_entry):
         mask_email(email),
     )
 
-    # Create client with auth token and fetch devices
-    async with AsyncDysonClient(
-        auth_token=auth_token, country=country, culture=culture
+    async def _create_client() -> AsyncDysonClient:
+        return AsyncDysonClient(auth_token=auth_token, country=country, culture=culture)
+
+    # Borrow the account's pooled client and fetch devices
+    async with get_cloud_client_pool(hass).async_client(
+        CloudAccountKey(email, country, culture, auth_token), _create_client
     ) as client:
         devices = await client.get_devices()
 
@@ -1344,7 +1351,7 @@ async def _fetch_live_cloud_devices(config_entry):
 
 
 async def _get_device_data_from_config_entry(
-    config_entry, sanitize: bool
+    config_entry, sanitize: bool, hass: HomeAssistant | None = None
 ) -> dict[str, Any]:
     """Get device data from config entry - attempts live cloud API first, fallback to stored data."""
     email = config_entry.data.get("email")
@@ -1356,7 +1363,7 @@ async def _get_device_data_from_config_entry(
 
     # Try to get live data from cloud API first
     try:
-        live_devices = await _fetch_live_cloud_devices(config_entry)
+        live_devices = await _fetch_live_cloud_devices(config_entry, hass)
         if live_devices:
             _LOGGER.info(
                 "Using live cloud API data for %d devices from account %s",
@@ -0,0 +1,144 @@
+"""Fleet-wide pacing of Dyson device startup.
+
+Home Assistant sets up every device config entry at the same time, so a
+large install used to open all of its MQTT connections, cloud lookups and
+initial state requests at once. Each device then competed for the same
+executor threads, cloud API and Wi-Fi airtime, and the slowest connects
+held back everything else.
+
+Pacing Model:
+    - One orchestrator is shared by all device entries of the integration
+    - By default devices are not held back; with ``startup_concurrency`` set
+      in YAML, at most that many devices run their first refresh (connect,
+      capability refinement, initial state) at the same time
+    - A device gives up its slot as soon as its first refresh finishes, so
+      its platforms are set up while other devices are still connecting
+
+Timings:
+    Every device records how long it waited for a slot, how long its first
+    refresh took and how long its platforms took to set up, so slow devices
+    can be told apart from a queue that is simply too short.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_STARTUP, DATA_STARTUP_CONCURRENCY
+from .device_utils import mask_serial
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class DysonStartupTiming:
+    """Seconds a device spent in each phase of its startup."""
+
+    queued: float = 0.0
+    connect: float = 0.0
+    platforms: float = 0.0
+
+    @property
+    def total(self) -> float:
+        """Return the time from entry setup to platforms being ready."""
+        return self.queued + self.connect + self.platforms
+
+
+class DysonStartupOrchestrator:
+    """Bound how many devices connect at once and record their timings.
+
+    Only used from the event loop.
+    """
+
+    def __init__(self, concurrency: int | None = None) -> None:
+        """Initialise with room for *concurrency* devices connecting at once.
+
+        ``None`` lets every device connect straight away.
+        """
+        self.concurrency = concurrency
+        self._semaphore = (
+            None if concurrency is None else asyncio.Semaphore(concurrency)
+        )
+        self._timings: dict[str, DysonStartupTiming] = {}
+
+    @property
+    def timings(self) -> dict[str, DysonStartupTiming]:
+        """Return the recorded timings by serial number."""
+        return dict(self._timings)
+
+    def get_timing(self, serial_number: str) -> DysonStartupTiming | None:
+        """Return the timing recorded for a device's latest startup, if any."""
+        return self._timings.get(serial_number)
+
+    async def async_connect(
+        self, serial_number: str, first_refresh: Callable[[], Awaitable[None]]
+    ) -> DysonStartupTiming:
+        """Run a device's first refresh once a startup slot is free.
+
+        Exceptions from *first_refresh* propagate unchanged; the slot is
+        released either way.
+        """
+        timing = self._timings[serial_number] = DysonStartupTiming()
+        queued_at = time.monotonic()
+        async with self._semaphore or nullcontext():
+            started = time.monotonic()
+            timing.queued = started - queued_at
+            try:
+                await first_refresh()
+            finally:
+                timing.connect = time.monotonic() - started
+        return timing
+
+    async def async_setup_platforms(
+        self,
+        serial_number: str,
+        timing: DysonStartupTiming,
+        setup_platforms: Awaitable[Any],
+    ) -> None:
+        """Set up a connected device's platforms outside of any startup slot."""
+        started = time.monotonic()
+        try:
+            await setup_platforms
+        finally:
+            timing.platforms = time.monotonic() - started
+        _LOGGER.debug(
+            "Startup of %s took %.1f s (%.1f s queued, %.1f s connecting, "
+            "%.1f s setting up platforms)",
+            mask_serial(serial_number),
+            timing.total,
+            timing.queued,
+            timing.connect,
+            timing.platforms,
+        )
+
+
+def get_startup_orchestrator(hass: HomeAssistant | Any) -> DysonStartupOrchestrator:
+    """Return the integration-wide startup orchestrator, creating it on first use.
+
+    The limit comes from the YAML ``startup_concurrency`` option, if set.
+    Hass stand-ins without a real ``data`` dict get an unshared orchestrator.
+    """
+    data = getattr(hass, "data", None)
+    if not isinstance(data, dict):
+        return DysonStartupOrchestrator()
+    orchestrator = data.get(DATA_STARTUP)
+    if orchestrator is None:
+        orchestrator = data[DATA_STARTUP] = DysonStartupOrchestrator(
+            data.get(DATA_STARTUP_CONCURRENCY)
+        )
+    return orchestrator
+
+
+def shutdown_startup_orchestrator(hass: HomeAssistant | Any) -> None:
+    """Drop the integration-wide startup orchestrator and its timings."""
+    data = getattr(hass, "data", None)
+    if isinstance(data, dict):
+        data.pop(DATA_STARTUP, None)
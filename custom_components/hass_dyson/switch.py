@@ -83,6 +83,7 @@ class DysonAutoModeSwitch(DysonEntity, SwitchEntity):
     """Switch for auto mode."""
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"auto"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the auto mode switch."""
@@ -118,7 +119,7 @@ class DysonAutoModeSwitch(DysonEntity, SwitchEntity):
 
         try:
             await self.coordinator.device.set_auto_mode(True)
-            # No need to refresh - MQTT provides real-time updates
+            self._async_set_optimistic(("auto",), is_on=True)
             _LOGGER.debug(
                 "Turned on auto mode for %s",
                 mask_serial(self.coordinator.serial_number),
@@ -149,7 +150,7 @@ class DysonAutoModeSwitch(DysonEntity, SwitchEntity):
 
         try:
             await self.coordinator.device.set_auto_mode(False)
-            # No need to refresh - MQTT provides real-time updates
+            self._async_set_optimistic(("auto",), is_on=False)
             _LOGGER.debug(
                 "Turned off auto mode for %s",
                 mask_serial(self.coordinator.serial_number),
@@ -178,6 +179,7 @@ class DysonNightModeSwitch(DysonEntity, SwitchEntity):
     """Switch for night mode."""
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"nmod"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the night mode switch."""
@@ -213,7 +215,7 @@ class DysonNightModeSwitch(DysonEntity, SwitchEntity):
 
         try:
             await self.coordinator.device.set_night_mode(True)
-            # No need to refresh - MQTT provides real-time updates
+            self._async_set_optimistic(("nmod",), is_on=True)
             _LOGGER.debug(
                 "Turned on night mode for %s",
                 mask_serial(self.coordinator.serial_number),
@@ -244,7 +246,7 @@ class DysonNightModeSwitch(DysonEntity, SwitchEntity):
 
         try:
             await self.coordinator.device.set_night_mode(False)
-            # No need to refresh - MQTT provides real-time updates
+            self._async_set_optimistic(("nmod",), is_on=False)
             _LOGGER.debug(
                 "Turned off night mode for %s", self.coordinator.serial_number
             )
@@ -276,6 +278,7 @@ class DysonHeatingSwitch(DysonEntity, SwitchEntity):
     """Switch for heating mode."""
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"hmod", "hmax"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the heating switch."""
@@ -310,6 +313,7 @@ class DysonHeatingSwitch(DysonEntity, SwitchEntity):
 
         try:
             await self.coordinator.device.set_heating_mode("HEAT")
+            self._async_set_optimistic(("hmod",), is_on=True)
             _LOGGER.debug(
                 "Turned on heating for %s", mask_serial(self.coordinator.serial_number)
             )
@@ -339,6 +343,7 @@ class DysonHeatingSwitch(DysonEntity, SwitchEntity):
 
         try:
             await self.coordinator.device.set_heating_mode("OFF")
+            self._async_set_optimistic(("hmod",), is_on=False)
             _LOGGER.debug(
                 "Turned off heating for %s", mask_serial(self.coordinator.serial_number)
             )
@@ -396,6 +401,7 @@ class DysonContinuousMonitoringSwitch(DysonEntity, SwitchEntity):
     """Switch for continuous monitoring."""
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"rhtm"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the continuous monitoring switch."""
@@ -432,6 +438,7 @@ class DysonContinuousMonitoringSwitch(DysonEntity, SwitchEntity):
 
         try:
             await self.coordinator.device.set_continuous_monitoring(True)
+            self._async_set_optimistic(("rhtm",), is_on=True)
             _LOGGER.debug(
                 "Turned on continuous monitoring for %s", self.coordinator.serial_number
             )
@@ -461,6 +468,7 @@ class DysonContinuousMonitoringSwitch(DysonEntity, SwitchEntity):
 
         try:
             await self.coordinator.device.set_continuous_monitoring(False)
+            self._async_set_optimistic(("rhtm",), is_on=False)
             _LOGGER.debug(
                 "Turned off continuous monitoring for %s",
                 self.coordinator.serial_number,
@@ -580,6 +588,7 @@ class DysonFindFollowSwitch(DysonEntity, SwitchEntity):
     """
 
     coordinator: DysonDataUpdateCoordinator
+    _product_state_keys = frozenset({"soon", "sost"})
 
     def __init__(self, coordinator: DysonDataUpdateCoordinator) -> None:
         """Initialize the Find+Follow switch."""
@@ -628,6 +637,7 @@ class DysonFindFollowSwitch(DysonEntity, SwitchEntity):
             return
         try:
             await self.coordinator.device.set_find_follow("ON")
+            self._async_set_optimistic(("soon",), is_on=True)
             _LOGGER.debug(
                 "Enabled Find+Follow for %s",
                 mask_serial(self.coordinator.serial_number),
@@ -651,6 +661,7 @@ class DysonFindFollowSwitch(DysonEntity, SwitchEntity):
             return
         try:
             await self.coordinator.device.set_find_follow("OFF")
+            self._async_set_optimistic(("soon",), is_on=False)
             _LOGGER.debug(
                 "Disabled Find+Follow for %s",
                 mask_serial(self.coordinator.serial_number),
@@ -41,8 +41,8 @@ Position Tracking:
 
 from __future__ import annotations
 
-import asyncio
 import logging
+import time
 from typing import Any
 
 from homeassistant.components.vacuum import (
@@ -57,9 +57,16 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DEVICE_CATEGORY_ROBOT, DOMAIN, ROBOT_STATE_TO_HA_STATE
-from .coordinator import DysonDataUpdateCoordinator, TTLCache
+from .coordinator import (
+    DysonDataUpdateCoordinator,
+    TTLCache,
+    coordinator_call_key,
+    single_flight,
+)
 from .device_utils import mask_serial
+from .disk_cache import async_restore, persist
 from .entity import DysonEntity
+from .instrumentation import METRIC_FETCH_CLEAN_MAPS
 from .services import (
     _effective_current_map,
     _fetch_persistent_map_metadata,
@@ -79,12 +86,11 @@ _LOGGER = logging.getLogger(__name__)
 # fetched from a cached CleanRecord is still valid.
 _clean_maps_cache: TTLCache = TTLCache(10 * 60)
 
-# Per-serial locks prevent a cache-stampede when multiple entities all call
-# fetch_clean_maps simultaneously on startup (they would all miss the empty
-# cache and each fire a redundant API request).
-_clean_maps_locks: dict[str, asyncio.Lock] = {}
+# Disk-cache namespace for the records, so history survives restarts.
+_CLEAN_MAPS_DISK_NAMESPACE = "clean_maps"
 
 
+@single_flight(coordinator_call_key)
 async def fetch_clean_maps(coordinator: DysonDataUpdateCoordinator) -> list:
     """Fetch recent cleaning runs via libdyson-rest (cached 30 min, newest-first).
 
@@ -95,9 +101,24 @@ async def fetch_clean_maps(coordinator: DysonDataUpdateCoordinator) -> list:
     400 Bad Request or unexpected response shapes from device models whose
     clean-maps API differs from the 360 Vis Nav) are cached for the full TTL
     so the endpoint is not hammered on every entity update.
+
+    The first call after a restart returns the records persisted by the
+    previous run, if any, and refreshes them in the background.
+
+    Concurrent calls for one serial (every entity on startup) share a single
+    fetch instead of each firing a redundant API request.
     """
-    from libdyson_rest.exceptions import DysonAPIError, DysonAuthError
+    started = time.perf_counter()
+    try:
+        return await _async_fetch_clean_maps(coordinator)
+    finally:
+        coordinator.metrics.record(
+            METRIC_FETCH_CLEAN_MAPS, time.perf_counter() - started
+        )
+
 
+async def _async_fetch_clean_maps(coordinator: DysonDataUpdateCoordinator) -> list:
+    """Return clean maps from memory, disk or the cloud, in that order."""
     serial = coordinator.serial_number
 
     # Fast path: already cached.
@@ -105,51 +126,65 @@ async def fetch_clean_maps(coordinator: DysonDataUpdateCoordinator) -> list:
     if fresh is not None:
         return fresh
 
-    # Acquire a per-serial lock so that only one coroutine performs the
-    # network fetch while any other concurrent callers wait and then re-use
-    # the cached result.
-    if serial not in _clean_maps_locks:
-        _clean_maps_locks[serial] = asyncio.Lock()
-
-    async with _clean_maps_locks[serial]:
-        # Re-check after acquiring the lock — a concurrent caller may have
-        # already populated the cache while we were waiting.
-        fresh = _clean_maps_cache.get(serial)
-        if fresh is not None:
-            return fresh
-
-        async with coordinator.async_cloud_client() as client:
-            if client is None:
-                return _clean_maps_cache.get_stale(serial) or []
-            try:
-                records = await client.get_clean_maps(
+    from libdyson_rest.models import CleanRecord
+
+    hass = getattr(coordinator, "hass", None)
+    restored = await async_restore(
+        hass, _clean_maps_cache, _CLEAN_MAPS_DISK_NAMESPACE, serial, CleanRecord
+    )
+    if restored is not None:
+        hass.async_create_background_task(
+            _async_revalidate_clean_maps(coordinator),
+            name=f"{DOMAIN}_revalidate_clean_maps_{serial}",
+        )
+        return restored
+
+    return await _async_download_clean_maps(coordinator)
+
+
+async def _async_revalidate_clean_maps(coordinator: DysonDataUpdateCoordinator) -> None:
+    """Refresh clean maps restored from disk and notify the entities."""
+    await _async_download_clean_maps(coordinator)
+    coordinator.async_update_listeners()
+
+
+@single_flight(coordinator_call_key)
+async def _async_download_clean_maps(coordinator: DysonDataUpdateCoordinator) -> list:
+    """Fetch clean maps from the cloud and cache them in memory and on disk."""
+    from libdyson_rest.exceptions import DysonAPIError, DysonAuthError
+
+    serial = coordinator.serial_number
+
+    async with coordinator.async_cloud_client() as client:
+        if client is None:
+            return _clean_maps_cache.get_stale(serial) or []
+        try:
+            records = await client.get_clean_maps(
+                serial,
+                api_version=await coordinator.async_discover_map_api_version(client),
+                include_dust_map=True,
+            )
+        except DysonAuthError as err:
+            # Auth errors may resolve after re-authentication; do not cache.
+            _LOGGER.debug("Failed to fetch clean maps for %s: %s", serial, err)
+            return _clean_maps_cache.get_stale(serial) or []
+        except DysonAPIError as err:
+            err_str = str(err)
+            # Cache the failure so we do not re-request on every entity
+            # update.  Log a warning for known incompatibility signals so
+            # users can see a clear message rather than a silent failure.
+            if "400" in err_str:
+                _LOGGER.warning(
+                    "Clean maps endpoint returned 400 for %s — this device"
+                    " model may not support the clean-maps API; will not"
+                    " retry for 10 minutes",
                     serial,
-                    api_version=await coordinator.async_discover_map_api_version(
-                        client
-                    ),
-                    include_dust_map=True,
                 )
-            except DysonAuthError as err:
-                # Auth errors may resolve after re-authentication; do not cache.
+            else:
                 _LOGGER.debug("Failed to fetch clean maps for %s: %s", serial, err)
-                return _clean_maps_cache.get_stale(serial) or []
-            except DysonAPIError as err:
-                err_str = str(err)
-                # Cache the failure so we do not re-request on every entity
-                # update.  Log a warning for known incompatibility signals so
-                # users can see a clear message rather than a silent failure.
-                if "400" in err_str:
-                    _LOGGER.warning(
-                        "Clean maps endpoint returned 400 for %s — this device"
-                        " model may not support the clean-maps API; will not"
-                        " retry for 10 minutes",
-                        serial,
-                    )
-                else:
-                    _LOGGER.debug("Failed to fetch clean maps for %s: %s", serial, err)
-                fallback = _clean_maps_cache.get_stale(serial) or []
-                _clean_maps_cache.set(serial, fallback)
-                return fallback
+            fallback = _clean_maps_cache.get_stale(serial) or []
+            _clean_maps_cache.set(serial, fallback)
+            return fallback
 
     # Newest-first.  v2 records carry Unix epoch integers (start_time_epoch);
     # v1 records carry ISO-8601 strings in the timeline.  Normalise both to a
@@ -170,6 +205,9 @@ async def fetch_clean_maps(coordinator: DysonDataUpdateCoordinator) -> list:
 
     records.sort(key=_sort_epoch, reverse=True)
     _clean_maps_cache.set(serial, records)
+    persist(
+        getattr(coordinator, "hass", None), _CLEAN_MAPS_DISK_NAMESPACE, serial, records
+    )
     return records
 
 
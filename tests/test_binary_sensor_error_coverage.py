@@ -493,3 +493,40 @@ class TestFaultSensorErrorHandling:
 
         name = sensor._get_fault_friendly_name()
         assert name == "XYZ"
+
+
+class TestFaultSensorFaultIndex:
+    """Test fault sensors reading the device's fault index."""
+
+    def test_reads_fault_index_and_skips_unchanged_entries(self, mock_coordinator):
+        """The sensor reads its index entry and writes state only when it moves."""
+        from custom_components.hass_dyson.device import DysonFaultEntry
+
+        mock_coordinator.device.fault_index = {
+            "aqs": DysonFaultEntry("FAIL", "product-errors", "Critical", 1)
+        }
+        sensor = DysonFaultSensor(mock_coordinator, "aqs", {"FAIL": "Failure"})
+
+        with (
+            patch.object(sensor, "async_write_ha_state") as write,
+            patch(
+                "custom_components.hass_dyson.binary_sensor._is_fault_code_relevant",
+                return_value=True,
+            ) as relevant,
+        ):
+            sensor._handle_coordinator_update()
+            sensor._handle_coordinator_update()
+
+            assert write.call_count == 1
+            assert relevant.call_count == 1
+            assert sensor.is_on is True
+            assert sensor.extra_state_attributes["severity"] == "Critical"
+
+            mock_coordinator.device.fault_index = {
+                "aqs": DysonFaultEntry("OK", "product-errors", "Unknown", 2)
+            }
+            sensor._handle_coordinator_update()
+
+        assert write.call_count == 2
+        assert sensor.is_on is False
+        assert sensor.extra_state_attributes["status"] == "OK"
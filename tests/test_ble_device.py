@@ -406,8 +406,66 @@ class TestDysonBLEDevice:
         assert dev.state.daylight_mode is None
         assert dev._manual_mode_valid_until == 0.0
 
+    @pytest.mark.asyncio
+    async def test_initial_reads_share_one_deadline(self, monkeypatch):
+        """A silent characteristic costs one timeout and the others still land."""
+        from custom_components.hass_dyson import ble_device
+        from custom_components.hass_dyson.const import (
+            BLE_BRIGHTNESS_LUMENS_UUID,
+            BLE_COLOR_TEMP_UUID,
+            BLE_POWER_UUID,
+        )
+
+        monkeypatch.setattr(ble_device, "_GATT_OP_TIMEOUT", 0.05)
+        dev = self._make_device()
+        never = asyncio.Event()
+        values = {
+            BLE_POWER_UUID: bytearray([0x01]),
+            BLE_COLOR_TEMP_UUID: (4000).to_bytes(2, "little"),
+        }
+
+        async def read_gatt_char(uuid):
+            if uuid == BLE_BRIGHTNESS_LUMENS_UUID:
+                await never.wait()
+            await asyncio.sleep(0.01)
+            return values[uuid]
+
+        client = MagicMock()
+        client.read_gatt_char = read_gatt_char
+        dev._client = client
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        answered = await dev._read_initial_state()
+
+        assert loop.time() - started < 0.2
+        assert answered == {"power", "color_temp"}
+        assert dev.state.power is True
+        assert dev.state.color_temp_kelvin == 4000
+        assert dev.state.brightness is None
+
+    @pytest.mark.asyncio
+    async def test_subscribe_notifications_reports_accepted(self):
+        """Subscriptions are issued together and failures are reported."""
+        from custom_components.hass_dyson.const import BLE_MOTION_UUID
+
+        dev = self._make_device()
+        client = MagicMock()
+
+        async def start_notify(uuid, handler):
+            if uuid == BLE_MOTION_UUID:
+                raise RuntimeError("not permitted")
+
+        client.start_notify = AsyncMock(side_effect=start_notify)
+        dev._client = client
+
+        answered = await dev._subscribe_notifications()
+
+        assert client.start_notify.await_count == 6
+        assert answered == {"power", "brightness", "color_temp", "11006", "11007"}
+
     def test_fire_state_change_calls_bus(self):
-        """_fire_state_change fires EVENT_BLE_STATE_CHANGE on the event bus."""
+        """By default EVENT_BLE_STATE_CHANGE carries the full state."""
         hass = MagicMock()
         hass.bus = MagicMock()
         hass.bus.async_fire = MagicMock()
@@ -419,6 +477,28 @@ class TestDysonBLEDevice:
         data = call_args[0][1]
         assert data["serial_number"] == self.SERIAL
 
+    def test_fire_state_change_sends_changed_fields_to_callbacks(self):
+        """State callbacks get only changed fields; unchanged state fires nothing."""
+        hass = MagicMock()
+        dev = self._make_device(hass)
+        received = []
+        dev.add_state_callback(received.append)
+
+        dev._fire_state_change()
+        dev.state.power = True
+        dev._fire_state_change()
+        dev._fire_state_change()
+
+        assert len(received) == 2
+        assert received[0]["power"] is None
+        assert received[1] == {"power": True}
+        assert hass.bus.async_fire.call_count == 2
+
+        dev.remove_state_callback(received.append)
+        dev.state.power = False
+        dev._fire_state_change()
+        assert len(received) == 2
+
     @pytest.mark.asyncio
     async def test_set_power_raises_when_not_connected(self):
         """set_power raises RuntimeError when device is not connected."""
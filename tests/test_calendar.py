@@ -278,6 +278,23 @@ class TestExpandScheduleToCalendarEvents:
         )
         assert len(result) == 2
 
+    def test_compile_schedule_builds_weekday_mask_and_times(self):
+        """compile_schedule pre-parses times and packs weekdays into a bitmask."""
+        from datetime import time
+
+        from custom_components.hass_dyson.calendar import compile_schedule
+
+        ev_on = _make_event(start_time="22:00:00", days=[1, 3])  # Mon, Wed
+        ev_off = _make_event(start_time="06:30:00", days=[1, 3])
+        compiled = compile_schedule(_make_data([ev_on, ev_off]), "Fan")
+
+        assert len(compiled) == 1
+        group = compiled[0]
+        assert group.weekday_mask == 0b0000101
+        assert group.start == time(6, 30)
+        assert group.end == time(22, 0)
+        assert group.description.endswith("Days: Monday, Wednesday")
+
 
 # ---------------------------------------------------------------------------
 # DysonScheduleCalendar entity
@@ -334,7 +351,7 @@ class TestDysonScheduleCalendar:
         mock_cloud_client.get_scheduled_events.return_value = sched_data
 
         with patch(
-            "custom_components.hass_dyson.calendar._device_product_type",
+            "custom_components.hass_dyson.sensor._device_product_type",
             return_value=None,
         ):
             await entity._async_refresh(None)
@@ -359,7 +376,7 @@ class TestDysonScheduleCalendar:
         entity = _make_calendar(mock_coordinator)
 
         with patch(
-            "custom_components.hass_dyson.calendar._device_product_type",
+            "custom_components.hass_dyson.sensor._device_product_type",
             return_value=None,
         ):
             await entity._async_refresh(None)
@@ -406,6 +423,45 @@ class TestDysonScheduleCalendar:
         assert len(result) == 1
         assert result[0].start.hour == 10
 
+    @pytest.mark.asyncio
+    async def test_async_get_events_reuses_compiled_schedule(self, mock_coordinator):
+        """Repeated queries compile once and memoise windows until data changes."""
+        from custom_components.hass_dyson import calendar as calendar_module
+        from custom_components.hass_dyson.sensor import _schedule_cache
+
+        serial = mock_coordinator.serial_number
+        _schedule_cache.set(serial, _make_data([_make_event(days=[1])]))
+
+        entity = _make_calendar(mock_coordinator)
+        start = datetime(2026, 5, 18, 0, 0, tzinfo=UTC)
+        end = start + timedelta(days=28)
+        hass = mock_coordinator.hass
+
+        with (
+            patch.object(
+                calendar_module,
+                "compile_schedule",
+                wraps=calendar_module.compile_schedule,
+            ) as mock_compile,
+            patch.object(
+                calendar_module,
+                "expand_compiled_schedule",
+                wraps=calendar_module.expand_compiled_schedule,
+            ) as mock_expand,
+        ):
+            first = await entity.async_get_events(hass, start, end)
+            second = await entity.async_get_events(hass, start, end)
+            assert mock_compile.call_count == 1
+            assert mock_expand.call_count == 1
+            assert first == second
+            assert len(first) == 4
+
+            _schedule_cache.set(serial, _make_data([_make_event(days=[1, 2])]))
+            third = await entity.async_get_events(hass, start, end)
+
+        assert mock_compile.call_count == 2
+        assert len(third) == 8
+
     @pytest.mark.asyncio
     async def test_async_get_events_returns_empty_when_no_data(self, mock_coordinator):
         """async_get_events returns [] when neither cache nor fallback has data."""
@@ -0,0 +1,158 @@
+"""Tests for the shared Dyson cloud client pool."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from libdyson_rest.exceptions import DysonAuthError
+
+from custom_components.hass_dyson.cloud_client import (
+    CloudAccountKey,
+    CloudClientLease,
+    DysonCloudClientPool,
+    async_shutdown_cloud_client_pool,
+    get_cloud_client_pool,
+)
+from custom_components.hass_dyson.const import DATA_CLOUD_CLIENT_POOL
+
+KEY = CloudAccountKey("user@example.com", "GB", "en-GB", "token-1")
+
+
+def _factory():
+    """Return a factory producing a fresh mock client per call."""
+
+    async def create():
+        client = MagicMock()
+        client.close = AsyncMock()
+        return client
+
+    return AsyncMock(side_effect=create)
+
+
+class TestDysonCloudClientPool:
+    """Test pooling, reference counting and retirement."""
+
+    @pytest.mark.asyncio
+    async def test_same_account_shares_one_client(self):
+        """Concurrent borrowers of one account share a single client."""
+        pool = DysonCloudClientPool()
+        factory = _factory()
+
+        async with pool.async_client(KEY, factory) as first:
+            async with pool.async_client(KEY, factory) as second:
+                assert first is second
+                assert pool.size == 1
+            first.close.assert_not_awaited()
+
+        factory.assert_awaited_once()
+        first.close.assert_awaited_once()
+        assert pool.size == 0
+
+    @pytest.mark.asyncio
+    async def test_refreshed_token_gets_new_client(self):
+        """A changed auth token resolves to a different client."""
+        pool = DysonCloudClientPool()
+        factory = _factory()
+
+        old = await pool.async_acquire(KEY, factory)
+        new = await pool.async_acquire(KEY._replace(auth_token="token-2"), factory)
+
+        assert old is not new
+        assert pool.size == 2
+
+    @pytest.mark.asyncio
+    async def test_auth_error_retires_client(self):
+        """A rejected client is never handed out again."""
+        pool = DysonCloudClientPool()
+        factory = _factory()
+        holder = await pool.async_acquire(KEY, factory)
+
+        with pytest.raises(DysonAuthError):
+            async with pool.async_client(KEY, factory):
+                raise DysonAuthError("token expired")
+
+        replacement = await pool.async_acquire(KEY, factory)
+        assert replacement is not holder
+
+        # The retired client closes once its remaining holder lets go
+        await pool.async_release(holder)
+        holder.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_slow_login_does_not_block_other_accounts(self):
+        """Creating one account's client does not serialise other accounts."""
+        pool = DysonCloudClientPool()
+        login = asyncio.Event()
+
+        async def slow_create():
+            await login.wait()
+            return MagicMock(close=AsyncMock())
+
+        slow = asyncio.ensure_future(
+            pool.async_acquire(KEY, AsyncMock(side_effect=slow_create))
+        )
+        await asyncio.sleep(0)
+
+        other = KEY._replace(email="other@example.com")
+        client = await asyncio.wait_for(pool.async_acquire(other, _factory()), 1)
+        assert not slow.done()
+
+        login.set()
+        assert await slow is not client
+
+    @pytest.mark.asyncio
+    async def test_close_errors_are_swallowed(self):
+        """A failing close does not propagate out of release."""
+        pool = DysonCloudClientPool()
+        client = await pool.async_acquire(KEY, _factory())
+        client.close.side_effect = RuntimeError("boom")
+
+        await pool.async_release(client)
+
+        assert pool.size == 0
+
+
+class TestCloudClientLease:
+    """Test the long-lived lease used by coordinators."""
+
+    @pytest.mark.asyncio
+    async def test_lease_reuses_client_and_follows_key(self):
+        """The lease keeps its client until the key changes or it is released."""
+        pool = DysonCloudClientPool()
+        factory = _factory()
+        lease = CloudClientLease(pool)
+
+        first = await lease.async_get(KEY, factory)
+        assert await lease.async_get(KEY, factory) is first
+
+        second = await lease.async_get(KEY._replace(auth_token="token-2"), factory)
+        first.close.assert_awaited_once()
+
+        await lease.async_release()
+        second.close.assert_awaited_once()
+        assert pool.size == 0
+
+
+class TestPoolRegistry:
+    """Test the hass.data-backed pool accessors."""
+
+    @pytest.mark.asyncio
+    async def test_pool_is_stored_and_shut_down(self):
+        """The pool lives in hass.data and shutdown closes every client."""
+        hass = MagicMock()
+        hass.data = {}
+
+        pool = get_cloud_client_pool(hass)
+        assert get_cloud_client_pool(hass) is pool
+        client = await pool.async_acquire(KEY, _factory())
+
+        await async_shutdown_cloud_client_pool(hass)
+
+        client.close.assert_awaited_once()
+        assert DATA_CLOUD_CLIENT_POOL not in hass.data
+
+    def test_mock_hass_gets_private_pool(self):
+        """Hass stand-ins without a data dict get an unshared pool."""
+        hass = MagicMock()
+
+        assert get_cloud_client_pool(hass) is not get_cloud_client_pool(hass)
@@ -1,5 +1,6 @@
 """Test coordinator device communication logic."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -16,7 +17,13 @@ from custom_components.hass_dyson.const import (
     DISCOVERY_MANUAL,
     DISCOVERY_STICKER,
 )
-from custom_components.hass_dyson.coordinator import DysonDataUpdateCoordinator
+from custom_components.hass_dyson.coordinator import (
+    DysonDataUpdateCoordinator,
+    DysonKeySubscription,
+    TTLCache,
+    single_flight,
+)
+from custom_components.hass_dyson.device import DysonChangeSet, DysonDevice
 
 
 @pytest.fixture
@@ -219,35 +226,14 @@ class TestDysonDataUpdateCoordinatorInit:
 class TestDysonDataUpdateCoordinatorCallbacks:
     """Test coordinator callback handling."""
 
-    def test_on_environmental_update(self):
-        """Test environmental data update callback."""
-        with patch(
-            "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
-        ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
-            mock_hass = MagicMock()
-            mock_device = MagicMock()
-            mock_device._environmental_data = {"pm25": "010", "pm10": "020"}
-            mock_config_entry = MagicMock()
-            mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-
-            coordinator.hass = mock_hass
-            coordinator.device = mock_device
-            coordinator.config_entry = mock_config_entry
-
-            coordinator._on_environmental_update()
-
-            mock_hass.add_job.assert_called_once()
-
     def test_on_message_update_state_change(self):
         """Test message update callback for STATE-CHANGE."""
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with patch.object(
                 coordinator, "_handle_state_change_message"
@@ -260,10 +246,9 @@ class TestDysonDataUpdateCoordinatorCallbacks:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with patch.object(
                 coordinator, "_handle_state_change_message"
@@ -276,10 +261,9 @@ class TestDysonDataUpdateCoordinatorCallbacks:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with patch.object(
                 coordinator, "_handle_environmental_message"
@@ -296,10 +280,9 @@ class TestDysonDataUpdateCoordinatorCallbacks:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
             coordinator.data = {}
 
             # Mock hass and its loop
@@ -330,10 +313,9 @@ class TestDysonDataUpdateCoordinatorCallbacks:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with patch.object(
                 coordinator, "_handle_state_change_message"
@@ -500,6 +482,22 @@ class TestDysonDataUpdateCoordinatorScheduling:
             # Should not raise exception
             coordinator._schedule_fallback_update()
 
+    def test_notify_ha_via_loop_updates_listeners(self):
+        """Test the loop notification updates listeners without re-reading state."""
+        with patch(
+            "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
+        ):
+            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
+            coordinator.hass = MagicMock()
+            coordinator.device = MagicMock()
+            coordinator.async_update_listeners = MagicMock()
+
+            coordinator._notify_ha_via_loop()
+
+            coordinator.async_update_listeners.assert_called_once()
+            coordinator.device.get_state.assert_not_called()
+            coordinator.hass.add_job.assert_not_called()
+
 
 class TestDysonDataUpdateCoordinatorProperties:
     """Test coordinator property methods."""
@@ -509,10 +507,9 @@ class TestDysonDataUpdateCoordinatorProperties:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             assert coordinator.serial_number == "TEST123456"
 
@@ -521,10 +518,9 @@ class TestDysonDataUpdateCoordinatorProperties:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_DEVICE_NAME: "Living Room Fan"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             assert coordinator.device_name == "Living Room Fan"
 
@@ -533,10 +529,9 @@ class TestDysonDataUpdateCoordinatorProperties:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             # The actual implementation returns "Dyson {serial}" when no device name is provided
             assert coordinator.device_name == "Dyson TEST123456"
@@ -546,10 +541,9 @@ class TestDysonDataUpdateCoordinatorProperties:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_DISCOVERY_METHOD: DISCOVERY_CLOUD}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             # The actual implementation returns a default connection type, not the discovery method
             assert (
@@ -566,10 +560,9 @@ class TestDysonDataUpdateCoordinatorSetup:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with patch.object(coordinator, "_async_setup_device") as mock_setup:
                 with patch(
@@ -586,10 +579,9 @@ class TestDysonDataUpdateCoordinatorSetup:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with patch.object(
                 coordinator,
@@ -605,10 +597,9 @@ class TestDysonDataUpdateCoordinatorSetup:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_DISCOVERY_METHOD: DISCOVERY_CLOUD}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with patch.object(
                 coordinator, "_async_setup_cloud_device"
@@ -622,10 +613,9 @@ class TestDysonDataUpdateCoordinatorSetup:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_DISCOVERY_METHOD: DISCOVERY_STICKER}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with pytest.raises(
                 UpdateFailed, match="Sticker discovery method temporarily disabled"
@@ -638,10 +628,9 @@ class TestDysonDataUpdateCoordinatorSetup:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_DISCOVERY_METHOD: DISCOVERY_MANUAL}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with patch.object(
                 coordinator, "_async_setup_manual_device"
@@ -655,10 +644,9 @@ class TestDysonDataUpdateCoordinatorSetup:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_DISCOVERY_METHOD: "unknown"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with pytest.raises(UpdateFailed, match="Unknown discovery method: unknown"):
                 await coordinator._async_setup_device()
@@ -673,10 +661,9 @@ class TestDysonDataUpdateCoordinatorCloudSetup:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
             coordinator._device_category = ["fan"]
 
             mock_cloud_client = MagicMock()
@@ -712,10 +699,9 @@ class TestDysonDataUpdateCoordinatorCloudSetup:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with patch.object(
                 coordinator,
@@ -888,10 +874,9 @@ class TestDysonDataUpdateCoordinatorCloudSetup:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with pytest.raises(UpdateFailed, match="Missing cloud credentials"):
                 await coordinator._authenticate_cloud_client()
@@ -902,10 +887,9 @@ class TestDysonDataUpdateCoordinatorCloudSetup:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             mock_cloud_client = AsyncMock()
             mock_device = MagicMock()
@@ -925,10 +909,9 @@ class TestDysonDataUpdateCoordinatorCloudSetup:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             mock_cloud_client = AsyncMock()
             mock_other_device = MagicMock()
@@ -1315,16 +1298,6 @@ class TestCoordinatorErrorHandling:
                 # Verify callback handled gracefully
                 assert True  # No exception raised
 
-            # Mock schedule_coordinator_data_update to raise exception
-            with patch.object(
-                coordinator,
-                "_schedule_coordinator_data_update",
-                side_effect=Exception("Scheduler error"),
-            ):
-                # Should not raise exception from callback (no parameters for _on_environmental_update)
-                coordinator._on_environmental_update()
-                assert True  # No exception propagated
-
     @pytest.mark.asyncio
     async def test_coordinator_device_setup_unknown_discovery_method(self, mock_hass):
         """Test coordinator with unknown discovery method."""
@@ -1385,7 +1358,6 @@ class TestCoordinatorMQTTClientId:
                 ) as mock_device_class,
             ):
                 mock_device.connect = AsyncMock(return_value=True)
-                mock_device.add_environmental_callback = MagicMock()
                 mock_device.add_message_callback = MagicMock()
                 coordinator.device = None
 
@@ -1452,7 +1424,6 @@ class TestCoordinatorMQTTClientId:
             ):
                 mock_device.connect = AsyncMock(return_value=True)
                 mock_device.set_firmware_version = MagicMock()
-                mock_device.add_environmental_callback = MagicMock()
                 mock_device.add_message_callback = MagicMock()
                 coordinator.device = None
 
@@ -1488,3 +1459,300 @@ class TestCoordinatorMQTTClientId:
         for _ in range(5):
             result = hashlib.sha256(f"{ha_uuid}{serial}".encode()).hexdigest()[:23]
             assert result == expected
+
+
+class TestDysonDataUpdateCoordinatorChangeSets:
+    """Test delta-driven coordinator updates from device change sets."""
+
+    def _coordinator(self, change_set):
+        config_entry = MagicMock()
+        config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
+        with patch(
+            "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
+        ):
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), config_entry)
+        coordinator.hass = MagicMock()
+        coordinator.hass.loop.call_soon_threadsafe.side_effect = (
+            lambda callback, *args: callback(*args)
+        )
+        coordinator.async_set_updated_data = MagicMock()
+        coordinator.device = MagicMock()
+        coordinator.device.state_data = {"product-state": {"fnsp": "0007"}}
+        coordinator.device.last_change_set = change_set
+        return coordinator
+
+    def test_state_change_publishes_retained_state_without_get_state(self):
+        """A delta update hands listeners the retained state and its change set."""
+        changes = DysonChangeSet("STATE-CHANGE", product_state=frozenset({"fnsp"}))
+        coordinator = self._coordinator(changes)
+        coordinator.device.get_state = AsyncMock()
+        seen = []
+        coordinator.async_set_updated_data.side_effect = lambda _data: seen.append(
+            coordinator.change_set
+        )
+
+        coordinator._on_message_update("topic", {"msg": "STATE-CHANGE"})
+
+        coordinator.async_set_updated_data.assert_called_once_with(
+            {"product-state": {"fnsp": "0007"}}
+        )
+        assert seen == [changes]
+        coordinator.device.get_state.assert_not_called()
+        coordinator.hass.async_create_task.assert_not_called()
+
+    def test_empty_change_set_skips_listener_update(self):
+        """Messages that change nothing do not notify listeners."""
+        coordinator = self._coordinator(DysonChangeSet("CURRENT-STATE"))
+
+        coordinator._on_message_update("topic", {"msg": "CURRENT-STATE"})
+
+        coordinator.async_set_updated_data.assert_not_called()
+        coordinator.hass.loop.call_soon_threadsafe.assert_not_called()
+
+    def test_mismatched_change_set_falls_back_to_full_refresh(self):
+        """A change set from another message type forces a full refresh."""
+        coordinator = self._coordinator(
+            DysonChangeSet("CURRENT-FAULTS", faults=frozenset({"amf1"}))
+        )
+        coordinator.hass.async_create_task = MagicMock()
+
+        coordinator._on_message_update("topic", {"msg": "STATE-CHANGE"})
+
+        coordinator.async_set_updated_data.assert_not_called()
+        coordinator.hass.async_create_task.assert_called_once()
+        coordinator.hass.async_create_task.call_args.args[0].close()
+
+    def test_unchanged_environmental_data_skips_listener_update(self):
+        """Environmental readings identical to the last ones notify nobody."""
+        coordinator = self._coordinator(
+            DysonChangeSet("ENVIRONMENTAL-CURRENT-SENSOR-DATA")
+        )
+        coordinator.data = {"environmental-data": {"pm25": "0003"}}
+
+        coordinator._on_message_update(
+            "topic",
+            {"msg": "ENVIRONMENTAL-CURRENT-SENSOR-DATA", "data": {"pm25": "0003"}},
+        )
+
+        coordinator.async_set_updated_data.assert_not_called()
+
+    def test_delta_update_skips_listeners_whose_keys_did_not_change(self):
+        """Only listeners subscribed to a changed key are called."""
+        coordinator = self._coordinator(
+            DysonChangeSet("STATE-CHANGE", product_state=frozenset({"fnsp"}))
+        )
+        coordinator.async_set_updated_data = MagicMock(
+            side_effect=lambda _data: coordinator.async_update_listeners()
+        )
+        fan_speed, night_mode, unsubscribed = MagicMock(), MagicMock(), MagicMock()
+        coordinator._listeners = {
+            1: (fan_speed, DysonKeySubscription(product_state=frozenset({"fnsp"}))),
+            2: (night_mode, DysonKeySubscription(product_state=frozenset({"nmod"}))),
+            3: (unsubscribed, None),
+        }
+
+        coordinator._on_message_update("topic", {"msg": "STATE-CHANGE"})
+
+        fan_speed.assert_called_once()
+        night_mode.assert_not_called()
+        unsubscribed.assert_called_once()
+        assert coordinator.change_set is None
+
+        # Outside a delta dispatch every listener is updated.
+        coordinator.async_update_listeners()
+        night_mode.assert_called_once()
+
+    def test_one_coordinator_update_per_current_state_message(self):
+        """Each inbound CURRENT-STATE reaches the coordinator exactly once."""
+        coordinator = self._coordinator(None)
+        device = DysonDevice(
+            hass=coordinator.hass,
+            serial_number="TEST123456",
+            host="192.168.1.100",
+            credential="test_cred",
+        )
+        device.add_message_callback(coordinator._on_message_update)
+        coordinator.device = device
+
+        device._process_message_data(
+            {"msg": "CURRENT-STATE", "product-state": {"fnsp": "0007"}},
+            "475/TEST123456/status/current",
+        )
+
+        coordinator.async_set_updated_data.assert_called_once_with(device.state_data)
+
+    def test_one_listener_pass_per_environmental_message(self):
+        """An environmental message with new PM readings is dispatched once."""
+        coordinator = self._coordinator(None)
+        coordinator.data = {}
+        device = DysonDevice(
+            hass=coordinator.hass,
+            serial_number="TEST123456",
+            host="192.168.1.100",
+            credential="test_cred",
+        )
+        device.add_message_callback(coordinator._on_message_update)
+        coordinator.device = device
+        listener = MagicMock()
+        coordinator._listeners = {1: (listener, None)}
+        coordinator.async_set_updated_data.side_effect = lambda _data: (
+            coordinator.async_update_listeners()
+        )
+
+        device._process_message_data(
+            {
+                "msg": "ENVIRONMENTAL-CURRENT-SENSOR-DATA",
+                "data": {"pm25": "0012", "pm10": "0015"},
+            },
+            "475/TEST123456/status/current",
+        )
+
+        listener.assert_called_once()
+        coordinator.hass.add_job.assert_not_called()
+
+    def test_burst_of_messages_is_coalesced(self):
+        """Change sets queued before the loop runs produce one merged update."""
+        coordinator = self._coordinator(None)
+        queued = []
+        coordinator.hass.loop.call_soon_threadsafe.side_effect = (
+            lambda callback, *args: queued.append((callback, args))
+        )
+        seen = []
+        coordinator.async_set_updated_data.side_effect = lambda _data: seen.append(
+            coordinator.change_set
+        )
+
+        coordinator._handle_state_change_message(
+            DysonChangeSet("STATE-CHANGE", product_state=frozenset({"fnsp"}))
+        )
+        coordinator._handle_state_change_message(
+            DysonChangeSet("CURRENT-FAULTS", faults=frozenset({"amf1"}))
+        )
+        for callback, args in queued:
+            callback(*args)
+
+        assert len(queued) == 1
+        assert seen == [
+            DysonChangeSet(
+                "CURRENT-FAULTS",
+                product_state=frozenset({"fnsp"}),
+                faults=frozenset({"amf1"}),
+            )
+        ]
+
+
+class TestTTLCacheBounds:
+    """Test capacity bounds, LRU eviction, stale fallback and counters."""
+
+    def test_lru_entry_evicted_at_capacity(self):
+        """The least recently used entry goes first when full."""
+        cache = TTLCache(3600, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+
+        assert cache.get_stale("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_byte_budget_evicts_images(self):
+        """Bytes values count against max_bytes; other values do not."""
+        cache = TTLCache(3600, max_bytes=1000)
+        cache.set("png-1", b"x" * 600)
+        cache.set("meta", {"zones": []})
+        cache.set("png-2", b"y" * 600)
+
+        assert cache.get_stale("png-1") is None
+        assert cache.get_stale("meta") is not None
+        assert cache.stats()["bytes"] == 600
+
+    def test_stale_fallback_kept_without_pressure(self):
+        """Expired entries stay available to get_stale() however old they are."""
+        cache = TTLCache(10)
+        with patch(
+            "custom_components.hass_dyson.coordinator.time.monotonic",
+            return_value=1000.0,
+        ):
+            cache.set("k", "v")
+        with patch(
+            "custom_components.hass_dyson.coordinator.time.monotonic",
+            return_value=1_000_000.0,
+        ):
+            assert cache.get("k") is None
+            cache.set("other", "w")
+            assert cache.get_stale("k") == "v"
+
+        stats = cache.stats()
+        assert (stats["misses"], stats["expirations"], stats["entries"]) == (1, 0, 2)
+
+    def test_expired_entries_evicted_before_fresh_ones(self):
+        """At capacity an expired entry goes before a less recently used one."""
+        cache = TTLCache(3600, max_entries=2)
+        cache.set("fresh", 1)
+        cache.set("expired", 2)
+        cache.expire("expired")
+        cache.set("new", 3)
+
+        assert cache.get_stale("expired") is None
+        assert cache.get("fresh") == 1
+        stats = cache.stats()
+        assert (stats["evictions"], stats["expirations"]) == (0, 1)
+
+
+class TestSingleFlight:
+    """Test coalescing of concurrent calls."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """Callers with the same key share a result; other keys run separately."""
+        calls = []
+
+        @single_flight(lambda key: key)
+        async def fetch(key):
+            calls.append(key)
+            await asyncio.sleep(0)
+            return object()
+
+        first, second, other = await asyncio.gather(fetch("a"), fetch("a"), fetch("b"))
+
+        assert first is second
+        assert other is not first
+        assert calls == ["a", "b"]
+        assert not fetch.in_flight
+
+        await fetch("a")
+        assert calls == ["a", "b", "a"]
+
+    @pytest.mark.asyncio
+    async def test_exception_reaches_every_caller(self):
+        """A failure is raised to all callers that joined the flight."""
+
+        @single_flight(lambda: "k")
+        async def fail():
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(fail(), fail(), return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert results[0] is results[1]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Cancelling one waiter leaves the shared call running."""
+        release = asyncio.Event()
+
+        @single_flight(lambda: "k")
+        async def slow():
+            await release.wait()
+            return "done"
+
+        first = asyncio.ensure_future(slow())
+        second = asyncio.ensure_future(slow())
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "done"
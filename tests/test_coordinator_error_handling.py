@@ -196,30 +196,6 @@ class TestCoordinatorConnectionFailures:
 class TestCoordinatorDataParsingErrors:
     """Test data parsing and validation error scenarios."""
 
-    @pytest.mark.asyncio
-    @patch("custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__")
-    async def test_malformed_device_state_data(
-        self, mock_super_init, pure_mock_hass, mock_config_entry_cloud
-    ):
-        """Test handling of malformed device state data."""
-        mock_super_init.return_value = None
-
-        coordinator = DysonDataUpdateCoordinator(
-            pure_mock_hass, mock_config_entry_cloud
-        )
-        coordinator.hass = pure_mock_hass
-        coordinator._listeners = {}
-        coordinator.device = MagicMock()
-
-        # Mock device returning malformed data
-        coordinator.device.get_state = AsyncMock(return_value=None)
-
-        # Should handle gracefully
-        await coordinator._notify_ha_of_state_change()
-
-        # Verify no exception raised and coordinator still functional
-        assert coordinator.device is not None
-
     @pytest.mark.asyncio
     @patch("custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__")
     async def test_missing_required_fields_in_device_info(
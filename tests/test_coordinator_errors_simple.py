@@ -45,51 +45,6 @@ def mock_config_entry_cloud():
 class TestCoordinatorErrorHandling:
     """Test coordinator error handling paths."""
 
-    @patch("custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__")
-    @pytest.mark.asyncio
-    async def test_notify_ha_get_state_exception(
-        self, mock_super_init, mock_hass, mock_config_entry_cloud
-    ):
-        """Test notification when get_state raises exception."""
-        mock_super_init.return_value = None
-        coordinator = DysonDataUpdateCoordinator(mock_hass, mock_config_entry_cloud)
-        coordinator.hass = mock_hass
-        coordinator._listeners = {}
-        coordinator.config_entry = mock_config_entry_cloud
-        coordinator.device = MagicMock()
-        coordinator.async_set_updated_data = MagicMock()
-
-        # Mock get_state to raise exception
-        coordinator.device.get_state = AsyncMock(
-            side_effect=RuntimeError("Failed to get state")
-        )
-
-        # Should handle exception gracefully
-        await coordinator._notify_ha_of_state_change()
-
-        # Verify async_set_updated_data was not called
-        coordinator.async_set_updated_data.assert_not_called()
-
-    @patch("custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__")
-    @pytest.mark.asyncio
-    async def test_notify_ha_no_device(
-        self, mock_super_init, mock_hass, mock_config_entry_cloud
-    ):
-        """Test notification when device is None."""
-        mock_super_init.return_value = None
-        coordinator = DysonDataUpdateCoordinator(mock_hass, mock_config_entry_cloud)
-        coordinator.hass = mock_hass
-        coordinator._listeners = {}
-        coordinator.config_entry = mock_config_entry_cloud
-        coordinator.device = None
-        coordinator.async_set_updated_data = MagicMock()
-
-        # Should skip if no device
-        await coordinator._notify_ha_of_state_change()
-
-        # Verify nothing was called
-        coordinator.async_set_updated_data.assert_not_called()
-
     @patch("custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__")
     def test_handle_environmental_message_exception(
         self, mock_super_init, mock_hass, mock_config_entry_cloud
@@ -255,35 +255,14 @@ class TestDysonDataUpdateCoordinatorInit:
 class TestDysonDataUpdateCoordinatorCallbacks:
     """Test coordinator callback handling."""
 
-    def test_on_environmental_update(self):
-        """Test environmental data update callback."""
-        with patch(
-            "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
-        ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
-            mock_hass = MagicMock()
-            mock_device = MagicMock()
-            mock_device._environmental_data = {"pm25": "010", "pm10": "020"}
-            mock_config_entry = MagicMock()
-            mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-
-            coordinator.hass = mock_hass
-            coordinator.device = mock_device
-            coordinator.config_entry = mock_config_entry
-
-            coordinator._on_environmental_update()
-
-            mock_hass.add_job.assert_called_once()
-
     def test_on_message_update_state_change(self):
         """Test message update callback for STATE-CHANGE."""
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with patch.object(
                 coordinator, "_handle_state_change_message"
@@ -296,10 +275,9 @@ class TestDysonDataUpdateCoordinatorCallbacks:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with patch.object(
                 coordinator, "_handle_state_change_message"
@@ -312,10 +290,9 @@ class TestDysonDataUpdateCoordinatorCallbacks:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with patch.object(
                 coordinator, "_handle_environmental_message"
@@ -332,10 +309,9 @@ class TestDysonDataUpdateCoordinatorCallbacks:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
             coordinator.data = {}
 
             # Mock hass and its loop
@@ -366,10 +342,9 @@ class TestDysonDataUpdateCoordinatorCallbacks:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with patch.object(
                 coordinator, "_handle_state_change_message"
@@ -545,10 +520,9 @@ class TestDysonDataUpdateCoordinatorProperties:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             assert coordinator.serial_number == "TEST123456"
 
@@ -557,10 +531,9 @@ class TestDysonDataUpdateCoordinatorProperties:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_DEVICE_NAME: "Living Room Fan"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             assert coordinator.device_name == "Living Room Fan"
 
@@ -569,10 +542,9 @@ class TestDysonDataUpdateCoordinatorProperties:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             # The actual implementation returns "Dyson {serial}" when no device name is provided
             assert coordinator.device_name == "Dyson TEST123456"
@@ -582,10 +554,9 @@ class TestDysonDataUpdateCoordinatorProperties:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_DISCOVERY_METHOD: DISCOVERY_CLOUD}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             # The actual implementation returns a default connection type, not the discovery method
             assert (
@@ -602,10 +573,9 @@ class TestDysonDataUpdateCoordinatorSetup:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with patch.object(coordinator, "_async_setup_device") as mock_setup:
                 with patch(
@@ -622,10 +592,9 @@ class TestDysonDataUpdateCoordinatorSetup:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with patch.object(
                 coordinator,
@@ -641,10 +610,9 @@ class TestDysonDataUpdateCoordinatorSetup:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_DISCOVERY_METHOD: DISCOVERY_CLOUD}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with patch.object(
                 coordinator, "_async_setup_cloud_device"
@@ -658,10 +626,9 @@ class TestDysonDataUpdateCoordinatorSetup:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_DISCOVERY_METHOD: DISCOVERY_STICKER}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with pytest.raises(
                 UpdateFailed, match="Sticker discovery method temporarily disabled"
@@ -674,10 +641,9 @@ class TestDysonDataUpdateCoordinatorSetup:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_DISCOVERY_METHOD: DISCOVERY_MANUAL}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with patch.object(
                 coordinator, "_async_setup_manual_device"
@@ -691,10 +657,9 @@ class TestDysonDataUpdateCoordinatorSetup:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_DISCOVERY_METHOD: "unknown"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with pytest.raises(UpdateFailed, match="Unknown discovery method: unknown"):
                 await coordinator._async_setup_device()
@@ -709,10 +674,9 @@ class TestDysonDataUpdateCoordinatorCloudSetup:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
             coordinator._device_category = ["fan"]
 
             mock_cloud_client = MagicMock()
@@ -748,10 +712,9 @@ class TestDysonDataUpdateCoordinatorCloudSetup:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with patch.object(
                 coordinator,
@@ -879,10 +842,9 @@ class TestDysonDataUpdateCoordinatorCloudSetup:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             with pytest.raises(UpdateFailed, match="Missing cloud credentials"):
                 await coordinator._authenticate_cloud_client()
@@ -893,10 +855,9 @@ class TestDysonDataUpdateCoordinatorCloudSetup:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             mock_cloud_client = AsyncMock()
             mock_device = MagicMock()
@@ -916,10 +877,9 @@ class TestDysonDataUpdateCoordinatorCloudSetup:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
             mock_config_entry = MagicMock()
             mock_config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
-            coordinator.config_entry = mock_config_entry
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), mock_config_entry)
 
             mock_cloud_client = AsyncMock()
             mock_other_device = MagicMock()
@@ -1607,7 +1567,6 @@ class TestDysonDataUpdateCoordinatorManualSetup:
         mock_device = MagicMock()
         mock_device.connect = AsyncMock(return_value=True)
         mock_device.set_firmware_version = MagicMock()
-        mock_device.add_environmental_callback = MagicMock()
         mock_device.add_message_callback = MagicMock()
 
         with patch(
@@ -1627,7 +1586,6 @@ class TestDysonDataUpdateCoordinatorManualSetup:
 
             mock_device.connect.assert_called_once()
             mock_device.set_firmware_version.assert_called_once_with("Unknown")
-            mock_device.add_environmental_callback.assert_called_once()
             mock_device.add_message_callback.assert_called_once()
 
     @pytest.mark.asyncio
@@ -1717,8 +1675,8 @@ class TestDysonCloudAccountCoordinatorCNRegion:
         with patch(
             "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
         ):
-            coordinator = DysonCloudAccountCoordinator.__new__(
-                DysonCloudAccountCoordinator
+            coordinator = DysonCloudAccountCoordinator(
+                mock_hass, mock_config_entry_cloud_cn
             )
 
             # Mock hass with async_add_executor_job
@@ -1727,12 +1685,6 @@ class TestDysonCloudAccountCoordinatorCNRegion:
 
             mock_hass.async_add_executor_job = AsyncMock(side_effect=mock_executor_job)
             coordinator.hass = mock_hass
-            coordinator.config_entry = mock_config_entry_cloud_cn
-            coordinator._email = mock_config_entry_cloud_cn.data.get("email")
-            coordinator._auth_token = mock_config_entry_cloud_cn.data.get("auth_token")
-            coordinator._country = mock_config_entry_cloud_cn.data[CONF_COUNTRY]
-            coordinator._culture = mock_config_entry_cloud_cn.data[CONF_CULTURE]
-            coordinator._last_known_devices = set()
 
             # Mock device data returned from cloud
             mock_device_data = [
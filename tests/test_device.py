@@ -5,6 +5,7 @@ import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from homeassistant.util.ssl import get_default_context
 
 from custom_components.hass_dyson.const import (
     CONNECTION_STATUS_CLOUD,
@@ -316,14 +317,6 @@ class TestDysonDevice:
             credential="local_cred",
         )
 
-        # Add mock environmental callback
-        callback_called = []
-
-        def mock_callback():
-            callback_called.append(True)
-
-        device.add_environmental_callback(mock_callback)
-
         # Create mock MQTT message for environmental data
         mock_message = MagicMock()
         mock_message.topic = "475/ENV123/status/current"
@@ -338,8 +331,10 @@ class TestDysonDevice:
         assert device._environmental_data["pm10"] == "0015"
         assert device._environmental_data["hmax"] == "0030"
 
-        # Check that environmental callback was triggered
-        assert len(callback_called) == 1
+        # Check that the message's change set lists the changed keys
+        assert device.last_change_set.environmental == frozenset(
+            {"pm25", "pm10", "hmax"}
+        )
 
     def test_mqtt_message_processing_faults_data(self, mock_hass):
         """Test MQTT message processing for faults data."""
@@ -383,35 +378,6 @@ class TestDysonDevice:
         # State should remain empty since JSON parsing failed
         assert len(device._state_data) == 0
 
-    def test_environmental_callback_management(self, mock_hass):
-        """Test adding and removing environmental callbacks."""
-        device = DysonDevice(
-            hass=mock_hass,
-            serial_number="CALLBACK123",
-            host="192.168.1.100",
-            credential="local_cred",
-        )
-
-        def mock_callback1():
-            pass
-
-        def mock_callback2():
-            pass
-
-        # Test adding callbacks
-        device.add_environmental_callback(mock_callback1)
-        device.add_environmental_callback(mock_callback2)
-        assert len(device._environmental_callbacks) == 2
-
-        # Test adding duplicate callback (should not add)
-        device.add_environmental_callback(mock_callback1)
-        assert len(device._environmental_callbacks) == 2
-
-        # Test removing callback
-        device.remove_environmental_callback(mock_callback1)
-        assert len(device._environmental_callbacks) == 1
-        assert mock_callback2 in device._environmental_callbacks
-
     def test_message_callback_management(self, mock_hass):
         """Test adding and removing message callbacks."""
         device = DysonDevice(
@@ -478,7 +444,8 @@ class TestDysonDevice:
             )
 
             assert result is True
-            mock_client.tls_set.assert_called_once()
+            # Home Assistant's shared TLS context, not one built per connect
+            mock_client.tls_set_context.assert_called_once_with(get_default_context())
             mock_client.ws_set_options.assert_called_once()
 
     @pytest.mark.asyncio
@@ -1475,25 +1442,6 @@ class TestDysonDeviceMessageHandling:
         hass.async_add_executor_job = AsyncMock()
         return hass
 
-    def test_add_and_remove_environmental_callback(self, mock_hass):
-        """Test adding and removing environmental callbacks."""
-        device = DysonDevice(
-            hass=mock_hass,
-            serial_number="TEST123",
-            host="192.168.1.100",
-            credential="test_cred",
-        )
-
-        callback = MagicMock()
-
-        # Add callback
-        device.add_environmental_callback(callback)
-        assert callback in device._environmental_callbacks
-
-        # Remove callback
-        device.remove_environmental_callback(callback)
-        assert callback not in device._environmental_callbacks
-
     def test_add_and_remove_message_callback(self, mock_hass):
         """Test adding and removing message callbacks."""
         device = DysonDevice(
@@ -1537,11 +1485,6 @@ class TestDysonDeviceMessageHandling:
             credential="test_cred",
         )
 
-        # Add callback to verify it gets triggered
-        callback = MagicMock()
-        device.add_environmental_callback(callback)
-
-        # Add some PM data to ensure the callback gets triggered
         test_data = {
             "msg": "ENVIRONMENTAL-CURRENT-SENSOR-DATA",
             "data": {
@@ -1552,7 +1495,7 @@ class TestDysonDeviceMessageHandling:
                 "pm10": "020",
             },
         }
-        device._handle_environmental_data(test_data)
+        changes = device._handle_environmental_data(test_data)
 
         # Environmental data stores only the "data" part
         expected_data = {
@@ -1563,7 +1506,7 @@ class TestDysonDeviceMessageHandling:
             "pm10": "020",
         }
         assert device._environmental_data == expected_data
-        callback.assert_called_once()
+        assert changes.environmental == frozenset(expected_data)
 
     def test_handle_faults_data(self, mock_hass):
         """Test handling faults data updates."""
@@ -2291,3 +2234,455 @@ class TestDysonDeviceMQTTClientId:
         client_id = mock_client_class.call_args.kwargs.get("client_id")
         assert client_id is not None
         assert len(client_id) <= 23
+
+
+class TestDysonDevicePendingResponses:
+    """Test awaiting device replies instead of sleeping a fixed delay."""
+
+    @pytest.fixture
+    async def device(self):
+        """Device whose hass.loop is the running test loop."""
+        import asyncio
+
+        hass = MagicMock()
+        hass.loop = asyncio.get_running_loop()
+        hass.async_add_executor_job = AsyncMock()
+        device = DysonDevice(
+            hass=hass,
+            serial_number="REPLY123",
+            host="192.168.1.100",
+            credential="test_cred",
+        )
+        device._connected = True
+        device._mqtt_client = MagicMock()
+        return device
+
+    @pytest.mark.asyncio
+    async def test_wait_resolves_on_matching_message(self, device):
+        """A registered waiter receives the next message of its type."""
+        reply = device.expect_message("CURRENT-STATE")
+        device._process_message_data(
+            {"msg": "CURRENT-STATE", "product-state": {"fpwr": "ON"}},
+            "475/REPLY123/status/current",
+        )
+
+        data = await device.async_wait_for_message(reply, 1.0)
+
+        assert data["product-state"] == {"fpwr": "ON"}
+        assert not device._pending_responses
+
+    @pytest.mark.asyncio
+    async def test_wait_ignores_other_message_types(self, device):
+        """Messages of another type do not resolve the waiter."""
+        reply = device.expect_message("CURRENT-FAULTS")
+        device._process_message_data(
+            {"msg": "CURRENT-STATE", "product-state": {}},
+            "475/REPLY123/status/current",
+        )
+
+        assert await device.async_wait_for_message(reply, 0.05) is None
+        assert reply.cancelled()
+        assert not device._pending_responses
+
+    @pytest.mark.asyncio
+    async def test_request_current_state_returns_on_reply(self, device):
+        """_request_current_state returns as soon as CURRENT-STATE arrives."""
+        import asyncio
+
+        def _reply(*_args):
+            asyncio.get_running_loop().call_soon(
+                device._process_message_data,
+                {"msg": "CURRENT-STATE", "product-state": {"fnsp": "0004"}},
+                "475/REPLY123/status/current",
+            )
+            return MagicMock(rc=0)
+
+        device._mqtt_client.publish.side_effect = _reply
+
+        data = await device._request_current_state(timeout=5.0)
+
+        assert data["product-state"] == {"fnsp": "0004"}
+        assert device._state_data["product-state"] == {"fnsp": "0004"}
+
+    @pytest.mark.asyncio
+    async def test_request_current_faults_returns_on_reply(self, device):
+        """_request_current_faults returns as soon as CURRENT-FAULTS arrives."""
+        import asyncio
+
+        def _reply(*_args):
+            asyncio.get_running_loop().call_soon(
+                device._process_message_data,
+                {"msg": "CURRENT-FAULTS", "product-errors": {"amf1": "OK"}},
+                "475/REPLY123/status/faults",
+            )
+            return MagicMock(rc=0)
+
+        device._mqtt_client.publish.side_effect = _reply
+
+        data = await device._request_current_faults(timeout=5.0)
+
+        assert data["product-errors"] == {"amf1": "OK"}
+        assert not device._pending_responses
+
+    @pytest.mark.asyncio
+    async def test_request_current_faults_discards_waiter_on_error(self, device):
+        """A failed fault request deregisters its waiter."""
+        device._mqtt_client.publish.side_effect = RuntimeError("boom")
+
+        assert await device._request_current_faults(timeout=5.0) is None
+        assert not device._pending_responses
+
+    @pytest.mark.asyncio
+    async def test_request_current_state_times_out(self, device):
+        """An unanswered request gives up after the timeout."""
+        assert await device._request_current_state(timeout=0.01) is None
+        assert not device._pending_responses
+
+
+class TestDysonDeviceChangeSets:
+    """Test the per-message change sets published by the device."""
+
+    @pytest.fixture
+    def device(self):
+        """Device with its MQTT side mocked out."""
+        hass = MagicMock()
+        device = DysonDevice(
+            hass=hass,
+            serial_number="DELTA123",
+            host="192.168.1.100",
+            credential="test_cred",
+        )
+        device._state_data = {"product-state": {"fpwr": "ON", "fnsp": "0004"}}
+        return device
+
+    def test_state_change_reports_only_changed_keys(self, device):
+        """STATE-CHANGE lists keys whose current value differs."""
+        device._process_message_data(
+            {
+                "msg": "STATE-CHANGE",
+                "time": "2026-01-01T00:00:00Z",
+                "product-state": {"fpwr": ["ON", "ON"], "fnsp": ["0004", "0007"]},
+            },
+            "475/DELTA123/status/current",
+        )
+
+        changes = device.last_change_set
+        assert changes.message_type == "STATE-CHANGE"
+        assert changes.product_state == {"fnsp"}
+        assert not changes.other
+        assert changes.touches(product_state=("fnsp",))
+        assert not changes.touches(product_state=("fpwr",))
+
+    def test_current_state_without_changes_is_empty(self, device):
+        """A CURRENT-STATE snapshot matching retained state changes nothing."""
+        device._process_message_data(
+            {
+                "msg": "CURRENT-STATE",
+                "time": "2026-01-01T00:00:00Z",
+                "product-state": {"fpwr": "ON", "fnsp": "0004"},
+            },
+            "475/DELTA123/status/current",
+        )
+
+        assert not device.last_change_set
+
+    def test_current_state_reports_dropped_keys(self, device):
+        """Keys missing from a CURRENT-STATE snapshot count as changed."""
+        device._process_message_data(
+            {"msg": "CURRENT-STATE", "product-state": {"fpwr": "ON"}},
+            "475/DELTA123/status/current",
+        )
+
+        assert device.last_change_set.product_state == {"fnsp"}
+
+    def test_callbacks_see_change_set_of_their_message(self, device):
+        """Message callbacks read the change set of the message they handle."""
+        seen = []
+        device.add_message_callback(
+            lambda _topic, data: seen.append(
+                (data["msg"], device.last_change_set.message_type)
+            )
+        )
+
+        device._process_message_data(
+            {"msg": "CURRENT-STATE", "product-state": {"fnsp": "0001"}},
+            "475/DELTA123/status/current",
+        )
+
+        assert seen and all(msg == seen_type for msg, seen_type in seen)
+
+    def test_environmental_data_reports_changed_sensors(self, device):
+        """Environmental messages list the sensor keys whose readings moved."""
+        device._environmental_data = {"pm25": "0003", "tact": "2950"}
+
+        device._process_message_data(
+            {
+                "msg": "ENVIRONMENTAL-CURRENT-SENSOR-DATA",
+                "data": {"pm25": "0003", "tact": "2951", "hact": "0040"},
+            },
+            "475/DELTA123/status/current",
+        )
+
+        assert device.last_change_set.environmental == {"tact", "hact"}
+
+    def test_faults_data_reports_changed_codes(self, device):
+        """CURRENT-FAULTS lists changed codes from every section."""
+        device._faults_data = {"product-errors": {"amf1": "OK", "amf2": "OK"}}
+
+        device._process_message_data(
+            {
+                "msg": "CURRENT-FAULTS",
+                "product-errors": {"amf1": "FAIL", "amf2": "OK"},
+                "module-warnings": {"srnk": "OK"},
+            },
+            "475/DELTA123/status/faults",
+        )
+
+        assert device.last_change_set.faults == {"amf1", "srnk"}
+
+    def test_robot_state_change_reports_transition_keys(self, device):
+        """Robot transitions and retained top-level keys land in ``other``."""
+        device._state_data["persistentMapId"] = "map-1"
+
+        device._process_message_data(
+            {
+                "msg": "STATE-CHANGE",
+                "oldstate": "INACTIVE_CHARGED",
+                "newstate": "FULL_CLEAN_RUNNING",
+                "persistentMapId": "map-1",
+                "zoneStatus": [],
+            },
+            "N223/DELTA123/status",
+        )
+
+        changes = device.last_change_set
+        assert {"oldstate", "newstate", "zoneStatus"} <= changes.other
+        assert "persistentMapId" not in changes.other
+
+    def test_faults_data_builds_versioned_fault_index(self, device):
+        """The fault index flattens sections and only re-versions moved codes."""
+        device._process_message_data(
+            {
+                "msg": "CURRENT-FAULTS",
+                "product-errors": {"amf1": "FAIL", "fltr": "OK"},
+                "module-warnings": {"amf1": "OK", "srnk": "WARN"},
+            },
+            "475/DELTA123/status/faults",
+        )
+        first = dict(device.fault_index)
+
+        assert first["amf1"].value == "FAIL"
+        assert first["amf1"].section == "product-errors"
+        assert first["amf1"].severity == "Critical"
+        assert first["srnk"].section == "module-warnings"
+
+        device._process_message_data(
+            {"msg": "CURRENT-FAULTS", "product-errors": {"amf1": "OK", "fltr": "OK"}},
+            "475/DELTA123/status/faults",
+        )
+
+        assert device.fault_index["fltr"] is first["fltr"]
+        assert device.fault_index["srnk"] is first["srnk"]
+        assert device.fault_index["amf1"].value == "OK"
+        assert device.fault_index["amf1"].version > first["amf1"].version
+
+
+class TestDysonDeviceStateSetCoalescing:
+    """Test merging of STATE-SET commands issued close together."""
+
+    @pytest.fixture
+    async def device(self):
+        """Connected device recording the payloads it publishes."""
+        hass = MagicMock()
+        hass.async_add_executor_job = AsyncMock()
+        device = DysonDevice(
+            hass=hass,
+            serial_number="BATCH123",
+            host="192.168.1.100",
+            credential="test_cred",
+        )
+        device._connected = True
+        device._mqtt_client = MagicMock()
+        return device
+
+    @staticmethod
+    def _published(device):
+        """Return the decoded messages passed to publish, in order."""
+        import json
+
+        return [
+            json.loads(call.args[1])
+            for call in device._mqtt_client.publish.call_args_list
+        ]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_state_sets_share_one_publish(self, device):
+        """Commands in the same window merge, the last value per key winning."""
+        import asyncio
+
+        await asyncio.gather(
+            device.send_command("STATE-SET", {"fnsp": "0004"}),
+            device.send_command("STATE-SET", {"oson": "ON", "fnsp": "0006"}),
+            device.send_command("STATE-SET", {"nmod": "ON"}),
+        )
+
+        messages = self._published(device)
+        assert len(messages) == 1
+        assert messages[0]["msg"] == "STATE-SET"
+        assert messages[0]["data"] == {"fnsp": "0006", "oson": "ON", "nmod": "ON"}
+
+    @pytest.mark.asyncio
+    async def test_other_commands_stay_behind_queued_state_sets(self, device):
+        """A queued batch is published before a command issued after it."""
+        pending = device.queue_state_set({"fpwr": "ON"})
+
+        await device.send_command("RESET-FILTER", {"filter": "hepa"})
+
+        assert pending.done()
+        messages = self._published(device)
+        assert [message["msg"] for message in messages] == [
+            "STATE-SET",
+            "RESET-FILTER",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_publish_error_reaches_every_caller(self, device):
+        """Each caller's future raises the merged publish's error."""
+        import asyncio
+
+        device._mqtt_client.publish.side_effect = OSError("broken pipe")
+
+        first = device.queue_state_set({"fnsp": "0004"})
+        second = device.queue_state_set({"nmod": "ON"})
+        await asyncio.wait([first, second])
+
+        assert isinstance(first.exception(), OSError)
+        assert isinstance(second.exception(), OSError)
+        with pytest.raises(OSError):
+            await device.send_command("STATE-SET", {"fnsp": "0005"})
+
+
+class TestDysonDevicePublish:
+    """Test publishing directly from the event loop."""
+
+    @pytest.fixture
+    def device(self):
+        """Connected device with a mocked paho client."""
+        hass = MagicMock()
+        hass.async_add_executor_job = AsyncMock()
+        device = DysonDevice(
+            hass=hass,
+            serial_number="PUB123",
+            host="192.168.1.100",
+            credential="test_cred",
+        )
+        device._connected = True
+        device._mqtt_client = MagicMock()
+        device._mqtt_client.publish.return_value = MagicMock(rc=0)
+        return device
+
+    @pytest.mark.asyncio
+    async def test_requests_publish_without_executor(self, device):
+        """Fault and environment requests call paho directly and time it."""
+        await device._request_current_faults(timeout=0.01)
+        await device._request_environmental_data()
+
+        assert device._mqtt_client.publish.call_count == 2
+        device.hass.async_add_executor_job.assert_not_called()
+        assert device.last_publish_latency is not None
+
+    @pytest.mark.asyncio
+    async def test_unqueued_publish_raises(self, device):
+        """A publish paho could not queue surfaces as a command error."""
+        import paho.mqtt.client as mqtt
+
+        device._mqtt_client.publish.return_value = MagicMock(rc=mqtt.MQTT_ERR_NO_CONN)
+
+        with pytest.raises(RuntimeError, match="failed"):
+            await device.send_command("RESET-FILTER", {"filter": "hepa"})
+
+
+class TestDysonDeviceConnectionWait:
+    """Test that the connection wait wakes on paho callbacks."""
+
+    @pytest.fixture
+    def device(self):
+        """Device with the post-connect follow-ups stubbed out."""
+        device = DysonDevice(
+            hass=MagicMock(),
+            serial_number="WAIT123",
+            host="192.168.1.100",
+            credential="test_cred",
+        )
+        device._request_current_state = MagicMock()
+        device._start_heartbeat = MagicMock()
+        device._stop_heartbeat = MagicMock()
+        return device
+
+    @pytest.mark.asyncio
+    async def test_wakes_on_connack_and_records_latency(self, device):
+        """CONNACK resolves the wait at once and records time-to-CONNACK."""
+        import asyncio
+
+        import paho.mqtt.client as mqtt
+
+        device.hass.loop = asyncio.get_running_loop()
+        device._handshake_started = time.monotonic()
+        wait = asyncio.ensure_future(device._wait_for_connection("local"))
+        await asyncio.sleep(0)
+
+        device._on_connect(MagicMock(), None, {}, mqtt.CONNACK_ACCEPTED)
+
+        assert await asyncio.wait_for(wait, 1) is True
+        assert device.last_connack_latency is not None
+        assert device._connection_waiter is None
+
+    @pytest.mark.asyncio
+    async def test_wakes_on_handshake_rst(self, device):
+        """A reset before CONNACK ends the wait without the 5 s timeout."""
+        import asyncio
+
+        device.hass.loop = asyncio.get_running_loop()
+        wait = asyncio.ensure_future(device._wait_for_connection("local"))
+        await asyncio.sleep(0)
+
+        flags = MagicMock(is_disconnect_packet_from_server=False)
+        device._on_disconnect(MagicMock(), None, flags, 7)
+
+        assert await asyncio.wait_for(wait, 1) is False
+        assert device._rst_during_handshake is True
+
+    @pytest.mark.asyncio
+    async def test_connack_before_wait_is_not_missed(self, device):
+        """A CONNACK that lands before the wait starts still counts."""
+        import asyncio
+
+        import paho.mqtt.client as mqtt
+
+        device.hass.loop = asyncio.get_running_loop()
+        device._on_connect(MagicMock(), None, {}, mqtt.CONNACK_ACCEPTED)
+
+        assert await asyncio.wait_for(device._wait_for_connection("cloud"), 1)
+
+
+class TestDysonDeviceCloudSetupCache:
+    """Test that cloud connection setup is reused across reconnects."""
+
+    def test_cloud_credential_is_parsed_once(self):
+        """The credential JSON is only re-parsed when it changes."""
+        device = DysonDevice(
+            hass=MagicMock(),
+            serial_number="CLOUD123",
+            host="192.168.1.100",
+            credential="local_cred",
+        )
+
+        with patch(
+            "custom_components.hass_dyson.device.json.loads",
+            side_effect=lambda raw: {"client_id": raw},
+        ) as loads:
+            first = device._parse_cloud_credential('{"a": 1}')
+            assert device._parse_cloud_credential('{"a": 1}') is first
+            device._parse_cloud_credential('{"a": 2}')
+
+        assert loads.call_count == 2
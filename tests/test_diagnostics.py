@@ -0,0 +1,98 @@
+"""Tests for config entry diagnostics."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.hass_dyson.const import (
+    CONF_CREDENTIAL,
+    CONF_SERIAL_NUMBER,
+    DATA_STARTUP,
+    DOMAIN,
+)
+from custom_components.hass_dyson.coordinator import DysonDataUpdateCoordinator
+from custom_components.hass_dyson.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.hass_dyson.startup import get_startup_orchestrator
+
+SERIAL = "VS6-EU-HJA1234A"
+
+
+def _entry():
+    entry = MagicMock()
+    entry.entry_id = "entry1"
+    entry.title = "Living room"
+    entry.data = {
+        CONF_SERIAL_NUMBER: SERIAL,
+        CONF_CREDENTIAL: "secret",
+        "hostname": "192.168.1.20",
+    }
+    entry.options = {}
+    return entry
+
+
+class TestConfigEntryDiagnostics:
+    """Test redaction and the per-device metrics."""
+
+    @pytest.mark.asyncio
+    async def test_device_entry_includes_metrics_and_redacts_secrets(self):
+        entry = _entry()
+        with patch(
+            "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
+        ):
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), entry)
+        coordinator.last_update_success = True
+        coordinator.device = MagicMock()
+        coordinator.device.connection_status = "Local"
+        coordinator.device.last_connack_latency = 0.05
+        coordinator.device.last_publish_latency = 0.0001
+        coordinator.device.metrics.as_dict.return_value = {"counters": {}}
+        hass = MagicMock()
+        hass.data = {DOMAIN: {entry.entry_id: coordinator}}
+        await get_startup_orchestrator(hass).async_connect(SERIAL, _noop)
+
+        with patch.object(DysonDataUpdateCoordinator, "device_category", new=["ec"]):
+            diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+        assert diagnostics["entry"]["data"][CONF_CREDENTIAL] == "**REDACTED**"
+        assert diagnostics["entry"]["data"][CONF_SERIAL_NUMBER] == "**REDACTED**"
+        assert diagnostics["entry"]["data"]["hostname"] == "192.168.1.20"
+        device = diagnostics["device"]
+        assert SERIAL not in device["serial_number"]
+        assert device["connection_status"] == "Local"
+        assert device["device_metrics"] == {"counters": {}}
+        assert "histograms" in device["coordinator_metrics"]
+        assert device["startup"]["total"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_device_entry_does_not_create_startup_orchestrator(self):
+        entry = _entry()
+        with patch(
+            "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
+        ):
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), entry)
+        coordinator.last_update_success = True
+        coordinator.device = None
+        hass = MagicMock()
+        hass.data = {DOMAIN: {entry.entry_id: coordinator}}
+
+        with patch.object(DysonDataUpdateCoordinator, "device_category", new=["ec"]):
+            diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+        assert diagnostics["device"]["startup"] is None
+        assert DATA_STARTUP not in hass.data
+
+    @pytest.mark.asyncio
+    async def test_account_entry_has_no_device_section(self):
+        entry = _entry()
+        hass = MagicMock()
+        hass.data = {}
+
+        diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+        assert "device" not in diagnostics
+
+
+async def _noop():
+    return None
@@ -0,0 +1,159 @@
+"""Tests for the persistent robot map cache."""
+
+import json
+import os
+from unittest.mock import MagicMock
+
+import pytest
+from libdyson_rest.models import CleanRecord, PersistentMap
+
+from custom_components.hass_dyson.const import DATA_MAP_DISK_CACHE
+from custom_components.hass_dyson.coordinator import TTLCache
+from custom_components.hass_dyson.disk_cache import (
+    DysonDiskCache,
+    async_restore,
+    get_disk_cache,
+)
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\0" * 8
+CLEAN_RECORD = {
+    "cleanId": "clean-1",
+    "persistentMapId": "map-1",
+    "startTime": 1700000000,
+    "areaCleaned": 12.5,
+    "zones": [
+        {
+            "id": "1",
+            "name": "Kitchen",
+            "isSelected": True,
+            "settings": {"cleaningStrategy": "auto", "mopPasses": 1},
+            "nameLocation": {"x": 10, "y": 20},
+        }
+    ],
+    "faults": [{"type": "stuck", "x": 1, "y": 2}],
+}
+PERSISTENT_MAP = {
+    "id": "map-1",
+    "name": "Ground floor",
+    "offset": {"x": -1500.0, "y": 250.0},
+    "presentationMap": {"data": "iVBORw0KGgo="},
+    "zonesDefinition": {"persistentMapDisplayOrientation": 90},
+    "zones": [{"id": "1", "name": "Kitchen", "icon": "kitchen", "area": 9.5}],
+}
+
+
+def _hass(tmp_path):
+    """Return a hass stand-in whose executor runs jobs inline."""
+    hass = MagicMock()
+    hass.data = {}
+
+    async def run(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = run
+    hass.config.path = lambda *parts: os.path.join(str(tmp_path), *parts)
+    return hass
+
+
+class TestDysonDiskCache:
+    """Test storage, eviction and recovery."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_survives_new_instance(self, tmp_path):
+        """A stored value is readable by a later cache on the same directory."""
+        hass = _hass(tmp_path)
+        await DysonDiskCache(hass, str(tmp_path)).async_set("ns", "k", PNG)
+
+        cache = DysonDiskCache(hass, str(tmp_path))
+        assert await cache.async_get("ns", "k") == PNG
+        assert await cache.async_get("ns", "other") is None
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entries_evicted(self, tmp_path):
+        """Exceeding the byte budget drops the least recently used entry."""
+        hass = _hass(tmp_path)
+        cache = DysonDiskCache(hass, str(tmp_path), max_bytes=2500)
+
+        await cache.async_set("ns", "a", PNG + b"a" * 1000)
+        await cache.async_set("ns", "b", PNG + b"b" * 1000)
+        assert await cache.async_get("ns", "a") is not None
+        await cache.async_set("ns", "c", PNG + b"c" * 1000)
+
+        assert await cache.async_get("ns", "b") is None
+        assert await cache.async_get("ns", "a") is not None
+        assert await cache.async_get("ns", "c") is not None
+        assert cache.size <= 2500
+
+    @pytest.mark.asyncio
+    async def test_unreadable_entry_discarded(self, tmp_path):
+        """A corrupt entry is a miss and is removed from disk."""
+        hass = _hass(tmp_path)
+        cache = DysonDiskCache(hass, str(tmp_path))
+        await cache.async_set("ns", "k", PNG)
+        path = tmp_path / DysonDiskCache._file_name("ns", "k", ".png")
+        path.write_bytes(b"not a png")
+
+        assert await cache.async_get("ns", "k") is None
+        assert not path.exists()
+
+    @pytest.mark.asyncio
+    async def test_models_round_trip_as_json(self, tmp_path):
+        """Clean records and persistent maps are stored as JSON and rebuilt."""
+        hass = _hass(tmp_path)
+        records = [CleanRecord.from_dict(CLEAN_RECORD)]
+        pmap = PersistentMap.from_dict(PERSISTENT_MAP)
+        await DysonDiskCache(hass, str(tmp_path)).async_set("maps", "k", records)
+        await DysonDiskCache(hass, str(tmp_path)).async_set("pmap", "k", pmap)
+
+        cache = DysonDiskCache(hass, str(tmp_path))
+        assert await cache.async_get("maps", "k", CleanRecord) == records
+        assert await cache.async_get("pmap", "k", PersistentMap) == pmap
+        path = tmp_path / DysonDiskCache._file_name("pmap", "k", ".json")
+        assert json.loads(path.read_text())["value"]["id"] == "map-1"
+
+    @pytest.mark.asyncio
+    async def test_record_not_matching_model_discarded(self, tmp_path):
+        """A record missing fields the running model requires is a miss."""
+        hass = _hass(tmp_path)
+        cache = DysonDiskCache(hass, str(tmp_path))
+        await cache.async_set("pmap", "k", {"id": "map-1"})
+        path = tmp_path / DysonDiskCache._file_name("pmap", "k", ".json")
+
+        assert await cache.async_get("pmap", "k", PersistentMap) is None
+        assert not path.exists()
+
+    @pytest.mark.asyncio
+    async def test_legacy_entries_removed(self, tmp_path):
+        """Entries from the earlier pickle format are deleted, never read."""
+        legacy = tmp_path / "render-0123.cache"
+        legacy.write_bytes(b"legacy")
+        cache = DysonDiskCache(_hass(tmp_path), str(tmp_path))
+
+        assert await cache.async_get("render", "0123") is None
+        assert not legacy.exists()
+
+
+class TestRestore:
+    """Test seeding memory caches from disk."""
+
+    @pytest.mark.asyncio
+    async def test_restores_once_per_key(self, tmp_path):
+        """Only the first lookup after start-up reads the disk."""
+        hass = _hass(tmp_path)
+        disk = get_disk_cache(hass)
+        await disk.async_set("ns", "k", PNG)
+        memory = TTLCache(60)
+
+        assert await async_restore(hass, memory, "ns", "k") == PNG
+        assert memory.get("k") == PNG
+
+        memory.invalidate("k")
+        assert await async_restore(hass, memory, "ns", "k") is None
+
+    def test_registry(self, tmp_path):
+        """The cache lives in hass.data; mock hass disables it."""
+        hass = _hass(tmp_path)
+        assert get_disk_cache(hass) is get_disk_cache(hass)
+        assert DATA_MAP_DISK_CACHE in hass.data
+
+        assert get_disk_cache(MagicMock()) is None
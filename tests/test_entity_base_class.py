@@ -11,8 +11,12 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from custom_components.hass_dyson.coordinator import DysonDataUpdateCoordinator
-from custom_components.hass_dyson.entity import DysonEntity
+from custom_components.hass_dyson.coordinator import (
+    DysonDataUpdateCoordinator,
+    DysonKeySubscription,
+)
+from custom_components.hass_dyson.device import DysonChangeSet
+from custom_components.hass_dyson.entity import OPTIMISTIC_TIMEOUT, DysonEntity
 
 
 class TestDysonEntityDeviceInfo:
@@ -435,3 +439,176 @@ class TestDysonEntityEdgeCases:
             # Act & Assert - exception should propagate
             with pytest.raises(RuntimeError, match="Update failed"):
                 await entity._async_handle_coordinator_update()
+
+
+class TestDysonEntityKeySubscription:
+    """Test the coordinator context built from declared state keys."""
+
+    def test_entity_without_keys_subscribes_to_everything(self):
+        """Entities that declare no keys get no subscription context."""
+        entity = DysonEntity(MagicMock(spec=DysonDataUpdateCoordinator))
+
+        assert entity.coordinator_context is None
+
+    def test_declared_keys_become_coordinator_context(self):
+        """Declared keys are registered as a DysonKeySubscription."""
+
+        class _FilterEntity(DysonEntity):
+            _product_state_keys = frozenset({"hflr"})
+            _environmental_keys = frozenset({"pm25"})
+
+        entity = _FilterEntity(MagicMock(spec=DysonDataUpdateCoordinator))
+
+        assert entity.coordinator_context == DysonKeySubscription(
+            product_state=frozenset({"hflr"}), environmental=frozenset({"pm25"})
+        )
+
+    def test_platform_entities_declare_the_keys_they_read(self):
+        """Spot-check declarations on platform entities."""
+        from custom_components.hass_dyson.sensor import (
+            DysonHEPAFilterLifeSensor,
+            DysonPM25Sensor,
+        )
+
+        assert DysonPM25Sensor._environmental_keys == {"p25r", "pm25"}
+        assert "hflr" in DysonHEPAFilterLifeSensor._product_state_keys
+
+
+class _NightModeEntity(DysonEntity):
+    """Minimal entity deriving is_on from nmod, like the night mode switch."""
+
+    _product_state_keys = frozenset({"nmod"})
+
+    def _handle_coordinator_update(self) -> None:
+        product_state = self.coordinator.data["product-state"]
+        self._attr_is_on = product_state["nmod"] == "ON"
+        super()._handle_coordinator_update()
+
+
+class TestDysonEntityOptimisticCommands:
+    """Test optimistic command state, confirmation and rollback."""
+
+    @pytest.fixture
+    def entity(self):
+        """Return an entity whose device reports night mode off."""
+        coordinator = MagicMock(spec=DysonDataUpdateCoordinator)
+        coordinator.serial_number = "TEST-123"
+        coordinator.data = {"product-state": {"nmod": "OFF"}}
+        coordinator.change_set = None
+        entity = _NightModeEntity(coordinator)
+        entity.hass = MagicMock()
+        entity.async_write_ha_state = MagicMock()
+        entity._attr_is_on = False
+        return entity
+
+    def test_held_through_updates_until_confirmed(self, entity):
+        """Updates that still show the old value keep the optimistic state."""
+        cancel = MagicMock()
+        with patch(
+            "custom_components.hass_dyson.entity.async_call_later",
+            return_value=cancel,
+        ) as call_later:
+            entity._async_set_optimistic(("nmod",), is_on=True)
+
+        assert call_later.call_args[0][1] == OPTIMISTIC_TIMEOUT
+        assert entity._attr_is_on is True
+        entity.async_write_ha_state.assert_called_once()
+
+        # A full refresh sent before the device applied the command
+        entity._handle_coordinator_update()
+        assert entity._attr_is_on is True
+        assert len(entity._pending_commands) == 1
+
+        entity.coordinator.data["product-state"]["nmod"] = "ON"
+        entity.coordinator.change_set = DysonChangeSet(
+            "STATE-CHANGE", product_state=frozenset({"nmod"})
+        )
+        entity._handle_coordinator_update()
+        assert entity._attr_is_on is True
+        assert entity._pending_commands == ()
+        cancel.assert_called_once()
+
+    def test_rolled_back_when_device_reports_other_value(self, entity):
+        """A STATE-CHANGE of the commanded key at another value wins."""
+        with patch("custom_components.hass_dyson.entity.async_call_later"):
+            entity._async_set_optimistic(("nmod",), is_on=True)
+
+        # Changes to other keys do not settle the command
+        entity.coordinator.change_set = DysonChangeSet(
+            "STATE-CHANGE", product_state=frozenset({"fnsp"})
+        )
+        entity._handle_coordinator_update()
+        assert entity._attr_is_on is True
+
+        entity.coordinator.change_set = DysonChangeSet(
+            "STATE-CHANGE", product_state=frozenset({"nmod"})
+        )
+        entity._handle_coordinator_update()
+        assert entity._attr_is_on is False
+        assert entity._pending_commands == ()
+
+    def test_rolled_back_on_timeout(self, entity):
+        """An unconfirmed command reverts to the reported state."""
+        with patch(
+            "custom_components.hass_dyson.entity.async_call_later"
+        ) as call_later:
+            entity._async_set_optimistic(("nmod",), is_on=True)
+        expire = call_later.call_args[0][2]
+
+        expire(None)
+
+        assert entity._attr_is_on is False
+        assert entity._pending_commands == ()
+
+    def test_newer_command_replaces_older(self, entity):
+        """Commanding the same attribute again cancels the earlier command."""
+        first_cancel, second_cancel = MagicMock(), MagicMock()
+        with patch(
+            "custom_components.hass_dyson.entity.async_call_later",
+            side_effect=[first_cancel, second_cancel],
+        ):
+            entity._async_set_optimistic(("nmod",), is_on=True)
+            entity._async_set_optimistic(("nmod",), is_on=False)
+
+        first_cancel.assert_called_once()
+        second_cancel.assert_not_called()
+        assert len(entity._pending_commands) == 1
+        assert entity._attr_is_on is False
+
+    def test_late_echo_of_replaced_command_is_not_a_rollback(self, entity):
+        """An echo of a value sent by a replaced command keeps the newer state."""
+        entity.coordinator.device = MagicMock()
+        with patch("custom_components.hass_dyson.entity.async_call_later"):
+            entity.coordinator.device.commanded_state = {"nmod": "ON"}
+            entity._async_set_optimistic(("nmod",), is_on=True)
+            entity.coordinator.device.commanded_state = {"nmod": "OFF"}
+            entity._async_set_optimistic(("nmod",), is_on=False)
+        entity.coordinator.change_set = DysonChangeSet(
+            "STATE-CHANGE", product_state=frozenset({"nmod"})
+        )
+
+        # The first command's echo arrives after the second was sent
+        entity.coordinator.data["product-state"]["nmod"] = "ON"
+        entity._handle_coordinator_update()
+        assert entity._attr_is_on is False
+        assert len(entity._pending_commands) == 1
+
+        entity.coordinator.data["product-state"]["nmod"] = "OFF"
+        entity._handle_coordinator_update()
+        assert entity._attr_is_on is False
+        assert entity._pending_commands == ()
+
+    def test_unsent_value_rolls_back(self, entity):
+        """A reported value that no pending command sent is a rejection."""
+        entity.coordinator.device = MagicMock()
+        entity.coordinator.device.commanded_state = {"nmod": "ON"}
+        with patch("custom_components.hass_dyson.entity.async_call_later"):
+            entity._async_set_optimistic(("nmod",), is_on=True)
+
+        entity.coordinator.change_set = DysonChangeSet(
+            "STATE-CHANGE", product_state=frozenset({"nmod"})
+        )
+        entity._handle_coordinator_update()
+
+        assert entity._attr_is_on is False
+        assert entity._pending_commands == ()
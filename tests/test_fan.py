@@ -489,12 +489,16 @@ class TestDysonFan:
         fan = DysonFan(mock_coordinator)
 
         # Act
-        await fan.async_set_percentage(60)
+        with patch.object(fan, "async_write_ha_state"):
+            await fan.async_set_percentage(60)
 
         # Assert
         mock_coordinator.device.set_fan_speed.assert_called_once_with(
             6
         )  # 60 -> speed 6
+        # Speed is shown optimistically until the device reports fnsp
+        assert fan._attr_percentage == 60
+        assert len(fan._pending_commands) == 1
 
     @pytest.mark.asyncio
     async def test_async_set_percentage_zero(self, mock_coordinator):
@@ -538,7 +542,10 @@ class TestDysonFan:
 
         # Assert
         mock_coordinator.device.set_direction.assert_called_once_with("forward")
-        mock_coordinator.async_request_refresh.assert_called_once()
+        # State is shown optimistically instead of waiting on a refresh
+        mock_coordinator.async_request_refresh.assert_not_called()
+        assert fan._attr_current_direction == "forward"
+        assert len(fan._pending_commands) == 1
 
     @pytest.mark.asyncio
     async def test_async_set_direction_reverse(self, mock_coordinator):
@@ -790,37 +797,6 @@ class TestFanCoverageEnhancement:
         # Assert
         assert fan._attr_preset_mode is None
 
-    def test_start_command_pending_debug_logging(self, mock_coordinator):
-        """Test _start_command_pending debug logging (lines 177-179)."""
-        fan = DysonFan(mock_coordinator)
-
-        with patch("custom_components.hass_dyson.fan._LOGGER") as mock_logger:
-            # Act - this should trigger debug logging on lines 177-179
-            fan._start_command_pending(5.0)
-
-            # Assert - verify debug logging was called
-            mock_logger.debug.assert_called_with(
-                "Fan %s started command pending period for %.1f seconds",
-                "TEST-SERIAL-123",
-                5.0,
-            )
-            assert fan._command_pending is True
-
-    def test_stop_command_pending_debug_logging(self, mock_coordinator):
-        """Test _stop_command_pending debug logging (lines 185-187)."""
-        fan = DysonFan(mock_coordinator)
-
-        with patch("custom_components.hass_dyson.fan._LOGGER") as mock_logger:
-            # Act - this should trigger debug logging on lines 185-187
-            fan._stop_command_pending()
-
-            # Assert - verify debug logging was called
-            mock_logger.debug.assert_called_with(
-                "Fan %s stopped command pending period", "TEST-SERIAL-123"
-            )
-            assert fan._command_pending is False
-            assert fan._command_end_time is None
-
     def test_extra_state_attributes_missing_coverage(self, mock_coordinator):
         """Test extra_state_attributes missing coverage paths."""
         fan = DysonFan(mock_coordinator)
@@ -830,22 +806,6 @@ class TestFanCoverageEnhancement:
         attributes = fan.extra_state_attributes
         assert attributes is None
 
-    def test_command_pending_logic_coverage(self, mock_coordinator):
-        """Test command pending logic edge cases - debug logging coverage."""
-        fan = DysonFan(mock_coordinator)
-
-        # Initialize command pending attributes by starting a command pending period
-        fan._start_command_pending()
-
-        # Test command pending attributes are properly set
-        assert fan._command_pending is True
-        assert fan._command_end_time is not None
-
-        # Test command pending stop functionality
-        fan._stop_command_pending()
-        assert fan._command_pending is False
-        assert fan._command_end_time is None
-
     @pytest.mark.asyncio
     async def test_async_set_percentage_command_pending_integration(
         self, mock_coordinator
@@ -314,13 +314,13 @@ class TestCoordinatorFirmwareMethods:
     @pytest.fixture
     def coordinator(self, mock_hass, mock_config_entry):
         """Create a coordinator instance."""
-        coord = DysonDataUpdateCoordinator.__new__(DysonDataUpdateCoordinator)
+        with patch(
+            "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
+        ):
+            coord = DysonDataUpdateCoordinator(mock_hass, mock_config_entry)
         coord.hass = mock_hass
-        coord.config_entry = mock_config_entry
         coord._device_type = "438"
         coord._firmware_version = "1.0.0"
-        coord._firmware_latest_version = None
-        coord._firmware_update_in_progress = False
         coord.device = Mock()
         coord.async_update_listeners = Mock()
         # Mock the cloud authentication method
@@ -8,15 +8,19 @@ Covers:
 - _render_dust_map_png: no Pillow, bad data, size mismatch, no floor plan,
   with floor plan, compositing with offset, fallback centering, rotation
 - _render_presentation_png: no Pillow, bad PNG, valid PNG, rotation
+- MapRenderWorker: off-loop execution, de-duplication, concurrency bound,
+  queue depth, cancellation and error propagation
 - DysonDustMapImage: init attrs, _build scenarios, async_image, async_update
 - DysonFloorPlanImage: init attrs, _build scenarios, async_image, async_update
 """
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import builtins
 import io
+import threading
 import zlib
 from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -29,6 +33,7 @@ from custom_components.hass_dyson.const import DEVICE_CATEGORY_ROBOT, DOMAIN
 from custom_components.hass_dyson.image import (
     DysonDustMapImage,
     DysonFloorPlanImage,
+    MapRenderWorker,
     _apply_orientation,
     _palette_from_floor_plan,
     _render_dust_map_png,
@@ -36,6 +41,7 @@ from custom_components.hass_dyson.image import (
     _render_v2_floor_plan_png,
     _render_v2_map_png,
 )
+from custom_components.hass_dyson.instrumentation import DysonHotPathMetrics
 
 # ---------------------------------------------------------------------------
 # Shared test-data factories
@@ -746,6 +752,7 @@ class TestFetchCleanMapDataImage:
             yield fake_client
 
         mock_coordinator.async_cloud_client = make_client
+        mock_coordinator.metrics = DysonHotPathMetrics()
         cache = TTLCache(3600)
 
         with patch.object(image_module, "_map_image_cache", cache):
@@ -756,6 +763,8 @@ class TestFetchCleanMapDataImage:
         assert result is not None
         assert result[:4] == b"\x89PNG"
         assert cache.get("VS9-GB-HJA0000A:clean-42") == result
+        render = mock_coordinator.metrics.get_histogram("render.render_v2_map_png")
+        assert render.count == 1
 
 
 # ---------------------------------------------------------------------------
@@ -807,6 +816,7 @@ class TestFetchV2FloorPlanImage:
             yield fake_client
 
         mock_coordinator.async_cloud_client = make_client
+        mock_coordinator.metrics = DysonHotPathMetrics()
         cache = TTLCache(3600)
 
         with patch.object(image_module, "_floor_plan_cache", cache):
@@ -817,6 +827,10 @@ class TestFetchV2FloorPlanImage:
         assert result is not None
         assert result[:4] == b"\x89PNG"
         assert cache.get("VS9-GB-HJA0000A:fp:clean-fp-1") == result
+        render = mock_coordinator.metrics.get_histogram(
+            "render.render_v2_floor_plan_png"
+        )
+        assert render.count == 1
 
     @pytest.mark.asyncio
     async def test_api_error_caches_sentinel(self, mock_coordinator):
@@ -871,6 +885,40 @@ class TestFetchV2FloorPlanImage:
         assert result == expected_png
         fake_client.get_clean_map_data.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_dust_map_and_floor_plan_share_one_fetch(self, mock_coordinator):
+        """Concurrent dust-map and floor-plan builds fetch the clean once."""
+        from custom_components.hass_dyson.coordinator import TTLCache
+
+        calls = 0
+
+        async def get_clean_map_data(serial, clean_id):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return {}
+
+        fake_client = MagicMock()
+        fake_client.get_clean_map_data = get_clean_map_data
+
+        @asynccontextmanager
+        async def make_client():
+            yield fake_client
+
+        mock_coordinator.async_cloud_client = make_client
+
+        with (
+            patch.object(image_module, "_map_image_cache", TTLCache(3600)),
+            patch.object(image_module, "_floor_plan_cache", TTLCache(3600)),
+        ):
+            results = await asyncio.gather(
+                image_module._fetch_clean_map_data_image(mock_coordinator, "c-1"),
+                image_module._fetch_v2_floor_plan_image(mock_coordinator, "c-1"),
+            )
+
+        assert results == [None, None]
+        assert calls == 1
+
 
 # ---------------------------------------------------------------------------
 # Tests: _render_dust_map_png
@@ -1298,6 +1346,225 @@ class TestRenderPresentationPng:
         assert result_img.size[0] >= 4
 
 
+# ---------------------------------------------------------------------------
+# Tests: LUT rasterisation helpers
+# ---------------------------------------------------------------------------
+
+
+def _reference_heatmap(levels: list[int], scale: int, count: int) -> bytes:
+    """Per-pixel reference for the dust heatmap (the pre-LUT renderer)."""
+    n_levels = len(image_module._DUST_GRADIENT_RGB)
+    rgba = bytearray(count * 4)
+    for i, level in enumerate(levels[:count]):
+        if level == 0:
+            continue
+        idx = min(n_levels - 1, int(min(1.0, level / scale) * n_levels))
+        rgba[i * 4 : i * 4 + 3] = bytes(image_module._DUST_GRADIENT_RGB[idx])
+        rgba[i * 4 + 3] = 220
+    return bytes(rgba)
+
+
+class TestLutRasterisation:
+    """The LUT pipeline must match the per-pixel renderer exactly."""
+
+    @pytest.mark.parametrize("scale", [1, 7, 100, 255])
+    def test_dust_heatmap_matches_reference_for_every_level(self, scale):
+        """Every 8-bit level maps to the same RGBA as the per-pixel loop."""
+        raw = bytes(range(256))
+        img = image_module._dust_heatmap(raw, 16, 16, scale)
+        assert img.mode == "RGBA"
+        assert img.tobytes() == _reference_heatmap(list(raw), scale, 256)
+
+    def test_v2_heatmap_matches_reference(self):
+        """Unbounded v2 values are normalised to the maximum like before."""
+        values = [0, 3, 17, 250, 999, 4000, 0, 1, 2500]
+        img = image_module._v2_dust_heatmap(values, 3, 3)
+        assert img.tobytes() == _reference_heatmap(values, 4000, 9)
+
+    def test_v2_heatmap_pads_short_and_ignores_surplus_data(self):
+        """Missing cells stay transparent; values past the grid are dropped."""
+        short = image_module._v2_dust_heatmap([5, 10], 2, 2)
+        assert short.tobytes() == _reference_heatmap([5, 10], 10, 4)
+
+        long = image_module._v2_dust_heatmap([1, 2, 3, 4, 50], 2, 2)
+        assert long.tobytes() == _reference_heatmap([1, 2, 3, 4], 50, 4)
+
+    def test_floor_plan_thresholds_match_per_pixel_rules(self):
+        """Channel thresholds are strict and every channel must agree."""
+        samples = [
+            ((201, 201, 201, 255), (60, 60, 90, 255)),
+            ((200, 255, 255, 255), (235, 235, 235, 255)),
+            ((49, 49, 49, 0), (250, 248, 240, 255)),
+            ((50, 0, 0, 255), (235, 235, 235, 255)),
+            ((0, 255, 0, 255), (235, 235, 235, 255)),
+        ]
+        img = Image.new("RGBA", (len(samples), 1))
+        img.putdata([pixel for pixel, _ in samples])
+        buf = io.BytesIO()
+        img.save(buf, format="PNG")
+
+        result = _palette_from_floor_plan(buf.getvalue())
+
+        assert list(result.getdata()) == [expected for _, expected in samples]
+
+
+class TestFullSizeRender:
+    """Render a synthetic Vis Nav map at full floor-plan size.
+
+    Render time is measured by the map render benchmark in
+    test_mqtt_throughput_benchmark.py; this only checks the output.
+    """
+
+    @staticmethod
+    def _render(size: int, dusty: bool) -> Image.Image:
+        floor = Image.new("RGBA", (size, size), (128, 128, 128, 255))
+        floor.paste((0, 0, 0, 255), (10, 10, size - 10, size - 10))
+        buf = io.BytesIO()
+        floor.save(buf, format="PNG")
+        raw = bytes(
+            200 if dusty and (x // 20 + y // 20) % 2 else 0
+            for y in range(size)
+            for x in range(size)
+        )
+        dust_map = {
+            "width": size,
+            "height": size,
+            "dustData": [
+                {
+                    "data": base64.b64encode(zlib.compress(raw)).decode(),
+                    "scaleFactor": 255,
+                }
+            ],
+        }
+        result = _render_dust_map_png(
+            dust_map,
+            None,
+            buf.getvalue(),
+            rotation_deg=90,
+            map_offset_mm=(0.0, 0.0),
+            clean_position_mm=(0.0, 0.0),
+        )
+        assert result is not None
+        return Image.open(io.BytesIO(result))
+
+    def test_dust_is_drawn_over_full_size_floor_plan(self):
+        """Dust changes the pixels drawn, not the size of the image."""
+        clean = self._render(200, dusty=False)
+        dusty = self._render(200, dusty=True)
+
+        assert clean.size == dusty.size
+        assert min(dusty.size) >= 200
+        assert clean.tobytes() != dusty.tobytes()
+
+
+# ---------------------------------------------------------------------------
+# Tests: MapRenderWorker
+# ---------------------------------------------------------------------------
+
+
+async def _wait_until(predicate) -> None:
+    """Yield to the loop until *predicate* holds."""
+    for _ in range(500):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+class TestMapRenderWorker:
+    """Test the bounded, de-duplicating render worker."""
+
+    @pytest.mark.asyncio
+    async def test_renders_off_the_event_loop(self):
+        """The render function runs on a worker thread."""
+        worker = MapRenderWorker()
+
+        thread_id = await worker.async_render("k", threading.get_ident)
+
+        assert thread_id != threading.get_ident()
+        assert worker.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_identical_renders_are_deduplicated(self):
+        """Concurrent requests with the same key share one render."""
+        worker = MapRenderWorker()
+        release = threading.Event()
+        calls = []
+
+        def render(value):
+            calls.append(value)
+            release.wait(5)
+            return value * 2
+
+        first = asyncio.ensure_future(worker.async_render("k", render, 21))
+        second = asyncio.ensure_future(worker.async_render("k", render, 21))
+        await _wait_until(lambda: calls)
+        release.set()
+
+        assert await asyncio.gather(first, second) == [42, 42]
+        assert calls == [21]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded_and_queue_depth_reported(self):
+        """Renders beyond the limit wait for a slot and count as queued."""
+        worker = MapRenderWorker(max_concurrency=1)
+        release = threading.Event()
+
+        first = asyncio.ensure_future(worker.async_render("a", release.wait, 5))
+        second = asyncio.ensure_future(worker.async_render("b", release.wait, 5))
+        await _wait_until(lambda: worker.active == 1 and worker.queue_depth == 1)
+        assert worker.in_flight == 2
+
+        release.set()
+        assert await asyncio.gather(first, second) == [True, True]
+        assert (worker.active, worker.queue_depth, worker.in_flight) == (0, 0, 0)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_render(self):
+        """A waiter going away leaves the render running for the others."""
+        worker = MapRenderWorker()
+        release = threading.Event()
+
+        def render():
+            release.wait(5)
+            return "png"
+
+        first = asyncio.ensure_future(worker.async_render("k", render))
+        second = asyncio.ensure_future(worker.async_render("k", render))
+        await _wait_until(lambda: worker.active == 1)
+        first.cancel()
+        release.set()
+
+        assert await second == "png"
+
+    @pytest.mark.asyncio
+    async def test_render_errors_propagate_and_free_the_key(self):
+        """A failing render raises to its callers and can be retried."""
+        worker = MapRenderWorker()
+
+        def fail():
+            raise ValueError("bad map")
+
+        with pytest.raises(ValueError):
+            await worker.async_render("k", fail)
+
+        assert worker.in_flight == 0
+        assert await worker.async_render("k", lambda: "ok") == "ok"
+
+    @pytest.mark.asyncio
+    async def test_shutdown_stops_threads_until_next_render(self):
+        """Shutdown releases the render threads; a later render restarts them."""
+        worker = MapRenderWorker()
+        await worker.async_render("k", lambda: "png")
+        executor = worker._executor
+
+        worker.shutdown()
+
+        assert worker._executor is None
+        assert executor._shutdown
+        assert await worker.async_render("k2", lambda: "again") == "again"
+
+
 # ---------------------------------------------------------------------------
 # Tests: DysonDustMapImage
 # ---------------------------------------------------------------------------
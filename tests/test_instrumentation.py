@@ -0,0 +1,186 @@
+"""Tests for hot-path counters and latency histograms."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from custom_components.hass_dyson.const import CONF_SERIAL_NUMBER
+from custom_components.hass_dyson.coordinator import (
+    DysonDataUpdateCoordinator,
+    DysonKeySubscription,
+)
+from custom_components.hass_dyson.device import DysonChangeSet, DysonDevice
+from custom_components.hass_dyson.instrumentation import (
+    COUNTER_CALLBACK_ERRORS,
+    COUNTER_EXECUTOR_JOBS,
+    COUNTER_LISTENER_UPDATES,
+    COUNTER_LISTENERS_SKIPPED,
+    COUNTER_MESSAGE_ERRORS,
+    COUNTER_MESSAGES,
+    METRIC_CALLBACKS,
+    METRIC_LISTENER_PREFIX,
+    METRIC_ON_MESSAGE,
+    DysonHotPathMetrics,
+    DysonLatencyHistogram,
+)
+from custom_components.hass_dyson.sensor import (
+    DysonMqttHandlingTimeSensor,
+    DysonMqttMessagesSensor,
+)
+
+
+def _message(payload: bytes) -> SimpleNamespace:
+    return SimpleNamespace(topic="438/TEST123456/status/current", payload=payload)
+
+
+class TestDysonHotPathMetrics:
+    """Test histogram bucketing and the serialised metrics."""
+
+    def test_histogram_buckets_samples(self):
+        histogram = DysonLatencyHistogram()
+        for seconds in (0.00005, 0.003, 0.003, 2.0):
+            histogram.record(seconds)
+
+        data = histogram.as_dict()
+        assert data["count"] == 4
+        assert data["max_ms"] == 2000
+        assert data["buckets"]["le_0.1ms"] == 1
+        assert data["buckets"]["le_5ms"] == 2
+        assert data["buckets"]["gt_1000ms"] == 1
+        assert histogram.mean == pytest.approx((0.05 + 3 + 3 + 2000) / 4)
+
+    def test_as_dict_reports_rates_by_message_type(self):
+        metrics = DysonHotPathMetrics()
+        metrics.started -= 120
+        for message_type in ("CURRENT-STATE", "CURRENT-STATE", ""):
+            metrics.count_message(message_type)
+        metrics.record(METRIC_ON_MESSAGE, 0.001)
+
+        data = metrics.as_dict()
+        assert data["counters"][COUNTER_MESSAGES] == 3
+        assert data["messages_per_minute"] == 1.5
+        assert data["message_types"]["CURRENT-STATE"]["count"] == 2
+        assert data["message_types"]["unknown"]["per_minute"] == 0.5
+        assert data["histograms"][METRIC_ON_MESSAGE]["count"] == 1
+
+
+class TestDeviceInstrumentation:
+    """Test what the device records while handling messages."""
+
+    def _device(self) -> DysonDevice:
+        return DysonDevice(
+            hass=MagicMock(),
+            serial_number="TEST123456",
+            host="192.168.1.100",
+            credential="test_cred",
+        )
+
+    def test_messages_and_callbacks_are_recorded(self):
+        device = self._device()
+        device.add_message_callback(MagicMock())
+        device.add_message_callback(MagicMock(side_effect=RuntimeError))
+
+        device._on_message(None, None, _message(b'{"msg": "CURRENT-STATE"}'))
+        device._on_message(None, None, _message(b"not json"))
+
+        metrics = device.metrics
+        assert metrics.message_types == {"CURRENT-STATE": 1}
+        assert metrics.counters[COUNTER_MESSAGE_ERRORS] == 1
+        assert metrics.counters[COUNTER_CALLBACK_ERRORS] == 1
+        assert metrics.get_histogram(METRIC_ON_MESSAGE).count == 2
+        assert metrics.get_histogram(METRIC_CALLBACKS).count == 1
+
+    def test_executor_hops_are_counted(self):
+        device = self._device()
+
+        device._async_add_executor_job(print, "x")
+
+        device.hass.async_add_executor_job.assert_called_once_with(print, "x")
+        assert device.metrics.counters[COUNTER_EXECUTOR_JOBS] == 1
+
+
+class _FanSpeedSensor:
+    def __init__(self):
+        self.updates = 0
+
+    def handle_update(self):
+        self.updates += 1
+
+
+class TestCoordinatorInstrumentation:
+    """Test listener timings per entity class."""
+
+    def test_listener_updates_are_timed_per_entity_class(self):
+        config_entry = MagicMock()
+        config_entry.data = {CONF_SERIAL_NUMBER: "TEST123456"}
+        with patch(
+            "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
+        ):
+            coordinator = DysonDataUpdateCoordinator(MagicMock(), config_entry)
+        sensor = _FanSpeedSensor()
+        coordinator._listeners = {
+            1: (
+                sensor.handle_update,
+                DysonKeySubscription(product_state=frozenset({"fnsp"})),
+            ),
+            2: (MagicMock(), DysonKeySubscription(product_state=frozenset({"nmod"}))),
+        }
+
+        coordinator.change_set = DysonChangeSet(
+            "STATE-CHANGE", product_state=frozenset({"fnsp"})
+        )
+        coordinator.async_update_listeners()
+        coordinator.change_set = None
+        coordinator.async_update_listeners()
+
+        metrics = coordinator.metrics
+        assert sensor.updates == 2
+        assert metrics.counters[COUNTER_LISTENER_UPDATES] == 3
+        assert metrics.counters[COUNTER_LISTENERS_SKIPPED] == 1
+        histogram = metrics.get_histogram(METRIC_LISTENER_PREFIX + "_FanSpeedSensor")
+        assert histogram.count == 2
+
+
+class TestMetricsSensors:
+    """Test that the metrics sensors write state on a timer."""
+
+    def _sensor(self, sensor_class):
+        coordinator = MagicMock()
+        coordinator.serial_number = "TEST123456"
+        coordinator.device.metrics = DysonHotPathMetrics()
+        sensor = sensor_class(coordinator)
+        sensor.async_write_ha_state = MagicMock()
+        return sensor
+
+    @pytest.mark.asyncio
+    async def test_state_is_written_periodically_not_per_message(self):
+        sensor = self._sensor(DysonMqttMessagesSensor)
+        sensor.hass = MagicMock()
+        with (
+            patch.object(CoordinatorEntity, "async_added_to_hass", AsyncMock()),
+            patch(
+                "custom_components.hass_dyson.sensor.async_track_time_interval"
+            ) as track,
+        ):
+            await sensor.async_added_to_hass()
+
+        sensor._handle_coordinator_update()
+        sensor.async_write_ha_state.assert_not_called()
+
+        write = track.call_args[0][1]
+        write(None)
+        sensor.async_write_ha_state.assert_called_once()
+        assert sensor.native_value == 0
+
+    def test_growing_attributes_are_not_recorded(self):
+        messages = self._sensor(DysonMqttMessagesSensor)
+        messages.coordinator.device.metrics.count_message("CURRENT-STATE")
+        handling = self._sensor(DysonMqttHandlingTimeSensor)
+        handling.coordinator.metrics = DysonHotPathMetrics()
+
+        assert "message_types" in messages.extra_state_attributes
+        assert "message_types" in messages._unrecorded_attributes
+        assert "entity_update_ms" in handling.extra_state_attributes
+        assert "entity_update_ms" in handling._unrecorded_attributes
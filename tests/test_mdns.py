@@ -0,0 +1,167 @@
+"""Tests for the shared mDNS device address cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from zeroconf import ServiceStateChange
+
+from custom_components.hass_dyson.const import DATA_MDNS_CACHE, MDNS_SERVICE_DYSON
+from custom_components.hass_dyson.mdns import (
+    DysonMdnsCache,
+    _serial_from_service_name,
+    async_get_mdns_cache,
+    get_mdns_cache,
+)
+
+SERIAL = "VS6-EU-HJA1234A"
+
+
+def _hass():
+    """Return a hass stand-in that runs background tasks on the test loop."""
+    hass = MagicMock()
+    hass.data = {}
+    hass.config.components = set()
+    hass.async_create_background_task = lambda coro, name: asyncio.ensure_future(coro)
+    return hass
+
+
+def _service_info(addresses):
+    """Return an AsyncServiceInfo stand-in resolving to *addresses*."""
+    info = MagicMock()
+    info.async_request = AsyncMock(return_value=bool(addresses))
+    info.parsed_addresses = MagicMock(return_value=addresses)
+    return info
+
+
+class TestDysonMdnsCache:
+    """Test announcement indexing, lookups and change notification."""
+
+    def test_serial_from_service_name(self):
+        """Serials are taken from the instance name, with or without a prefix."""
+        assert (
+            _serial_from_service_name(
+                f"{SERIAL}.{MDNS_SERVICE_DYSON}", MDNS_SERVICE_DYSON
+            )
+            == SERIAL
+        )
+        assert (
+            _serial_from_service_name(
+                f"438_{SERIAL.lower()}.{MDNS_SERVICE_DYSON}", MDNS_SERVICE_DYSON
+            )
+            == SERIAL
+        )
+        assert (
+            _serial_from_service_name("other._http._tcp.local.", MDNS_SERVICE_DYSON)
+            is None
+        )
+
+    @pytest.mark.asyncio
+    async def test_announcement_is_indexed_and_listeners_notified_on_change(self):
+        """A new address reaches listeners once; repeats are silent."""
+        cache = DysonMdnsCache(_hass())
+        cache._zeroconf = MagicMock()
+        seen = []
+        remove = cache.async_add_listener(SERIAL.lower(), seen.append)
+        name = f"{SERIAL}.{MDNS_SERVICE_DYSON}"
+
+        for address in ("192.168.1.20", "192.168.1.20", "192.168.1.31"):
+            with patch(
+                "custom_components.hass_dyson.mdns.AsyncServiceInfo",
+                return_value=_service_info([address]),
+            ):
+                cache._on_service_state_change(
+                    cache._zeroconf,
+                    MDNS_SERVICE_DYSON,
+                    name,
+                    ServiceStateChange.Updated,
+                )
+                await asyncio.gather(*cache._resolving.values())
+                await asyncio.sleep(0)  # let the done callback clear the entry
+
+        assert seen == ["192.168.1.20", "192.168.1.31"]
+        assert cache.get_address(SERIAL) == "192.168.1.31"
+
+        remove()
+        cache._async_set_address(SERIAL, "192.168.1.40")
+        assert seen == ["192.168.1.20", "192.168.1.31"]
+
+    @pytest.mark.asyncio
+    async def test_resolve_answers_from_cache_without_query(self):
+        """Announced devices resolve without touching the network."""
+        cache = DysonMdnsCache(_hass())
+        cache._zeroconf = MagicMock()
+        cache._async_set_address(SERIAL, "192.168.1.20")
+
+        with patch("custom_components.hass_dyson.mdns.AsyncServiceInfo") as info_cls:
+            assert await cache.async_resolve(SERIAL) == "192.168.1.20"
+        info_cls.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_resolve_queries_unannounced_device(self):
+        """Unknown serials fall back to one targeted service query."""
+        cache = DysonMdnsCache(_hass())
+        cache._zeroconf = MagicMock()
+
+        with patch(
+            "custom_components.hass_dyson.mdns.AsyncServiceInfo",
+            return_value=_service_info([]),
+        ) as info_cls:
+            assert await cache.async_resolve(SERIAL, timeout=2) is None
+        info_cls.assert_called_once_with(
+            MDNS_SERVICE_DYSON, f"{SERIAL}.{MDNS_SERVICE_DYSON}"
+        )
+        info_cls.return_value.async_request.assert_awaited_once_with(
+            cache._zeroconf, 2000
+        )
+
+    @pytest.mark.asyncio
+    async def test_async_get_mdns_cache_requires_zeroconf(self):
+        """Without HA's zeroconf integration no browser is started."""
+        hass = _hass()
+        assert await async_get_mdns_cache(hass) is None
+        assert get_mdns_cache(MagicMock(spec=[])) is None
+
+        hass.config.components.add("zeroconf")
+        with patch.object(DysonMdnsCache, "async_start", AsyncMock()) as start:
+            cache = await async_get_mdns_cache(hass)
+        assert cache is hass.data[DATA_MDNS_CACHE]
+        start.assert_awaited_once()
+
+
+class TestCoordinatorMdnsTracking:
+    """Test that coordinators follow announced address changes."""
+
+    def test_new_address_updates_host_and_reconnects_when_down(self):
+        """A disconnected device is pointed at the new address and reconnected."""
+        from custom_components.hass_dyson.coordinator import (
+            DysonDataUpdateCoordinator,
+        )
+
+        coordinator = MagicMock()
+        coordinator.serial_number = SERIAL
+        coordinator.device.host = "192.168.1.20"
+        coordinator.device.is_connected = False
+        coordinator.device.connect = MagicMock(return_value="connect-coro")
+
+        DysonDataUpdateCoordinator._on_mdns_address(coordinator, "192.168.1.31")
+
+        assert coordinator.device.host == "192.168.1.31"
+        coordinator.device.connect.assert_called_once_with(force=True)
+        coordinator.hass.async_create_task.assert_called_once_with("connect-coro")
+
+    def test_same_address_or_connected_device_is_left_alone(self):
+        """No reconnect for an unchanged address or a device that is still up."""
+        from custom_components.hass_dyson.coordinator import (
+            DysonDataUpdateCoordinator,
+        )
+
+        coordinator = MagicMock()
+        coordinator.device.host = "192.168.1.20"
+        coordinator.device.is_connected = True
+
+        DysonDataUpdateCoordinator._on_mdns_address(coordinator, "192.168.1.20")
+        DysonDataUpdateCoordinator._on_mdns_address(coordinator, "192.168.1.31")
+
+        assert coordinator.device.host == "192.168.1.31"
+        coordinator.hass.async_create_task.assert_not_called()
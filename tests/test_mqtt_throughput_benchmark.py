@@ -0,0 +1,345 @@
+"""Replay-driven throughput benchmarks for the inbound MQTT hot path and map renders.
+
+Captures are replayed through ``DysonDevice._on_message`` exactly as paho
+delivers them (raw payload bytes on the network thread), so every run covers
+JSON decoding, change-set computation and callback dispatch:
+
+- tests/fixtures/devices/ec/438_steady_state_replay.jsonl is a synthetic hour
+  of a 438 purifier at the integration's own cadence: a heartbeat
+  REQUEST-CURRENT-STATE every 30 s (CURRENT-STATE plus the environmental
+  follow-up), STATE-CHANGE messages from app and auto-mode changes every
+  90 s, and CURRENT-FAULTS on connect and after 30 minutes. It is also
+  replayed through a ``DysonDataUpdateCoordinator`` and a set of real
+  entities to measure listener fan-out.
+- tests/fixtures/devices/robot/277_zone_clean_replay.jsonl is the Vis Nav
+  capture described in test_robot_mqtt_replay.py.
+
+Measured per capture: messages per second, bytes allocated per message
+(tracemalloc high-water mark while the message is handled) and, for the fan,
+fan-out latency from payload to the last entity update plus the number of
+entity updates per message.
+
+A full-size (1000x1000) Vis Nav dust map rendered over a floor plan of the
+same size is timed as well, since rendering shares the CPU with message
+handling.
+
+Results are compared with tests/fixtures/benchmarks/mqtt_throughput_baseline.json
+within the tolerances stored there. The benchmarks are deselected by default
+and run on demand, locally or through the "benchmarks" job of the test
+workflow, with::
+
+    python -m pytest tests/test_mqtt_throughput_benchmark.py -m benchmark
+
+To record a new baseline, run the same command with
+``DYSON_BENCHMARK_UPDATE=1`` set, then commit the updated file. Scenarios
+without a recorded baseline are skipped.
+"""
+
+import base64
+import io
+import json
+import os
+import statistics
+import time
+import tracemalloc
+import zlib
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from custom_components.hass_dyson.const import CONF_SERIAL_NUMBER
+from custom_components.hass_dyson.coordinator import DysonDataUpdateCoordinator
+from custom_components.hass_dyson.device import DysonDevice
+from custom_components.hass_dyson.image import _render_dust_map_png
+from custom_components.hass_dyson.sensor import (
+    DysonHEPAFilterLifeSensor,
+    DysonHumiditySensor,
+    DysonPM10Sensor,
+    DysonPM25Sensor,
+    DysonTemperatureSensor,
+)
+from custom_components.hass_dyson.switch import (
+    DysonAutoModeSwitch,
+    DysonNightModeSwitch,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+FAN_CAPTURE = FIXTURES / "devices" / "ec" / "438_steady_state_replay.jsonl"
+ROBOT_CAPTURE = FIXTURES / "devices" / "robot" / "277_zone_clean_replay.jsonl"
+BASELINE = FIXTURES / "benchmarks" / "mqtt_throughput_baseline.json"
+
+SERIAL = "MOCKSERIAL01"
+# Full replays per measurement, enough to smooth out timer resolution.
+ROUNDS = 10
+
+FAN_ENTITIES = (
+    DysonPM25Sensor,
+    DysonPM10Sensor,
+    DysonTemperatureSensor,
+    DysonHumiditySensor,
+    DysonHEPAFilterLifeSensor,
+    DysonNightModeSwitch,
+    DysonAutoModeSwitch,
+)
+
+
+class _InlineLoop:
+    """Event loop stand-in that runs thread-safe callbacks immediately."""
+
+    def call_soon_threadsafe(self, callback, *args):
+        callback(*args)
+
+
+class _BenchHass:
+    """Minimal hass; a MagicMock would record every call and skew allocations."""
+
+    def __init__(self):
+        self.loop = _InlineLoop()
+        self.bus = self
+        self.data = {}
+
+    def async_fire(self, *args, **kwargs):
+        pass
+
+    def async_create_task(self, coro, *args, **kwargs):
+        coro.close()
+
+
+def _payloads(path: Path) -> list[bytes]:
+    """Return the capture's messages as raw MQTT payloads."""
+    return [line.encode() for line in path.read_text().splitlines() if line.strip()]
+
+
+def _message(prefix: str, payload: bytes) -> SimpleNamespace:
+    """Return a paho-style message for *payload*."""
+    return SimpleNamespace(topic=f"{prefix}/{SERIAL}/status/current", payload=payload)
+
+
+def _device(prefix: str) -> DysonDevice:
+    return DysonDevice(
+        hass=_BenchHass(),
+        serial_number=SERIAL,
+        host="192.0.2.10",
+        credential="benchmark",
+        mqtt_prefix=prefix,
+    )
+
+
+def _fan_pipeline() -> tuple[DysonDevice, list[int]]:
+    """Wire a device to a coordinator and real entities; return it and a counter."""
+    device = _device("438")
+    entry = SimpleNamespace(data={CONF_SERIAL_NUMBER: SERIAL})
+    with patch(
+        "custom_components.hass_dyson.coordinator.DataUpdateCoordinator.__init__"
+    ):
+        coordinator = DysonDataUpdateCoordinator(device.hass, entry)
+    coordinator.hass = device.hass
+    coordinator.device = device
+    coordinator.data = {}
+    coordinator.last_update_success = True
+    coordinator._listeners = {}
+
+    def _set_updated_data(data):
+        coordinator.data = data
+        coordinator.async_update_listeners()
+
+    coordinator.async_set_updated_data = _set_updated_data
+    device.add_message_callback(coordinator._on_message_update)
+
+    updates = [0]
+    for index, entity_class in enumerate(FAN_ENTITIES):
+        entity = entity_class(coordinator)
+        entity.async_write_ha_state = lambda: None
+
+        def _listener(entity=entity):
+            updates[0] += 1
+            entity._handle_coordinator_update()
+
+        coordinator._listeners[index] = (_listener, entity.coordinator_context)
+    return device, updates
+
+
+def _messages_per_second(devices: list[DysonDevice], messages: list) -> float:
+    """Replay *messages* once through each device and return the rate."""
+    started = time.perf_counter()
+    for device in devices:
+        for message in messages:
+            device._on_message(None, None, message)
+    return len(devices) * len(messages) / (time.perf_counter() - started)
+
+
+def _alloc_bytes_per_message(device: DysonDevice, messages: list) -> float:
+    """Return the mean allocation high-water mark per handled message."""
+    total = 0
+    tracemalloc.start()
+    try:
+        for message in messages:
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            device._on_message(None, None, message)
+            total += tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    return total / len(messages)
+
+
+def _compare_with_baseline(scenario: str, results: dict[str, float]) -> None:
+    """Fail if *results* regressed beyond the baseline's tolerances."""
+    baseline = json.loads(BASELINE.read_text())
+    if os.environ.get("DYSON_BENCHMARK_UPDATE") == "1":
+        baseline["results"][scenario] = {
+            metric: round(value, 3) for metric, value in results.items()
+        }
+        BASELINE.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        return
+
+    recorded = baseline["results"].get(scenario)
+    if recorded is None:
+        pytest.skip(
+            f"No baseline recorded for {scenario}; run with DYSON_BENCHMARK_UPDATE=1"
+        )
+
+    tolerance = baseline["tolerance"]
+    regressions = []
+    for metric, value in results.items():
+        reference = recorded.get(metric)
+        if reference is None:
+            continue
+        if metric == "messages_per_second":
+            limit = reference / tolerance["throughput"]
+            regressed = value < limit
+        elif metric == "entity_updates_per_message":
+            # Deterministic for a given capture: any increase means listeners
+            # are being woken for keys they do not read. Baselines are stored
+            # rounded, so compare at the same precision.
+            limit = reference
+            regressed = round(value, 3) > limit
+        elif metric == "alloc_bytes_per_message":
+            limit = reference * tolerance["allocations"]
+            regressed = value > limit
+        else:
+            limit = reference * tolerance["latency"]
+            regressed = value > limit
+        if regressed:
+            regressions.append(
+                f"{metric}: {value:.3f} (baseline {reference}, limit {limit:.3f})"
+            )
+    assert not regressions, f"{scenario} regressed: " + "; ".join(regressions)
+
+
+class TestFanCaptureReplay:
+    """Sanity checks on the synthetic fan capture the benchmarks replay."""
+
+    def test_capture_has_expected_shape(self):
+        kinds = [json.loads(payload)["msg"] for payload in _payloads(FAN_CAPTURE)]
+        assert kinds.count("CURRENT-STATE") == 120
+        assert kinds.count("ENVIRONMENTAL-CURRENT-SENSOR-DATA") == 120
+        assert kinds.count("STATE-CHANGE") == 41
+        assert kinds.count("CURRENT-FAULTS") == 2
+
+    def test_final_state_matches_capture(self):
+        device = _device("438")
+        for payload in _payloads(FAN_CAPTURE):
+            device._on_message(None, None, _message("438", payload))
+
+        product_state = device.state_data["product-state"]
+        assert product_state["fnsp"] == "0005"
+        assert product_state["nmod"] == "ON"
+        assert product_state["hflr"] == "0078"
+        assert device.get_environmental_data()["pm25"] == "0009"
+
+    def test_key_subscriptions_limit_entity_fan_out(self):
+        """Most messages change nothing an entity reads; few updates result."""
+        device, updates = _fan_pipeline()
+        messages = [_message("438", p) for p in _payloads(FAN_CAPTURE)]
+
+        for message in messages:
+            device._on_message(None, None, message)
+
+        assert 0 < updates[0] < len(messages) * len(FAN_ENTITIES) / 2
+
+
+@pytest.mark.benchmark
+class TestMqttThroughputBenchmark:
+    """Measure the hot path and compare it with the recorded baseline."""
+
+    def test_fan_steady_state(self):
+        messages = [_message("438", p) for p in _payloads(FAN_CAPTURE)]
+        results = {
+            "messages_per_second": _messages_per_second(
+                [_device("438") for _ in range(ROUNDS)], messages
+            ),
+            "alloc_bytes_per_message": _alloc_bytes_per_message(
+                _device("438"), messages
+            ),
+        }
+
+        latencies = []
+        for device, _updates in [_fan_pipeline() for _ in range(ROUNDS)]:
+            for message in messages:
+                started = time.perf_counter()
+                device._on_message(None, None, message)
+                latencies.append((time.perf_counter() - started) * 1e6)
+        device, updates = _fan_pipeline()
+        for message in messages:
+            device._on_message(None, None, message)
+        results["fanout_p50_us"] = statistics.median(latencies)
+        results["fanout_p95_us"] = statistics.quantiles(latencies, n=20)[18]
+        results["entity_updates_per_message"] = updates[0] / len(messages)
+
+        _compare_with_baseline("438_steady_state", results)
+
+    def test_robot_zone_clean(self):
+        messages = [_message("277", p) for p in _payloads(ROBOT_CAPTURE)]
+        results = {
+            "messages_per_second": _messages_per_second(
+                [_device("277") for _ in range(ROUNDS)], messages
+            ),
+            "alloc_bytes_per_message": _alloc_bytes_per_message(
+                _device("277"), messages
+            ),
+        }
+
+        _compare_with_baseline("277_zone_clean", results)
+
+    def test_vis_nav_full_size_render(self):
+        size = 1000
+        floor = Image.new("RGBA", (size, size), (128, 128, 128, 255))
+        for left in range(50, size - 200, 300):
+            floor.paste((0, 0, 0, 255), (left, 50, left + 280, size - 50))
+            floor.paste((255, 255, 255, 255), (left + 278, 50, left + 282, size - 50))
+        buf = io.BytesIO()
+        floor.save(buf, format="PNG")
+        raw = bytes(
+            (x * y) % 256 if (x // 40 + y // 40) % 3 else 0
+            for y in range(size)
+            for x in range(size)
+        )
+        dust_map = {
+            "width": size,
+            "height": size,
+            "dustData": [
+                {
+                    "data": base64.b64encode(zlib.compress(raw)).decode(),
+                    "scaleFactor": 255,
+                }
+            ],
+        }
+
+        timings = []
+        for _ in range(3):
+            started = time.perf_counter()
+            _render_dust_map_png(
+                dust_map,
+                None,
+                buf.getvalue(),
+                rotation_deg=90,
+                map_offset_mm=(0.0, 0.0),
+                clean_position_mm=(0.0, 0.0),
+            )
+            timings.append((time.perf_counter() - started) * 1000)
+
+        _compare_with_baseline("vis_nav_1000px_render", {"render_ms": min(timings)})
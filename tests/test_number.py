@@ -7,7 +7,6 @@ This consolidated module combines number platform testing including:
 Following pure pytest patterns for Home Assistant integration testing.
 """
 
-import asyncio
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
@@ -139,7 +138,7 @@ class TestDysonSleepTimerNumber:
         mock_coordinator.device.get_state_value.return_value = "0060"
 
         with patch.object(entity, "async_write_ha_state"):
-            with patch.object(entity, "_start_timer_polling_if_needed"):
+            with patch.object(entity, "_start_timer_tracking"):
                 entity._handle_coordinator_update()
 
         assert entity._attr_native_value == 60
@@ -159,11 +158,15 @@ class TestDysonSleepTimerNumber:
         """Test setting sleep timer value successfully."""
         entity = DysonSleepTimerNumber(mock_coordinator)
 
-        with patch("custom_components.hass_dyson.number._LOGGER") as mock_logger:
+        with (
+            patch("custom_components.hass_dyson.number._LOGGER") as mock_logger,
+            patch.object(entity, "async_write_ha_state"),
+        ):
             await entity.async_set_native_value(90.0)
 
         mock_coordinator.device.set_sleep_timer.assert_called_once_with(90)
-        assert mock_logger.debug.call_count == 2  # Setting + waiting logs
+        assert mock_logger.debug.call_count == 2  # Setting + countdown logs
+        assert entity._attr_native_value == 90
 
     @pytest.mark.asyncio
     async def test_async_set_native_value_no_device(self, mock_coordinator):
@@ -420,12 +423,12 @@ class TestNumberMissingCoverage:
 
     @pytest.mark.asyncio
     async def test_async_will_remove_from_hass_with_task(self, mock_coordinator):
-        """Test entity removal with active polling task."""
+        """Test entity removal with a pending countdown tick."""
         entity = DysonSleepTimerNumber(mock_coordinator)
 
-        # Create a mock task
-        mock_task = MagicMock()
-        entity._timer_polling_task = mock_task
+        # Pending countdown tick
+        mock_unsub = MagicMock()
+        entity._unsub_timer_tick = mock_unsub
 
         # Mock the parent method
         with patch(
@@ -434,13 +437,13 @@ class TestNumberMissingCoverage:
         ):
             await entity.async_will_remove_from_hass()
 
-        mock_task.cancel.assert_called_once()
+        mock_unsub.assert_called_once()
+        assert entity._unsub_timer_tick is None
 
     @pytest.mark.asyncio
     async def test_async_will_remove_from_hass_no_task(self, mock_coordinator):
-        """Test entity removal without polling task."""
+        """Test entity removal without a pending countdown tick."""
         entity = DysonSleepTimerNumber(mock_coordinator)
-        # Don't set _timer_polling_task attribute
 
         # Mock the parent method
         with patch(
@@ -450,55 +453,6 @@ class TestNumberMissingCoverage:
             # Should not raise exception
             await entity.async_will_remove_from_hass()
 
-    def test_start_timer_polling_already_running(self, mock_coordinator):
-        """Test starting timer polling when already running."""
-        entity = DysonSleepTimerNumber(mock_coordinator)
-
-        # Create mock running task
-        mock_task = MagicMock()
-        mock_task.done.return_value = False
-        entity._timer_polling_task = mock_task
-
-        # Mock coordinator with timer data
-        entity.coordinator.device = MagicMock()
-        entity.coordinator.data = {
-            "product-state": {
-                "sltm": "0060"  # 60 minutes timer
-            }
-        }
-
-        # Should return early without creating new task
-        entity._start_timer_polling_if_needed()
-
-        # Task should not have been replaced
-        assert entity._timer_polling_task is mock_task
-
-    @pytest.mark.asyncio
-    async def test_poll_timer_updates_cancelled(self, mock_coordinator):
-        """Test timer polling with cancellation."""
-        entity = DysonSleepTimerNumber(mock_coordinator)
-
-        # Mock the polling methods to raise CancelledError
-        with patch.object(
-            entity, "_do_frequent_initial_polling", side_effect=asyncio.CancelledError
-        ):
-            await entity._poll_timer_updates()
-            # Should handle CancelledError gracefully
-
-    @pytest.mark.asyncio
-    async def test_poll_timer_updates_connection_error(self, mock_coordinator):
-        """Test timer polling with connection error."""
-        entity = DysonSleepTimerNumber(mock_coordinator)
-
-        # Mock the polling methods to raise ConnectionError
-        with patch.object(
-            entity,
-            "_do_frequent_initial_polling",
-            side_effect=ConnectionError("Connection failed"),
-        ):
-            await entity._poll_timer_updates()
-            # Should handle ConnectionError gracefully
-
 
 class TestNumberEntityErrorHandling:
     """Test error handling scenarios for number entities."""
@@ -514,78 +468,10 @@ class TestNumberEntityErrorHandling:
 
         entity = DysonSleepTimerNumber(mock_coordinator)
 
-        with patch.object(entity, "_start_timer_polling_if_needed") as mock_start:
+        with patch.object(entity, "_start_timer_tracking") as mock_start:
             await entity.async_added_to_hass()
             mock_start.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_sleep_timer_async_will_remove_from_hass(self):
-        """Test async_will_remove_from_hass method with active polling task."""
-        mock_coordinator = Mock(spec=DysonDataUpdateCoordinator)
-        mock_coordinator.serial_number = "TEST-123"
-        mock_coordinator.data = None
-
-        entity = DysonSleepTimerNumber(mock_coordinator)
-
-        # Mock active polling task
-        mock_task = Mock()
-        mock_task.cancel = Mock()
-        entity._timer_polling_task = mock_task
-
-        await entity.async_will_remove_from_hass()
-        mock_task.cancel.assert_called_once()
-
-    def test_sleep_timer_start_polling_already_running(self):
-        """Test _start_timer_polling_if_needed when already running."""
-        mock_coordinator = Mock(spec=DysonDataUpdateCoordinator)
-        mock_coordinator.serial_number = "TEST-123"
-        mock_coordinator.data = None
-
-        entity = DysonSleepTimerNumber(mock_coordinator)
-
-        # Mock running task
-        mock_task = Mock()
-        mock_task.done = Mock(return_value=False)
-        entity._timer_polling_task = mock_task
-
-        entity._start_timer_polling_if_needed()
-        # Should return early without creating new task
-
-    def test_sleep_timer_start_polling_invalid_timer_data(self):
-        """Test _start_timer_polling_if_needed with invalid timer data."""
-        mock_coordinator = Mock(spec=DysonDataUpdateCoordinator)
-        mock_coordinator.serial_number = "TEST-123"
-        mock_coordinator.device = Mock()
-        mock_coordinator.device.get_state_value = Mock(return_value="invalid")
-        mock_coordinator.data = {"product-state": {"sltm": "invalid"}}
-
-        entity = DysonSleepTimerNumber(mock_coordinator)
-
-        # Should handle ValueError gracefully
-        entity._start_timer_polling_if_needed()
-        assert (
-            not hasattr(entity, "_timer_polling_task")
-            or entity._timer_polling_task is None
-        )
-
-    def test_sleep_timer_stop_polling(self):
-        """Test _stop_timer_polling method."""
-        mock_coordinator = Mock(spec=DysonDataUpdateCoordinator)
-        mock_coordinator.serial_number = "TEST-123"
-        mock_coordinator.data = None
-
-        entity = DysonSleepTimerNumber(mock_coordinator)
-
-        # Mock active task
-        mock_task = Mock()
-        mock_task.done = Mock(return_value=False)
-        mock_task.cancel = Mock()
-        entity._timer_polling_task = mock_task
-
-        entity._stop_timer_polling()
-        mock_task.cancel.assert_called_once()
-        assert entity._timer_polling_task is None
-
     def test_sleep_timer_handle_coordinator_update_off(self):
         """Test _handle_coordinator_update with timer OFF."""
         mock_coordinator = Mock(spec=DysonDataUpdateCoordinator)
@@ -692,39 +578,6 @@ class TestNumberEntityErrorHandling:
         result = entity.extra_state_attributes
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_polling_frequent_initial_error(self):
-        """Test _do_frequent_initial_polling error handling."""
-        mock_coordinator = Mock(spec=DysonDataUpdateCoordinator)
-        mock_coordinator.serial_number = "TEST-123"
-        mock_coordinator.data = None
-
-        entity = DysonSleepTimerNumber(mock_coordinator)
-
-        # Mock method to raise exception
-        with patch.object(
-            entity, "_do_frequent_initial_polling", side_effect=Exception("Test error")
-        ):
-            await entity._poll_timer_updates()
-            # Should handle exception gracefully
-
-    @pytest.mark.asyncio
-    async def test_polling_regular_error(self):
-        """Test _do_regular_polling error handling."""
-        mock_coordinator = Mock(spec=DysonDataUpdateCoordinator)
-        mock_coordinator.serial_number = "TEST-123"
-        mock_coordinator.data = None
-
-        entity = DysonSleepTimerNumber(mock_coordinator)
-
-        # Mock methods
-        with patch.object(entity, "_do_frequent_initial_polling", return_value=None):
-            with patch.object(
-                entity, "_do_regular_polling", side_effect=TimeoutError("Timeout")
-            ):
-                await entity._poll_timer_updates()
-                # Should handle TimeoutError gracefully
-
 
 class TestOscillationAngleNumberEntities:
     """Test oscillation angle number entities error handling."""
@@ -1,10 +1,9 @@
 """Additional number.py coverage tests to reach 75% overall target.
 
-Targets uncovered areas in sleep timer polling and oscillation angle entities.
+Targets uncovered areas in the sleep timer countdown and oscillation angle entities.
 Expected impact: +2-3% overall coverage improvement (74% -> 76-77%).
 """
 
-import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -18,200 +17,161 @@ from custom_components.hass_dyson.number import (
 )
 
 
-class TestSleepTimerPollingCoverage:
-    """Tests for sleep timer polling logic."""
-
-    @pytest.mark.asyncio
-    async def test_poll_timer_updates_initial_polling_phase(self):
-        """Test initial polling phase with 6 polls over 3 minutes."""
-        coordinator = Mock(spec=DysonDataUpdateCoordinator)
-        coordinator.serial_number = "TEST-TIMER-001"
-        coordinator.device = Mock()
-        coordinator.device.is_connected = True
-        coordinator.device._request_current_state = AsyncMock()
-        coordinator.device.get_state_value = Mock(return_value="30")
-        coordinator.data = {"product-state": {"sltm": "30"}}
-
-        timer = DysonSleepTimerNumber(coordinator)
-
-        # Mock asyncio.sleep to speed up test and count calls
-        sleep_calls = []
-        original_sleep = asyncio.sleep
-
-        async def mock_sleep(delay):
-            sleep_calls.append(delay)
-            # Use very short sleep to speed up test
-            await original_sleep(0.001)
-
-        with patch("asyncio.sleep", mock_sleep):
-            with patch.object(timer, "_poll_timer_once", AsyncMock(return_value=True)):
-                # Start polling task
-                task = asyncio.create_task(timer._poll_timer_updates())
-
-                # Wait briefly for initial polls to happen
-                await asyncio.sleep(0.1)
-
-                # Cancel task
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
-
-        # Should have at least attempted initial 30-second polls
-        assert 30 in sleep_calls
-
-    @pytest.mark.asyncio
-    async def test_do_regular_polling_continues_with_60_second_intervals(self):
-        """Test regular polling continues with 60-second intervals."""
-        coordinator = Mock(spec=DysonDataUpdateCoordinator)
-        coordinator.serial_number = "TEST-TIMER-002"
-        coordinator.device = Mock()
-        coordinator.device.is_connected = True
-        coordinator.device._request_current_state = AsyncMock()
-        coordinator.device.get_state_value = Mock(return_value="45")
-        coordinator.data = {"product-state": {"sltm": "45"}}
-
-        timer = DysonSleepTimerNumber(coordinator)
-
-        sleep_calls = []
-        poll_count = [0]
-
-        async def mock_sleep(delay):
-            sleep_calls.append(delay)
-
-        async def mock_poll_once(poll_type):
-            poll_count[0] += 1
-            return poll_count[0] < 2
-
-        with patch("custom_components.hass_dyson.number.asyncio.sleep", mock_sleep):
-            with patch.object(timer, "_poll_timer_once", side_effect=mock_poll_once):
-                await timer._do_regular_polling()
-
-        assert 60 in sleep_calls
-        assert poll_count[0] == 2
-
-    @pytest.mark.asyncio
-    async def test_poll_timer_once_device_not_connected(self):
-        """Test poll_timer_once returns False when device not connected."""
-        coordinator = Mock(spec=DysonDataUpdateCoordinator)
-        coordinator.serial_number = "TEST-TIMER-003"
-        coordinator.device = Mock()
-        coordinator.device.is_connected = False
-        coordinator.data = {"product-state": {"sltm": "30"}}
-
-        timer = DysonSleepTimerNumber(coordinator)
-
-        result = await timer._poll_timer_once("test poll")
-
-        assert result is False
+def _timer_coordinator(sltm="0060"):
+    """Return a coordinator mock whose device reports *sltm*."""
+    coordinator = Mock(spec=DysonDataUpdateCoordinator)
+    coordinator.serial_number = "TEST-TIMER-001"
+    coordinator.device = Mock()
+    coordinator.device.is_connected = True
+    coordinator.device.send_command = Mock(return_value="request-coro")
+    coordinator.device.get_state_value = Mock(
+        side_effect=lambda state, key, default: state.get(key, default)
+    )
+    coordinator.data = {"product-state": {"sltm": sltm}}
+    return coordinator
+
+
+class TestSleepTimerCountdownCoverage:
+    """Tests for the locally tracked sleep timer countdown."""
+
+    def test_remaining_minutes_counts_down_from_anchor(self):
+        """Remaining time is derived from the anchored value and elapsed time."""
+        with patch(
+            "custom_components.hass_dyson.number.time.monotonic", return_value=1000.0
+        ):
+            timer = DysonSleepTimerNumber(_timer_coordinator("0060"))
+        assert timer.native_value == 60
+
+        with patch(
+            "custom_components.hass_dyson.number.time.monotonic", return_value=1125.0
+        ):
+            assert timer._remaining_minutes() == 58
+
+        with patch(
+            "custom_components.hass_dyson.number.time.monotonic", return_value=9999.0
+        ):
+            assert timer._remaining_minutes() == 0
+
+    def test_tracking_ticks_on_minute_boundaries(self):
+        """The next tick is scheduled for the anchor's next minute boundary."""
+        with patch(
+            "custom_components.hass_dyson.number.time.monotonic", return_value=1000.0
+        ):
+            timer = DysonSleepTimerNumber(_timer_coordinator("0060"))
+        timer.hass = Mock()
+
+        with (
+            patch(
+                "custom_components.hass_dyson.number.time.monotonic",
+                return_value=1045.0,
+            ),
+            patch(
+                "custom_components.hass_dyson.number.async_call_later"
+            ) as mock_call_later,
+        ):
+            timer._start_timer_tracking()
+            timer._start_timer_tracking()  # already scheduled
+
+        mock_call_later.assert_called_once_with(
+            timer.hass, 15.0, timer._async_timer_tick
+        )
 
-    @pytest.mark.asyncio
-    async def test_poll_timer_once_timer_is_off(self):
-        """Test poll_timer_once returns False when timer shows OFF."""
-        coordinator = Mock(spec=DysonDataUpdateCoordinator)
-        coordinator.serial_number = "TEST-TIMER-004"
-        coordinator.device = Mock()
-        coordinator.device.is_connected = True
-        coordinator.device.get_state_value = Mock(return_value="OFF")
+    def test_tick_updates_value_without_device_request(self):
+        """A tick while time remains only writes the new value."""
+        coordinator = _timer_coordinator("0060")
+        with patch(
+            "custom_components.hass_dyson.number.time.monotonic", return_value=1000.0
+        ):
+            timer = DysonSleepTimerNumber(coordinator)
+        timer.hass = Mock()
+
+        with (
+            patch(
+                "custom_components.hass_dyson.number.time.monotonic",
+                return_value=1060.0,
+            ),
+            patch("custom_components.hass_dyson.number.async_call_later"),
+            patch.object(timer, "async_write_ha_state") as mock_write,
+        ):
+            timer._async_timer_tick(None)
+
+        assert timer.native_value == 59
+        mock_write.assert_called_once()
+        coordinator.device.send_command.assert_not_called()
+
+    def test_tick_requests_state_only_when_device_disagrees(self):
+        """Reaching zero while the device still reports a timer asks once."""
+        coordinator = _timer_coordinator("0015")
+        with patch(
+            "custom_components.hass_dyson.number.time.monotonic", return_value=1000.0
+        ):
+            timer = DysonSleepTimerNumber(coordinator)
+        timer.hass = Mock()
+
+        with (
+            patch(
+                "custom_components.hass_dyson.number.time.monotonic",
+                return_value=1900.0,
+            ),
+            patch.object(timer, "async_write_ha_state"),
+        ):
+            timer._async_timer_tick(None)
+
+        assert timer.native_value == 0
+        coordinator.device.send_command.assert_called_once_with("REQUEST-CURRENT-STATE")
+        timer.hass.async_create_task.assert_called_once_with("request-coro")
+
+        coordinator.device.send_command.reset_mock()
         coordinator.data = {"product-state": {"sltm": "OFF"}}
-
-        timer = DysonSleepTimerNumber(coordinator)
-
-        result = await timer._poll_timer_once("test poll")
-
-        assert result is False
-
-    @pytest.mark.asyncio
-    async def test_poll_timer_once_timer_is_zero(self):
-        """Test poll_timer_once returns False when timer value is 0."""
-        coordinator = Mock(spec=DysonDataUpdateCoordinator)
-        coordinator.serial_number = "TEST-TIMER-005"
-        coordinator.device = Mock()
-        coordinator.device.is_connected = True
-        coordinator.device.get_state_value = Mock(return_value="0")
-        coordinator.data = {"product-state": {"sltm": "0"}}
-
-        timer = DysonSleepTimerNumber(coordinator)
-
-        result = await timer._poll_timer_once("test poll")
-
-        assert result is False
+        with patch.object(timer, "async_write_ha_state"):
+            timer._async_timer_tick(None)
+        coordinator.device.send_command.assert_not_called()
+
+    def test_only_new_reports_reanchor_the_countdown(self):
+        """Updates repeating the last reported value keep the local countdown."""
+        coordinator = _timer_coordinator("0060")
+        with patch(
+            "custom_components.hass_dyson.number.time.monotonic", return_value=1000.0
+        ):
+            timer = DysonSleepTimerNumber(coordinator)
+
+        with (
+            patch(
+                "custom_components.hass_dyson.number.time.monotonic",
+                return_value=1600.0,
+            ),
+            patch.object(timer, "async_write_ha_state"),
+        ):
+            timer._handle_coordinator_update()
+            assert timer.native_value == 50
+
+            coordinator.data = {"product-state": {"sltm": "0045"}}
+            timer._handle_coordinator_update()
+            assert timer.native_value == 45
+            assert timer._timer_anchor == (45, 1600.0)
 
     @pytest.mark.asyncio
-    async def test_poll_timer_once_timer_active_success(self):
-        """Test poll_timer_once returns True when timer active."""
-        coordinator = Mock(spec=DysonDataUpdateCoordinator)
-        coordinator.serial_number = "TEST-TIMER-006"
-        coordinator.device = Mock()
-        coordinator.device.is_connected = True
-        coordinator.device.get_state_value = Mock(return_value="45")
+    async def test_set_native_value_counts_down_without_polling(self):
+        """Setting the timer anchors locally instead of sleeping and polling."""
+        coordinator = _timer_coordinator("OFF")
+        coordinator.device.set_sleep_timer = AsyncMock()
         coordinator.device._request_current_state = AsyncMock()
-        coordinator.data = {"product-state": {"sltm": "45"}}
-
-        timer = DysonSleepTimerNumber(coordinator)
-
-        result = await timer._poll_timer_once("test poll")
-
-        assert result is True
-        coordinator.device._request_current_state.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_start_timer_polling_timer_value_error(self):
-        """Test _start_timer_polling_if_needed handles ValueError in timer data."""
-        coordinator = Mock(spec=DysonDataUpdateCoordinator)
-        coordinator.serial_number = "TEST-TIMER-007"
-        coordinator.device = Mock()
-        coordinator.device.get_state_value = Mock(return_value="INVALID")
-        coordinator.data = {"product-state": {"sltm": "INVALID"}}
-
         timer = DysonSleepTimerNumber(coordinator)
 
-        # Should not raise exception, should handle ValueError gracefully
-        timer._start_timer_polling_if_needed()
-
-        # No task should be created
-        assert timer._timer_polling_task is None
-
-    @pytest.mark.asyncio
-    async def test_start_timer_polling_timer_type_error(self):
-        """Test _start_timer_polling_if_needed handles TypeError in timer data."""
-        coordinator = Mock(spec=DysonDataUpdateCoordinator)
-        coordinator.serial_number = "TEST-TIMER-008"
-        coordinator.device = Mock()
-        coordinator.device.get_state_value = Mock(return_value=["not", "an", "int"])
-        coordinator.data = {"product-state": {"sltm": ["not", "an", "int"]}}
-
-        timer = DysonSleepTimerNumber(coordinator)
-
-        # Should not raise exception, should handle TypeError gracefully
-        timer._start_timer_polling_if_needed()
-
-        # No task should be created
-        assert timer._timer_polling_task is None
-
-    @pytest.mark.asyncio
-    async def test_stop_timer_polling_task_done(self):
-        """Test _stop_timer_polling when task is already done."""
-        coordinator = Mock(spec=DysonDataUpdateCoordinator)
-        coordinator.serial_number = "TEST-TIMER-009"
-        coordinator.device = Mock()
-        coordinator.data = None
-
-        timer = DysonSleepTimerNumber(coordinator)
-
-        # Create a done task
-        async def dummy_task():
-            return True
-
-        timer._timer_polling_task = asyncio.create_task(dummy_task())
-        await asyncio.sleep(0.01)  # Let task complete
-
-        # Stop should handle done task gracefully
-        timer._stop_timer_polling()
-
-        # Task should not be None since it was done (not cancelled)
-        assert timer._timer_polling_task is not None
+        with (
+            patch(
+                "custom_components.hass_dyson.number.time.monotonic",
+                return_value=1000.0,
+            ),
+            patch.object(timer, "async_write_ha_state") as mock_write,
+        ):
+            await timer.async_set_native_value(90)
+
+        coordinator.device.set_sleep_timer.assert_awaited_once_with(90)
+        coordinator.device._request_current_state.assert_not_called()
+        assert timer.native_value == 90
+        assert timer._timer_anchor == (90, 1000.0)
+        mock_write.assert_called_once()
 
 
 class TestOscillationAngleErrorCoverage:
@@ -2,8 +2,6 @@
 
 This module focuses on uncovered error paths in number.py to improve
 coverage from 45% toward the 75% target. Tests cover:
-- Lines 106-112: AsyncCancelledError in timer polling
-- Lines 132, 151-163: ConnectionError, TimeoutError, Generic exceptions in polling
 - Lines 235-257: KeyError, AttributeError, ValueError, TypeError in coordinator updates
 - Lines 287-293: ConnectionError, ValueError, Exception in set_native_value
 - Lines 367-370, 376: ValueError, TypeError in oscillation value parsing
@@ -11,7 +9,6 @@ coverage from 45% toward the 75% target. Tests cover:
 - Multiple uncovered error branches in oscillation angle entities
 """
 
-import asyncio
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
@@ -53,92 +50,6 @@ def mock_coordinator():
 class TestSleepTimerErrorHandling:
     """Test error handling in DysonSleepTimerNumber."""
 
-    @pytest.mark.asyncio
-    async def test_timer_polling_cancelled_error_on_sleep(self, mock_coordinator):
-        """Test AsyncCancelledError handling during timer polling sleep."""
-        timer = DysonSleepTimerNumber(mock_coordinator)
-        timer.hass = MagicMock()
-        timer._attr_native_value = 60
-        timer.entity_id = "number.test_sleep_timer"
-
-        # Mock the polling method to raise CancelledError directly
-        async def mock_poll():
-            raise asyncio.CancelledError()
-
-        with patch.object(timer, "_poll_timer_updates", side_effect=mock_poll):
-            timer._start_timer_polling_if_needed()
-
-            # Wait briefly for task to start and handle cancellation
-            await asyncio.sleep(0.2)
-
-            # Task should handle cancellation gracefully
-
-    @pytest.mark.asyncio
-    async def test_timer_polling_cancelled_error_on_request(self, mock_coordinator):
-        """Test AsyncCancelledError handling during state request."""
-        timer = DysonSleepTimerNumber(mock_coordinator)
-        timer.hass = MagicMock()
-        timer._attr_native_value = 60
-        timer.entity_id = "number.test_sleep_timer"
-
-        # Mock request_current_state to raise CancelledError
-        mock_coordinator.device._request_current_state = AsyncMock(
-            side_effect=asyncio.CancelledError()
-        )
-
-        timer._start_timer_polling_if_needed()
-        await asyncio.sleep(0.2)
-
-        # Task should handle cancellation
-
-    @pytest.mark.asyncio
-    async def test_timer_polling_connection_error(self, mock_coordinator):
-        """Test ConnectionError handling in timer polling."""
-        timer = DysonSleepTimerNumber(mock_coordinator)
-        timer.hass = MagicMock()
-        timer._attr_native_value = 60
-        timer.entity_id = "number.test_sleep_timer"
-
-        # Mock request to raise ConnectionError
-        mock_coordinator.device._request_current_state = AsyncMock(
-            side_effect=ConnectionError("Connection lost")
-        )
-
-        timer._start_timer_polling_if_needed()
-        await asyncio.sleep(0.2)
-
-        # Task should complete despite error
-
-    @pytest.mark.asyncio
-    async def test_timer_polling_timeout_error(self, mock_coordinator):
-        """Test TimeoutError handling in timer polling."""
-        timer = DysonSleepTimerNumber(mock_coordinator)
-        timer.hass = MagicMock()
-        timer._attr_native_value = 60
-        timer.entity_id = "number.test_sleep_timer"
-
-        mock_coordinator.device._request_current_state = AsyncMock(
-            side_effect=TimeoutError("Request timeout")
-        )
-
-        timer._start_timer_polling_if_needed()
-        await asyncio.sleep(0.2)
-
-    @pytest.mark.asyncio
-    async def test_timer_polling_generic_exception(self, mock_coordinator):
-        """Test generic Exception handling in timer polling."""
-        timer = DysonSleepTimerNumber(mock_coordinator)
-        timer.hass = MagicMock()
-        timer._attr_native_value = 60
-        timer.entity_id = "number.test_sleep_timer"
-
-        mock_coordinator.device._request_current_state = AsyncMock(
-            side_effect=RuntimeError("Unexpected error")
-        )
-
-        timer._start_timer_polling_if_needed()
-        await asyncio.sleep(0.2)
-
     def test_coordinator_update_key_error(self, mock_coordinator):
         """Test KeyError handling in coordinator update."""
         timer = DysonSleepTimerNumber(mock_coordinator)
@@ -16,6 +16,7 @@ DeviceMock work can convert it into a DeviceFixture.
 import json
 import logging
 from pathlib import Path
+from unittest.mock import MagicMock
 
 from custom_components.hass_dyson.const import ROBOT_FAULT_SUBSYSTEMS
 from custom_components.hass_dyson.device import DysonDevice
@@ -30,14 +31,13 @@ FIXTURE = (
 
 
 def _bare_device() -> DysonDevice:
-    device = object.__new__(DysonDevice)
-    device._state_data = {}
-    device._log_serial = "TEST-SERIAL"
-    device._message_callbacks = []
-    # STATE-CHANGE bookkeeping touched by _process_message_data
-    device._total_state_messages = 0
-    device._fpwr_message_count = 0
-    device._fmod_message_count = 0
+    device = DysonDevice(
+        hass=MagicMock(),
+        serial_number="TEST-SERIAL",
+        host="192.168.1.100",
+        credential="test_cred",
+    )
+    # Skip power control detection, which robots do not need
     device._power_control_type = "fpwr"
     return device
 
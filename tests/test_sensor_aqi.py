@@ -569,3 +569,53 @@ class TestDysonDominantPollutantSensor:
         assert sensor.native_value == "None"
         assert sensor.extra_state_attributes["aqi"] == 0
         assert sensor.extra_state_attributes["category"] == AQI_CATEGORY_GOOD
+
+
+class TestSharedAQIResult:
+    """Test that the AQI is computed once per environmental update."""
+
+    def test_pollutant_aqi_bisect_matches_breakpoints(self):
+        """Range edges, gaps between ranges and overflow resolve as before."""
+        assert _calculate_pollutant_aqi(35, AQI_PM25_RANGES) == (50, AQI_CATEGORY_GOOD)
+        assert _calculate_pollutant_aqi(36, AQI_PM25_RANGES) == (51, AQI_CATEGORY_FAIR)
+        assert _calculate_pollutant_aqi(35.5, AQI_PM25_RANGES) == (
+            500,
+            AQI_CATEGORY_SEVERE,
+        )
+        assert _calculate_pollutant_aqi(20000, AQI_PM25_RANGES) == (
+            500,
+            AQI_CATEGORY_SEVERE,
+        )
+
+    @patch("custom_components.hass_dyson.entity.DysonEntity._handle_coordinator_update")
+    def test_aqi_sensors_share_one_calculation(
+        self, mock_parent_update, mock_sensor_with_hass, pure_mock_coordinator
+    ):
+        """All three AQI sensors read one result until the data changes."""
+        pure_mock_coordinator.environmental_version = 1
+        pure_mock_coordinator.data = {"environmental-data": {"p25r": 60}}
+        sensors = [
+            mock_sensor_with_hass(DysonAQISensor),
+            mock_sensor_with_hass(DysonAQICategorySensor),
+            mock_sensor_with_hass(DysonDominantPollutantSensor),
+        ]
+
+        with patch(
+            "custom_components.hass_dyson.sensor._calculate_overall_aqi",
+            wraps=_calculate_overall_aqi,
+        ) as calculate:
+            for sensor in sensors:
+                sensor._handle_coordinator_update()
+            assert calculate.call_count == 1
+
+            pure_mock_coordinator.data["environmental-data"]["p25r"] = 10
+            pure_mock_coordinator.environmental_version = 2
+            for sensor in sensors:
+                sensor._handle_coordinator_update()
+            assert calculate.call_count == 2
+
+        assert [sensor.native_value for sensor in sensors] == [
+            14,
+            AQI_CATEGORY_GOOD,
+            "PM2.5",
+        ]
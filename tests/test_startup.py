@@ -0,0 +1,109 @@
+"""Tests for the fleet-wide device startup orchestrator."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.hass_dyson.const import DATA_STARTUP, DATA_STARTUP_CONCURRENCY
+from custom_components.hass_dyson.startup import (
+    DysonStartupOrchestrator,
+    get_startup_orchestrator,
+    shutdown_startup_orchestrator,
+)
+
+
+class TestDysonStartupOrchestrator:
+    """Test bounded concurrency and per-device timings."""
+
+    @pytest.mark.asyncio
+    async def test_first_refreshes_are_bounded(self):
+        """No more than the configured number of devices connect at once."""
+        startup = DysonStartupOrchestrator(2)
+        running = 0
+        peak = 0
+
+        async def _first_refresh():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await asyncio.gather(
+            *(startup.async_connect(f"SERIAL{i}", _first_refresh) for i in range(6))
+        )
+
+        assert peak == 2
+        assert len(startup.timings) == 6
+        assert max(timing.queued for timing in startup.timings.values()) > 0
+
+    @pytest.mark.asyncio
+    async def test_unbounded_by_default(self):
+        """Without a configured limit no device waits for another."""
+        startup = DysonStartupOrchestrator()
+        running = 0
+        peak = 0
+
+        async def _first_refresh():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await asyncio.gather(
+            *(startup.async_connect(f"SERIAL{i}", _first_refresh) for i in range(6))
+        )
+
+        assert peak == 6
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_releases_slot(self):
+        """A device whose first refresh fails does not keep its slot."""
+        startup = DysonStartupOrchestrator(1)
+
+        async def _fail():
+            raise ConnectionError("unreachable")
+
+        with pytest.raises(ConnectionError):
+            await startup.async_connect("BROKEN", _fail)
+
+        timing = await asyncio.wait_for(
+            startup.async_connect("HEALTHY", lambda: asyncio.sleep(0)), 1
+        )
+        assert startup.get_timing("HEALTHY") is timing
+        assert startup.get_timing("BROKEN") is not None
+
+    @pytest.mark.asyncio
+    async def test_platform_setup_is_timed(self):
+        """Platform setup time is added to the device's timing."""
+        startup = DysonStartupOrchestrator()
+        timing = await startup.async_connect("SERIAL", lambda: asyncio.sleep(0))
+
+        await startup.async_setup_platforms("SERIAL", timing, asyncio.sleep(0.01))
+
+        assert timing.platforms > 0
+        assert timing.total >= timing.platforms
+
+    def test_orchestrator_is_shared(self):
+        """Entries share one orchestrator through hass.data."""
+        hass = MagicMock()
+        hass.data = {}
+
+        startup = get_startup_orchestrator(hass)
+
+        assert hass.data[DATA_STARTUP] is startup
+        assert get_startup_orchestrator(hass) is startup
+        assert get_startup_orchestrator(MagicMock(spec=[])) is not startup
+
+        shutdown_startup_orchestrator(hass)
+        assert DATA_STARTUP not in hass.data
+
+    def test_configured_limit_is_used(self):
+        """The YAML startup_concurrency option caps a new orchestrator."""
+        hass = MagicMock()
+        hass.data = {DATA_STARTUP_CONCURRENCY: 3}
+
+        assert get_startup_orchestrator(hass).concurrency == 3
+        assert get_startup_orchestrator(MagicMock(spec=[])).concurrency is None
@@ -18,7 +18,6 @@ from custom_components.hass_dyson.const import (
 from custom_components.hass_dyson.vacuum import (
     DysonVacuumEntity,
     _clean_maps_cache,
-    _clean_maps_locks,
     async_setup_entry,
     fetch_clean_maps,
 )
@@ -1044,12 +1043,12 @@ def _make_v1_record(iso_start: str):
 
 @pytest.fixture(autouse=True)
 def _reset_clean_maps_state():
-    """Isolate each test: clear the module-level cache and lock dict."""
+    """Isolate each test: clear the module-level cache and in-flight fetches."""
     _clean_maps_cache._store.clear()
-    _clean_maps_locks.clear()
+    fetch_clean_maps.in_flight.clear()
     yield
     _clean_maps_cache._store.clear()
-    _clean_maps_locks.clear()
+    fetch_clean_maps.in_flight.clear()
 
 
 class TestFetchCleanMaps:
@@ -1271,7 +1270,7 @@ class TestFetchCleanMaps:
         assert result == []
 
     # ------------------------------------------------------------------
-    # Concurrent stampede prevention (double-checked locking)
+    # Concurrent stampede prevention (single-flight)
     # ------------------------------------------------------------------
 
     # ------------------------------------------------------------------